@@ -0,0 +1,158 @@
+"""Create graph_statistics table
+
+Revision ID: w3x4y5z6a1b2
+Revises: add_llm_openai_enum
+Create Date: 2025-12-16 10:00:00.000000
+
+Creates the graph_statistics table holding precomputed per-tenant knowledge
+graph statistics (entity counts by type, relationship counts by type, degree
+distribution buckets and top hubs).
+
+Counts are maintained incrementally by the projection handlers and fully
+recomputed by the periodic reconcile task, so the stats endpoint can serve
+them without aggregating over the tenant's whole graph.
+
+Also creates the graph_stats_merge_counts() helper used by the projection
+handlers to fold per-type count deltas into the JSONB count maps.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "w3x4y5z6a1b2"
+down_revision: Union[str, None] = "add_llm_openai_enum"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create graph_statistics table and count merge helper."""
+
+    op.create_table(
+        "graph_statistics",
+        # Primary key is tenant_id (one stats row per tenant)
+        sa.Column(
+            "tenant_id",
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            comment="Tenant these statistics belong to",
+        ),
+        # Totals
+        sa.Column(
+            "total_entities",
+            sa.BigInteger(),
+            nullable=False,
+            server_default="0",
+            comment="Number of canonical entities",
+        ),
+        sa.Column(
+            "total_relationships",
+            sa.BigInteger(),
+            nullable=False,
+            server_default="0",
+            comment="Number of relationships",
+        ),
+        # Breakdowns
+        sa.Column(
+            "entity_counts",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default="{}",
+            comment="Canonical entity count by entity type",
+        ),
+        sa.Column(
+            "relationship_counts",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default="{}",
+            comment="Relationship count by relationship type",
+        ),
+        sa.Column(
+            "degree_histogram",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default="{}",
+            comment="Entity count by degree bucket (maintained by reconcile)",
+        ),
+        sa.Column(
+            "top_hubs",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default="[]",
+            comment="Highest-degree entities (maintained by reconcile)",
+        ),
+        # Timestamps
+        sa.Column(
+            "reconciled_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="When statistics were last fully recomputed",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+            comment="When the stats row was created",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+            comment="When the stats row was last updated",
+        ),
+        # Foreign key
+        sa.ForeignKeyConstraint(
+            ["tenant_id"],
+            ["tenants.id"],
+            name="fk_graph_statistics_tenant",
+            ondelete="CASCADE",
+        ),
+    )
+
+    # Merge two {key: count} maps by summing counts, dropping non-positive keys.
+    # Used by projection handlers to apply per-type deltas in a single UPSERT.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION graph_stats_merge_counts(base jsonb, delta jsonb)
+        RETURNS jsonb
+        LANGUAGE sql
+        IMMUTABLE
+        AS $$
+            SELECT COALESCE(
+                jsonb_object_agg(key, total) FILTER (WHERE total > 0),
+                '{}'::jsonb
+            )
+            FROM (
+                SELECT key, sum(value::bigint) AS total
+                FROM (
+                    SELECT key, value FROM jsonb_each_text(COALESCE(base, '{}'::jsonb))
+                    UNION ALL
+                    SELECT key, value FROM jsonb_each_text(COALESCE(delta, '{}'::jsonb))
+                ) pairs
+                GROUP BY key
+            ) merged
+        $$
+    """)
+
+    # Grant permissions (no RLS needed - primary key is tenant_id)
+    # Queries will be filtered by tenant_id in application logic
+    op.execute("""
+        GRANT SELECT, INSERT, UPDATE ON graph_statistics
+        TO knowledge_mapper_app_user
+    """)
+    op.execute("""
+        GRANT EXECUTE ON FUNCTION graph_stats_merge_counts(jsonb, jsonb)
+        TO knowledge_mapper_app_user
+    """)
+
+
+def downgrade() -> None:
+    """Drop graph_statistics table and count merge helper."""
+    op.drop_table("graph_statistics")
+    op.execute("DROP FUNCTION IF EXISTS graph_stats_merge_counts(jsonb, jsonb)")
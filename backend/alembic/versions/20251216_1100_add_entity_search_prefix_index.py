@@ -0,0 +1,47 @@
+"""Add prefix index for entity typeahead search
+
+Revision ID: x4y5z6a1b2c3
+Revises: w3x4y5z6a1b2
+Create Date: 2025-12-16 11:00:00.000000
+
+Adds a btree index on (tenant_id, normalized_name text_pattern_ops) for
+canonical entities so prefix (typeahead) searches using
+``normalized_name LIKE 'term%'`` are index range scans.
+
+Fuzzy searches use the existing idx_blocking_normalized_trigram GIN index
+via the pg_trgm ``%`` and ``<%`` operators; trigram indexes serve short
+prefixes poorly, which is what this index covers.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "x4y5z6a1b2c3"
+down_revision: Union[str, None] = "w3x4y5z6a1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create prefix search index on canonical entity names."""
+    op.execute(
+        """
+        CREATE INDEX idx_entities_normalized_prefix
+        ON extracted_entities (tenant_id, normalized_name text_pattern_ops)
+        WHERE is_canonical = true
+        """
+    )
+
+    op.execute(
+        """
+        COMMENT ON INDEX idx_entities_normalized_prefix IS
+        'Prefix (typeahead) search on canonical entity names'
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove prefix search index."""
+    op.drop_index("idx_entities_normalized_prefix", table_name="extracted_entities")
@@ -0,0 +1,79 @@
+"""Create processed_content_hashes table
+
+Revision ID: y5z6a1b2c3d4
+Revises: x4y5z6a1b2c3
+Create Date: 2025-12-16 12:00:00.000000
+
+Creates the processed_content_hashes table, the durable idempotency index of
+ExtractionTriggerHandler. Each (tenant_id, content_hash) pair is claimed
+once with INSERT ... ON CONFLICT DO NOTHING, so page content triggers at
+most one extraction process across restarts, replays and replicas. A claim
+whose process was never saved is taken over with an UPDATE once it is stale.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "y5z6a1b2c3d4"
+down_revision: Union[str, None] = "x4y5z6a1b2c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create processed_content_hashes table."""
+
+    op.create_table(
+        "processed_content_hashes",
+        sa.Column(
+            "tenant_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            comment="Tenant the content belongs to",
+        ),
+        sa.Column(
+            "content_hash",
+            sa.String(128),
+            nullable=False,
+            comment="Hash of the scraped page content",
+        ),
+        sa.Column(
+            "process_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            comment="ExtractionProcess triggered for the content",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+            comment="When the content was claimed for extraction",
+        ),
+        sa.PrimaryKeyConstraint(
+            "tenant_id", "content_hash", name="pk_processed_content_hashes"
+        ),
+        sa.ForeignKeyConstraint(
+            ["tenant_id"],
+            ["tenants.id"],
+            name="fk_processed_content_hashes_tenant",
+            ondelete="CASCADE",
+        ),
+    )
+
+    # Grant permissions (no RLS needed - only read by the trigger projection,
+    # which always filters by tenant_id)
+    op.execute("""
+        GRANT SELECT, INSERT, UPDATE, DELETE ON processed_content_hashes
+        TO knowledge_mapper_app_user
+    """)
+
+
+def downgrade() -> None:
+    """Drop processed_content_hashes table."""
+    op.drop_table("processed_content_hashes")
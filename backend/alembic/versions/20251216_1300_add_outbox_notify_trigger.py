@@ -0,0 +1,51 @@
+"""Notify outbox publishers on event_outbox inserts
+
+Revision ID: z6a1b2c3d4e5
+Revises: y5z6a1b2c3d4
+Create Date: 2025-12-16 13:00:00.000000
+
+Adds a statement-level trigger that sends NOTIFY event_outbox after rows
+are inserted into the outbox. OutboxPublisher LISTENs on the channel, so it
+publishes new events right away instead of polling an idle table.
+
+The trigger fires once per INSERT statement, and PostgreSQL delivers
+identical notifications of a transaction only once, so a batch append
+costs a single notification.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "z6a1b2c3d4e5"
+down_revision: Union[str, None] = "y5z6a1b2c3d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the outbox notify function and trigger."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION event_outbox_notify()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            PERFORM pg_notify('event_outbox', '');
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_event_outbox_notify
+        AFTER INSERT ON event_outbox
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION event_outbox_notify()
+    """)
+
+
+def downgrade() -> None:
+    """Drop the outbox notify trigger and function."""
+    op.execute("DROP TRIGGER IF EXISTS trg_event_outbox_notify ON event_outbox")
+    op.execute("DROP FUNCTION IF EXISTS event_outbox_notify()")
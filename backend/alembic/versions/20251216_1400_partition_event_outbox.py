@@ -0,0 +1,354 @@
+"""Partition event_outbox by day and add partition maintenance
+
+Revision ID: a7b8c9d0e1f2
+Revises: z6a1b2c3d4e5
+Create Date: 2025-12-16 14:00:00.000000
+
+Published outbox rows were never removed, so every pending scan had to
+skip an ever growing table. This migration recreates event_outbox as a
+table partitioned by RANGE (created_at) with one partition per UTC day and
+a DEFAULT partition as a safety net. Pending rows are carried over, failed
+rows go to event_outbox_failed and published rows are left behind with the
+old table.
+
+The pending scan is backed by a single partial index on (created_at, id)
+WHERE status = 'pending', matching the publisher's ORDER BY; the redundant
+(status, created_at) index is not recreated. The primary key must include
+the partition key and becomes (id, created_at).
+
+event_outbox_maintain_partitions(days_ahead, retain_days, detach) creates
+the partitions of the coming days and drops (or detaches) day partitions
+older than the retention window. Failed rows of an expired partition are
+moved to event_outbox_failed first, so they stay available for inspection
+without keeping the partition alive; only pending rows hold a partition
+back. The function runs as SECURITY DEFINER because the application user
+has no DDL rights, so EXECUTE is revoked from PUBLIC and granted to the
+application user only; the maintain_outbox_partitions Celery beat task
+calls it.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, None] = "z6a1b2c3d4e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Day partitions created by the migration after the current day
+INITIAL_DAYS_AHEAD = 7
+
+# Retention passed while migrating, so no partition is expired yet
+NO_RETENTION = 36500
+
+OUTBOX_COLUMNS = """
+    id, event_id, event_type, aggregate_id, aggregate_type, tenant_id,
+    event_data, created_at, published_at, retry_count, last_error, status
+"""
+
+
+def upgrade() -> None:
+    """Recreate event_outbox as a daily partitioned table."""
+    op.execute("ALTER TABLE event_outbox RENAME TO event_outbox_legacy")
+    op.execute(
+        "ALTER TABLE event_outbox_legacy "
+        "RENAME CONSTRAINT event_outbox_pkey TO event_outbox_legacy_pkey"
+    )
+    for index in (
+        "idx_outbox_status_created",
+        "idx_outbox_pending",
+        "idx_outbox_event_id",
+        "idx_outbox_tenant_id",
+    ):
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.execute("""
+        CREATE TABLE event_outbox (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            event_id UUID NOT NULL,
+            event_type VARCHAR(255) NOT NULL,
+            aggregate_id UUID NOT NULL,
+            aggregate_type VARCHAR(255) NOT NULL,
+            tenant_id UUID,
+            event_data JSONB NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            published_at TIMESTAMPTZ,
+            retry_count INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            status VARCHAR(20) NOT NULL DEFAULT 'pending',
+            CONSTRAINT event_outbox_pkey PRIMARY KEY (id, created_at),
+            CONSTRAINT chk_outbox_status
+                CHECK (status IN ('pending', 'published', 'failed'))
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("CREATE TABLE event_outbox_default PARTITION OF event_outbox DEFAULT")
+
+    # Rows that exhausted their retries, kept out of the partitions so they
+    # do not block expiry
+    op.execute("""
+        CREATE TABLE event_outbox_failed (
+            LIKE event_outbox INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            CONSTRAINT event_outbox_failed_pkey PRIMARY KEY (id)
+        )
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION event_outbox_maintain_partitions(
+            days_ahead integer,
+            retain_days integer,
+            detach boolean DEFAULT false
+        )
+        RETURNS TABLE (partition_name text, action text, rows_affected bigint)
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = public
+        AS $$
+        DECLARE
+            today date := (now() AT TIME ZONE 'UTC')::date;
+            partition_day date;
+            lower_bound timestamptz;
+            upper_bound timestamptz;
+            expired record;
+            has_pending boolean;
+        BEGIN
+            -- Create missing day partitions up to days_ahead. Rows of the day
+            -- that already landed in the default partition are moved into the
+            -- new partition before it is attached.
+            FOR partition_day IN
+                SELECT d::date
+                FROM generate_series(
+                    COALESCE(
+                        (SELECT (min(created_at) AT TIME ZONE 'UTC')::date
+                         FROM event_outbox_default),
+                        today
+                    ),
+                    today + days_ahead,
+                    interval '1 day'
+                ) AS d
+            LOOP
+                partition_name := 'event_outbox_p' || to_char(partition_day, 'YYYYMMDD');
+                CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+                lower_bound := partition_day::timestamp AT TIME ZONE 'UTC';
+                upper_bound := (partition_day + 1)::timestamp AT TIME ZONE 'UTC';
+
+                EXECUTE format(
+                    'CREATE TABLE %I (LIKE event_outbox INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                    partition_name
+                );
+                EXECUTE format(
+                    'WITH moved AS ('
+                    '  DELETE FROM event_outbox_default'
+                    '  WHERE created_at >= %L AND created_at < %L RETURNING *'
+                    ') INSERT INTO %I SELECT * FROM moved',
+                    lower_bound, upper_bound, partition_name
+                );
+                GET DIAGNOSTICS rows_affected = ROW_COUNT;
+                EXECUTE format(
+                    'ALTER TABLE event_outbox ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, lower_bound, upper_bound
+                );
+                action := 'created';
+                RETURN NEXT;
+            END LOOP;
+
+            -- Drop or detach day partitions past the retention window once
+            -- no row in them is pending; failed rows are moved out first
+            FOR expired IN
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'event_outbox'::regclass
+                  AND c.relname ~ '^event_outbox_p[0-9]{8}$'
+                  AND to_date(substring(c.relname FROM 15), 'YYYYMMDD')
+                      < today - retain_days
+                ORDER BY c.relname
+            LOOP
+                EXECUTE format(
+                    'SELECT EXISTS (SELECT 1 FROM %I WHERE status = %L)',
+                    expired.relname, 'pending'
+                ) INTO has_pending;
+                CONTINUE WHEN has_pending;
+
+                EXECUTE format(
+                    'WITH moved AS ('
+                    '  DELETE FROM %I WHERE status = %L RETURNING *'
+                    ') INSERT INTO event_outbox_failed SELECT * FROM moved',
+                    expired.relname, 'failed'
+                );
+                GET DIAGNOSTICS rows_affected = ROW_COUNT;
+                IF rows_affected > 0 THEN
+                    partition_name := expired.relname;
+                    action := 'failed_moved';
+                    RETURN NEXT;
+                END IF;
+
+                partition_name := expired.relname;
+                rows_affected := NULL;
+                IF detach THEN
+                    EXECUTE format(
+                        'ALTER TABLE event_outbox DETACH PARTITION %I', expired.relname
+                    );
+                    action := 'detached';
+                ELSE
+                    EXECUTE format('DROP TABLE %I', expired.relname);
+                    action := 'dropped';
+                END IF;
+                RETURN NEXT;
+            END LOOP;
+
+            -- The default partition is not dropped; expire its rows instead
+            partition_name := 'event_outbox_default';
+            lower_bound := today::timestamp AT TIME ZONE 'UTC'
+                - make_interval(days => retain_days);
+
+            WITH moved AS (
+                DELETE FROM event_outbox_default
+                WHERE status = 'failed' AND created_at < lower_bound
+                RETURNING *
+            )
+            INSERT INTO event_outbox_failed SELECT * FROM moved;
+            GET DIAGNOSTICS rows_affected = ROW_COUNT;
+            IF rows_affected > 0 THEN
+                action := 'failed_moved';
+                RETURN NEXT;
+            END IF;
+
+            DELETE FROM event_outbox_default
+            WHERE status = 'published' AND created_at < lower_bound;
+            GET DIAGNOSTICS rows_affected = ROW_COUNT;
+            IF rows_affected > 0 THEN
+                action := 'deleted';
+                RETURN NEXT;
+            END IF;
+        END
+        $$
+    """)
+
+    # Pending rows are copied into the default partition first; the
+    # maintenance function then creates a partition for each of their days
+    # (up to INITIAL_DAYS_AHEAD days ahead) and moves them in
+    op.execute(f"""
+        INSERT INTO event_outbox ({OUTBOX_COLUMNS})
+        SELECT {OUTBOX_COLUMNS}
+        FROM event_outbox_legacy
+        WHERE status = 'pending'
+    """)
+    op.execute(f"""
+        INSERT INTO event_outbox_failed ({OUTBOX_COLUMNS})
+        SELECT {OUTBOX_COLUMNS}
+        FROM event_outbox_legacy
+        WHERE status = 'failed'
+    """)
+    op.execute(
+        f"SELECT * FROM event_outbox_maintain_partitions({INITIAL_DAYS_AHEAD}, {NO_RETENTION})"
+    )
+    op.execute("DROP TABLE event_outbox_legacy")
+
+    # Indexes on the parent are created on every partition, including
+    # partitions attached later
+    op.execute("""
+        CREATE INDEX idx_outbox_pending ON event_outbox (created_at, id)
+        WHERE status = 'pending'
+    """)
+    op.execute("CREATE INDEX idx_outbox_event_id ON event_outbox (event_id)")
+    op.execute("""
+        CREATE INDEX idx_outbox_tenant_id ON event_outbox (tenant_id)
+        WHERE tenant_id IS NOT NULL
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trg_event_outbox_notify
+        AFTER INSERT ON event_outbox
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION event_outbox_notify()
+    """)
+
+    op.execute("""
+        GRANT SELECT, INSERT, UPDATE ON event_outbox
+        TO knowledge_mapper_app_user
+    """)
+    op.execute("""
+        GRANT SELECT, DELETE ON event_outbox_failed
+        TO knowledge_mapper_app_user
+    """)
+    # Functions are executable by PUBLIC by default; this one runs with the
+    # owner's rights, so only the application user may call it
+    op.execute("""
+        REVOKE EXECUTE ON FUNCTION event_outbox_maintain_partitions(integer, integer, boolean)
+        FROM PUBLIC
+    """)
+    op.execute("""
+        GRANT EXECUTE ON FUNCTION event_outbox_maintain_partitions(integer, integer, boolean)
+        TO knowledge_mapper_app_user
+    """)
+
+
+def downgrade() -> None:
+    """Recreate event_outbox as a plain table with the unpublished rows."""
+    op.execute(
+        "DROP FUNCTION IF EXISTS event_outbox_maintain_partitions(integer, integer, boolean)"
+    )
+    op.execute("ALTER TABLE event_outbox RENAME TO event_outbox_partitioned")
+    op.execute(
+        "ALTER TABLE event_outbox_partitioned "
+        "RENAME CONSTRAINT event_outbox_pkey TO event_outbox_partitioned_pkey"
+    )
+    for index in ("idx_outbox_pending", "idx_outbox_event_id", "idx_outbox_tenant_id"):
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.execute("""
+        CREATE TABLE event_outbox (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            event_id UUID NOT NULL,
+            event_type VARCHAR(255) NOT NULL,
+            aggregate_id UUID NOT NULL,
+            aggregate_type VARCHAR(255) NOT NULL,
+            tenant_id UUID,
+            event_data JSONB NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            published_at TIMESTAMPTZ,
+            retry_count INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            status VARCHAR(20) NOT NULL DEFAULT 'pending',
+            CONSTRAINT chk_outbox_status
+                CHECK (status IN ('pending', 'published', 'failed'))
+        )
+    """)
+    op.execute(f"""
+        INSERT INTO event_outbox ({OUTBOX_COLUMNS})
+        SELECT {OUTBOX_COLUMNS}
+        FROM event_outbox_partitioned
+        WHERE status <> 'published'
+        UNION ALL
+        SELECT {OUTBOX_COLUMNS}
+        FROM event_outbox_failed
+    """)
+    op.execute("DROP TABLE event_outbox_partitioned")
+    op.execute("DROP TABLE event_outbox_failed")
+
+    op.execute("""
+        CREATE INDEX idx_outbox_status_created ON event_outbox (status, created_at)
+        WHERE status = 'pending'
+    """)
+    op.execute("""
+        CREATE INDEX idx_outbox_pending ON event_outbox (created_at)
+        WHERE status = 'pending'
+    """)
+    op.execute("CREATE INDEX idx_outbox_event_id ON event_outbox (event_id)")
+    op.execute("""
+        CREATE INDEX idx_outbox_tenant_id ON event_outbox (tenant_id)
+        WHERE tenant_id IS NOT NULL
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_event_outbox_notify
+        AFTER INSERT ON event_outbox
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION event_outbox_notify()
+    """)
+    op.execute("""
+        GRANT SELECT, INSERT, UPDATE ON event_outbox
+        TO knowledge_mapper_app_user
+    """)
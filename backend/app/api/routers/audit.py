@@ -63,6 +63,9 @@ def _create_event_summary(event_type: str, event_data: dict) -> str:
         "PageScrapingFailed": lambda d: f"Failed to scrape page: {d.get('url', 'Unknown')[:40]}",
         "EntityExtracted": lambda d: f"Extracted {d.get('entity_type', 'Unknown')} entity: {d.get('name', 'Unknown')[:30]}",
         "EntitiesExtractedBatch": lambda d: f"Extracted batch of {d.get('entity_count', 0)} entities",
+        "EntitiesRecordedBatch": lambda d: f"Recorded batch of {len(d.get('entity_ids', []))} entities",
+        "RelationshipsRecordedBatch": lambda d: f"Recorded batch of {len(d.get('relationship_ids', []))} relationships",
+        "EntitiesRetracted": lambda d: f"Retracted {len(d.get('entity_ids', []))} streamed entities",
         "EntityRelationshipCreated": lambda d: f"Created {d.get('relationship_type', 'Unknown')} relationship",
         "ExtractionFailed": lambda d: f"Extraction failed: {d.get('error_message', 'Unknown')[:50]}",
         "EntitySyncedToNeo4j": lambda d: "Synced entity to Neo4j",
@@ -30,6 +30,11 @@ from app.schemas.scraping import (
     EntityRelationshipResponse,
     PaginatedResponse,
 )
+from app.services.entity_search import (
+    SearchMode,
+    entity_search_condition,
+    entity_search_rank,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -73,13 +78,18 @@ async def list_entities(
     entity_type: Optional[str] = Query(None, description="Filter by entity type"),
     extraction_method: Optional[str] = Query(None, description="Filter by extraction method"),
     search: Optional[str] = Query(None, description="Search by name"),
+    search_mode: SearchMode = Query(
+        SearchMode.FUZZY,
+        description="Search mode: 'fuzzy' (ranked, typo-tolerant) or 'prefix' (typeahead)",
+    ),
     job_id: Optional[UUID] = Query(None, description="Filter by scraping job ID"),
     canonical_only: bool = Query(True, description="Only return canonical (non-merged) entities"),
 ) -> PaginatedResponse:
     """
     Get a paginated list of extracted entities.
 
-    Entities are filtered by tenant automatically via RLS.
+    Entities are filtered by tenant automatically via RLS. When searching,
+    results are ordered by relevance instead of creation time.
     """
     tenant_id = UUID(user.tenant_id)
 
@@ -106,11 +116,8 @@ async def list_entities(
             pass  # Ignore invalid methods
 
     if search:
-        search_pattern = f"%{search}%"
-        query = query.where(
-            ExtractedEntity.name.ilike(search_pattern) |
-            ExtractedEntity.normalized_name.ilike(search_pattern)
-        )
+        # Trigram/prefix match served by the pg_trgm and prefix indexes
+        query = query.where(entity_search_condition(search, search_mode))
 
     if job_id:
         # Need to join with scraped_pages to filter by job
@@ -127,7 +134,13 @@ async def list_entities(
 
     # Apply pagination
     offset = (page - 1) * page_size
-    query = query.order_by(ExtractedEntity.created_at.desc())
+    if search:
+        query = query.order_by(
+            entity_search_rank(search, search_mode).desc(),
+            ExtractedEntity.created_at.desc(),
+        )
+    else:
+        query = query.order_by(ExtractedEntity.created_at.desc())
     query = query.offset(offset).limit(page_size)
 
     # Execute query
@@ -4,18 +4,23 @@ Knowledge graph query API endpoints.
 This router provides endpoints for:
 - Querying the knowledge graph (Neo4j)
 - Retrieving graph data for visualization
+- Serving precomputed graph statistics
+- Streaming bulk exports of the graph as CSV
 """
 
 import logging
-from typing import Annotated, Optional
+from collections.abc import AsyncIterator
+from typing import Annotated, Literal, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import CurrentUserWithTenant
 from app.api.dependencies.tenant import TenantSession
+from app.graph.bulk import aiter_export_chunks, rows_to_csv
 from app.models.extracted_entity import (
     EntityRelationship,
     EntityType,
@@ -25,7 +30,9 @@ from app.schemas.scraping import (
     GraphQueryResponse,
     GraphNode,
     GraphEdge,
+    GraphStatsResponse,
 )
+from app.services.graph_stats import GraphStatisticsService
 
 logger = logging.getLogger(__name__)
 
@@ -235,3 +242,70 @@ async def query_graph(
         total_edges=len(edges),
         truncated=truncated,
     )
+
+
+@router.get(
+    "/stats",
+    response_model=GraphStatsResponse,
+    summary="Get knowledge graph statistics",
+    description=(
+        "Get precomputed entity/relationship counts, degree distribution, "
+        "and top hubs for the tenant's knowledge graph."
+    ),
+)
+async def get_graph_stats(
+    user: CurrentUserWithTenant,
+    db: DbSession,
+) -> GraphStatsResponse:
+    """
+    Get statistics for the tenant's knowledge graph.
+
+    Statistics are read from the precomputed graph_statistics row, so this
+    is a single lookup regardless of graph size. Counts are updated as
+    entities and relationships are projected; the degree histogram and top
+    hubs are refreshed by the periodic reconcile task.
+    """
+    tenant_id = UUID(user.tenant_id)
+
+    stats = await GraphStatisticsService(db).get_stats(tenant_id)
+
+    return GraphStatsResponse(**stats)
+
+
+@router.get(
+    "/export/{kind}",
+    response_class=StreamingResponse,
+    summary="Export knowledge graph as CSV",
+    description=(
+        "Stream the tenant's canonical entities or the relationships between "
+        "them as CSV, in id order."
+    ),
+)
+async def export_graph(
+    user: CurrentUserWithTenant,
+    db: DbSession,
+    kind: Literal["entities", "relationships"],
+) -> StreamingResponse:
+    """
+    Stream a CSV export of the tenant's graph.
+
+    Rows are read with a server-side cursor and written chunk by chunk, so
+    memory use is bounded by GRAPH_BULK_CHUNK_SIZE regardless of graph size.
+    The columns match the files used by the bulk Neo4j rebuild.
+    """
+    tenant_id = UUID(user.tenant_id)
+
+    async def generate() -> AsyncIterator[str]:
+        header = True
+        async for rows in aiter_export_chunks(db, kind, tenant_id):
+            yield rows_to_csv(kind, rows, header=header)
+            header = False
+        if header:
+            # Empty graph: still emit the header line
+            yield rows_to_csv(kind, [], header=True)
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{kind}.csv"'},
+    )
@@ -34,6 +34,11 @@ from app.schemas.scraping import (
     ExtractedEntitySummary,
     PaginatedResponse,
 )
+from app.services.entity_search import (
+    SearchMode,
+    entity_search_condition,
+    entity_search_rank,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -128,6 +133,10 @@ async def list_entities(
         max_length=100,
         description="Search by entity name",
     ),
+    search_mode: SearchMode = Query(
+        SearchMode.FUZZY,
+        description="Search mode: 'fuzzy' (ranked, typo-tolerant) or 'prefix' (typeahead)",
+    ),
 ) -> PaginatedResponse:
     """List all extracted entities for the tenant."""
     query = select(ExtractedEntity).where(
@@ -139,7 +148,7 @@ async def list_entities(
         query = query.where(ExtractedEntity.entity_type == entity_type.lower())
 
     if search:
-        query = query.where(ExtractedEntity.name.ilike(f"%{search}%"))
+        query = query.where(entity_search_condition(search, search_mode))
 
     # Get total count
     count_query = select(func.count()).select_from(query.subquery())
@@ -148,7 +157,13 @@ async def list_entities(
 
     # Get paginated results
     offset = (page - 1) * page_size
-    query = query.order_by(ExtractedEntity.created_at.desc())
+    if search:
+        query = query.order_by(
+            entity_search_rank(search, search_mode).desc(),
+            ExtractedEntity.created_at.desc(),
+        )
+    else:
+        query = query.order_by(ExtractedEntity.created_at.desc())
     query = query.offset(offset).limit(page_size)
 
     result = await db.execute(query)
@@ -5,6 +5,7 @@ This module configures Celery for handling asynchronous tasks such as:
 - Web scraping jobs
 - Entity extraction
 - Knowledge graph synchronization
+- Event outbox partition maintenance
 
 All tasks are tenant-aware and maintain proper isolation.
 """
@@ -13,7 +14,11 @@ import logging
 import os
 
 from celery import Celery
-from celery.signals import after_setup_logger, after_setup_task_logger
+from celery.signals import (
+    after_setup_logger,
+    after_setup_task_logger,
+    worker_process_shutdown,
+)
 from kombu import Exchange, Queue
 
 from app.core.config import settings
@@ -70,6 +75,18 @@ celery_app.conf.update(
             "task": "app.tasks.graph.sync_pending_entities",
             "schedule": 300.0,  # Every 5 minutes
         },
+        "reconcile-graph-statistics": {
+            "task": "app.tasks.graph.reconcile_graph_statistics",
+            "schedule": float(settings.GRAPH_STATS_RECONCILE_INTERVAL),
+        },
+        "drain-extraction-queue": {
+            "task": "app.tasks.extraction.drain_extraction_queue",
+            "schedule": float(settings.EXTRACTION_SCHEDULER_DRAIN_INTERVAL),
+        },
+        "maintain-outbox-partitions": {
+            "task": "app.tasks.outbox.maintain_outbox_partitions",
+            "schedule": float(settings.OUTBOX_MAINTENANCE_INTERVAL),
+        },
     },
 
     # Task annotations for rate limiting
@@ -117,6 +134,7 @@ celery_app.autodiscover_tasks([
     "app.tasks.extraction",
     "app.tasks.graph",
     "app.tasks.consolidation",
+    "app.tasks.outbox",
 ])
 
 
@@ -159,6 +177,19 @@ def setup_celery_task_logger(logger: logging.Logger, **kwargs) -> None:
     _setup_celery_json_logging(logger, **kwargs)
 
 
+@worker_process_shutdown.connect
+def shutdown_worker_async_runtime(**kwargs) -> None:
+    """Close cached extraction services, the Neo4j driver, the process pool and event loop."""
+    from app.core.neo4j import close_sync_driver
+    from app.extraction.service_cache import reset_extraction_service_cache
+    from app.worker.runtime import shutdown_async_runtime, shutdown_process_pool
+
+    reset_extraction_service_cache()
+    close_sync_driver()
+    shutdown_process_pool()
+    shutdown_async_runtime()
+
+
 # Task base class with common functionality
 class TenantAwareTask(celery_app.Task):
     """
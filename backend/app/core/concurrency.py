@@ -0,0 +1,357 @@
+"""
+Adaptive concurrency limits for LLM and embedding endpoints.
+
+Throughput of an LLM endpoint depends on model, hardware and provider rate
+limits, so a fixed concurrency setting is either too timid or overloads the
+server. AdaptiveConcurrencyLimiter discovers the limit with AIMD:
+
+- each successful request that used at least half of the limit adds
+  1/limit (about +1 per full window of requests)
+- an overload signal multiplies the limit by ADAPTIVE_CONCURRENCY_BACKOFF,
+  at most once per cooldown so a burst of failures counts once
+- overload signals are 429 and 5xx responses, timeouts, and latency above
+  ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE times the endpoint's smoothed
+  baseline latency
+
+State (limit, baseline latency, in-flight leases) lives in Redis and is
+updated by Lua scripts, so every worker process shares one limit per
+endpoint. Leases expire, so a crashed worker cannot leak capacity. If Redis
+is unavailable the limiter fails open.
+
+Example:
+    limiter = get_concurrency_limiter("ollama:http://gpu-1:11434")
+
+    async with concurrency_slot(limiter):
+        response = await client.post(...)
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+import time
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+
+import httpx
+from prometheus_client import Gauge
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Prometheus Metrics
+# =============================================================================
+
+concurrency_limit = Gauge(
+    name="llm_concurrency_limit",
+    documentation="Adaptive concurrency limit per LLM/embedding endpoint",
+    labelnames=["endpoint"],
+)
+
+concurrency_in_flight = Gauge(
+    name="llm_concurrency_in_flight",
+    documentation="Requests in flight per LLM/embedding endpoint (all workers)",
+    labelnames=["endpoint"],
+)
+
+
+# =============================================================================
+# Lua Scripts
+# =============================================================================
+
+# KEYS: leases, state; ARGV: lease id, lease seconds, initial limit
+# Returns {granted, limit, in flight}
+_ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+local limit = tonumber(redis.call('HGET', KEYS[2], 'limit') or ARGV[3])
+local in_flight = redis.call('ZCARD', KEYS[1])
+local granted = 0
+if in_flight < math.floor(limit) then
+    redis.call('ZADD', KEYS[1], now + tonumber(ARGV[2]), ARGV[1])
+    in_flight = in_flight + 1
+    granted = 1
+end
+return {granted, tostring(limit), in_flight}
+"""
+
+# KEYS: leases, state
+# ARGV: lease id, outcome, latency, min, max, backoff, tolerance, initial limit
+# Returns {limit, in flight}
+_RELEASE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local in_flight = redis.call('ZCARD', KEYS[1])
+local removed = redis.call('ZREM', KEYS[1], ARGV[1])
+
+local state = redis.call('HMGET', KEYS[2], 'limit', 'baseline', 'decreased_at')
+local limit = tonumber(state[1] or ARGV[8])
+local baseline = tonumber(state[2] or '0')
+local decreased_at = tonumber(state[3] or '0')
+
+local outcome = ARGV[2]
+local latency = tonumber(ARGV[3])
+local backoff = tonumber(ARGV[6])
+local tolerance = tonumber(ARGV[7])
+
+local overloaded = outcome == 'overload'
+if outcome == 'success' then
+    if tolerance > 0 and baseline > 0 and latency > baseline * tolerance then
+        overloaded = true
+    elseif in_flight * 2 >= limit then
+        limit = limit + 1 / limit
+    end
+    if baseline == 0 then
+        baseline = latency
+    else
+        baseline = baseline + (latency - baseline) * 0.05
+    end
+end
+
+if overloaded and now - decreased_at >= math.max(baseline, 1) then
+    limit = limit * backoff
+    decreased_at = now
+end
+
+limit = math.max(tonumber(ARGV[4]), math.min(tonumber(ARGV[5]), limit))
+redis.call('HSET', KEYS[2], 'limit', tostring(limit), 'baseline', tostring(baseline),
+    'decreased_at', tostring(decreased_at))
+return {tostring(limit), in_flight - removed}
+"""
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """Raised when no slot became free within the acquire timeout.
+
+    Attributes:
+        endpoint: Endpoint whose limit was reached
+        retry_after: Suggested seconds before retrying
+    """
+
+    def __init__(self, endpoint: str, retry_after: float):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__(
+            f"Concurrency limit reached for {endpoint}. Retry after {retry_after:.1f}s"
+        )
+
+
+def is_overload(exc: BaseException) -> bool:
+    """
+    Whether an exception signals that the endpoint is overloaded.
+
+    Args:
+        exc: Exception raised by the request
+
+    Returns:
+        True for timeouts and 429/5xx responses
+    """
+    if isinstance(exc, (httpx.TimeoutException, TimeoutError)):
+        return True
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit for one endpoint, shared through Redis.
+
+    Attributes:
+        endpoint: Endpoint identifier (e.g., "ollama:http://gpu-1:11434")
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        redis_client: Any = None,
+        initial_limit: Optional[int] = None,
+        min_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        backoff: Optional[float] = None,
+        latency_tolerance: Optional[float] = None,
+        acquire_timeout: Optional[float] = None,
+        lease_seconds: Optional[int] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            endpoint: Endpoint identifier, used in Redis keys and metric labels
+            redis_client: Async Redis client (defaults to the shared client)
+            initial_limit: Limit before any feedback (defaults to settings)
+            min_limit: Lower bound (defaults to settings)
+            max_limit: Upper bound (defaults to settings)
+            backoff: Multiplicative decrease factor (defaults to settings)
+            latency_tolerance: Latency/baseline ratio treated as overload,
+                0 to disable (defaults to settings)
+            acquire_timeout: Seconds to wait for a slot (defaults to settings)
+            lease_seconds: Lease duration for a slot (defaults to settings)
+        """
+        self.endpoint = endpoint
+        self._redis = redis_client
+        self._initial = initial_limit or settings.ADAPTIVE_CONCURRENCY_INITIAL
+        self._min = min_limit or settings.ADAPTIVE_CONCURRENCY_MIN
+        self._max = max_limit or settings.ADAPTIVE_CONCURRENCY_MAX
+        self._backoff = backoff or settings.ADAPTIVE_CONCURRENCY_BACKOFF
+        self._tolerance = (
+            latency_tolerance
+            if latency_tolerance is not None
+            else settings.ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE
+        )
+        self._acquire_timeout = acquire_timeout or settings.ADAPTIVE_CONCURRENCY_ACQUIRE_TIMEOUT
+        self._lease_seconds = lease_seconds or settings.ADAPTIVE_CONCURRENCY_LEASE_SECONDS
+        self._keys = [f"concurrency:{endpoint}:leases", f"concurrency:{endpoint}:state"]
+        self._scripts: dict[str, Any] = {}
+
+    async def _get_scripts(self) -> Optional[dict[str, Any]]:
+        if not self._scripts:
+            if self._redis is None:
+                from app.core.cache import get_redis_client
+
+                self._redis = await get_redis_client()
+                if self._redis is None:
+                    return None
+            self._scripts = {
+                "acquire": self._redis.register_script(_ACQUIRE_SCRIPT),
+                "release": self._redis.register_script(_RELEASE_SCRIPT),
+            }
+        return self._scripts
+
+    def _observe(self, limit: Any, in_flight: Any) -> None:
+        concurrency_limit.labels(self.endpoint).set(float(limit))
+        concurrency_in_flight.labels(self.endpoint).set(int(in_flight))
+
+    async def acquire(self) -> Optional[str]:
+        """
+        Wait for a slot.
+
+        Returns:
+            Lease ID, or None if Redis is unavailable (fail open)
+
+        Raises:
+            ConcurrencyLimitExceeded: If no slot frees up within the timeout
+        """
+        deadline = time.monotonic() + self._acquire_timeout
+        lease_id = uuid.uuid4().hex
+        delay = 0.05
+
+        while True:
+            try:
+                scripts = await self._get_scripts()
+                if scripts is None:
+                    return None
+                granted, limit, in_flight = await scripts["acquire"](
+                    keys=self._keys,
+                    args=[lease_id, self._lease_seconds, self._initial],
+                )
+            except Exception as e:
+                logger.warning(f"Concurrency limiter unavailable for {self.endpoint}: {e}")
+                return None
+
+            self._observe(limit, in_flight)
+            if int(granted) == 1:
+                return lease_id
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ConcurrencyLimitExceeded(self.endpoint, retry_after=delay)
+            await asyncio.sleep(min(remaining, delay * random.uniform(0.5, 1.5)))
+            delay = min(delay * 2, 1.0)
+
+    async def release(self, lease_id: Optional[str], outcome: str, latency: float) -> None:
+        """
+        Return a slot and feed the outcome into the limit.
+
+        Args:
+            lease_id: Lease from acquire() (None is ignored)
+            outcome: "success", "overload", or "ignore" (errors that say
+                nothing about load, such as validation failures)
+            latency: Request duration in seconds
+        """
+        if lease_id is None:
+            return
+        try:
+            scripts = await self._get_scripts()
+            if scripts is None:
+                return
+            limit, in_flight = await scripts["release"](
+                keys=self._keys,
+                args=[
+                    lease_id,
+                    outcome,
+                    latency,
+                    self._min,
+                    self._max,
+                    self._backoff,
+                    self._tolerance,
+                    self._initial,
+                ],
+            )
+            self._observe(limit, in_flight)
+        except Exception as e:
+            # The lease expires on its own
+            logger.warning(f"Failed to release concurrency slot for {self.endpoint}: {e}")
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of one request, recording its outcome."""
+        lease_id = await self.acquire()
+        start = time.monotonic()
+        outcome = "ignore"
+        try:
+            yield
+            outcome = "success"
+        except BaseException as e:
+            if is_overload(e):
+                outcome = "overload"
+            raise
+        finally:
+            await self.release(lease_id, outcome, time.monotonic() - start)
+
+
+def concurrency_slot(
+    limiter: Optional[AdaptiveConcurrencyLimiter],
+) -> contextlib.AbstractAsyncContextManager:
+    """
+    Slot context for an optional limiter.
+
+    Args:
+        limiter: Limiter, or None when adaptive concurrency is disabled
+
+    Returns:
+        The limiter's slot() context, or a no-op context
+    """
+    return limiter.slot() if limiter is not None else contextlib.nullcontext()
+
+
+# Limiters per endpoint (one per process; state is shared through Redis)
+_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_concurrency_limiter(endpoint: str) -> Optional[AdaptiveConcurrencyLimiter]:
+    """
+    Get the limiter for an endpoint.
+
+    Args:
+        endpoint: Endpoint identifier, e.g. "ollama:<base_url>"
+
+    Returns:
+        AdaptiveConcurrencyLimiter, or None if disabled in settings
+    """
+    if not settings.ADAPTIVE_CONCURRENCY_ENABLED:
+        return None
+    limiter = _limiters.get(endpoint)
+    if limiter is None:
+        limiter = _limiters[endpoint] = AdaptiveConcurrencyLimiter(endpoint)
+    return limiter
+
+
+def reset_concurrency_limiters() -> None:
+    """Drop all limiter instances (primarily for testing)."""
+    _limiters.clear()
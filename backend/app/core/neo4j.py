@@ -0,0 +1,382 @@
+"""
+Shared Neo4j connection layer.
+
+This module owns Neo4j driver configuration for the whole application so
+that the async API/projection path (app.services.neo4j.Neo4jService) and
+the sync Celery path (app.graph.client.Neo4jClient) use the same pool
+sizing, timeouts and fetch size, and report pool usage the same way.
+
+It provides:
+- Driver options built from settings (pool size, acquisition timeout,
+  connection lifetime, fetch size, transaction retry budget)
+- A process-wide sync driver and an async driver factory
+- Tracked sessions that publish pool metrics to Prometheus
+- Helpers to run several statements in one managed (retried) transaction
+
+Pool metrics (exposed on the existing /metrics endpoint):
+- neo4j_pool_in_use: Sessions currently holding a pool slot
+- neo4j_pool_waiters: Sessions waiting for a pool slot
+- neo4j_pool_acquisition_seconds: Time spent waiting for a pool slot
+
+Each tracked session holds one slot from a gate that belongs to its driver
+and is sized to that driver's pool, so waiters and acquisition latency
+reflect real contention for its connections (the driver's own pool counters
+are not part of its public API).
+
+Example:
+    from app.core.neo4j import get_sync_driver, sync_session, run_statements
+
+    with sync_session(get_sync_driver()) as session:
+        session.execute_write(
+            run_statements,
+            [
+                ("MERGE (e:Entity {id: $id})", {"id": "a"}),
+                ("MERGE (e:Entity {id: $id})", {"id": "b"}),
+            ],
+        )
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Optional
+
+from neo4j import (
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncSession,
+    Driver,
+    GraphDatabase,
+    ManagedTransaction,
+    Session,
+)
+from prometheus_client import Gauge, Histogram
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# A statement to run inside a transaction: (cypher, parameters)
+Statement = tuple[str, dict[str, Any]]
+
+
+# =============================================================================
+# Prometheus Metrics
+# =============================================================================
+
+# Label "driver" distinguishes the sync (Celery) and async (API) drivers
+neo4j_pool_in_use = Gauge(
+    name="neo4j_pool_in_use",
+    documentation="Neo4j sessions currently holding a connection pool slot",
+    labelnames=["driver"],
+)
+
+neo4j_pool_waiters = Gauge(
+    name="neo4j_pool_waiters",
+    documentation="Neo4j sessions waiting for a connection pool slot",
+    labelnames=["driver"],
+)
+
+neo4j_pool_acquisition_seconds = Histogram(
+    name="neo4j_pool_acquisition_seconds",
+    documentation="Time spent waiting for a Neo4j connection pool slot",
+    labelnames=["driver"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0),
+)
+
+
+# =============================================================================
+# Driver Configuration
+# =============================================================================
+
+
+def driver_options() -> dict[str, Any]:
+    """
+    Build Neo4j driver keyword arguments from settings.
+
+    Returns:
+        Keyword arguments shared by the sync and async drivers
+    """
+    return {
+        "auth": (settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+        "max_connection_pool_size": settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        "connection_acquisition_timeout": settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        "connection_timeout": settings.NEO4J_CONNECTION_TIMEOUT,
+        "max_connection_lifetime": settings.NEO4J_MAX_CONNECTION_LIFETIME,
+        "max_transaction_retry_time": settings.NEO4J_MAX_TRANSACTION_RETRY_TIME,
+        "fetch_size": settings.NEO4J_FETCH_SIZE,
+    }
+
+
+def create_sync_driver(uri: Optional[str] = None, **overrides: Any) -> Driver:
+    """
+    Create a sync Neo4j driver with the shared configuration.
+
+    Most callers should use get_sync_driver(); a separate driver is only
+    needed to reach a different server or to connect as another user.
+
+    Args:
+        uri: Neo4j URI (defaults to settings)
+        **overrides: Driver options overriding the shared configuration
+
+    Returns:
+        New Driver, owned by the caller
+    """
+    options = {**driver_options(), **overrides}
+    driver = GraphDatabase.driver(uri or settings.NEO4J_URI, **options)
+    _gates[driver] = _SyncPoolGate(options["max_connection_pool_size"])
+    return driver
+
+
+_sync_driver: Optional[Driver] = None
+_sync_driver_lock = threading.Lock()
+
+
+def get_sync_driver() -> Driver:
+    """
+    Get the process-wide sync Neo4j driver, creating it on first use.
+
+    The driver is thread-safe and shared by all Celery tasks in a worker
+    process, so they draw from a single connection pool.
+
+    Returns:
+        Shared sync Driver
+    """
+    global _sync_driver
+
+    if _sync_driver is None:
+        with _sync_driver_lock:
+            if _sync_driver is None:
+                _sync_driver = create_sync_driver()
+                logger.info(
+                    f"Neo4j sync driver created: {settings.NEO4J_URI} "
+                    f"(pool_size={settings.NEO4J_MAX_CONNECTION_POOL_SIZE})"
+                )
+
+    return _sync_driver
+
+
+def close_sync_driver() -> None:
+    """Close the process-wide sync Neo4j driver."""
+    global _sync_driver
+
+    with _sync_driver_lock:
+        if _sync_driver is not None:
+            _sync_driver.close()
+            _sync_driver = None
+            logger.info("Neo4j sync driver closed")
+
+
+def create_async_driver(uri: Optional[str] = None, **overrides: Any) -> AsyncDriver:
+    """
+    Create an async Neo4j driver with the shared configuration.
+
+    Async drivers are bound to the event loop they are used on, so callers
+    own the returned driver (Neo4jService keeps one per service instance).
+
+    Args:
+        uri: Neo4j URI (defaults to settings)
+        **overrides: Driver options overriding the shared configuration
+
+    Returns:
+        New AsyncDriver
+    """
+    options = {**driver_options(), **overrides}
+    driver = AsyncGraphDatabase.driver(uri or settings.NEO4J_URI, **options)
+    _gates[driver] = _AsyncPoolGate(options["max_connection_pool_size"])
+    return driver
+
+
+# =============================================================================
+# Pool Slot Tracking
+# =============================================================================
+
+
+class _SyncPoolGate:
+    """Thread-safe pool slot gate for sync sessions."""
+
+    def __init__(self, size: int) -> None:
+        self._semaphore = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def slot(self, timeout: float) -> Iterator[None]:
+        neo4j_pool_waiters.labels(driver="sync").inc()
+        start = time.perf_counter()
+        try:
+            acquired = self._semaphore.acquire(timeout=timeout)
+        finally:
+            neo4j_pool_waiters.labels(driver="sync").dec()
+        neo4j_pool_acquisition_seconds.labels(driver="sync").observe(
+            time.perf_counter() - start
+        )
+        if not acquired:
+            raise TimeoutError(
+                f"Timed out after {timeout}s waiting for a Neo4j connection"
+            )
+
+        neo4j_pool_in_use.labels(driver="sync").inc()
+        try:
+            yield
+        finally:
+            neo4j_pool_in_use.labels(driver="sync").dec()
+            self._semaphore.release()
+
+
+class _AsyncPoolGate:
+    """Pool slot gate for async sessions (recreated if the event loop changes)."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._size)
+            self._loop = loop
+        return self._semaphore
+
+    @asynccontextmanager
+    async def slot(self, timeout: float) -> AsyncIterator[None]:
+        semaphore = self._get_semaphore()
+        neo4j_pool_waiters.labels(driver="async").inc()
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Timed out after {timeout}s waiting for a Neo4j connection"
+            ) from None
+        finally:
+            neo4j_pool_waiters.labels(driver="async").dec()
+            neo4j_pool_acquisition_seconds.labels(driver="async").observe(
+                time.perf_counter() - start
+            )
+
+        neo4j_pool_in_use.labels(driver="async").inc()
+        try:
+            yield
+        finally:
+            neo4j_pool_in_use.labels(driver="async").dec()
+            semaphore.release()
+
+
+# One gate per driver, sized to its pool; dropped with the driver
+_gates: "weakref.WeakKeyDictionary[Any, _SyncPoolGate | _AsyncPoolGate]" = (
+    weakref.WeakKeyDictionary()
+)
+_gates_lock = threading.Lock()
+
+
+def _gate_for(driver: Any, gate_class: type) -> Any:
+    """Get the driver's pool gate, creating one for drivers built elsewhere."""
+    gate = _gates.get(driver)
+    if gate is None:
+        with _gates_lock:
+            gate = _gates.get(driver)
+            if gate is None:
+                gate = gate_class(settings.NEO4J_MAX_CONNECTION_POOL_SIZE)
+                _gates[driver] = gate
+    return gate
+
+
+@contextmanager
+def sync_session(driver: Driver, database: Optional[str] = None) -> Iterator[Session]:
+    """
+    Open a sync session that holds a tracked pool slot.
+
+    Args:
+        driver: Sync Neo4j driver
+        database: Database name (defaults to settings)
+
+    Yields:
+        Session that is closed on exit
+
+    Raises:
+        TimeoutError: If no pool slot frees up within the acquisition timeout
+    """
+    gate = _gate_for(driver, _SyncPoolGate)
+    with gate.slot(settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT):
+        with driver.session(database=database or settings.NEO4J_DATABASE) as session:
+            yield session
+
+
+@asynccontextmanager
+async def async_session(
+    driver: AsyncDriver,
+    database: Optional[str] = None,
+) -> AsyncIterator[AsyncSession]:
+    """
+    Open an async session that holds a tracked pool slot.
+
+    Args:
+        driver: Async Neo4j driver
+        database: Database name (defaults to settings)
+
+    Yields:
+        AsyncSession that is closed on exit
+
+    Raises:
+        TimeoutError: If no pool slot frees up within the acquisition timeout
+    """
+    gate = _gate_for(driver, _AsyncPoolGate)
+    async with gate.slot(settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT):
+        session = driver.session(database=database or settings.NEO4J_DATABASE)
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+# =============================================================================
+# Transaction Helpers
+# =============================================================================
+
+
+def run_statements(
+    tx: ManagedTransaction,
+    statements: Sequence[Statement],
+) -> list[list[dict[str, Any]]]:
+    """
+    Run several statements in one managed transaction.
+
+    Intended as the unit of work for ``session.execute_write`` so that all
+    statements commit (or are retried) together.
+
+    Args:
+        tx: Managed transaction
+        statements: (cypher, parameters) pairs, run in order
+
+    Returns:
+        Records of each statement as lists of dicts
+    """
+    return [tx.run(query, parameters).data() for query, parameters in statements]
+
+
+async def run_statements_async(
+    tx: AsyncManagedTransaction,
+    statements: Sequence[Statement],
+) -> list[list[dict[str, Any]]]:
+    """
+    Run several statements in one async managed transaction.
+
+    Async counterpart of run_statements for ``AsyncSession.execute_write``.
+
+    Args:
+        tx: Async managed transaction
+        statements: (cypher, parameters) pairs, run in order
+
+    Returns:
+        Records of each statement as lists of dicts
+    """
+    results = []
+    for query, parameters in statements:
+        result = await tx.run(query, parameters)
+        results.append(await result.data())
+    return results
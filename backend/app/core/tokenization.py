@@ -0,0 +1,124 @@
+"""
+Tokenizers for sizing LLM inputs in tokens rather than characters.
+
+Characters per token vary widely by language (about 4 for English prose,
+about 1 for Chinese or Japanese), so character limits either waste context
+or overflow it. This module provides tokenizers that report token spans:
+
+- HuggingFaceTokenizer: exact counts from a `tokenizers` tokenizer.json,
+  by Hugging Face Hub ID or local path (CHUNK_TOKENIZER)
+- ApproximateTokenizer: a regex heuristic used when no tokenizer is
+  configured or it cannot be loaded, e.g. on hosts without Hub access
+
+get_tokenizer() caches tokenizers per process, so a tokenizer is loaded
+once and reused by every chunker and extractor.
+
+Example:
+    tokenizer = get_tokenizer(settings.CHUNK_TOKENIZER)
+    text, truncated = truncate_to_tokens(content, 16000, tokenizer)
+"""
+
+import functools
+import logging
+import os
+import re
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+# CJK characters count as one token each; other letters in runs of up to 6,
+# digits in runs of up to 3, and each punctuation mark as one token
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_APPROXIMATE_TOKEN = re.compile(rf"[{_CJK}]|[^\W\d_{_CJK}]{{1,6}}|\d{{1,3}}|[^\w\s]")
+
+
+class Tokenizer(Protocol):
+    """Protocol for tokenizers used to size chunks and prompts."""
+
+    name: str
+
+    def token_spans(self, text: str) -> list[tuple[int, int]]:
+        """Return the (start, end) character span of each token in text."""
+        ...
+
+
+class ApproximateTokenizer:
+    """Regex-based token estimate, close to BPE counts for common languages."""
+
+    name = "approximate"
+
+    def token_spans(self, text: str) -> list[tuple[int, int]]:
+        """Return the character span of each estimated token."""
+        return [match.span() for match in _APPROXIMATE_TOKEN.finditer(text)]
+
+
+class HuggingFaceTokenizer:
+    """Exact token spans from a Hugging Face `tokenizers` tokenizer."""
+
+    def __init__(self, name: str):
+        """
+        Load a tokenizer.
+
+        Args:
+            name: Path to a tokenizer.json file or a Hugging Face Hub model ID
+
+        Raises:
+            ImportError: If the tokenizers package is not installed
+            Exception: If the tokenizer cannot be loaded
+        """
+        from tokenizers import Tokenizer as HFTokenizer
+
+        self.name = name
+        if os.path.exists(name):
+            self._tokenizer = HFTokenizer.from_file(name)
+        else:
+            self._tokenizer = HFTokenizer.from_pretrained(name)
+
+    def token_spans(self, text: str) -> list[tuple[int, int]]:
+        """Return the character span of each token."""
+        return self._tokenizer.encode(text, add_special_tokens=False).offsets
+
+
+@functools.lru_cache(maxsize=8)
+def get_tokenizer(name: str = "") -> Tokenizer:
+    """
+    Get a tokenizer, loading it at most once per process.
+
+    Args:
+        name: tokenizer.json path or Hub model ID; empty for the approximate
+            tokenizer
+
+    Returns:
+        The requested tokenizer, or ApproximateTokenizer if it cannot be loaded
+    """
+    if not name:
+        return ApproximateTokenizer()
+    try:
+        tokenizer = HuggingFaceTokenizer(name)
+        logger.info("Loaded tokenizer", extra={"tokenizer": name})
+        return tokenizer
+    except Exception as e:
+        logger.warning(f"Failed to load tokenizer {name!r}: {e}, using approximate counts")
+        return ApproximateTokenizer()
+
+
+def truncate_to_tokens(text: str, max_tokens: int, tokenizer: Tokenizer) -> tuple[str, bool]:
+    """
+    Cut text to at most max_tokens tokens.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+        tokenizer: Tokenizer used to count
+
+    Returns:
+        Tuple of (text, whether it was truncated)
+    """
+    # Every token covers at least one UTF-8 byte (byte-level BPE splits a
+    # multi-byte character into several tokens, so characters don't bound it)
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text, False
+    spans = tokenizer.token_spans(text)
+    if len(spans) <= max_tokens:
+        return text, False
+    return text[: spans[max_tokens - 1][1]], True
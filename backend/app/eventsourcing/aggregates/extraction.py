@@ -9,26 +9,31 @@ The aggregate uses eventsource-py's DeclarativeAggregate pattern with
 @handles decorators for clean event handler registration.
 """
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from eventsource import DeclarativeAggregate, handles
 from pydantic import BaseModel, Field
 
 from app.eventsourcing.events.extraction import (
+    EntitiesRecordedBatch,
+    EntitiesRetracted,
     ExtractionCompleted,
     ExtractionProcessFailed,
     ExtractionRequested,
     ExtractionRetryScheduled,
     ExtractionStarted,
     RelationshipDiscovered,
+    RelationshipsRecordedBatch,
 )
 from app.eventsourcing.events.scraping import EntityExtracted
 
 if TYPE_CHECKING:
     from eventsource import AggregateRepository, EventStore
+    from eventsource.snapshots import SnapshotStore
 
 
 # =============================================================================
@@ -163,6 +168,11 @@ class ExtractionProcess(DeclarativeAggregate[ExtractionProcessState]):
 
     aggregate_type = "ExtractionProcess"
 
+    # Version of ExtractionProcessState stored in snapshots. Increment on any
+    # incompatible state change; older snapshots are then ignored and the
+    # aggregate is rebuilt from its events.
+    schema_version = 1
+
     def _get_initial_state(self) -> ExtractionProcessState:
         """Return the initial state for a new extraction process."""
         # Initial state is populated by ExtractionRequested event
@@ -279,8 +289,6 @@ class ExtractionProcess(DeclarativeAggregate[ExtractionProcessState]):
                 f"Extraction must be IN_PROGRESS."
             )
 
-        from uuid import uuid4
-
         entity_id = uuid4()
 
         self.create_event(
@@ -333,8 +341,6 @@ class ExtractionProcess(DeclarativeAggregate[ExtractionProcessState]):
                 f"Extraction must be IN_PROGRESS."
             )
 
-        from uuid import uuid4
-
         relationship_id = uuid4()
 
         self.create_event(
@@ -350,6 +356,147 @@ class ExtractionProcess(DeclarativeAggregate[ExtractionProcessState]):
         )
         return relationship_id
 
+    def record_entities(
+        self,
+        entities: Sequence[dict],
+        job_id: UUID | None = None,
+        extraction_method: str = "llm",
+    ) -> list[UUID]:
+        """
+        Record all entities extracted from the page with a single event.
+
+        Each dict takes the keyword arguments of record_entity():
+        entity_type, name, normalized_name and optionally properties,
+        confidence_score, description and source_text.
+
+        Args:
+            entities: Extracted entities
+            job_id: Optional job ID for tracking
+            extraction_method: How the entities were extracted
+
+        Returns:
+            UUIDs of the created entities, in input order (no event is
+            emitted for an empty list)
+
+        Raises:
+            ValueError: If extraction is not IN_PROGRESS
+        """
+        if self._state is None:
+            raise ValueError("Cannot record entities: extraction not yet requested")
+
+        if self._state.status != ExtractionStatus.IN_PROGRESS:
+            raise ValueError(
+                f"Cannot record entities in {self._state.status.value} status. "
+                f"Extraction must be IN_PROGRESS."
+            )
+
+        if not entities:
+            return []
+
+        entity_ids = [uuid4() for _ in entities]
+
+        self.create_event(
+            EntitiesRecordedBatch,
+            tenant_id=self._state.tenant_id,
+            page_id=self._state.page_id,
+            job_id=job_id or self._state.page_id,  # Fallback to page_id if no job
+            extraction_method=extraction_method,
+            entity_ids=entity_ids,
+            entity_types=[entity["entity_type"] for entity in entities],
+            names=[entity["name"] for entity in entities],
+            normalized_names=[entity["normalized_name"] for entity in entities],
+            descriptions=[entity.get("description") for entity in entities],
+            properties=[entity.get("properties") or {} for entity in entities],
+            confidence_scores=[entity.get("confidence_score", 1.0) for entity in entities],
+            source_texts=[entity.get("source_text") for entity in entities],
+        )
+        return entity_ids
+
+    def retract_entities(self, entity_ids: Sequence[UUID], reason: str) -> None:
+        """
+        Withdraw entities recorded earlier in this extraction.
+
+        Used when entities recorded while a response streamed in turn out
+        to belong to a response that fails validation.
+
+        Args:
+            entity_ids: IDs returned by record_entities()
+            reason: Why the entities are withdrawn
+
+        Raises:
+            ValueError: If extraction is not IN_PROGRESS or an ID was not
+                recorded by this extraction
+        """
+        if self._state is None:
+            raise ValueError("Cannot retract entities: extraction not yet requested")
+
+        if self._state.status != ExtractionStatus.IN_PROGRESS:
+            raise ValueError(
+                f"Cannot retract entities in {self._state.status.value} status. "
+                f"Extraction must be IN_PROGRESS."
+            )
+
+        if not entity_ids:
+            return
+
+        recorded = {entity.entity_id for entity in self._state.entities}
+        unknown = [entity_id for entity_id in entity_ids if entity_id not in recorded]
+        if unknown:
+            raise ValueError(f"Cannot retract entities not recorded by this extraction: {unknown}")
+
+        self.create_event(
+            EntitiesRetracted,
+            tenant_id=self._state.tenant_id,
+            page_id=self._state.page_id,
+            entity_ids=list(entity_ids),
+            reason=reason,
+        )
+
+    def record_relationships(self, relationships: Sequence[dict]) -> list[UUID]:
+        """
+        Record all relationships discovered on the page with a single event.
+
+        Each dict takes the keyword arguments of record_relationship():
+        source_entity_name, target_entity_name, relationship_type and
+        optionally confidence_score and context.
+
+        Args:
+            relationships: Discovered relationships
+
+        Returns:
+            UUIDs of the created relationships, in input order (no event is
+            emitted for an empty list)
+
+        Raises:
+            ValueError: If extraction is not IN_PROGRESS
+        """
+        if self._state is None:
+            raise ValueError("Cannot record relationships: extraction not yet requested")
+
+        if self._state.status != ExtractionStatus.IN_PROGRESS:
+            raise ValueError(
+                f"Cannot record relationships in {self._state.status.value} status. "
+                f"Extraction must be IN_PROGRESS."
+            )
+
+        if not relationships:
+            return []
+
+        relationship_ids = [uuid4() for _ in relationships]
+
+        self.create_event(
+            RelationshipsRecordedBatch,
+            tenant_id=self._state.tenant_id,
+            page_id=self._state.page_id,
+            relationship_ids=relationship_ids,
+            source_entity_names=[rel["source_entity_name"] for rel in relationships],
+            target_entity_names=[rel["target_entity_name"] for rel in relationships],
+            relationship_types=[rel["relationship_type"] for rel in relationships],
+            confidence_scores=[rel.get("confidence_score", 1.0) for rel in relationships],
+            contexts=[rel.get("context") for rel in relationships],
+        )
+        return relationship_ids
+
     def complete(self, duration_ms: int, extraction_method: str) -> None:
         """
         Mark extraction as complete.
@@ -484,41 +631,67 @@ class ExtractionProcess(DeclarativeAggregate[ExtractionProcessState]):
 
     @handles(EntityExtracted)
     def _on_entity_extracted(self, event: EntityExtracted) -> None:
-        """Handle EntityExtracted event - record extracted entity."""
+        """Handle legacy EntityExtracted event - upcast to a one-entity batch."""
+        self._on_entities_recorded_batch(EntitiesRecordedBatch.from_entity_events([event]))
+
+    @handles(EntitiesRecordedBatch)
+    def _on_entities_recorded_batch(self, event: EntitiesRecordedBatch) -> None:
+        """Handle EntitiesRecordedBatch event - record extracted entities."""
         if self._state is None:
             return
 
-        entity_record = ExtractedEntityRecord(
-            entity_id=event.entity_id,
-            entity_type=event.entity_type,
-            name=event.name,
-            normalized_name=event.normalized_name,
-            properties=event.properties,
-            confidence_score=event.confidence_score,
-            source_text=event.source_text,
+        entity_records = [
+            ExtractedEntityRecord(
+                entity_id=entity["entity_id"],
+                entity_type=entity["entity_type"],
+                name=entity["name"],
+                normalized_name=entity["normalized_name"],
+                properties=entity["properties"],
+                confidence_score=entity["confidence_score"],
+                source_text=entity["source_text"],
+            )
+            for entity in event.entities()
+        ]
+
+        self._state = self._state.model_copy(
+            update={"entities": [*self._state.entities, *entity_records]}
         )
 
+    @handles(EntitiesRetracted)
+    def _on_entities_retracted(self, event: EntitiesRetracted) -> None:
+        """Handle EntitiesRetracted event - drop the retracted entities."""
+        if self._state is None:
+            return
+
+        retracted = set(event.entity_ids)
         self._state = self._state.model_copy(
-            update={"entities": [*self._state.entities, entity_record]}
+            update={
+                "entities": [
+                    entity for entity in self._state.entities if entity.entity_id not in retracted
+                ]
+            }
         )
 
     @handles(RelationshipDiscovered)
     def _on_relationship_discovered(self, event: RelationshipDiscovered) -> None:
-        """Handle RelationshipDiscovered event - record relationship."""
+        """Handle legacy RelationshipDiscovered event - upcast to a one-relationship batch."""
+        self._on_relationships_recorded_batch(
+            RelationshipsRecordedBatch.from_relationship_events([event])
+        )
+
+    @handles(RelationshipsRecordedBatch)
+    def _on_relationships_recorded_batch(self, event: RelationshipsRecordedBatch) -> None:
+        """Handle RelationshipsRecordedBatch event - record relationships."""
         if self._state is None:
             return
 
-        relationship_record = ExtractedRelationshipRecord(
-            relationship_id=event.relationship_id,
-            source_entity_name=event.source_entity_name,
-            target_entity_name=event.target_entity_name,
-            relationship_type=event.relationship_type,
-            confidence_score=event.confidence_score,
-            context=event.context,
-        )
+        relationship_records = [
+            ExtractedRelationshipRecord(**relationship)
+            for relationship in event.relationships()
+        ]
 
         self._state = self._state.model_copy(
-            update={"relationships": [*self._state.relationships, relationship_record]}
+            update={"relationships": [*self._state.relationships, *relationship_records]}
         )
 
     @handles(ExtractionCompleted)
@@ -579,6 +752,9 @@ class ExtractionProcess(DeclarativeAggregate[ExtractionProcessState]):
 
 def create_extraction_process_repository(
     event_store: "EventStore",
+    snapshot_store: "SnapshotStore | None" = None,
+    snapshot_threshold: int | None = None,
+    snapshot_mode: str | None = None,
 ) -> "AggregateRepository[ExtractionProcess]":
     """
     Create a repository for ExtractionProcess aggregates.
@@ -586,8 +762,21 @@ def create_extraction_process_repository(
     This factory function provides a convenient way to create properly
     configured repositories for extraction process management.
 
+    A run records its entities and relationships as one EntitiesRecordedBatch
+    and one RelationshipsRecordedBatch event, so a stream grows by a few
+    events per run; it only reaches snapshot_threshold events for processes
+    that are retried or re-extracted many times, or that record items one
+    at a time with record_entity()/record_relationship(). With a snapshot
+    store the repository then saves the state every snapshot_threshold
+    events and loads from the latest snapshot plus the events after it.
+
     Args:
         event_store: The event store for persistence
+        snapshot_store: Optional snapshot store (see get_snapshot_store())
+        snapshot_threshold: Events between snapshots (defaults to
+            settings.SNAPSHOT_THRESHOLD)
+        snapshot_mode: "sync", "background" or "manual" (defaults to
+            settings.SNAPSHOT_MODE)
 
     Returns:
         Configured AggregateRepository for ExtractionProcess
@@ -600,10 +789,22 @@ def create_extraction_process_repository(
     """
     from eventsource import AggregateRepository
 
+    if snapshot_store is None:
+        return AggregateRepository(
+            event_store=event_store,
+            aggregate_factory=ExtractionProcess,
+            aggregate_type="ExtractionProcess",
+        )
+
+    from app.core.config import settings
+
     return AggregateRepository(
         event_store=event_store,
         aggregate_factory=ExtractionProcess,
         aggregate_type="ExtractionProcess",
+        snapshot_store=snapshot_store,
+        snapshot_threshold=snapshot_threshold or settings.SNAPSHOT_THRESHOLD,
+        snapshot_mode=snapshot_mode or settings.SNAPSHOT_MODE,
     )
 
 
@@ -16,6 +16,8 @@ from app.eventsourcing.events.consolidation import (
     MergeUndone,
 )
 from app.eventsourcing.events.extraction import (
+    EntitiesRecordedBatch,
+    EntitiesRetracted,
     ExtractionBatchCompleted,
     ExtractionBatchStarted,
     ExtractionCompleted,
@@ -24,6 +26,7 @@ from app.eventsourcing.events.extraction import (
     ExtractionRetryScheduled,
     ExtractionStarted,
     RelationshipDiscovered,
+    RelationshipsRecordedBatch,
 )
 from app.eventsourcing.events.inference import (
     InferenceCancelled,
@@ -84,6 +87,9 @@ __all__ = [
     "ExtractionProcessFailed",
     "ExtractionRetryScheduled",
     "RelationshipDiscovered",
+    "EntitiesRecordedBatch",
+    "RelationshipsRecordedBatch",
+    "EntitiesRetracted",
     "ExtractionBatchStarted",
     "ExtractionBatchCompleted",
     # Neo4j sync events
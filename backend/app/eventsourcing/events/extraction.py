@@ -6,13 +6,16 @@ initial request through to completion or failure. They are designed
 to drive the event-sourced extraction architecture.
 """
 
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 from eventsource import register_event
+from pydantic import model_validator
 
 from app.eventsourcing.events.base import TenantDomainEvent
+from app.eventsourcing.events.scraping import EntityExtracted
 
 
 # =============================================================================
@@ -115,6 +118,230 @@ class RelationshipDiscovered(TenantDomainEvent):
     context: Optional[str] = None
 
 
+# =============================================================================
+# Recorded Batch Events
+# =============================================================================
+
+
+def _check_columns(event: TenantDomainEvent, columns: Sequence[str]) -> None:
+    """Raise ValueError unless all columnar fields have the same length."""
+    lengths = {name: len(getattr(event, name)) for name in columns}
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"Columns of {event.event_type} differ in length: {lengths}")
+
+
+_ENTITY_COLUMNS = (
+    "entity_ids",
+    "entity_types",
+    "names",
+    "normalized_names",
+    "descriptions",
+    "properties",
+    "confidence_scores",
+    "source_texts",
+)
+
+
+@register_event
+class EntitiesRecordedBatch(TenantDomainEvent):
+    """Emitted once per page with all entities recorded for it.
+
+    Replaces one EntityExtracted event per entity. The payload is columnar:
+    position i of every list describes entity i, so field names are stored
+    once per batch instead of once per entity. Legacy EntityExtracted
+    events are upcast with from_entity_events().
+    """
+
+    event_type: str = "EntitiesRecordedBatch"
+    aggregate_type: str = "ExtractionProcess"
+
+    page_id: UUID
+    job_id: UUID
+    extraction_method: str
+
+    entity_ids: list[UUID]
+    entity_types: list[str]
+    names: list[str]
+    normalized_names: list[str]
+    descriptions: list[Optional[str]]
+    properties: list[dict]
+    confidence_scores: list[float]
+    source_texts: list[Optional[str]]
+
+    @model_validator(mode="after")
+    def _columns_match(self) -> "EntitiesRecordedBatch":
+        _check_columns(self, _ENTITY_COLUMNS)
+        return self
+
+    @property
+    def entity_count(self) -> int:
+        """Number of entities in the batch."""
+        return len(self.entity_ids)
+
+    def entities(self) -> list[dict]:
+        """Entities as one dict per entity, keyed like EntityExtracted fields."""
+        return [
+            {
+                "entity_id": entity_id,
+                "entity_type": entity_type,
+                "name": name,
+                "normalized_name": normalized_name,
+                "description": description,
+                "properties": properties,
+                "confidence_score": confidence_score,
+                "source_text": source_text,
+            }
+            for (
+                entity_id,
+                entity_type,
+                name,
+                normalized_name,
+                description,
+                properties,
+                confidence_score,
+                source_text,
+            ) in zip(*(getattr(self, column) for column in _ENTITY_COLUMNS), strict=True)
+        ]
+
+    @classmethod
+    def from_entity_events(cls, events: Sequence[EntityExtracted]) -> "EntitiesRecordedBatch":
+        """
+        Upcast per-entity events of one page into a batch.
+
+        Args:
+            events: Non-empty EntityExtracted events from the same page
+
+        Returns:
+            Equivalent batch event carrying the first event's metadata
+        """
+        first = events[0]
+        return cls(
+            event_id=first.event_id,
+            aggregate_id=first.aggregate_id,
+            aggregate_version=first.aggregate_version,
+            tenant_id=first.tenant_id,
+            occurred_at=first.occurred_at,
+            page_id=first.page_id,
+            job_id=first.job_id,
+            extraction_method=first.extraction_method,
+            entity_ids=[event.entity_id for event in events],
+            entity_types=[event.entity_type for event in events],
+            names=[event.name for event in events],
+            normalized_names=[event.normalized_name for event in events],
+            descriptions=[event.description for event in events],
+            properties=[event.properties for event in events],
+            confidence_scores=[event.confidence_score for event in events],
+            source_texts=[event.source_text for event in events],
+        )
+
+
+_RELATIONSHIP_COLUMNS = (
+    "relationship_ids",
+    "source_entity_names",
+    "target_entity_names",
+    "relationship_types",
+    "confidence_scores",
+    "contexts",
+)
+
+
+@register_event
+class RelationshipsRecordedBatch(TenantDomainEvent):
+    """Emitted once per page with all relationships discovered on it.
+
+    Columnar counterpart of RelationshipDiscovered; see EntitiesRecordedBatch.
+    """
+
+    event_type: str = "RelationshipsRecordedBatch"
+    aggregate_type: str = "ExtractionProcess"
+
+    page_id: UUID
+
+    relationship_ids: list[UUID]
+    source_entity_names: list[str]
+    target_entity_names: list[str]
+    relationship_types: list[str]
+    confidence_scores: list[float]
+    contexts: list[Optional[str]]
+
+    @model_validator(mode="after")
+    def _columns_match(self) -> "RelationshipsRecordedBatch":
+        _check_columns(self, _RELATIONSHIP_COLUMNS)
+        return self
+
+    @property
+    def relationship_count(self) -> int:
+        """Number of relationships in the batch."""
+        return len(self.relationship_ids)
+
+    def relationships(self) -> list[dict]:
+        """Relationships as one dict per relationship, keyed like RelationshipDiscovered."""
+        return [
+            {
+                "relationship_id": relationship_id,
+                "source_entity_name": source_entity_name,
+                "target_entity_name": target_entity_name,
+                "relationship_type": relationship_type,
+                "confidence_score": confidence_score,
+                "context": context,
+            }
+            for (
+                relationship_id,
+                source_entity_name,
+                target_entity_name,
+                relationship_type,
+                confidence_score,
+                context,
+            ) in zip(*(getattr(self, column) for column in _RELATIONSHIP_COLUMNS), strict=True)
+        ]
+
+    @classmethod
+    def from_relationship_events(
+        cls, events: Sequence["RelationshipDiscovered"]
+    ) -> "RelationshipsRecordedBatch":
+        """
+        Upcast per-relationship events of one page into a batch.
+
+        Args:
+            events: Non-empty RelationshipDiscovered events from the same page
+
+        Returns:
+            Equivalent batch event carrying the first event's metadata
+        """
+        first = events[0]
+        return cls(
+            event_id=first.event_id,
+            aggregate_id=first.aggregate_id,
+            aggregate_version=first.aggregate_version,
+            tenant_id=first.tenant_id,
+            occurred_at=first.occurred_at,
+            page_id=first.page_id,
+            relationship_ids=[event.relationship_id for event in events],
+            source_entity_names=[event.source_entity_name for event in events],
+            target_entity_names=[event.target_entity_name for event in events],
+            relationship_types=[event.relationship_type for event in events],
+            confidence_scores=[event.confidence_score for event in events],
+            contexts=[event.context for event in events],
+        )
+
+
+@register_event
+class EntitiesRetracted(TenantDomainEvent):
+    """Emitted when entities recorded while streaming are withdrawn.
+
+    Streaming extraction records entities before the complete response is
+    validated. If that validation fails, the entities are retracted and the
+    extraction result recorded afresh.
+    """
+
+    event_type: str = "EntitiesRetracted"
+    aggregate_type: str = "ExtractionProcess"
+
+    page_id: UUID
+    entity_ids: list[UUID]
+    reason: str
+
+
 # =============================================================================
 # Batch Events (for performance optimization)
 # =============================================================================
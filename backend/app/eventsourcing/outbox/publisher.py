@@ -1,39 +1,80 @@
 """
 Outbox publisher for reliable event delivery to Kafka.
 
-Implements the transactional outbox pattern by polling the outbox table
+Implements the transactional outbox pattern by reading the outbox table
 and publishing events to Kafka with proper tenant-based topic routing.
+
+Each batch is locked with FOR UPDATE SKIP LOCKED, grouped by topic and
+published with one bus call per topic; the topics of a batch are published
+concurrently. Published entries are marked with a single UPDATE. Between
+batches the publisher waits for a NOTIFY on the event_outbox channel (sent
+by a trigger on insert) and backs off exponentially while the outbox stays
+empty, so an idle publisher rarely queries the table. If the LISTEN
+connection is lost, it is re-established on the next loop iteration.
+
+Several publishers (e.g., one per API replica) can run at once: SKIP LOCKED
+hands each of them different entries. Ordering is then only guaranteed
+within a batch, so consumers should order by aggregate version.
+
+The outbox is partitioned by day on created_at (see the partition_event_outbox
+migration). Pending entries are read in (created_at, id) order, which the
+partial pending index serves directly, and status updates are bounded by the
+batch's oldest created_at so they only touch the partitions involved.
+Published partitions are dropped by the maintain_outbox_partitions task;
+failed entries of an expired partition are moved to event_outbox_failed.
 """
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import select, update
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import any_, bindparam, case, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from prometheus_client import Histogram
 
 from eventsource import DomainEvent
 from eventsource.bus import EventBus
 from eventsource.events import default_registry
 
 from app.core.config import settings
-from app.core.database import AsyncSessionLocal
+from app.core.database import AsyncSessionLocal, engine
 
 logger = logging.getLogger(__name__)
 
+# Channel notified by the event_outbox insert trigger
+OUTBOX_CHANNEL = "event_outbox"
+
+# Time from outbox insert to successful publish
+outbox_publish_latency_seconds = Histogram(
+    name="outbox_publish_latency_seconds",
+    documentation="Seconds between an event entering the outbox and its publication",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+
+# Duration of the locked pending-entries query
+outbox_fetch_duration_seconds = Histogram(
+    name="outbox_fetch_duration_seconds",
+    documentation="Seconds spent reading a batch of pending outbox entries",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
 
 class OutboxPublisher:
     """
     Background task that publishes events from the outbox to Kafka.
 
-    The publisher polls the outbox table for pending events and publishes
+    The publisher reads pending events from the outbox table and publishes
     them to tenant-specific Kafka topics. Events are marked as published
     after successful delivery.
 
     Features:
     - Tenant-based topic routing (events.tenant-{id}.{aggregate_type})
+    - One publish call per topic and one status update per batch
+    - LISTEN/NOTIFY wakeups with adaptive backoff while idle
     - Automatic retry with exponential backoff
     - Dead letter handling for persistently failing events
     - Graceful shutdown support
@@ -52,28 +93,41 @@ class OutboxPublisher:
         poll_interval: float = 0.1,
         batch_size: int = 100,
         max_retries: int = 5,
+        max_idle_interval: float = 5.0,
+        listen: bool = True,
     ):
         """
         Initialize the outbox publisher.
 
         Args:
             kafka_bus: Kafka bus for publishing events
-            poll_interval: Seconds between polls (default 100ms)
+            poll_interval: Seconds between polls while events are flowing
+                (default 100ms)
             batch_size: Maximum events per batch
             max_retries: Max retry attempts before marking as failed
+            max_idle_interval: Longest wait between polls while the outbox
+                is empty; NOTIFY wakes the publisher earlier
+            listen: Wake up on NOTIFY from the outbox insert trigger
         """
         self._kafka_bus = kafka_bus
         self._poll_interval = poll_interval
         self._batch_size = batch_size
         self._max_retries = max_retries
+        self._max_idle_interval = max(max_idle_interval, poll_interval)
+        self._listen = listen
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._listen_connection: Optional[AsyncConnection] = None
+        self._listen_driver_connection: Any = None
+        # Set when the LISTEN connection is lost, until LISTEN succeeds again
+        self._relisten = False
 
     async def start(self) -> None:
         """
         Start the outbox publisher background task.
 
-        Creates an asyncio task that continuously polls the outbox
+        Creates an asyncio task that continuously reads the outbox
         and publishes events. The task runs until stop() is called.
         """
         if self._running:
@@ -86,6 +140,7 @@ class OutboxPublisher:
             "Outbox publisher started",
             extra={
                 "poll_interval": self._poll_interval,
+                "max_idle_interval": self._max_idle_interval,
                 "batch_size": self._batch_size,
             },
         )
@@ -101,6 +156,7 @@ class OutboxPublisher:
             return
 
         self._running = False
+        self._wakeup.set()
         if self._task:
             try:
                 await asyncio.wait_for(self._task, timeout=5.0)
@@ -115,23 +171,129 @@ class OutboxPublisher:
         logger.info("Outbox publisher stopped")
 
     async def _run(self) -> None:
-        """Main loop that polls and publishes events."""
-        while self._running:
-            try:
-                published_count = await self._publish_batch()
-                if published_count > 0:
-                    logger.debug(
-                        "Published events from outbox",
-                        extra={"count": published_count},
+        """Main loop that publishes batches and waits for new events."""
+        await self._start_listening()
+        idle_interval = self._poll_interval
+        try:
+            while self._running:
+                # Cleared before reading, so a NOTIFY during the batch is kept
+                self._wakeup.clear()
+                await self._ensure_listening()
+                published_count = 0
+                try:
+                    published_count = await self._publish_batch()
+                    if published_count > 0:
+                        logger.debug(
+                            "Published events from outbox",
+                            extra={"count": published_count},
+                        )
+                except Exception as e:
+                    logger.error(
+                        "Error in outbox publisher",
+                        extra={"error": str(e)},
+                        exc_info=True,
                     )
-            except Exception as e:
-                logger.error(
-                    "Error in outbox publisher",
-                    extra={"error": str(e)},
-                    exc_info=True,
-                )
 
-            await asyncio.sleep(self._poll_interval)
+                if published_count >= self._batch_size:
+                    # More events are likely pending; read the next batch now
+                    idle_interval = self._poll_interval
+                    continue
+
+                notified = await self._wait_for_wakeup(idle_interval)
+                if notified or published_count > 0:
+                    idle_interval = self._poll_interval
+                else:
+                    idle_interval = min(idle_interval * 2, self._max_idle_interval)
+        finally:
+            await self._stop_listening()
+
+    async def _wait_for_wakeup(self, timeout: float) -> bool:
+        """
+        Wait for a NOTIFY (or stop) for at most timeout seconds.
+
+        Returns:
+            True if woken up before the timeout
+        """
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _start_listening(self) -> None:
+        """LISTEN on the outbox channel; falls back to polling on failure."""
+        if not self._listen:
+            return
+        connection: Optional[AsyncConnection] = None
+        try:
+            connection = await engine.connect()
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            await driver_connection.add_listener(OUTBOX_CHANNEL, self._on_notify)
+            driver_connection.add_termination_listener(self._on_listen_terminated)
+        except Exception as e:
+            logger.warning(
+                "Outbox LISTEN unavailable, polling with backoff only",
+                extra={"error": str(e)},
+            )
+            if connection is not None:
+                await connection.close()
+            return
+        self._listen_connection = connection
+        self._listen_driver_connection = driver_connection
+
+    async def _ensure_listening(self) -> None:
+        """Re-establish LISTEN if its connection was lost.
+
+        NOTIFYs sent while the connection was down are not delivered; the
+        batch read that follows picks up their events.
+        """
+        driver_connection = self._listen_driver_connection
+        if driver_connection is not None and driver_connection.is_closed():
+            self._relisten = True
+        if not self._relisten:
+            return
+
+        if self._listen_connection is not None:
+            logger.warning("Outbox LISTEN connection lost, reconnecting")
+            try:
+                await self._listen_connection.invalidate()
+            except Exception as e:
+                logger.debug("Failed to invalidate outbox LISTEN connection: %s", e)
+            self._listen_connection = None
+            self._listen_driver_connection = None
+
+        await self._start_listening()
+        if self._listen_connection is not None:
+            self._relisten = False
+            logger.info("Outbox LISTEN re-established")
+
+    async def _stop_listening(self) -> None:
+        """Remove the listener and return its connection to the pool."""
+        if self._listen_connection is None:
+            return
+        try:
+            await self._listen_driver_connection.remove_listener(
+                OUTBOX_CHANNEL, self._on_notify
+            )
+            self._listen_driver_connection.remove_termination_listener(
+                self._on_listen_terminated
+            )
+        except Exception as e:
+            logger.debug("Failed to remove outbox listener: %s", e)
+        finally:
+            await self._listen_connection.close()
+            self._listen_connection = None
+            self._listen_driver_connection = None
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """asyncpg notification callback."""
+        self._wakeup.set()
+
+    def _on_listen_terminated(self, connection: Any) -> None:
+        """asyncpg termination callback of the LISTEN connection."""
+        self._relisten = True
+        self._wakeup.set()
 
     async def _publish_batch(self) -> int:
         """
@@ -141,93 +303,146 @@ class OutboxPublisher:
             Number of events published
         """
         async with AsyncSessionLocal() as session:
-            # Fetch pending events
+            # Fetch pending events, oldest first (served by idx_outbox_pending)
+            fetch_started = time.perf_counter()
             result = await session.execute(
                 select(OutboxEntry)
                 .where(OutboxEntry.status == "pending")
-                .order_by(OutboxEntry.id)
+                .order_by(OutboxEntry.created_at, OutboxEntry.id)
                 .limit(self._batch_size)
                 .with_for_update(skip_locked=True)
             )
             entries = result.scalars().all()
+            outbox_fetch_duration_seconds.observe(time.perf_counter() - fetch_started)
 
             if not entries:
                 return 0
 
-            published_count = 0
+            # Group by topic, keeping outbox order within each topic
+            topics: dict[str, list[tuple[OutboxEntry, DomainEvent]]] = {}
             for entry in entries:
                 try:
-                    await self._publish_entry(session, entry)
-                    published_count += 1
+                    event = self._reconstruct_event(entry)
                 except Exception as e:
-                    await self._handle_failure(session, entry, e)
+                    await self._handle_failure(session, [entry], e)
+                    continue
+                topic = self._build_topic(entry.tenant_id, entry.aggregate_type)
+                topics.setdefault(topic, []).append((entry, event))
+
+            outcomes = await asyncio.gather(
+                *(self._publish_topic(topic, group) for topic, group in topics.items()),
+                return_exceptions=True,
+            )
+
+            published: list[OutboxEntry] = []
+            for group, outcome in zip(topics.values(), outcomes, strict=True):
+                group_entries = [entry for entry, _ in group]
+                if isinstance(outcome, Exception):
+                    await self._handle_failure(session, group_entries, outcome)
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    published.extend(group_entries)
+
+            if published:
+                # Mark as published
+                published_at = datetime.now(timezone.utc)
+                await session.execute(
+                    update(OutboxEntry)
+                    .where(
+                        OutboxEntry.id == any_(_ENTRY_IDS),
+                        OutboxEntry.created_at >= _OLDEST_CREATED_AT,
+                    )
+                    .values(status="published", published_at=published_at)
+                    .execution_options(synchronize_session=False),
+                    {
+                        "entry_ids": [entry.id for entry in published],
+                        "oldest_created_at": min(entry.created_at for entry in published),
+                    },
+                )
 
             await session.commit()
-            return published_count
 
-    async def _publish_entry(self, session: AsyncSession, entry: "OutboxEntry") -> None:
+            if published:
+                for entry in published:
+                    outbox_publish_latency_seconds.observe(
+                        max((published_at - entry.created_at).total_seconds(), 0.0)
+                    )
+            return len(published)
+
+    async def _publish_topic(
+        self, topic: str, group: list[tuple["OutboxEntry", DomainEvent]]
+    ) -> None:
         """
-        Publish a single outbox entry to Kafka.
+        Publish the entries of one topic with a single bus call.
 
         Args:
-            session: Database session for updating status
-            entry: Outbox entry to publish
+            topic: Kafka topic of the entries
+            group: Outbox entries with their reconstructed events, in order
         """
-        # Reconstruct the event from stored data
-        event = self._reconstruct_event(entry)
-
-        # Build tenant-specific topic
-        topic = self._build_topic(entry.tenant_id, entry.aggregate_type)
-
-        # Publish to Kafka
-        await self._kafka_bus.publish([event], topic=topic)
-
-        # Mark as published
-        entry.status = "published"
-        entry.published_at = datetime.now(timezone.utc)
+        await self._kafka_bus.publish([event for _, event in group], topic=topic)
 
         logger.debug(
-            "Published event to Kafka",
+            "Published events to Kafka",
             extra={
-                "event_id": str(entry.event_id),
                 "topic": topic,
-                "event_type": entry.event_type,
+                "count": len(group),
+                "event_ids": [str(entry.event_id) for entry, _ in group],
             },
         )
 
     async def _handle_failure(
-        self, session: AsyncSession, entry: "OutboxEntry", error: Exception
+        self, session: AsyncSession, entries: list["OutboxEntry"], error: Exception
     ) -> None:
         """
         Handle a failed publish attempt.
 
         Args:
             session: Database session
-            entry: Failed outbox entry
+            entries: Outbox entries that failed together
             error: The exception that occurred
         """
-        entry.retry_count += 1
-        entry.last_error = str(error)
-
-        if entry.retry_count >= self._max_retries:
-            entry.status = "failed"
-            logger.error(
-                "Event publish failed after max retries",
-                extra={
-                    "event_id": str(entry.event_id),
-                    "retry_count": entry.retry_count,
-                    "error": str(error),
-                },
+        retry_count = OutboxEntry.retry_count + 1
+        await session.execute(
+            update(OutboxEntry)
+            .where(
+                OutboxEntry.id == any_(_ENTRY_IDS),
+                OutboxEntry.created_at >= _OLDEST_CREATED_AT,
             )
-        else:
-            logger.warning(
-                "Event publish failed, will retry",
-                extra={
-                    "event_id": str(entry.event_id),
-                    "retry_count": entry.retry_count,
-                    "error": str(error),
-                },
+            .values(
+                retry_count=retry_count,
+                last_error=str(error),
+                status=case(
+                    (retry_count >= self._max_retries, "failed"),
+                    else_=OutboxEntry.status,
+                ),
             )
+            .execution_options(synchronize_session=False),
+            {
+                "entry_ids": [entry.id for entry in entries],
+                "oldest_created_at": min(entry.created_at for entry in entries),
+            },
+        )
+
+        for entry in entries:
+            if entry.retry_count + 1 >= self._max_retries:
+                logger.error(
+                    "Event publish failed after max retries",
+                    extra={
+                        "event_id": str(entry.event_id),
+                        "retry_count": entry.retry_count + 1,
+                        "error": str(error),
+                    },
+                )
+            else:
+                logger.warning(
+                    "Event publish failed, will retry",
+                    extra={
+                        "event_id": str(entry.event_id),
+                        "retry_count": entry.retry_count + 1,
+                        "error": str(error),
+                    },
+                )
 
     def _reconstruct_event(self, entry: "OutboxEntry") -> DomainEvent:
         """
@@ -282,5 +497,13 @@ class OutboxEntry(OutboxBase):
     status = Column(String(20), nullable=False, default="pending")
     retry_count = Column(Integer, nullable=False, default=0)
     last_error = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False)
+    # Partition key, part of the primary key of the partitioned table
+    created_at = Column(DateTime(timezone=True), primary_key=True, nullable=False)
     published_at = Column(DateTime(timezone=True), nullable=True)
+
+
+# Outbox entry IDs bound as one array parameter (WHERE id = ANY(:entry_ids))
+_ENTRY_IDS = bindparam("entry_ids", type_=ARRAY(PGUUID(as_uuid=True)))
+
+# Lower created_at bound of a status update, so only the batch's partitions are scanned
+_OLDEST_CREATED_AT = bindparam("oldest_created_at", type_=DateTime(timezone=True))
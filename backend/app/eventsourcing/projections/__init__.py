@@ -14,6 +14,7 @@ from app.eventsourcing.projections.neo4j_sync import (
     Neo4jEntitySyncHandler,
     Neo4jRelationshipSyncHandler,
 )
+from app.eventsourcing.projections.partitioned import CatchUpSummary, PartitionedCatchUp
 
 __all__ = [
     # Base classes
@@ -28,6 +29,9 @@ __all__ = [
     "Neo4jRelationshipSyncHandler",
     # Consolidation projections
     "ConsolidationProjectionHandler",
+    # Partitioned catch-up
+    "CatchUpSummary",
+    "PartitionedCatchUp",
     # Utilities
     "map_entity_type",
     "map_extraction_method",
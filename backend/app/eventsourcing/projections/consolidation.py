@@ -9,7 +9,7 @@ Handlers update:
 - extracted_entities: Entity status, canonical flags
 - entity_aliases: Alias records
 - merge_review_queue: Review item status
-- Denormalized views for entity counts and relationships
+- graph_statistics: Canonical entity counts (decremented on merge/split)
 """
 
 from __future__ import annotations
@@ -31,6 +31,7 @@ from app.eventsourcing.events.consolidation import (
     MergeReviewDecision,
     MergeUndone,
 )
+from app.services.graph_stats import stats_delta_sql
 
 if TYPE_CHECKING:
     from eventsource.repositories import CheckpointRepository, DLQRepository
@@ -108,15 +109,26 @@ class ConsolidationProjectionHandler(DatabaseProjection):
         tenant_id = event.tenant_id
 
         try:
-            # Update merged entities to point to canonical
+            # Update merged entities to point to canonical. Entities that were
+            # still canonical before this statement are subtracted from the
+            # tenant's graph statistics (replays find none and change nothing).
             update_merged_sql = text("""
-                UPDATE extracted_entities
-                SET is_canonical = FALSE,
-                    is_alias_of = :canonical_id,
-                    updated_at = NOW()
-                WHERE id = ANY(:merged_ids)
-                  AND tenant_id = :tenant_id
-            """)
+                WITH demoted AS (
+                    SELECT tenant_id, entity_type
+                    FROM extracted_entities
+                    WHERE id = ANY(:merged_ids)
+                      AND tenant_id = :tenant_id
+                      AND is_canonical = TRUE
+                ),
+                updated AS (
+                    UPDATE extracted_entities
+                    SET is_canonical = FALSE,
+                        is_alias_of = :canonical_id,
+                        updated_at = NOW()
+                    WHERE id = ANY(:merged_ids)
+                      AND tenant_id = :tenant_id
+                )
+            """ + stats_delta_sql("demoted", "entity", sign=-1))
 
             await conn.execute(
                 update_merged_sql,
@@ -287,15 +299,25 @@ class ConsolidationProjectionHandler(DatabaseProjection):
         tenant_id = event.tenant_id
 
         try:
-            # Update original entity with split info
+            # Update original entity with split info, subtracting it from the
+            # tenant's graph statistics if it was still canonical
             update_original_sql = text("""
-                UPDATE extracted_entities
-                SET is_canonical = FALSE,
-                    properties = properties || :split_properties,
-                    updated_at = NOW()
-                WHERE id = :original_id
-                  AND tenant_id = :tenant_id
-            """)
+                WITH demoted AS (
+                    SELECT tenant_id, entity_type
+                    FROM extracted_entities
+                    WHERE id = :original_id
+                      AND tenant_id = :tenant_id
+                      AND is_canonical = TRUE
+                ),
+                updated AS (
+                    UPDATE extracted_entities
+                    SET is_canonical = FALSE,
+                        properties = properties || :split_properties,
+                        updated_at = NOW()
+                    WHERE id = :original_id
+                      AND tenant_id = :tenant_id
+                )
+            """ + stats_delta_sql("demoted", "entity", sign=-1))
 
             await conn.execute(
                 update_original_sql,
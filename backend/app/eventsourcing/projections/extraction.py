@@ -8,10 +8,12 @@ Handlers use:
 - DatabaseProjection from eventsource-py for transaction management
 - @handles decorator for declarative event routing
 - Upsert (INSERT ... ON CONFLICT) for idempotent event handling
+- Incremental graph_statistics updates folded into the same upsert statement
 """
 
 import json
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -20,14 +22,18 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection, async_sessionmaker, AsyncSession
 
 from app.eventsourcing.events.extraction import (
+    EntitiesRecordedBatch,
+    EntitiesRetracted,
     ExtractionCompleted,
     ExtractionProcessFailed,
     ExtractionRequested,
     ExtractionStarted,
     RelationshipDiscovered,
+    RelationshipsRecordedBatch,
 )
 from app.eventsourcing.events.scraping import EntityExtracted
 from app.models.extracted_entity import EntityType, ExtractionMethod
+from app.services.graph_stats import stats_delta_sql
 
 if TYPE_CHECKING:
     from eventsource.repositories import CheckpointRepository, DLQRepository
@@ -140,11 +146,13 @@ def map_extraction_method(method_str: str) -> str:
 
 class EntityProjectionHandler(DatabaseProjection):
     """
-    Projection handler for EntityExtracted events.
+    Projection handler for EntityExtracted, EntitiesRecordedBatch and
+    EntitiesRetracted events.
 
     Updates the extracted_entities table in PostgreSQL, creating or updating
-    entity records for each EntityExtracted event. Uses upsert semantics for
-    idempotent event handling.
+    entity records for each EntityExtracted event and each entity of an
+    EntitiesRecordedBatch event, and deleting retracted entities. Uses
+    upsert semantics for idempotent event handling.
 
     The handler maps event data to the database schema, including:
     - Converting entity_type strings to valid EntityType enum values
@@ -211,50 +219,58 @@ class EntityProjectionHandler(DatabaseProjection):
 
         # Upsert SQL using INSERT ... ON CONFLICT DO UPDATE
         # This ensures idempotent handling - replaying the same event
-        # will update to the same values
+        # will update to the same values. Newly inserted rows (xmax = 0)
+        # are also folded into the tenant's graph statistics in the same
+        # statement, so replays never double count.
         sql = text("""
-            INSERT INTO extracted_entities (
-                id,
-                tenant_id,
-                source_page_id,
-                entity_type,
-                name,
-                normalized_name,
-                description,
-                properties,
-                extraction_method,
-                confidence_score,
-                source_text,
-                external_ids,
-                created_at,
-                updated_at
-            ) VALUES (
-                :entity_id,
-                :tenant_id,
-                :page_id,
-                :entity_type,
-                :name,
-                :normalized_name,
-                :description,
-                :properties,
-                :extraction_method,
-                :confidence_score,
-                :source_text,
-                :external_ids,
-                NOW(),
-                NOW()
+            WITH upserted AS (
+                INSERT INTO extracted_entities (
+                    id,
+                    tenant_id,
+                    source_page_id,
+                    entity_type,
+                    name,
+                    normalized_name,
+                    description,
+                    properties,
+                    extraction_method,
+                    confidence_score,
+                    source_text,
+                    external_ids,
+                    created_at,
+                    updated_at
+                ) VALUES (
+                    :entity_id,
+                    :tenant_id,
+                    :page_id,
+                    :entity_type,
+                    :name,
+                    :normalized_name,
+                    :description,
+                    :properties,
+                    :extraction_method,
+                    :confidence_score,
+                    :source_text,
+                    :external_ids,
+                    NOW(),
+                    NOW()
+                )
+                ON CONFLICT (id) DO UPDATE SET
+                    entity_type = EXCLUDED.entity_type,
+                    name = EXCLUDED.name,
+                    normalized_name = EXCLUDED.normalized_name,
+                    description = EXCLUDED.description,
+                    properties = EXCLUDED.properties,
+                    extraction_method = EXCLUDED.extraction_method,
+                    confidence_score = EXCLUDED.confidence_score,
+                    source_text = EXCLUDED.source_text,
+                    updated_at = NOW()
+                RETURNING tenant_id, entity_type, (xmax = 0) AS inserted
+            ),
+            new_entities AS (
+                SELECT tenant_id, entity_type FROM upserted WHERE inserted
             )
-            ON CONFLICT (id) DO UPDATE SET
-                entity_type = EXCLUDED.entity_type,
-                name = EXCLUDED.name,
-                normalized_name = EXCLUDED.normalized_name,
-                description = EXCLUDED.description,
-                properties = EXCLUDED.properties,
-                extraction_method = EXCLUDED.extraction_method,
-                confidence_score = EXCLUDED.confidence_score,
-                source_text = EXCLUDED.source_text,
-                updated_at = NOW()
-        """)
+        """ + stats_delta_sql("new_entities", "entity"))
 
         await conn.execute(
             sql,
@@ -285,6 +301,168 @@ class EntityProjectionHandler(DatabaseProjection):
             },
         )
 
+    @handles(EntitiesRecordedBatch)
+    async def _handle_entities_recorded_batch(
+        self, conn: AsyncConnection, event: EntitiesRecordedBatch
+    ) -> None:
+        """
+        Handle EntitiesRecordedBatch event by upserting all its entities.
+
+        Passes each column as an array and unnests them, so the whole batch
+        is written with one statement, with the same upsert and statistics
+        semantics as the per-entity handler.
+
+        Args:
+            conn: Database connection from DatabaseProjection
+            event: EntitiesRecordedBatch event to process
+        """
+        if not event.entity_count:
+            return
+
+        entities = event.entities()
+        extraction_method = map_extraction_method(event.extraction_method)
+
+        sql = text("""
+            WITH upserted AS (
+                INSERT INTO extracted_entities (
+                    id,
+                    tenant_id,
+                    source_page_id,
+                    entity_type,
+                    name,
+                    normalized_name,
+                    description,
+                    properties,
+                    extraction_method,
+                    confidence_score,
+                    source_text,
+                    external_ids,
+                    created_at,
+                    updated_at
+                )
+                SELECT
+                    e.id,
+                    :tenant_id,
+                    :page_id,
+                    e.entity_type,
+                    e.name,
+                    e.normalized_name,
+                    e.description,
+                    CAST(e.properties AS jsonb),
+                    :extraction_method,
+                    e.confidence_score,
+                    e.source_text,
+                    CAST('{}' AS jsonb),
+                    NOW(),
+                    NOW()
+                FROM unnest(
+                    CAST(:entity_ids AS uuid[]),
+                    CAST(:entity_types AS text[]),
+                    CAST(:names AS text[]),
+                    CAST(:normalized_names AS text[]),
+                    CAST(:descriptions AS text[]),
+                    CAST(:properties AS text[]),
+                    CAST(:confidence_scores AS float8[]),
+                    CAST(:source_texts AS text[])
+                ) AS e(
+                    id,
+                    entity_type,
+                    name,
+                    normalized_name,
+                    description,
+                    properties,
+                    confidence_score,
+                    source_text
+                )
+                ON CONFLICT (id) DO UPDATE SET
+                    entity_type = EXCLUDED.entity_type,
+                    name = EXCLUDED.name,
+                    normalized_name = EXCLUDED.normalized_name,
+                    description = EXCLUDED.description,
+                    properties = EXCLUDED.properties,
+                    extraction_method = EXCLUDED.extraction_method,
+                    confidence_score = EXCLUDED.confidence_score,
+                    source_text = EXCLUDED.source_text,
+                    updated_at = NOW()
+                RETURNING tenant_id, entity_type, (xmax = 0) AS inserted
+            ),
+            new_entities AS (
+                SELECT tenant_id, entity_type FROM upserted WHERE inserted
+            )
+        """ + stats_delta_sql("new_entities", "entity"))
+
+        await conn.execute(
+            sql,
+            {
+                "tenant_id": event.tenant_id,
+                "page_id": event.page_id,
+                "extraction_method": extraction_method,
+                "entity_ids": [entity["entity_id"] for entity in entities],
+                "entity_types": [map_entity_type(entity["entity_type"]) for entity in entities],
+                "names": [entity["name"] for entity in entities],
+                "normalized_names": [
+                    entity["normalized_name"] or entity["name"].lower().strip()
+                    for entity in entities
+                ],
+                "descriptions": [entity["description"] for entity in entities],
+                "properties": [json.dumps(entity["properties"] or {}) for entity in entities],
+                "confidence_scores": [entity["confidence_score"] for entity in entities],
+                "source_texts": [entity["source_text"] for entity in entities],
+            },
+        )
+
+        logger.debug(
+            "Upserted extracted entity batch",
+            extra={
+                "projection": self._projection_name,
+                "page_id": str(event.page_id),
+                "entity_count": event.entity_count,
+                "tenant_id": str(event.tenant_id),
+            },
+        )
+
+    @handles(EntitiesRetracted)
+    async def _handle_entities_retracted(
+        self, conn: AsyncConnection, event: EntitiesRetracted
+    ) -> None:
+        """
+        Handle EntitiesRetracted event by deleting the retracted entities.
+
+        Deleted rows are subtracted from the tenant's graph statistics in
+        the same statement; replays find no rows and change nothing.
+
+        Args:
+            conn: Database connection from DatabaseProjection
+            event: EntitiesRetracted event to process
+        """
+        if not event.entity_ids:
+            return
+
+        sql = text("""
+            WITH deleted AS (
+                DELETE FROM extracted_entities
+                WHERE id = ANY(CAST(:entity_ids AS uuid[]))
+                  AND tenant_id = :tenant_id
+                RETURNING tenant_id, entity_type
+            )
+        """ + stats_delta_sql("deleted", "entity", sign=-1))
+
+        await conn.execute(
+            sql,
+            {"entity_ids": list(event.entity_ids), "tenant_id": event.tenant_id},
+        )
+
+        logger.debug(
+            "Deleted retracted entities",
+            extra={
+                "projection": self._projection_name,
+                "page_id": str(event.page_id),
+                "entity_count": len(event.entity_ids),
+                "reason": event.reason,
+                "tenant_id": str(event.tenant_id),
+            },
+        )
+
     async def _truncate_read_models(self) -> None:
         """
         Truncate the extracted_entities table for projection reset.
@@ -626,16 +804,42 @@ class ExtractionProcessProjectionHandler(DatabaseProjection):
 # =============================================================================
 
 
+# Pages whose entity name maps RelationshipProjectionHandler keeps cached
+_ENTITY_NAME_CACHE_PAGES = 256
+
+
+class _PageEntityNames:
+    """Entity IDs of one page by exact and by normalized name."""
+
+    def __init__(self) -> None:
+        self.by_name: dict[str, UUID] = {}
+        self.by_normalized_name: dict[str, UUID] = {}
+
+    def add(self, entity_id: UUID, name: str, normalized_name: str) -> None:
+        # The first entity with a name wins, as the LIMIT 1 lookups did
+        self.by_name.setdefault(name, entity_id)
+        self.by_normalized_name.setdefault(normalized_name, entity_id)
+
+    def resolve(self, name: str) -> UUID | None:
+        """Match the exact name first, then the normalized name."""
+        entity_id = self.by_name.get(name)
+        if entity_id is None:
+            entity_id = self.by_normalized_name.get(name.lower().strip())
+        return entity_id
+
+
 class RelationshipProjectionHandler(DatabaseProjection):
     """
-    Projection handler for RelationshipDiscovered events.
+    Projection handler for RelationshipDiscovered and RelationshipsRecordedBatch events.
 
     Creates EntityRelationship records by resolving entity names to entity IDs
     within the same page/tenant context. Uses upsert semantics for idempotent
     event handling.
 
     The handler:
-    - Resolves source and target entity names to entity IDs
+    - Resolves source and target entity names to entity IDs from a per-page
+      name map, loaded with one query and cached across events
+    - Writes all relationships of an event with one upsert statement
     - Creates relationships with proper tenant isolation
     - Handles missing entities gracefully with logging (no exceptions)
     - Uses INSERT ... ON CONFLICT for idempotency
@@ -669,71 +873,97 @@ class RelationshipProjectionHandler(DatabaseProjection):
             dlq_repo=dlq_repo,
             enable_tracing=enable_tracing,
         )
+        # Name to entity ID maps of recently seen pages, least recent first
+        self._entity_names: OrderedDict[tuple[UUID, UUID], _PageEntityNames] = OrderedDict()
         logger.info(
             "RelationshipProjectionHandler initialized",
             extra={"projection": self._projection_name},
         )
 
-    async def _find_entity_by_name(
+    async def _load_entity_names(
         self,
         conn: AsyncConnection,
         tenant_id: UUID,
         page_id: UUID,
-        name: str,
-    ) -> UUID | None:
+    ) -> _PageEntityNames:
         """
-        Find entity ID by name within tenant and page context.
-
-        Attempts exact name match first, then falls back to normalized name match.
+        Load the name to entity ID map of a page with one query.
 
         Args:
             conn: Database connection
             tenant_id: Tenant ID for isolation
             page_id: Source page ID for scoping
-            name: Entity name to search for
 
         Returns:
-            Entity UUID if found, None otherwise
+            _PageEntityNames for the page
         """
-        # Try exact name match first
-        exact_match_sql = text("""
-            SELECT id FROM extracted_entities
+        sql = text("""
+            SELECT id, name, normalized_name FROM extracted_entities
             WHERE tenant_id = :tenant_id
               AND source_page_id = :page_id
-              AND name = :name
-            LIMIT 1
+            ORDER BY created_at, id
         """)
 
-        result = await conn.execute(
-            exact_match_sql,
-            {"tenant_id": tenant_id, "page_id": page_id, "name": name},
-        )
-        row = result.fetchone()
+        result = await conn.execute(sql, {"tenant_id": tenant_id, "page_id": page_id})
+        names = _PageEntityNames()
+        for entity_id, name, normalized_name in result.fetchall():
+            names.add(entity_id, name, normalized_name)
+        return names
 
-        if row:
-            return row[0]
+    async def _resolve_endpoints(
+        self,
+        conn: AsyncConnection,
+        tenant_id: UUID,
+        page_id: UUID,
+        relationships: list[dict],
+    ) -> list[tuple[UUID | None, UUID | None]]:
+        """
+        Resolve source and target entity IDs of a page's relationships.
 
-        # Fall back to normalized name match
-        normalized_name = name.lower().strip()
-        normalized_match_sql = text("""
-            SELECT id FROM extracted_entities
-            WHERE tenant_id = :tenant_id
-              AND source_page_id = :page_id
-              AND normalized_name = :normalized_name
-            LIMIT 1
-        """)
+        The page's name map is cached across events, so catch-up over
+        per-relationship events loads it once per page. A cached map is
+        reloaded once if it cannot resolve every endpoint, in case the
+        entity projection has added entities since it was loaded.
 
-        result = await conn.execute(
-            normalized_match_sql,
-            {
-                "tenant_id": tenant_id,
-                "page_id": page_id,
-                "normalized_name": normalized_name,
-            },
-        )
-        row = result.fetchone()
+        Args:
+            conn: Database connection
+            tenant_id: Tenant ID for isolation
+            page_id: Page the relationships were discovered on
+            relationships: Relationship fields as in RelationshipDiscovered
 
-        return row[0] if row else None
+        Returns:
+            (source ID, target ID) per relationship; None where not found
+        """
+        key = (tenant_id, page_id)
+        names = self._entity_names.get(key)
+        cached = names is not None
+        if cached:
+            self._entity_names.move_to_end(key)
+        else:
+            names = await self._load_entity_names(conn, tenant_id, page_id)
+            self._cache_entity_names(key, names)
+
+        def resolve() -> list[tuple[UUID | None, UUID | None]]:
+            return [
+                (
+                    names.resolve(relationship["source_entity_name"]),
+                    names.resolve(relationship["target_entity_name"]),
+                )
+                for relationship in relationships
+            ]
+
+        endpoints = resolve()
+        if cached and any(None in pair for pair in endpoints):
+            names = await self._load_entity_names(conn, tenant_id, page_id)
+            self._cache_entity_names(key, names)
+            endpoints = resolve()
+        return endpoints
+
+    def _cache_entity_names(self, key: tuple[UUID, UUID], names: _PageEntityNames) -> None:
+        self._entity_names[key] = names
+        self._entity_names.move_to_end(key)
+        while len(self._entity_names) > _ENTITY_NAME_CACHE_PAGES:
+            self._entity_names.popitem(last=False)
 
     @handles(RelationshipDiscovered)
     async def _handle_relationship_discovered(
@@ -752,115 +982,187 @@ class RelationshipProjectionHandler(DatabaseProjection):
             conn: Database connection from DatabaseProjection
             event: RelationshipDiscovered event to process
         """
-        # Resolve source entity
-        source_entity_id = await self._find_entity_by_name(
+        await self._upsert_relationships(
             conn,
             event.tenant_id,
             event.page_id,
-            event.source_entity_name,
+            [
+                {
+                    "relationship_id": event.relationship_id,
+                    "source_entity_name": event.source_entity_name,
+                    "target_entity_name": event.target_entity_name,
+                    "relationship_type": event.relationship_type,
+                    "confidence_score": event.confidence_score,
+                    "context": event.context,
+                }
+            ],
         )
 
-        if source_entity_id is None:
-            logger.warning(
-                "Source entity not found for relationship",
-                extra={
-                    "projection": self._projection_name,
-                    "relationship_id": str(event.relationship_id),
-                    "source_entity_name": event.source_entity_name,
-                    "page_id": str(event.page_id),
-                    "tenant_id": str(event.tenant_id),
-                },
-            )
-            return
+    @handles(RelationshipsRecordedBatch)
+    async def _handle_relationships_recorded_batch(
+        self, conn: AsyncConnection, event: RelationshipsRecordedBatch
+    ) -> None:
+        """
+        Handle RelationshipsRecordedBatch event by upserting all its relationships.
 
-        # Resolve target entity
-        target_entity_id = await self._find_entity_by_name(
-            conn,
-            event.tenant_id,
-            event.page_id,
-            event.target_entity_name,
+        Args:
+            conn: Database connection from DatabaseProjection
+            event: RelationshipsRecordedBatch event to process
+        """
+        await self._upsert_relationships(
+            conn, event.tenant_id, event.page_id, event.relationships()
         )
 
-        if target_entity_id is None:
-            logger.warning(
-                "Target entity not found for relationship",
-                extra={
-                    "projection": self._projection_name,
-                    "relationship_id": str(event.relationship_id),
-                    "target_entity_name": event.target_entity_name,
-                    "page_id": str(event.page_id),
-                    "tenant_id": str(event.tenant_id),
-                },
-            )
-            return
+    async def _upsert_relationships(
+        self,
+        conn: AsyncConnection,
+        tenant_id: UUID,
+        page_id: UUID,
+        relationships: list[dict],
+    ) -> None:
+        """
+        Resolve the endpoints of a page's relationships and upsert them.
 
-        # Normalize relationship type to uppercase
-        relationship_type = event.relationship_type.upper()
+        All relationships whose endpoints resolve are written with one
+        statement; the others are logged and skipped.
+
+        Args:
+            conn: Database connection
+            tenant_id: Tenant ID for isolation
+            page_id: Page the relationships were discovered on
+            relationships: Relationship fields as in RelationshipDiscovered
+        """
+        if not relationships:
+            return
 
-        # Build properties dict and serialize to JSON for asyncpg
-        properties = {}
-        if event.context:
-            properties["context"] = event.context
-        properties = json.dumps(properties)
+        endpoints = await self._resolve_endpoints(conn, tenant_id, page_id, relationships)
+
+        rows = []
+        for relationship, (source_entity_id, target_entity_id) in zip(
+            relationships, endpoints, strict=True
+        ):
+            if source_entity_id is None:
+                logger.warning(
+                    "Source entity not found for relationship",
+                    extra={
+                        "projection": self._projection_name,
+                        "relationship_id": str(relationship["relationship_id"]),
+                        "source_entity_name": relationship["source_entity_name"],
+                        "page_id": str(page_id),
+                        "tenant_id": str(tenant_id),
+                    },
+                )
+                continue
+
+            if target_entity_id is None:
+                logger.warning(
+                    "Target entity not found for relationship",
+                    extra={
+                        "projection": self._projection_name,
+                        "relationship_id": str(relationship["relationship_id"]),
+                        "target_entity_name": relationship["target_entity_name"],
+                        "page_id": str(page_id),
+                        "tenant_id": str(tenant_id),
+                    },
+                )
+                continue
+
+            rows.append((relationship, source_entity_id, target_entity_id))
+
+        if not rows:
+            return
 
         # Upsert SQL using INSERT ... ON CONFLICT DO UPDATE
         # This ensures idempotent handling - replaying the same event
-        # will update to the same values
+        # will update to the same values. Newly inserted rows are also
+        # counted into the tenant's graph statistics.
         sql = text("""
-            INSERT INTO entity_relationships (
-                id,
-                tenant_id,
-                source_entity_id,
-                target_entity_id,
-                relationship_type,
-                properties,
-                confidence_score,
-                synced_to_neo4j,
-                created_at,
-                updated_at
-            ) VALUES (
-                :relationship_id,
-                :tenant_id,
-                :source_entity_id,
-                :target_entity_id,
-                :relationship_type,
-                :properties,
-                :confidence_score,
-                FALSE,
-                NOW(),
-                NOW()
+            WITH upserted AS (
+                INSERT INTO entity_relationships (
+                    id,
+                    tenant_id,
+                    source_entity_id,
+                    target_entity_id,
+                    relationship_type,
+                    properties,
+                    confidence_score,
+                    synced_to_neo4j,
+                    created_at,
+                    updated_at
+                )
+                SELECT
+                    r.id,
+                    :tenant_id,
+                    r.source_entity_id,
+                    r.target_entity_id,
+                    r.relationship_type,
+                    CAST(r.properties AS jsonb),
+                    r.confidence_score,
+                    FALSE,
+                    NOW(),
+                    NOW()
+                FROM unnest(
+                    CAST(:relationship_ids AS uuid[]),
+                    CAST(:source_entity_ids AS uuid[]),
+                    CAST(:target_entity_ids AS uuid[]),
+                    CAST(:relationship_types AS text[]),
+                    CAST(:properties AS text[]),
+                    CAST(:confidence_scores AS float8[])
+                ) AS r(
+                    id,
+                    source_entity_id,
+                    target_entity_id,
+                    relationship_type,
+                    properties,
+                    confidence_score
+                )
+                ON CONFLICT (id) DO UPDATE SET
+                    source_entity_id = EXCLUDED.source_entity_id,
+                    target_entity_id = EXCLUDED.target_entity_id,
+                    relationship_type = EXCLUDED.relationship_type,
+                    properties = EXCLUDED.properties,
+                    confidence_score = EXCLUDED.confidence_score,
+                    updated_at = NOW()
+                RETURNING tenant_id, relationship_type, (xmax = 0) AS inserted
+            ),
+            new_relationships AS (
+                SELECT tenant_id, relationship_type FROM upserted WHERE inserted
             )
-            ON CONFLICT (id) DO UPDATE SET
-                source_entity_id = EXCLUDED.source_entity_id,
-                target_entity_id = EXCLUDED.target_entity_id,
-                relationship_type = EXCLUDED.relationship_type,
-                properties = EXCLUDED.properties,
-                confidence_score = EXCLUDED.confidence_score,
-                updated_at = NOW()
-        """)
-
-        await conn.execute(
-            sql,
-            {
-                "relationship_id": event.relationship_id,
-                "tenant_id": event.tenant_id,
-                "source_entity_id": source_entity_id,
-                "target_entity_id": target_entity_id,
-                "relationship_type": relationship_type,
-                "properties": properties,
-                "confidence_score": event.confidence_score,
-            },
-        )
+        """ + stats_delta_sql("new_relationships", "relationship"))
+
+        try:
+            await conn.execute(
+                sql,
+                {
+                    "tenant_id": tenant_id,
+                    "relationship_ids": [rel["relationship_id"] for rel, _, _ in rows],
+                    "source_entity_ids": [source_id for _, source_id, _ in rows],
+                    "target_entity_ids": [target_id for _, _, target_id in rows],
+                    # Normalize relationship type to uppercase
+                    "relationship_types": [
+                        rel["relationship_type"].upper() for rel, _, _ in rows
+                    ],
+                    "properties": [
+                        json.dumps({"context": rel["context"]} if rel["context"] else {})
+                        for rel, _, _ in rows
+                    ],
+                    "confidence_scores": [rel["confidence_score"] for rel, _, _ in rows],
+                },
+            )
+        except Exception:
+            # The cached IDs may be stale (e.g., entities were re-projected);
+            # let the retry reload them
+            self._entity_names.pop((tenant_id, page_id), None)
+            raise
 
         logger.debug(
-            "Upserted entity relationship",
+            "Upserted entity relationships",
             extra={
                 "projection": self._projection_name,
-                "relationship_id": str(event.relationship_id),
-                "source_entity_name": event.source_entity_name,
-                "target_entity_name": event.target_entity_name,
-                "relationship_type": relationship_type,
-                "tenant_id": str(event.tenant_id),
+                "page_id": str(page_id),
+                "relationship_count": len(rows),
+                "skipped": len(relationships) - len(rows),
+                "tenant_id": str(tenant_id),
             },
         )
 
@@ -874,6 +1176,7 @@ class RelationshipProjectionHandler(DatabaseProjection):
             "Truncating entity_relationships table",
             extra={"projection": self._projection_name},
         )
+        self._entity_names.clear()
         # Note: Actual truncation would need to be done within a session context
         # This is called during reset() which happens outside handle()
 
@@ -7,13 +7,16 @@ entity extraction from newly scraped pages.
 
 The handler:
 - Creates a new ExtractionProcess aggregate for each PageScraped event
-- Includes idempotency checks to prevent duplicate extractions
+- Claims each (tenant, content hash) in a durable index before creating a
+  process, so restarts, replays and replicas never extract content twice
+- Reclaims stale claims whose process was never saved (e.g., after a crash
+  between the claim and the save), so such content is still extracted
 - Uses error handling that logs but doesn't raise to avoid blocking scraping
 """
 
 import logging
 from typing import TYPE_CHECKING
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from eventsource import DeclarativeProjection, handles
 
@@ -22,6 +25,8 @@ from app.eventsourcing.aggregates.extraction import (
     create_extraction_process_repository,
 )
 from app.eventsourcing.events.scraping import PageScraped
+from app.eventsourcing.stores.content_hashes import ContentHashStore
+from app.eventsourcing.stores.factory import get_content_hash_store
 
 if TYPE_CHECKING:
     from eventsource import EventStore
@@ -39,7 +44,8 @@ class ExtractionTriggerHandler(DeclarativeProjection):
 
     This handler ensures:
     - Automatic triggering of extraction on page scrape
-    - Idempotent behavior (same content_hash doesn't create duplicate processes)
+    - Idempotent behavior (same content_hash of a tenant doesn't create
+      duplicate processes, see ContentHashStore)
     - Failure isolation (extraction failures don't block page scraping)
     - Full logging for debugging and monitoring
 
@@ -58,7 +64,7 @@ class ExtractionTriggerHandler(DeclarativeProjection):
         checkpoint_repo: "CheckpointRepository | None" = None,
         dlq_repo: "DLQRepository | None" = None,
         enable_tracing: bool = False,
-        processed_content_hashes: set[str] | None = None,
+        content_hash_store: ContentHashStore | None = None,
     ) -> None:
         """
         Initialize the extraction trigger handler.
@@ -68,8 +74,8 @@ class ExtractionTriggerHandler(DeclarativeProjection):
             checkpoint_repo: Optional checkpoint repository for tracking position
             dlq_repo: Optional DLQ repository for failed events
             enable_tracing: Enable OpenTelemetry tracing (default: False)
-            processed_content_hashes: Optional set for tracking processed hashes
-                                     (used for testing/dependency injection)
+            content_hash_store: Idempotency index of processed content
+                (defaults to the application's get_content_hash_store())
         """
         super().__init__(
             checkpoint_repo=checkpoint_repo,
@@ -77,48 +83,23 @@ class ExtractionTriggerHandler(DeclarativeProjection):
             enable_tracing=enable_tracing,
         )
         self._event_store = event_store
-        # Track processed content hashes for idempotency
-        # In production, this would typically be backed by a database lookup
-        self._processed_content_hashes: set[str] = processed_content_hashes or set()
+        self._content_hashes: ContentHashStore | None = content_hash_store
         logger.info(
             "ExtractionTriggerHandler initialized",
             extra={"projection": self.projection_name},
         )
 
-    def _is_content_already_processed(self, content_hash: str) -> bool:
-        """
-        Check if content has already been processed for extraction.
-
-        This provides idempotency - the same page content won't trigger
-        multiple extraction processes.
-
-        Args:
-            content_hash: Hash of the page content
-
-        Returns:
-            True if content has already been processed, False otherwise
-        """
-        return content_hash in self._processed_content_hashes
-
-    def _mark_content_processed(self, content_hash: str) -> None:
-        """
-        Mark content as processed to prevent duplicate extractions.
-
-        Args:
-            content_hash: Hash of the page content
-        """
-        self._processed_content_hashes.add(content_hash)
-
     @handles(PageScraped)
     async def handle_page_scraped(self, event: PageScraped) -> None:
         """
         Create extraction process for scraped page.
 
         This handler:
-        1. Checks idempotency (skips if content already processed)
+        1. Claims the content hash, or reclaims a stale claim without a
+           process (skips if content already processed)
         2. Creates a new ExtractionProcess aggregate
         3. Requests extraction with page details
-        4. Saves the process via repository
+        4. Saves the process via repository, releasing the claim on failure
         5. Logs success or failure appropriately
 
         Args:
@@ -128,8 +109,21 @@ class ExtractionTriggerHandler(DeclarativeProjection):
             Errors are logged but not raised to avoid blocking page processing.
         """
         try:
-            # Idempotency check
-            if self._is_content_already_processed(event.content_hash):
+            process_id = uuid4()
+
+            # Idempotency check. Claiming before saving keeps replicas that
+            # receive the same event from both creating a process.
+            content_hashes = await self._get_content_hashes()
+            claimed = await content_hashes.claim(event.tenant_id, event.content_hash, process_id)
+            if not claimed:
+                # The claimer may have crashed before saving its process
+                claimed = await content_hashes.reclaim(
+                    event.tenant_id,
+                    event.content_hash,
+                    process_id,
+                    process_exists=self._process_exists,
+                )
+            if not claimed:
                 logger.debug(
                     "Skipping extraction for already processed content",
                     extra={
@@ -141,26 +135,27 @@ class ExtractionTriggerHandler(DeclarativeProjection):
                 )
                 return
 
-            # Create repository from event store
-            repo = create_extraction_process_repository(self._event_store)
+            try:
+                # Create repository from event store
+                repo = create_extraction_process_repository(self._event_store)
 
-            # Create new extraction process
-            process_id = uuid4()
-            process = ExtractionProcess(process_id)
-
-            # Request extraction with page details
-            process.request_extraction(
-                page_id=event.page_id,
-                tenant_id=event.tenant_id,
-                page_url=event.url,
-                content_hash=event.content_hash,
-            )
+                # Create new extraction process
+                process = ExtractionProcess(process_id)
 
-            # Save the process (persists ExtractionRequested event)
-            await repo.save(process)
+                # Request extraction with page details
+                process.request_extraction(
+                    page_id=event.page_id,
+                    tenant_id=event.tenant_id,
+                    page_url=event.url,
+                    content_hash=event.content_hash,
+                )
 
-            # Mark content as processed for idempotency
-            self._mark_content_processed(event.content_hash)
+                # Save the process (persists ExtractionRequested event)
+                await repo.save(process)
+            except Exception:
+                # No process exists for the content, so a later delivery may retry
+                await content_hashes.release(event.tenant_id, event.content_hash)
+                raise
 
             logger.info(
                 "Created extraction process for page",
@@ -190,13 +185,25 @@ class ExtractionTriggerHandler(DeclarativeProjection):
                 exc_info=True,
             )
 
+    async def _process_exists(self, process_id: UUID) -> bool:
+        """Check whether an ExtractionProcess has been saved."""
+        repo = create_extraction_process_repository(self._event_store)
+        return await repo.exists(process_id)
+
+    async def _get_content_hashes(self) -> ContentHashStore:
+        """Return the content hash index, resolving the default on first use."""
+        if self._content_hashes is None:
+            self._content_hashes = await get_content_hash_store()
+        return self._content_hashes
+
     async def reset(self) -> None:
         """
         Reset the projection state.
 
-        Clears the set of processed content hashes and calls parent reset.
+        The content hash index is kept, so replaying PageScraped events
+        from the start does not trigger extraction for content that
+        already has a process.
         """
-        self._processed_content_hashes.clear()
         await super().reset()
         logger.info(
             "ExtractionTriggerHandler reset",
@@ -20,7 +20,12 @@ from eventsource import DatabaseProjection, handles
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
 
-from app.eventsourcing.events.extraction import RelationshipDiscovered
+from app.eventsourcing.events.extraction import (
+    EntitiesRecordedBatch,
+    EntitiesRetracted,
+    RelationshipDiscovered,
+    RelationshipsRecordedBatch,
+)
 from app.eventsourcing.events.scraping import EntityExtracted
 from app.services.neo4j import get_neo4j_service
 
@@ -30,11 +35,20 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _relationship_properties(relationship: dict) -> dict:
+    """Neo4j properties of a relationship (its context, when present)."""
+    properties = {}
+    if relationship["context"]:
+        properties["context"] = relationship["context"]
+    return properties
+
+
 class Neo4jEntitySyncHandler(DatabaseProjection):
     """
-    Syncs EntityExtracted events to Neo4j graph database.
+    Syncs EntityExtracted and EntitiesRecordedBatch events to Neo4j graph database.
 
-    Creates or updates entity nodes in Neo4j when entities are extracted.
+    Creates or updates entity nodes in Neo4j when entities are extracted,
+    and deletes them when EntitiesRetracted withdraws them.
     After successful sync, updates the PostgreSQL record with the Neo4j
     node ID for tracking and future reference.
 
@@ -172,6 +186,149 @@ class Neo4jEntitySyncHandler(DatabaseProjection):
                 exc_info=True,
             )
 
+    @handles(EntitiesRecordedBatch)
+    async def _handle_entities_recorded_batch(
+        self, conn: AsyncConnection, event: EntitiesRecordedBatch
+    ) -> None:
+        """
+        Sync all entities of a batch to Neo4j.
+
+        Merges the nodes in one Neo4j transaction and marks the entities
+        synced with one PostgreSQL update. Errors are handled as for
+        single entities.
+
+        Args:
+            conn: Database connection from DatabaseProjection
+            event: EntitiesRecordedBatch event to process
+        """
+        if not event.entity_count:
+            return
+
+        try:
+            neo4j = await get_neo4j_service()
+
+            node_ids = await neo4j.create_entity_nodes(
+                tenant_id=event.tenant_id,
+                entities=[
+                    {
+                        "id": entity["entity_id"],
+                        "type": entity["entity_type"].upper(),
+                        "name": entity["name"],
+                        "properties": entity["properties"] or {},
+                        "description": entity["description"],
+                    }
+                    for entity in event.entities()
+                ],
+            )
+
+            sql = text("""
+                UPDATE extracted_entities AS e
+                SET neo4j_node_id = synced.node_id,
+                    synced_to_neo4j = TRUE,
+                    synced_at = :synced_at,
+                    updated_at = NOW()
+                FROM unnest(
+                    CAST(:entity_ids AS uuid[]),
+                    CAST(:node_ids AS text[])
+                ) AS synced(entity_id, node_id)
+                WHERE e.id = synced.entity_id
+                  AND e.tenant_id = :tenant_id
+            """)
+
+            result = await conn.execute(
+                sql,
+                {
+                    "entity_ids": [UUID(entity_id) for entity_id in node_ids],
+                    "node_ids": list(node_ids.values()),
+                    "synced_at": datetime.now(UTC),
+                    "tenant_id": event.tenant_id,
+                },
+            )
+
+            if result.rowcount < event.entity_count:
+                logger.warning(
+                    "Not all entities found to update after Neo4j sync",
+                    extra={
+                        "projection": self._projection_name,
+                        "page_id": str(event.page_id),
+                        "entity_count": event.entity_count,
+                        "updated_count": result.rowcount,
+                        "tenant_id": str(event.tenant_id),
+                    },
+                )
+            else:
+                logger.debug(
+                    "Synced entity batch to Neo4j",
+                    extra={
+                        "projection": self._projection_name,
+                        "page_id": str(event.page_id),
+                        "entity_count": event.entity_count,
+                        "tenant_id": str(event.tenant_id),
+                    },
+                )
+
+        except Exception as e:
+            # Same policy as single entities: unsynced rows keep
+            # synced_to_neo4j=False for the compensation process
+            logger.error(
+                "Failed to sync entity batch to Neo4j: %s",
+                str(e),
+                extra={
+                    "projection": self._projection_name,
+                    "page_id": str(event.page_id),
+                    "entity_count": event.entity_count,
+                    "tenant_id": str(event.tenant_id),
+                    "error_type": type(e).__name__,
+                },
+                exc_info=True,
+            )
+
+    @handles(EntitiesRetracted)
+    async def _handle_entities_retracted(
+        self, conn: AsyncConnection, event: EntitiesRetracted
+    ) -> None:
+        """
+        Delete the nodes of retracted entities from Neo4j.
+
+        Errors are logged and not raised, as for syncs.
+
+        Args:
+            conn: Database connection from DatabaseProjection
+            event: EntitiesRetracted event to process
+        """
+        if not event.entity_ids:
+            return
+
+        try:
+            neo4j = await get_neo4j_service()
+            deleted = await neo4j.delete_entity_nodes(
+                tenant_id=event.tenant_id, entity_ids=list(event.entity_ids)
+            )
+            logger.debug(
+                "Deleted retracted entities from Neo4j",
+                extra={
+                    "projection": self._projection_name,
+                    "page_id": str(event.page_id),
+                    "entity_count": len(event.entity_ids),
+                    "deleted_count": deleted,
+                    "tenant_id": str(event.tenant_id),
+                },
+            )
+
+        except Exception as e:
+            logger.error(
+                "Failed to delete retracted entities from Neo4j: %s",
+                str(e),
+                extra={
+                    "projection": self._projection_name,
+                    "page_id": str(event.page_id),
+                    "entity_count": len(event.entity_ids),
+                    "tenant_id": str(event.tenant_id),
+                    "error_type": type(e).__name__,
+                },
+                exc_info=True,
+            )
+
     async def _truncate_read_models(self) -> None:
         """
         Truncate sync-related data for projection reset.
@@ -190,7 +347,7 @@ class Neo4jEntitySyncHandler(DatabaseProjection):
 
 class Neo4jRelationshipSyncHandler(DatabaseProjection):
     """
-    Syncs RelationshipDiscovered events to Neo4j graph database.
+    Syncs RelationshipDiscovered and RelationshipsRecordedBatch events to Neo4j.
 
     Creates relationships between entity nodes in Neo4j when relationships
     are discovered during extraction. After successful sync, updates the
@@ -304,105 +461,243 @@ class Neo4jRelationshipSyncHandler(DatabaseProjection):
             conn: Database connection from DatabaseProjection
             event: RelationshipDiscovered event to process
         """
+        await self._sync_relationship(
+            conn,
+            event.tenant_id,
+            event.page_id,
+            {
+                "relationship_id": event.relationship_id,
+                "source_entity_name": event.source_entity_name,
+                "target_entity_name": event.target_entity_name,
+                "relationship_type": event.relationship_type,
+                "confidence_score": event.confidence_score,
+                "context": event.context,
+            },
+        )
+
+    @handles(RelationshipsRecordedBatch)
+    async def _handle_relationships_recorded_batch(
+        self, conn: AsyncConnection, event: RelationshipsRecordedBatch
+    ) -> None:
+        """
+        Sync the relationships of a batch to Neo4j in one transaction.
+
+        Relationships whose entities cannot be resolved are skipped; the
+        rest are written together, so a Neo4j failure leaves the whole
+        batch unsynced (synced_to_neo4j=False) for a later retry.
+
+        Args:
+            conn: Database connection from DatabaseProjection
+            event: RelationshipsRecordedBatch event to process
+        """
+        resolved = []
         try:
-            # Find source and target entities by name
-            source = await self._find_entity(
-                conn, event.tenant_id, event.page_id, event.source_entity_name
-            )
-            target = await self._find_entity(
-                conn, event.tenant_id, event.page_id, event.target_entity_name
+            for relationship in event.relationships():
+                endpoints = await self._resolve_relationship(
+                    conn, event.tenant_id, event.page_id, relationship
+                )
+                if endpoints:
+                    resolved.append((relationship, *endpoints))
+            if not resolved:
+                return
+
+            # Get Neo4j service (connects lazily if needed)
+            neo4j = await get_neo4j_service()
+            rel_ids = await neo4j.create_relationships(
+                event.tenant_id,
+                [
+                    {
+                        "relationship_id": relationship["relationship_id"],
+                        "source_entity_id": source["id"],
+                        "target_entity_id": target["id"],
+                        "relationship_type": relationship["relationship_type"],
+                        "properties": _relationship_properties(relationship),
+                        "confidence_score": relationship["confidence_score"],
+                    }
+                    for relationship, source, target in resolved
+                ],
             )
 
-            if not source or not target:
-                logger.warning(
-                    "Cannot sync relationship: missing entity",
-                    extra={
-                        "projection": self._projection_name,
-                        "relationship_id": str(event.relationship_id),
-                        "tenant_id": str(event.tenant_id),
-                        "page_id": str(event.page_id),
-                        "source_entity_name": event.source_entity_name,
-                        "target_entity_name": event.target_entity_name,
-                        "source_found": source is not None,
-                        "target_found": target is not None,
-                    },
+            for (relationship, source, target), rel_id in zip(resolved, rel_ids, strict=True):
+                await self._record_relationship_sync(
+                    conn, event.tenant_id, relationship, source, target, rel_id
                 )
+
+        except Exception as e:
+            # Log error but don't raise - allow event processing to continue
+            logger.error(
+                "Failed to sync relationship batch to Neo4j: %s",
+                str(e),
+                extra={
+                    "projection": self._projection_name,
+                    "page_id": str(event.page_id),
+                    "relationship_count": len(resolved),
+                    "tenant_id": str(event.tenant_id),
+                    "error_type": type(e).__name__,
+                },
+                exc_info=True,
+            )
+
+    async def _resolve_relationship(
+        self,
+        conn: AsyncConnection,
+        tenant_id: UUID,
+        page_id: UUID,
+        relationship: dict,
+    ) -> tuple[dict, dict] | None:
+        """
+        Find the source and target entities of a relationship.
+
+        Args:
+            conn: Database connection
+            tenant_id: Tenant identifier
+            page_id: Page the relationship was discovered on
+            relationship: Relationship fields as in RelationshipDiscovered
+
+        Returns:
+            (source, target) entity dicts, or None if either is missing
+        """
+        source = await self._find_entity(
+            conn, tenant_id, page_id, relationship["source_entity_name"]
+        )
+        target = await self._find_entity(
+            conn, tenant_id, page_id, relationship["target_entity_name"]
+        )
+
+        if not source or not target:
+            logger.warning(
+                "Cannot sync relationship: missing entity",
+                extra={
+                    "projection": self._projection_name,
+                    "relationship_id": str(relationship["relationship_id"]),
+                    "tenant_id": str(tenant_id),
+                    "page_id": str(page_id),
+                    "source_entity_name": relationship["source_entity_name"],
+                    "target_entity_name": relationship["target_entity_name"],
+                    "source_found": source is not None,
+                    "target_found": target is not None,
+                },
+            )
+            return None
+        return source, target
+
+    async def _record_relationship_sync(
+        self,
+        conn: AsyncConnection,
+        tenant_id: UUID,
+        relationship: dict,
+        source: dict,
+        target: dict,
+        rel_id: str | None,
+    ) -> None:
+        """
+        Record a relationship's Neo4j ID and sync status in PostgreSQL.
+
+        Args:
+            conn: Database connection
+            tenant_id: Tenant identifier
+            relationship: Relationship fields as in RelationshipDiscovered
+            source: Resolved source entity
+            target: Resolved target entity
+            rel_id: Neo4j element ID, or None if Neo4j did not create it
+        """
+        if not rel_id:
+            logger.warning(
+                "Neo4j create_relationship returned None - entities may not exist in Neo4j",
+                extra={
+                    "projection": self._projection_name,
+                    "relationship_id": str(relationship["relationship_id"]),
+                    "tenant_id": str(tenant_id),
+                    "source_entity_id": str(source["id"]),
+                    "target_entity_id": str(target["id"]),
+                },
+            )
+            return
+
+        # Update PostgreSQL with Neo4j relationship ID and sync status
+        sql = text("""
+            UPDATE entity_relationships
+            SET neo4j_relationship_id = :rel_id,
+                synced_to_neo4j = TRUE,
+                updated_at = NOW()
+            WHERE id = :relationship_id
+              AND tenant_id = :tenant_id
+        """)
+
+        result = await conn.execute(
+            sql,
+            {
+                "rel_id": rel_id,
+                "relationship_id": relationship["relationship_id"],
+                "tenant_id": tenant_id,
+            },
+        )
+
+        if result.rowcount == 0:
+            logger.warning(
+                "No relationship found to update after Neo4j sync",
+                extra={
+                    "projection": self._projection_name,
+                    "relationship_id": str(relationship["relationship_id"]),
+                    "tenant_id": str(tenant_id),
+                    "neo4j_relationship_id": rel_id,
+                },
+            )
+        else:
+            logger.debug(
+                "Synced relationship to Neo4j",
+                extra={
+                    "projection": self._projection_name,
+                    "relationship_id": str(relationship["relationship_id"]),
+                    "relationship_type": relationship["relationship_type"],
+                    "source_entity": relationship["source_entity_name"],
+                    "target_entity": relationship["target_entity_name"],
+                    "neo4j_relationship_id": rel_id,
+                    "tenant_id": str(tenant_id),
+                },
+            )
+
+    async def _sync_relationship(
+        self,
+        conn: AsyncConnection,
+        tenant_id: UUID,
+        page_id: UUID,
+        relationship: dict,
+    ) -> None:
+        """
+        Sync one relationship to Neo4j and record the sync in PostgreSQL.
+
+        Args:
+            conn: Database connection
+            tenant_id: Tenant identifier
+            page_id: Page the relationship was discovered on
+            relationship: Relationship fields as in RelationshipDiscovered
+        """
+        try:
+            endpoints = await self._resolve_relationship(
+                conn, tenant_id, page_id, relationship
+            )
+            if not endpoints:
                 return
+            source, target = endpoints
 
             # Get Neo4j service (connects lazily if needed)
             neo4j = await get_neo4j_service()
 
-            # Build properties dict
-            properties = {}
-            if event.context:
-                properties["context"] = event.context
-
             # Create relationship in Neo4j
             rel_id = await neo4j.create_relationship(
-                relationship_id=event.relationship_id,
-                tenant_id=event.tenant_id,
+                relationship_id=relationship["relationship_id"],
+                tenant_id=tenant_id,
                 source_entity_id=source["id"],
                 target_entity_id=target["id"],
-                relationship_type=event.relationship_type,
-                properties=properties,
-                confidence_score=event.confidence_score,
+                relationship_type=relationship["relationship_type"],
+                properties=_relationship_properties(relationship),
+                confidence_score=relationship["confidence_score"],
             )
 
-            if rel_id:
-                # Update PostgreSQL with Neo4j relationship ID and sync status
-                sync_time = datetime.now(UTC)
-                sql = text("""
-                    UPDATE entity_relationships
-                    SET neo4j_relationship_id = :rel_id,
-                        synced_to_neo4j = TRUE,
-                        updated_at = NOW()
-                    WHERE id = :relationship_id
-                      AND tenant_id = :tenant_id
-                """)
-
-                result = await conn.execute(
-                    sql,
-                    {
-                        "rel_id": rel_id,
-                        "relationship_id": event.relationship_id,
-                        "tenant_id": event.tenant_id,
-                    },
-                )
-
-                if result.rowcount == 0:
-                    logger.warning(
-                        "No relationship found to update after Neo4j sync",
-                        extra={
-                            "projection": self._projection_name,
-                            "relationship_id": str(event.relationship_id),
-                            "tenant_id": str(event.tenant_id),
-                            "neo4j_relationship_id": rel_id,
-                        },
-                    )
-                else:
-                    logger.debug(
-                        "Synced relationship to Neo4j",
-                        extra={
-                            "projection": self._projection_name,
-                            "relationship_id": str(event.relationship_id),
-                            "relationship_type": event.relationship_type,
-                            "source_entity": event.source_entity_name,
-                            "target_entity": event.target_entity_name,
-                            "neo4j_relationship_id": rel_id,
-                            "tenant_id": str(event.tenant_id),
-                        },
-                    )
-            else:
-                logger.warning(
-                    "Neo4j create_relationship returned None - entities may not exist in Neo4j",
-                    extra={
-                        "projection": self._projection_name,
-                        "relationship_id": str(event.relationship_id),
-                        "tenant_id": str(event.tenant_id),
-                        "source_entity_id": str(source["id"]),
-                        "target_entity_id": str(target["id"]),
-                    },
-                )
+            await self._record_relationship_sync(
+                conn, tenant_id, relationship, source, target, rel_id
+            )
 
         except Exception as e:
             # Log error but don't raise - allow event processing to continue
@@ -413,11 +708,11 @@ class Neo4jRelationshipSyncHandler(DatabaseProjection):
                 str(e),
                 extra={
                     "projection": self._projection_name,
-                    "relationship_id": str(event.relationship_id),
-                    "relationship_type": event.relationship_type,
-                    "source_entity_name": event.source_entity_name,
-                    "target_entity_name": event.target_entity_name,
-                    "tenant_id": str(event.tenant_id),
+                    "relationship_id": str(relationship["relationship_id"]),
+                    "relationship_type": relationship["relationship_type"],
+                    "source_entity_name": relationship["source_entity_name"],
+                    "target_entity_name": relationship["target_entity_name"],
+                    "tenant_id": str(tenant_id),
                     "error_type": type(e).__name__,
                 },
                 exc_info=True,
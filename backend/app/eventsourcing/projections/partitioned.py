@@ -0,0 +1,515 @@
+"""
+Partitioned catch-up and rebuild of projections.
+
+The subscriptions of ExtractionSubscriptionManager each replay the event
+store one event at a time in a single global order, so catching up (or
+rebuilding the read models) uses one database connection per projection no
+matter how many cores the database has. PartitionedCatchUp reads the store
+once and shards the events across N asyncio workers:
+
+- Events are partitioned by tenant, or by page. Within a partition they are
+  applied in global position order; partitions run independently.
+- Every partition has its own checkpoint, so an interrupted catch-up
+  resumes each partition where it stopped.
+- Every worker owns its projection instances, so per-instance state (the
+  current connection, the relationship name cache) is never shared.
+- In rebuild mode a worker applies each chunk of its events to all
+  projections in one transaction, instead of one transaction and
+  checkpoint write per event and projection, and per-entity and
+  per-relationship events of a page are upcast into batch events so each
+  run is written with one statement. The worker's rebuild projections are
+  created with a session factory whose sessions join the chunk's
+  transaction (each handle() runs in a savepoint of it) and an in-memory
+  checkpoint repository, so they are driven through handle() alone.
+
+Example:
+    catch_up = PartitionedCatchUp(
+        event_store,
+        checkpoint_repo,
+        projection_factories=[EntityProjectionHandler, ...],
+        session_factory=AsyncSessionLocal,
+        partitions=8,
+    )
+    summary = await catch_up.run()
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from eventsource import DatabaseProjection, DomainEvent
+from eventsource.repositories.checkpoint import InMemoryCheckpointRepository
+from eventsource.stores import ReadOptions, StoredEvent
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from app.eventsourcing.events.extraction import (
+    EntitiesRecordedBatch,
+    RelationshipDiscovered,
+    RelationshipsRecordedBatch,
+)
+from app.eventsourcing.events.scraping import EntityExtracted
+
+if TYPE_CHECKING:
+    from eventsource.repositories import CheckpointRepository
+    from eventsource.stores import EventStore
+
+logger = logging.getLogger(__name__)
+
+# Supported partition keys. Every event the extraction projections handle
+# carries a page_id, and a page's relationships can only be resolved after
+# its entities, so "page" keeps a page's events together (legacy
+# EntityExtracted events have one aggregate per entity, so the aggregate id
+# alone would split them from their page's relationships).
+PARTITION_KEYS = ("tenant", "page")
+
+# Chunks buffered per partition before the reader waits for the worker
+_QUEUE_DEPTH = 4
+
+# Called without arguments for the per-event projections, and with
+# session_factory= and checkpoint_repo= keyword overrides for the rebuild
+# projections
+ProjectionFactory = Callable[..., DatabaseProjection]
+
+
+@dataclass
+class CatchUpSummary:
+    """Outcome of a partitioned catch-up.
+
+    Attributes:
+        position: Global position all partitions have caught up to
+        events_read: Events read from the event store
+        events_applied: Events applied, per partition
+        last_event_id: ID of the last event read, if any
+        last_event_type: Type of the last event read, if any
+    """
+
+    position: int = 0
+    events_read: int = 0
+    events_applied: list[int] = field(default_factory=list)
+    last_event_id: UUID | None = None
+    last_event_type: str | None = None
+
+
+@dataclass
+class _Chunk:
+    """Events of one partition from one read batch."""
+
+    events: list[StoredEvent]
+    # Position the partition has caught up to once the chunk is applied
+    position: int
+    last_event: StoredEvent
+
+
+class _ChunkSessions:
+    """Session factory for rebuild projections.
+
+    Sessions are bound to the connection of the chunk transaction that is
+    open, and their own transactions become savepoints of it.
+    """
+
+    def __init__(self) -> None:
+        self.connection: AsyncConnection | None = None
+
+    def __call__(self) -> AsyncSession:
+        if self.connection is None:
+            raise RuntimeError("No rebuild chunk transaction is open")
+        return AsyncSession(
+            bind=self.connection,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        )
+
+
+class PartitionedCatchUp:
+    """
+    Replays the event store into projections across parallel partitions.
+
+    Attributes:
+        name: Prefix of the partition checkpoint names
+        partitions: Number of partitions (and workers)
+        partition_key: "tenant" or "page"
+        batch_size: Events read from the store per batch
+        rebuild: Apply chunks in one transaction with batch writes
+    """
+
+    def __init__(
+        self,
+        event_store: "EventStore",
+        checkpoint_repo: "CheckpointRepository",
+        projection_factories: Sequence[ProjectionFactory],
+        session_factory: async_sessionmaker[AsyncSession],
+        partitions: int = 4,
+        partition_key: str = "tenant",
+        batch_size: int = 500,
+        rebuild: bool = False,
+        name: str = "ExtractionProjections",
+    ) -> None:
+        """
+        Initialize the catch-up.
+
+        Args:
+            event_store: Event store to read from
+            checkpoint_repo: Repository for the partition checkpoints
+            projection_factories: Create one projection each; called once per
+                worker (twice in rebuild mode, see ProjectionFactory), in
+                the order projections are applied
+            session_factory: Session factory for rebuild transactions
+            partitions: Number of partitions (and workers)
+            partition_key: "tenant" or "page"
+            batch_size: Events read from the store per batch
+            rebuild: Apply chunks in one transaction with batch writes
+            name: Prefix of the partition checkpoint names
+
+        Raises:
+            ValueError: If partitions or partition_key is invalid
+        """
+        if partitions < 1:
+            raise ValueError(f"partitions must be at least 1, got {partitions}")
+        if partition_key not in PARTITION_KEYS:
+            raise ValueError(
+                f"partition_key must be one of {PARTITION_KEYS}, got {partition_key!r}"
+            )
+        self._event_store = event_store
+        self._checkpoint_repo = checkpoint_repo
+        self._projection_factories = list(projection_factories)
+        self._session_factory = session_factory
+        self.partitions = partitions
+        self.partition_key = partition_key
+        self.batch_size = batch_size
+        self.rebuild = rebuild
+        self.name = name
+
+    def checkpoint_name(self, partition: int) -> str:
+        """Checkpoint name of a partition, e.g. 'ExtractionProjections:tenant:3/8'."""
+        return f"{self.name}:{self.partition_key}:{partition}/{self.partitions}"
+
+    def partition_of(self, event: DomainEvent) -> int:
+        """
+        Get the partition an event is applied in.
+
+        Args:
+            event: Domain event
+
+        Returns:
+            Partition index in [0, partitions)
+        """
+        if self.partition_key == "tenant":
+            key = event.tenant_id
+        else:
+            key = getattr(event, "page_id", None) or event.aggregate_id
+        if key is None:
+            return 0
+        return key.int % self.partitions
+
+    async def reset(self) -> None:
+        """Delete the partition checkpoints, so the next run starts over."""
+        for partition in range(self.partitions):
+            await self._checkpoint_repo.reset_checkpoint(self.checkpoint_name(partition))
+
+    async def run(self, initial_position: int = 0) -> CatchUpSummary:
+        """
+        Catch all partitions up to the current end of the event store.
+
+        Args:
+            initial_position: Position every partition starts from at the
+                earliest, e.g. the position the live subscriptions have
+                reached (a partition checkpoint behind it is stale)
+
+        Returns:
+            CatchUpSummary of the run
+
+        Raises:
+            Exception: If reading the store or saving a checkpoint fails;
+                failing events are logged and skipped as in the live
+                subscriptions
+        """
+        positions = []
+        for partition in range(self.partitions):
+            position = await self._checkpoint_repo.get_position(self.checkpoint_name(partition))
+            # Events up to initial_position were projected live after the
+            # partition last ran; replaying them would apply them twice
+            positions.append(max(position or 0, initial_position))
+
+        target = await self._event_store.get_global_position()
+        summary = CatchUpSummary(
+            position=max(min(positions), target),
+            events_applied=[0] * self.partitions,
+        )
+
+        logger.info(
+            "Starting partitioned projection catch-up",
+            extra={
+                "partitions": self.partitions,
+                "partition_key": self.partition_key,
+                "from_position": min(positions),
+                "target_position": target,
+                "rebuild": self.rebuild,
+            },
+        )
+
+        queues: list[asyncio.Queue[_Chunk | None]] = [
+            asyncio.Queue(maxsize=_QUEUE_DEPTH) for _ in range(self.partitions)
+        ]
+        workers = [
+            asyncio.create_task(self._work(partition, queues[partition], summary))
+            for partition in range(self.partitions)
+        ]
+        try:
+            await self._read(positions, target, queues, workers, summary)
+            for queue, worker in zip(queues, workers, strict=True):
+                await self._put(queue, None, worker)
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+
+        logger.info(
+            "Partitioned projection catch-up completed",
+            extra={
+                "position": summary.position,
+                "events_read": summary.events_read,
+                "events_applied": sum(summary.events_applied),
+            },
+        )
+        return summary
+
+    async def _read(
+        self,
+        positions: list[int],
+        target: int,
+        queues: list[asyncio.Queue[_Chunk | None]],
+        workers: list[asyncio.Task],
+        summary: CatchUpSummary,
+    ) -> None:
+        """Read the store up to target and hand each partition its events."""
+        position = min(positions)
+        while position < target:
+            options = ReadOptions(
+                from_position=position,
+                limit=min(self.batch_size, target - position),
+            )
+            batch = [stored async for stored in self._event_store.read_all(options)]
+            if not batch:
+                break
+
+            position = batch[-1].global_position
+            summary.events_read += len(batch)
+            summary.last_event_id = batch[-1].event_id
+            summary.last_event_type = batch[-1].event_type
+
+            chunks: list[list[StoredEvent]] = [[] for _ in range(self.partitions)]
+            for stored in batch:
+                partition = self.partition_of(stored.event)
+                if stored.global_position > positions[partition]:
+                    chunks[partition].append(stored)
+
+            for partition, events in enumerate(chunks):
+                if position <= positions[partition]:
+                    continue
+                await self._put(
+                    queues[partition],
+                    _Chunk(events=events, position=position, last_event=batch[-1]),
+                    workers[partition],
+                )
+
+    @staticmethod
+    async def _put(
+        queue: asyncio.Queue[_Chunk | None], item: _Chunk | None, worker: asyncio.Task
+    ) -> None:
+        """Queue an item for a worker, raising the worker's error if it failed."""
+        put = asyncio.ensure_future(queue.put(item))
+        await asyncio.wait({put, worker}, return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            worker.result()
+            raise RuntimeError("Catch-up worker stopped before the end of the stream")
+
+    async def _work(
+        self,
+        partition: int,
+        queue: asyncio.Queue[_Chunk | None],
+        summary: CatchUpSummary,
+    ) -> None:
+        """Apply a partition's chunks in order and checkpoint after each."""
+        projections = self._create_projections()
+        chunk_sessions = _ChunkSessions()
+        bulk_projections = self._create_bulk_projections(chunk_sessions) if self.rebuild else []
+        checkpoint_name = self.checkpoint_name(partition)
+
+        while (chunk := await queue.get()) is not None:
+            if chunk.events:
+                if self.rebuild:
+                    applied = await self._apply_in_bulk(
+                        bulk_projections, chunk_sessions, chunk.events
+                    )
+                    if not applied:
+                        # The failed transaction may have left per-instance
+                        # state (cached entity IDs) behind; start afresh
+                        bulk_projections = self._create_bulk_projections(chunk_sessions)
+                        await self._apply(projections, chunk.events)
+                else:
+                    await self._apply(projections, chunk.events)
+                summary.events_applied[partition] += len(chunk.events)
+
+            await self._checkpoint_repo.save_position(
+                checkpoint_name,
+                chunk.position,
+                chunk.last_event.event_id,
+                chunk.last_event.event_type,
+            )
+
+    def _create_projections(self, **overrides) -> list[tuple[DatabaseProjection, set[type]]]:
+        projections = []
+        for factory in self._projection_factories:
+            projection = factory(**overrides)
+            projections.append((projection, set(projection.subscribed_to())))
+        return projections
+
+    def _create_bulk_projections(
+        self, chunk_sessions: _ChunkSessions
+    ) -> list[tuple[DatabaseProjection, set[type]]]:
+        # Progress is tracked by the partition checkpoints; the projections'
+        # own checkpoints would be written per event outside the chunk
+        return self._create_projections(
+            session_factory=chunk_sessions,
+            checkpoint_repo=InMemoryCheckpointRepository(),
+        )
+
+    async def _apply(
+        self,
+        projections: list[tuple[DatabaseProjection, set[type]]],
+        events: list[StoredEvent],
+    ) -> None:
+        """Apply events one by one, with the projections' retry and DLQ handling."""
+        for stored in events:
+            for projection, handled in projections:
+                if type(stored.event) not in handled:
+                    continue
+                try:
+                    await projection.handle(stored.event)
+                except Exception as e:
+                    # handle() has retried and sent the event to the DLQ;
+                    # continue like the live subscriptions (continue_on_error)
+                    logger.warning(
+                        "Event processing failed during catch-up, continuing",
+                        extra={
+                            "projection": projection.projection_name,
+                            "event_id": str(stored.event_id),
+                            "event_type": stored.event_type,
+                            "global_position": stored.global_position,
+                            "error": str(e),
+                        },
+                    )
+
+    async def _apply_in_bulk(
+        self,
+        projections: list[tuple[DatabaseProjection, set[type]]],
+        chunk_sessions: _ChunkSessions,
+        events: list[StoredEvent],
+    ) -> bool:
+        """
+        Apply a chunk to all projections in one transaction.
+
+        Args:
+            projections: Rebuild projections created with chunk_sessions
+            chunk_sessions: Session factory of the rebuild projections
+            events: Events of the chunk
+
+        Returns:
+            True if the chunk was applied, False if it was rolled back
+        """
+        domain_events = [stored.event for stored in events]
+        try:
+            async with self._session_factory() as session, session.begin():
+                chunk_sessions.connection = await session.connection()
+                try:
+                    for projection, handled in projections:
+                        for event in coalesce_for_bulk(domain_events, handled):
+                            await projection.handle(event)
+                finally:
+                    chunk_sessions.connection = None
+        except Exception as e:
+            logger.warning(
+                "Bulk apply failed, replaying chunk event by event",
+                extra={
+                    "first_position": events[0].global_position,
+                    "last_position": events[-1].global_position,
+                    "error": str(e),
+                },
+            )
+            return False
+        return True
+
+
+def coalesce_for_bulk(events: Sequence[DomainEvent], handled: set[type]) -> list[DomainEvent]:
+    """
+    Select the events a projection handles, upcasting per-item runs to batches.
+
+    Consecutive EntityExtracted events of one page (and extraction method)
+    become one EntitiesRecordedBatch, and consecutive RelationshipDiscovered
+    events of one page one RelationshipsRecordedBatch, if the projection
+    handles the batch event. A run is split where an ID repeats, since an
+    upsert cannot touch the same row twice.
+
+    Args:
+        events: Events in order
+        handled: Event types the projection handles
+
+    Returns:
+        Events to apply, in order
+    """
+    coalesced: list[DomainEvent] = []
+    run: list[DomainEvent] = []
+    run_key: tuple | None = None
+    run_ids: set[UUID] = set()
+
+    def flush() -> None:
+        nonlocal run, run_key
+        if not run:
+            return
+        if len(run) == 1:
+            coalesced.append(run[0])
+        elif isinstance(run[0], EntityExtracted):
+            coalesced.append(EntitiesRecordedBatch.from_entity_events(run))
+        else:
+            coalesced.append(RelationshipsRecordedBatch.from_relationship_events(run))
+        run = []
+        run_key = None
+        run_ids.clear()
+
+    for event in events:
+        if type(event) not in handled:
+            continue
+
+        if isinstance(event, EntityExtracted) and EntitiesRecordedBatch in handled:
+            key = ("entity", event.tenant_id, event.page_id, event.job_id, event.extraction_method)
+            item_id = event.entity_id
+        elif isinstance(event, RelationshipDiscovered) and RelationshipsRecordedBatch in handled:
+            key = ("relationship", event.tenant_id, event.page_id)
+            item_id = event.relationship_id
+        else:
+            flush()
+            coalesced.append(event)
+            continue
+
+        if key != run_key or item_id in run_ids:
+            flush()
+            run_key = key
+        run.append(event)
+        run_ids.add(item_id)
+
+    flush()
+    return coalesced
+
+
+__all__ = [
+    "CatchUpSummary",
+    "PARTITION_KEYS",
+    "PartitionedCatchUp",
+    "coalesce_for_bulk",
+]
@@ -54,6 +54,7 @@ class TenantAwareRepository(Generic[TAggregate]):
         event_publisher: Optional[EventBus] = None,
         snapshot_store: Optional[SnapshotStore] = None,
         snapshot_threshold: Optional[int] = None,
+        snapshot_mode: Optional[str] = None,
     ):
         """
         Initialize the tenant-aware repository.
@@ -65,6 +66,8 @@ class TenantAwareRepository(Generic[TAggregate]):
             event_publisher: Optional event bus for publishing events
             snapshot_store: Optional snapshot store for performance
             snapshot_threshold: Events between automatic snapshots
+            snapshot_mode: "sync", "background" or "manual" (defaults to
+                settings.SNAPSHOT_MODE)
         """
         # Resolve snapshot threshold from settings if enabled
         resolved_threshold = snapshot_threshold or (
@@ -79,6 +82,7 @@ class TenantAwareRepository(Generic[TAggregate]):
             event_publisher=event_publisher,
             snapshot_store=snapshot_store,
             snapshot_threshold=resolved_threshold,
+            snapshot_mode=snapshot_mode or settings.SNAPSHOT_MODE,
             enable_tracing=True,
         )
 
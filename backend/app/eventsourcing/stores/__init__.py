@@ -1,11 +1,21 @@
 """Event store factory and configuration."""
 
+from app.eventsourcing.stores.batch import SyncEventBatch
+from app.eventsourcing.stores.content_hashes import (
+    ContentHashStore,
+    InMemoryContentHashStore,
+    PostgreSQLContentHashStore,
+)
 from app.eventsourcing.stores.factory import (
     get_event_store,
     get_event_store_sync,
     create_event_store,
     create_sync_event_store,
     close_event_store,
+    create_snapshot_store,
+    get_snapshot_store,
+    create_content_hash_store,
+    get_content_hash_store,
 )
 
 __all__ = [
@@ -14,4 +24,12 @@ __all__ = [
     "create_event_store",
     "create_sync_event_store",
     "close_event_store",
+    "create_snapshot_store",
+    "get_snapshot_store",
+    "create_content_hash_store",
+    "get_content_hash_store",
+    "ContentHashStore",
+    "InMemoryContentHashStore",
+    "PostgreSQLContentHashStore",
+    "SyncEventBatch",
 ]
@@ -0,0 +1,325 @@
+"""
+Batched event emission for synchronous Celery tasks.
+
+Tasks used to append each notification event on its own, one sync-to-async
+round trip per event and always after the task's transaction had committed.
+A SyncEventBatch collects the events of a task instead and appends them
+together when the task commits:
+
+- Bound to a sync session on a transactional store (PostgreSQL), the events
+  and their outbox rows are written with the session's connection right
+  before COMMIT, so they are committed atomically with the task's writes.
+- Otherwise (in-memory store, EVENT_STORE_SYNC_TRANSACTIONAL off, or when the
+  in-transaction write fails) they are appended with a single call on the
+  worker's shared async runtime right after the commit.
+
+A rollback of the session discards the events collected since the last
+commit. Savepoints are ignored.
+
+Example:
+    with TenantWorkerContext(tenant_id) as ctx:
+        ...
+        ctx.events.add(EntitiesExtractedBatch(...))
+        ctx.db.commit()  # writes the task's rows and the event together
+"""
+
+import json
+import logging
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID, uuid4
+
+from eventsource.events import DomainEvent
+from sqlalchemy import bindparam, event, text
+from sqlalchemy.orm import Session, SessionTransaction
+
+if TYPE_CHECKING:
+    from app.eventsourcing.stores.factory import SyncEventStoreWrapper
+
+logger = logging.getLogger(__name__)
+
+# Statements mirror PostgreSQLEventStore.append_events and _write_to_outbox,
+# so events written here are indistinguishable from events it appends. The
+# store has no public insert helper, so test_batch compares the rows written
+# here with the rows the installed store writes.
+_CURRENT_VERSIONS = text("""
+    SELECT aggregate_id, aggregate_type, MAX(version)
+    FROM events
+    WHERE aggregate_id IN :aggregate_ids
+    GROUP BY aggregate_id, aggregate_type
+""").bindparams(bindparam("aggregate_ids", expanding=True))
+
+_INSERT_EVENT = text("""
+    INSERT INTO events (
+        event_id, event_type, aggregate_type, aggregate_id,
+        tenant_id, actor_id, version, timestamp, payload, created_at
+    )
+    VALUES (
+        :event_id, :event_type, :aggregate_type, :aggregate_id,
+        :tenant_id, :actor_id, :version, :timestamp, :payload, NOW()
+    )
+""")
+
+_INSERT_OUTBOX = text("""
+    INSERT INTO event_outbox (
+        id, event_id, event_type, aggregate_id, aggregate_type,
+        tenant_id, event_data, created_at, status
+    )
+    VALUES (
+        :id, :event_id, :event_type, :aggregate_id, :aggregate_type,
+        :tenant_id, :event_data, :created_at, 'pending'
+    )
+""")
+
+
+def _aggregate_key(event_: DomainEvent) -> tuple[str, str]:
+    return str(event_.aggregate_id), getattr(event_, "aggregate_type", "Unknown")
+
+
+def group_by_aggregate(
+    events: Iterable[DomainEvent],
+) -> dict[tuple[str, str], list[DomainEvent]]:
+    """
+    Group events by (aggregate_id, aggregate_type), keeping their order.
+
+    Args:
+        events: Events to group
+
+    Returns:
+        Events per aggregate key, in order of first appearance
+    """
+    groups: dict[tuple[str, str], list[DomainEvent]] = {}
+    for event_ in events:
+        groups.setdefault(_aggregate_key(event_), []).append(event_)
+    return groups
+
+
+def write_events(session: Session, events: Sequence[DomainEvent], outbox_enabled: bool) -> None:
+    """
+    Write events (and outbox rows) in the session's current transaction.
+
+    Each event gets the next version of its aggregate stream; a concurrent
+    writer on the same stream fails the unique (aggregate, version)
+    constraint rather than interleaving.
+
+    Args:
+        session: Sync session whose transaction the events join
+        events: Events to write
+        outbox_enabled: Whether to write an event_outbox row per event
+    """
+    if not events:
+        return
+
+    groups = group_by_aggregate(events)
+    result = session.execute(
+        _CURRENT_VERSIONS,
+        {"aggregate_ids": sorted({aggregate_id for aggregate_id, _ in groups})},
+    )
+    versions = {(str(row[0]), row[1]): row[2] or 0 for row in result}
+
+    event_rows: list[dict] = []
+    outbox_rows: list[dict] = []
+    now = datetime.now(UTC)
+    for (aggregate_id, aggregate_type), group in groups.items():
+        version = versions.get((aggregate_id, aggregate_type), 0)
+        for event_ in group:
+            version += 1
+            tenant_id = str(event_.tenant_id) if event_.tenant_id else None
+            event_rows.append({
+                "event_id": str(event_.event_id),
+                "event_type": event_.event_type,
+                "aggregate_type": aggregate_type,
+                "aggregate_id": aggregate_id,
+                "tenant_id": tenant_id,
+                "actor_id": event_.actor_id,
+                "version": version,
+                "timestamp": event_.occurred_at,
+                "payload": json.dumps(event_.model_dump(mode="json")),
+            })
+            if outbox_enabled:
+                outbox_rows.append({
+                    "id": str(uuid4()),
+                    "event_id": str(event_.event_id),
+                    "event_type": event_.event_type,
+                    "aggregate_id": aggregate_id,
+                    "aggregate_type": aggregate_type,
+                    "tenant_id": tenant_id,
+                    "event_data": json.dumps({
+                        "event_id": str(event_.event_id),
+                        "aggregate_id": aggregate_id,
+                        "aggregate_type": aggregate_type,
+                        "tenant_id": tenant_id,
+                        "occurred_at": event_.occurred_at.isoformat(),
+                        "payload": event_.model_dump(mode="json"),
+                    }),
+                    "created_at": now,
+                })
+
+    session.execute(_INSERT_EVENT, event_rows)
+    if outbox_rows:
+        session.execute(_INSERT_OUTBOX, outbox_rows)
+
+
+class SyncEventBatch:
+    """Domain events collected during a task and appended together.
+
+    Attributes:
+        transactional: Whether events are written in the session's transaction
+    """
+
+    def __init__(
+        self,
+        event_store: "SyncEventStoreWrapper",
+        session: Optional[Session] = None,
+    ) -> None:
+        """
+        Initialize the batch.
+
+        Args:
+            event_store: Sync event store the events are appended to
+            session: Optional sync session whose commits append the events
+        """
+        self._store = event_store
+        self._session = session
+        self.transactional = session is not None and event_store.transactional
+        self._pending: list[DomainEvent] = []
+        self._event_ids: set[UUID] = set()
+        # Events that could not be written in the transaction; appended
+        # through the store once it commits
+        self._deferred: list[DomainEvent] = []
+
+        if session is not None:
+            event.listen(session, "before_commit", self._before_commit)
+            event.listen(session, "after_commit", self._after_commit)
+            event.listen(session, "after_soft_rollback", self._after_soft_rollback)
+
+    def __len__(self) -> int:
+        return len(self._pending) + len(self._deferred)
+
+    def __enter__(self) -> "SyncEventBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def add(self, event_: DomainEvent) -> None:
+        """
+        Collect an event; adding the same event twice has no effect.
+
+        Args:
+            event_: Event to append with the batch
+        """
+        if event_.event_id in self._event_ids:
+            return
+        self._event_ids.add(event_.event_id)
+        self._pending.append(event_)
+
+        # A commit without an open transaction is a no-op that fires no
+        # hooks, so make sure there is one to carry the events
+        if self._session is not None:
+            self._session.connection()
+
+    def extend(self, events: Iterable[DomainEvent]) -> None:
+        """
+        Collect several events.
+
+        Args:
+            events: Events to append with the batch
+        """
+        for event_ in events:
+            self.add(event_)
+
+    def flush(self) -> int:
+        """
+        Append the collected events now.
+
+        A transactional batch writes them into the session's open
+        transaction (they commit or roll back with it); any other batch
+        appends them through the event store.
+
+        Returns:
+            Number of events written or appended
+        """
+        if self.transactional:
+            return self._write_pending()
+
+        events = self._deferred + self._pending
+        self._deferred = []
+        self._pending = []
+        if events:
+            self._store.append_batch_sync(events)
+        return len(events)
+
+    def discard(self) -> None:
+        """Drop the collected events without appending them."""
+        self._pending = []
+        self._deferred = []
+        self._event_ids = set()
+
+    def close(self) -> None:
+        """Detach from the session; events still collected are dropped."""
+        if self._session is not None:
+            event.remove(self._session, "before_commit", self._before_commit)
+            event.remove(self._session, "after_commit", self._after_commit)
+            event.remove(self._session, "after_soft_rollback", self._after_soft_rollback)
+            self._session = None
+        if len(self):
+            logger.warning(
+                "Discarding uncommitted task events",
+                extra={"event_count": len(self)},
+            )
+        self.discard()
+
+    def _write_pending(self) -> int:
+        events = self._pending
+        if not events:
+            return 0
+        self._pending = []
+        try:
+            # The savepoint keeps a failed write from aborting the task's
+            # own transaction
+            with self._session.begin_nested():
+                write_events(self._session, events, self._store.outbox_enabled)
+        except Exception as e:
+            logger.warning(
+                "Failed to write task events in transaction, appending after commit",
+                extra={"event_count": len(events), "error": str(e)},
+            )
+            self._deferred.extend(events)
+            return 0
+        return len(events)
+
+    def _before_commit(self, session: Session) -> None:
+        if session.in_nested_transaction() or not self.transactional:
+            return
+        self._write_pending()
+
+    def _after_commit(self, session: Session) -> None:
+        if session.in_nested_transaction():
+            return
+        events = self._deferred + self._pending
+        self._deferred = []
+        self._pending = []
+        self._event_ids = set()
+        if not events:
+            return
+        try:
+            self._store.append_batch_sync(events)
+        except Exception as e:
+            logger.warning(
+                "Failed to append task events",
+                extra={"event_count": len(events), "error": str(e)},
+            )
+
+    def _after_soft_rollback(self, session: Session, previous: SessionTransaction) -> None:
+        if previous.nested:
+            return
+        self.discard()
+
+
+__all__ = [
+    "SyncEventBatch",
+    "group_by_aggregate",
+    "write_events",
+]
@@ -0,0 +1,323 @@
+"""
+Idempotency index of page content that has triggered extraction.
+
+ExtractionTriggerHandler claims a (tenant_id, content_hash) pair before it
+creates an ExtractionProcess. A claim succeeds only once, so the same page
+content never triggers two extractions.
+
+The claim and the process are saved in two steps, so a handler that crashes
+between them leaves a claim without a process. reclaim() hands such a claim
+to a new process once it is older than claim_timeout and its process still
+does not exist:
+
+- PostgreSQLContentHashStore claims with INSERT ... ON CONFLICT DO NOTHING
+  on the processed_content_hashes table, so the index survives restarts and
+  projection replays and is shared by all replicas. A bounded LRU of pairs
+  known to have a process answers repeats without a database round trip.
+- InMemoryContentHashStore keeps the claims in a dict, for tests and for
+  deployments running on the in-memory event store.
+
+Example:
+    store = await get_content_hash_store()
+    if await store.claim(tenant_id, content_hash, process_id) or await store.reclaim(
+        tenant_id, content_hash, process_id, process_exists=repo.exists
+    ):
+        ...  # create the process; on failure:
+        await store.release(tenant_id, content_hash)
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.processed_content_hash import ProcessedContentHash
+
+logger = logging.getLogger(__name__)
+
+ProcessExists = Callable[[UUID], Awaitable[bool]]
+
+
+class ContentHashStore(ABC):
+    """Index of (tenant_id, content_hash) pairs claimed for extraction."""
+
+    @abstractmethod
+    async def claim(self, tenant_id: UUID, content_hash: str, process_id: UUID) -> bool:
+        """
+        Claim content for extraction.
+
+        Args:
+            tenant_id: Tenant the content belongs to
+            content_hash: Hash of the page content
+            process_id: ExtractionProcess that will extract the content
+
+        Returns:
+            True if this call claimed the content, False if it was already claimed
+        """
+
+    @abstractmethod
+    async def reclaim(
+        self,
+        tenant_id: UUID,
+        content_hash: str,
+        process_id: UUID,
+        process_exists: ProcessExists,
+    ) -> bool:
+        """
+        Take over a stale claim whose extraction process was never created.
+
+        Args:
+            tenant_id: Tenant the content belongs to
+            content_hash: Hash of the page content
+            process_id: ExtractionProcess that will extract the content
+            process_exists: Checks whether the claiming process was saved
+
+        Returns:
+            True if the claim now belongs to process_id
+        """
+
+    @abstractmethod
+    async def release(self, tenant_id: UUID, content_hash: str) -> None:
+        """
+        Release a claim whose extraction process could not be created.
+
+        Args:
+            tenant_id: Tenant the content belongs to
+            content_hash: Hash of the page content
+        """
+
+    @abstractmethod
+    async def contains(self, tenant_id: UUID, content_hash: str) -> bool:
+        """
+        Check whether content has been claimed.
+
+        Args:
+            tenant_id: Tenant the content belongs to
+            content_hash: Hash of the page content
+
+        Returns:
+            True if the content has been claimed
+        """
+
+
+class InMemoryContentHashStore(ContentHashStore):
+    """Process-local content hash index.
+
+    Attributes:
+        claim_timeout: Age after which a claim without a process is reclaimed
+    """
+
+    def __init__(
+        self,
+        claimed: set[tuple[UUID, str]] | None = None,
+        claim_timeout: timedelta = timedelta(minutes=5),
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            claimed: Optional pre-claimed (tenant_id, content_hash) pairs,
+                never reclaimed as their processes are unknown
+            claim_timeout: Age after which a claim without a process is reclaimed
+        """
+        self.claim_timeout = claim_timeout
+        # (tenant_id, content_hash) -> (process_id, claimed_at)
+        self._claimed: dict[tuple[UUID, str], tuple[UUID | None, datetime]] = {
+            key: (None, datetime.min.replace(tzinfo=UTC)) for key in claimed or ()
+        }
+
+    async def claim(self, tenant_id: UUID, content_hash: str, process_id: UUID) -> bool:
+        key = (tenant_id, content_hash)
+        if key in self._claimed:
+            return False
+        self._claimed[key] = (process_id, datetime.now(UTC))
+        return True
+
+    async def reclaim(
+        self,
+        tenant_id: UUID,
+        content_hash: str,
+        process_id: UUID,
+        process_exists: ProcessExists,
+    ) -> bool:
+        key = (tenant_id, content_hash)
+        owner, claimed_at = self._claimed.get(key, (None, None))
+        if owner is None or claimed_at > datetime.now(UTC) - self.claim_timeout:
+            return False
+        if await process_exists(owner):
+            return False
+        # Another handler may have reclaimed it while the process was looked up
+        if self._claimed.get(key, (None,))[0] != owner:
+            return False
+        self._claimed[key] = (process_id, datetime.now(UTC))
+        return True
+
+    async def release(self, tenant_id: UUID, content_hash: str) -> None:
+        self._claimed.pop((tenant_id, content_hash), None)
+
+    async def contains(self, tenant_id: UUID, content_hash: str) -> bool:
+        return (tenant_id, content_hash) in self._claimed
+
+    def __len__(self) -> int:
+        return len(self._claimed)
+
+
+class PostgreSQLContentHashStore(ContentHashStore):
+    """Content hash index in the processed_content_hashes table.
+
+    Attributes:
+        cache_size: Maximum number of claimed pairs kept in the LRU
+        claim_timeout: Age after which a claim without a process is reclaimed
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        cache_size: int = 50_000,
+        claim_timeout: timedelta = timedelta(minutes=5),
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            session_factory: SQLAlchemy async session factory
+            cache_size: Maximum number of claimed pairs cached in process
+            claim_timeout: Age after which a claim without a process is reclaimed
+        """
+        self._session_factory = session_factory
+        self.cache_size = cache_size
+        self.claim_timeout = claim_timeout
+        # Pairs claimed by this instance or known to have a process, least
+        # recently seen first
+        self._cache: OrderedDict[tuple[UUID, str], None] = OrderedDict()
+
+    def _cached(self, key: tuple[UUID, str]) -> bool:
+        if key not in self._cache:
+            return False
+        self._cache.move_to_end(key)
+        return True
+
+    def _remember(self, key: tuple[UUID, str]) -> None:
+        self._cache[key] = None
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def claim(self, tenant_id: UUID, content_hash: str, process_id: UUID) -> bool:
+        key = (tenant_id, content_hash)
+        # A cached pair was claimed here or has a process, so it is never
+        # released or reclaimed by other instances
+        if self._cached(key):
+            return False
+
+        stmt = (
+            insert(ProcessedContentHash)
+            .values(tenant_id=tenant_id, content_hash=content_hash, process_id=process_id)
+            .on_conflict_do_nothing(index_elements=["tenant_id", "content_hash"])
+            .returning(ProcessedContentHash.process_id)
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            claimed = result.scalar_one_or_none() is not None
+            await session.commit()
+
+        # A lost claim is not cached, as its process may never be created
+        if claimed:
+            self._remember(key)
+        return claimed
+
+    async def reclaim(
+        self,
+        tenant_id: UUID,
+        content_hash: str,
+        process_id: UUID,
+        process_exists: ProcessExists,
+    ) -> bool:
+        key = (tenant_id, content_hash)
+        if self._cached(key):
+            return False
+
+        claimed = (
+            ProcessedContentHash.tenant_id == tenant_id,
+            ProcessedContentHash.content_hash == content_hash,
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(ProcessedContentHash.process_id).where(
+                    *claimed,
+                    ProcessedContentHash.created_at < func.now() - self.claim_timeout,
+                )
+            )
+            owner = result.scalar_one_or_none()
+        if owner is None:
+            return False
+        if await process_exists(owner):
+            self._remember(key)
+            return False
+
+        # Only one instance replaces the stale owner
+        async with self._session_factory() as session:
+            result = await session.execute(
+                update(ProcessedContentHash)
+                .where(*claimed, ProcessedContentHash.process_id == owner)
+                .values(process_id=process_id, created_at=func.now())
+                .returning(ProcessedContentHash.process_id)
+            )
+            reclaimed = result.scalar_one_or_none() is not None
+            await session.commit()
+
+        if reclaimed:
+            self._remember(key)
+            logger.warning(
+                "Reclaimed content hash claim without an extraction process",
+                extra={
+                    "tenant_id": str(tenant_id),
+                    "content_hash": content_hash,
+                    "stale_process_id": str(owner),
+                    "process_id": str(process_id),
+                },
+            )
+        return reclaimed
+
+    async def release(self, tenant_id: UUID, content_hash: str) -> None:
+        self._cache.pop((tenant_id, content_hash), None)
+        async with self._session_factory() as session:
+            await session.execute(
+                delete(ProcessedContentHash).where(
+                    ProcessedContentHash.tenant_id == tenant_id,
+                    ProcessedContentHash.content_hash == content_hash,
+                )
+            )
+            await session.commit()
+
+    async def contains(self, tenant_id: UUID, content_hash: str) -> bool:
+        key = (tenant_id, content_hash)
+        if self._cached(key):
+            return True
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(ProcessedContentHash.process_id).where(
+                    ProcessedContentHash.tenant_id == tenant_id,
+                    ProcessedContentHash.content_hash == content_hash,
+                )
+            )
+            found = result.scalar_one_or_none() is not None
+
+        if found:
+            self._remember(key)
+        return found
+
+
+__all__ = [
+    "ContentHashStore",
+    "ProcessExists",
+    "InMemoryContentHashStore",
+    "PostgreSQLContentHashStore",
+]
@@ -7,25 +7,42 @@ configuration and connection management.
 Factory Functions:
     - get_event_store(): Async factory for FastAPI endpoints (preferred)
     - get_event_store_sync(): Sync factory for Celery tasks
+    - get_snapshot_store(): Async factory for the aggregate snapshot store
+    - get_content_hash_store(): Async factory for the extraction trigger
+      idempotency index
     - close_event_store(): Cleanup for application shutdown
 """
 
 import logging
 from collections.abc import Sequence
+from datetime import timedelta
 from typing import Optional
 
 from eventsource import PostgreSQLEventStore, InMemoryEventStore
 from eventsource.events import DomainEvent, default_registry
+from eventsource.stores import ExpectedVersion
+from eventsource.snapshots import (
+    InMemorySnapshotStore,
+    PostgreSQLSnapshotStore,
+    SnapshotStore,
+)
 from eventsource.stores import EventStore
-from eventsource.sync import SyncEventStoreAdapter
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal
+from app.eventsourcing.stores.batch import SyncEventBatch, group_by_aggregate
+from app.eventsourcing.stores.content_hashes import (
+    ContentHashStore,
+    InMemoryContentHashStore,
+    PostgreSQLContentHashStore,
+)
+from app.worker.runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -80,19 +97,21 @@ def _get_worker_async_session_factory() -> async_sessionmaker[AsyncSession]:
 
 class SyncEventStoreWrapper:
     """
-    Thin wrapper over eventsource.sync.SyncEventStoreAdapter.
+    Synchronous facade over an async event store for Celery tasks.
 
-    Provides backward-compatible convenience methods for Celery tasks:
+    Provides convenience methods for Celery tasks:
     - append_sync(event): Append a single event
-    - append_events_sync(events): Append multiple events
+    - append_events_sync(events): Append multiple events of one aggregate
+    - append_batch_sync(events): Append events of any aggregates in one call
+    - batch(session): Collect events and append them when the session commits
 
-    Uses the library's SyncEventStoreAdapter for proper async/sync bridging
-    with timeout handling and thread safety.
+    Coroutines run on the worker process's shared async runtime
+    (app.worker.runtime) instead of a new event loop per call.
     """
 
     def __init__(self, event_store: EventStore, timeout: float = 30.0):
         self._store = event_store
-        self._adapter = SyncEventStoreAdapter(event_store, timeout=timeout)
+        self.timeout = timeout
 
     def append_sync(self, event: DomainEvent) -> None:
         """
@@ -123,21 +142,71 @@ class SyncEventStoreWrapper:
 
         # For notification events outside aggregate context, use version 0
         # (no optimistic locking needed)
-        self._adapter.append_events_sync(
-            aggregate_id=aggregate_id,
-            aggregate_type=aggregate_type,
-            events=list(events),
-            expected_version=0,
+        run_async(
+            self._store.append_events(
+                aggregate_id=aggregate_id,
+                aggregate_type=aggregate_type,
+                events=list(events),
+                expected_version=0,
+            ),
+            self.timeout,
         )
 
+    def append_batch_sync(self, events: Sequence[DomainEvent]) -> None:
+        """
+        Append events of any number of aggregates in one runtime call.
+
+        Events are grouped per aggregate and appended without a version
+        check, in order of first appearance.
+
+        Args:
+            events: Sequence of events to append
+        """
+        if not events:
+            return
+
+        async def _append() -> None:
+            for (_aggregate_id, aggregate_type), group in group_by_aggregate(events).items():
+                await self._store.append_events(
+                    aggregate_id=group[0].aggregate_id,
+                    aggregate_type=aggregate_type,
+                    events=group,
+                    expected_version=ExpectedVersion.ANY,
+                )
+
+        run_async(_append(), self.timeout)
+
+    def batch(self, session: Optional[Session] = None) -> SyncEventBatch:
+        """
+        Start a batch of events appended together.
+
+        Args:
+            session: Sync session whose commits append the batch; without
+                one the batch is appended by SyncEventBatch.flush()
+
+        Returns:
+            SyncEventBatch collecting the events
+        """
+        return SyncEventBatch(self, session)
+
     @property
     def outbox_enabled(self) -> bool:
         """Check if outbox is enabled on underlying store."""
         return getattr(self._store, "outbox_enabled", False)
 
+    @property
+    def transactional(self) -> bool:
+        """Whether batches are written in the task's own transaction."""
+        return settings.EVENT_STORE_SYNC_TRANSACTIONAL and isinstance(
+            self._store, PostgreSQLEventStore
+        )
+
+
 # Singleton instances
 _event_store: Optional[EventStore] = None
 _sync_event_store: Optional[SyncEventStoreWrapper] = None
+_snapshot_store: Optional[SnapshotStore] = None
+_content_hash_store: Optional[ContentHashStore] = None
 
 
 def create_event_store() -> EventStore:
@@ -187,13 +256,83 @@ async def get_event_store() -> EventStore:
     return _event_store
 
 
+def create_snapshot_store() -> Optional[SnapshotStore]:
+    """
+    Create a new snapshot store instance.
+
+    Snapshots are kept in the snapshots table next to the events, so an
+    aggregate loads from its latest snapshot plus the events after it.
+
+    Returns:
+        SnapshotStore, or None if snapshots are disabled
+    """
+    if not settings.SNAPSHOT_ENABLED:
+        return None
+
+    if not settings.EVENT_STORE_ENABLED:
+        logger.info("Event store disabled, using InMemorySnapshotStore")
+        return InMemorySnapshotStore()
+
+    return PostgreSQLSnapshotStore(
+        session_factory=AsyncSessionLocal,
+        enable_tracing=True,
+    )
+
+
+async def get_snapshot_store() -> Optional[SnapshotStore]:
+    """
+    Get the singleton snapshot store instance.
+
+    Returns:
+        The application's snapshot store, or None if snapshots are disabled
+    """
+    global _snapshot_store
+    if _snapshot_store is None:
+        _snapshot_store = create_snapshot_store()
+    return _snapshot_store
+
+
+def create_content_hash_store() -> ContentHashStore:
+    """
+    Create a new content hash store instance.
+
+    Returns:
+        PostgreSQLContentHashStore, or InMemoryContentHashStore if event
+        sourcing is disabled
+    """
+    if not settings.EVENT_STORE_ENABLED:
+        logger.info("Event store disabled, using InMemoryContentHashStore")
+        return InMemoryContentHashStore(
+            claim_timeout=timedelta(seconds=settings.CONTENT_HASH_CLAIM_TIMEOUT_SECONDS)
+        )
+
+    return PostgreSQLContentHashStore(
+        session_factory=AsyncSessionLocal,
+        cache_size=settings.CONTENT_HASH_CACHE_SIZE,
+        claim_timeout=timedelta(seconds=settings.CONTENT_HASH_CLAIM_TIMEOUT_SECONDS),
+    )
+
+
+async def get_content_hash_store() -> ContentHashStore:
+    """
+    Get the singleton content hash store instance.
+
+    Returns:
+        The application's content hash store
+    """
+    global _content_hash_store
+    if _content_hash_store is None:
+        _content_hash_store = create_content_hash_store()
+    return _content_hash_store
+
+
 async def close_event_store() -> None:
     """
     Clean up event store resources.
 
     Should be called during application shutdown to ensure proper cleanup.
     """
-    global _event_store, _sync_event_store
+    global _event_store, _sync_event_store, _snapshot_store, _content_hash_store
     if _event_store is not None:
         # PostgreSQLEventStore doesn't need explicit cleanup
         # (uses shared session factory)
@@ -202,6 +341,8 @@ async def close_event_store() -> None:
     if _sync_event_store is not None:
         _sync_event_store = None
         logger.info("Sync event store closed")
+    _snapshot_store = None
+    _content_hash_store = None
 
 
 def create_sync_event_store() -> SyncEventStoreWrapper:
@@ -6,10 +6,16 @@ projection handlers for the Knowledge Mapper application. Enables resumable even
 processing with checkpoint tracking.
 
 This module integrates:
-- EntityProjectionHandler: Projects EntityExtracted events to extracted_entities table
-- RelationshipProjectionHandler: Projects RelationshipDiscovered events
+- EntityProjectionHandler: Projects EntityExtracted and EntitiesRecordedBatch events
+  to extracted_entities table
+- RelationshipProjectionHandler: Projects RelationshipDiscovered and
+  RelationshipsRecordedBatch events
 - ExtractionProcessProjectionHandler: Projects extraction lifecycle events
 
+Before the subscriptions start, the backlog is replayed by PartitionedCatchUp
+across PROJECTION_CATCHUP_PARTITIONS parallel partitions, each with its own
+checkpoint; rebuild() replays everything in rebuild mode with batch writes.
+
 Example:
     >>> from app.eventsourcing.subscriptions import get_subscription_manager
     >>> manager = await get_subscription_manager()
@@ -18,11 +24,13 @@ Example:
     >>> await manager.stop()
 """
 
+import functools
 import logging
 from typing import TYPE_CHECKING
 
 from eventsource.repositories.checkpoint import PostgreSQLCheckpointRepository
 from eventsource.subscriptions import SubscriptionManager, SubscriptionConfig
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import settings
 from app.core.database import engine, AsyncSessionLocal
@@ -33,6 +41,7 @@ from app.eventsourcing.projections.extraction import (
     RelationshipProjectionHandler,
     ExtractionProcessProjectionHandler,
 )
+from app.eventsourcing.projections.partitioned import CatchUpSummary, PartitionedCatchUp
 
 if TYPE_CHECKING:
     from eventsource.stores import EventStore
@@ -43,6 +52,13 @@ logger = logging.getLogger(__name__)
 # Global singleton instance
 _subscription_manager: "ExtractionSubscriptionManager | None" = None
 
+# Subscription names, in the order their handlers are applied during catch-up
+SUBSCRIPTION_NAMES = (
+    "EntityProjection",
+    "RelationshipProjection",
+    "ExtractionProcessProjection",
+)
+
 
 class ExtractionSubscriptionManager:
     """
@@ -80,6 +96,8 @@ class ExtractionSubscriptionManager:
         entity_handler: EntityProjectionHandler,
         relationship_handler: RelationshipProjectionHandler,
         process_handler: ExtractionProcessProjectionHandler,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        enable_tracing: bool = True,
     ) -> None:
         """
         Initialize the extraction subscription manager.
@@ -94,6 +112,8 @@ class ExtractionSubscriptionManager:
             entity_handler: Handler for EntityExtracted events
             relationship_handler: Handler for RelationshipDiscovered events
             process_handler: Handler for extraction process lifecycle events
+            session_factory: Session factory for the catch-up's projections
+            enable_tracing: Enable tracing for the catch-up's projections
         """
         self._event_store = event_store
         self._event_bus = event_bus
@@ -101,6 +121,8 @@ class ExtractionSubscriptionManager:
         self._entity_handler = entity_handler
         self._relationship_handler = relationship_handler
         self._process_handler = process_handler
+        self._session_factory = session_factory
+        self._enable_tracing = enable_tracing
         self._manager: SubscriptionManager | None = None
         self._running = False
 
@@ -176,6 +198,122 @@ class ExtractionSubscriptionManager:
             entity_handler=entity_handler,
             relationship_handler=relationship_handler,
             process_handler=process_handler,
+            enable_tracing=enable_tracing,
+        )
+
+    def _partitioned_catch_up(
+        self,
+        rebuild: bool = False,
+        partitions: int | None = None,
+        partition_key: str | None = None,
+    ) -> PartitionedCatchUp:
+        """Create a PartitionedCatchUp over the three projections."""
+        handler_types = (
+            type(self._entity_handler),
+            type(self._relationship_handler),
+            type(self._process_handler),
+        )
+        return PartitionedCatchUp(
+            event_store=self._event_store,
+            checkpoint_repo=self._checkpoint_repo,
+            # Each worker gets its own handler instances
+            projection_factories=[
+                functools.partial(
+                    handler_type,
+                    session_factory=self._session_factory,
+                    checkpoint_repo=self._checkpoint_repo,
+                    enable_tracing=self._enable_tracing,
+                )
+                for handler_type in handler_types
+            ],
+            session_factory=self._session_factory,
+            partitions=partitions or settings.PROJECTION_CATCHUP_PARTITIONS,
+            partition_key=partition_key or settings.PROJECTION_CATCHUP_PARTITION_KEY,
+            batch_size=settings.PROJECTION_CATCHUP_BATCH_SIZE,
+            rebuild=rebuild,
+        )
+
+    async def catch_up(
+        self,
+        rebuild: bool = False,
+        partitions: int | None = None,
+        partition_key: str | None = None,
+    ) -> CatchUpSummary:
+        """
+        Replay the event store backlog across parallel partitions.
+
+        Partitions without a checkpoint start where the slowest
+        subscription stopped. Afterwards the subscription checkpoints are
+        moved up to the caught-up position, so start() only streams what
+        was appended since.
+
+        Args:
+            rebuild: Apply chunks in one transaction with batch writes
+            partitions: Number of partitions (defaults to settings)
+            partition_key: "tenant" or "page" (defaults to settings)
+
+        Returns:
+            CatchUpSummary of the run
+
+        Raises:
+            RuntimeError: If the live subscriptions are running
+        """
+        if self._running:
+            raise RuntimeError("Cannot catch up while the subscriptions are running")
+
+        subscribed = [
+            await self._checkpoint_repo.get_position(name) for name in SUBSCRIPTION_NAMES
+        ]
+        catch_up = self._partitioned_catch_up(rebuild, partitions, partition_key)
+        summary = await catch_up.run(
+            initial_position=min(position or 0 for position in subscribed)
+        )
+
+        if summary.last_event_id is not None:
+            for name, position in zip(SUBSCRIPTION_NAMES, subscribed, strict=True):
+                if (position or 0) < summary.position:
+                    await self._checkpoint_repo.save_position(
+                        name,
+                        summary.position,
+                        summary.last_event_id,
+                        summary.last_event_type,
+                    )
+        return summary
+
+    async def rebuild(
+        self,
+        partitions: int | None = None,
+        partition_key: str | None = None,
+    ) -> CatchUpSummary:
+        """
+        Rebuild the read models by replaying every event in rebuild mode.
+
+        Resets the projections and all checkpoints, then replays the whole
+        event store across parallel partitions with one transaction per
+        chunk and batch writes. An interrupted rebuild is resumed with
+        catch_up(rebuild=True) and the same partitioning.
+
+        Args:
+            partitions: Number of partitions (defaults to settings)
+            partition_key: "tenant" or "page" (defaults to settings)
+
+        Returns:
+            CatchUpSummary of the run
+
+        Raises:
+            RuntimeError: If the live subscriptions are running
+        """
+        if self._running:
+            raise RuntimeError("Cannot rebuild while the subscriptions are running")
+
+        for handler in (self._entity_handler, self._relationship_handler, self._process_handler):
+            await handler.reset()
+        for name in SUBSCRIPTION_NAMES:
+            await self._checkpoint_repo.reset_checkpoint(name)
+        await self._partitioned_catch_up(True, partitions, partition_key).reset()
+
+        return await self.catch_up(
+            rebuild=True, partitions=partitions, partition_key=partition_key
         )
 
     async def _initialize_manager(self) -> SubscriptionManager:
@@ -203,31 +341,13 @@ class ExtractionSubscriptionManager:
         )
 
         # Register projection handlers
-        await manager.subscribe(
-            self._entity_handler,
-            config=config,
-            name="EntityProjection",
-        )
-        await manager.subscribe(
-            self._relationship_handler,
-            config=config,
-            name="RelationshipProjection",
-        )
-        await manager.subscribe(
-            self._process_handler,
-            config=config,
-            name="ExtractionProcessProjection",
-        )
+        handlers = (self._entity_handler, self._relationship_handler, self._process_handler)
+        for handler, name in zip(handlers, SUBSCRIPTION_NAMES, strict=True):
+            await manager.subscribe(handler, config=config, name=name)
 
         logger.info(
             "Registered projection handlers",
-            extra={
-                "handlers": [
-                    "EntityProjection",
-                    "RelationshipProjection",
-                    "ExtractionProcessProjection",
-                ],
-            },
+            extra={"handlers": list(SUBSCRIPTION_NAMES)},
         )
 
         return manager
@@ -237,7 +357,9 @@ class ExtractionSubscriptionManager:
         Start the subscription manager and begin processing events.
 
         Initializes the SubscriptionManager, registers all handlers, and
-        starts event processing. Each handler will:
+        starts event processing. With PROJECTION_CATCHUP_PARTITIONS above 1
+        the backlog is first replayed by catch_up() across parallel
+        partitions. Each handler will then:
         1. Load its last checkpoint position
         2. Catch up from that position (if events are pending)
         3. Transition to live event processing
@@ -251,6 +373,9 @@ class ExtractionSubscriptionManager:
 
         logger.info("Starting extraction subscription manager")
 
+        if settings.PROJECTION_CATCHUP_PARTITIONS > 1:
+            await self.catch_up()
+
         # Initialize and start the manager
         self._manager = await self._initialize_manager()
         await self._manager.start()
@@ -33,6 +33,14 @@ from app.extraction.rate_limiter import (
     get_rate_limiter,
     reset_rate_limiter,
 )
+from app.extraction.scheduler import (
+    ExtractionPriority,
+    ExtractionScheduler,
+    LeaseState,
+    ScheduledJob,
+    get_extraction_scheduler,
+    reset_extraction_scheduler,
+)
 from app.extraction.retry import (
     RetryExhausted,
     ExtractionRetryPolicy,
@@ -78,6 +86,9 @@ from app.extraction.schemas import (
 )
 from app.extraction.worker import (
     process_extraction,
+    schedule_extraction,
+    schedule_page_extraction,
+    run_scheduled_extractions,
     ExtractionWorkerError,
     ProcessNotFoundError,
     PageContentNotFoundError,
@@ -117,6 +128,13 @@ __all__ = [
     "RateLimitExceeded",
     "get_rate_limiter",
     "reset_rate_limiter",
+    # Fair scheduling
+    "ExtractionPriority",
+    "ExtractionScheduler",
+    "LeaseState",
+    "ScheduledJob",
+    "get_extraction_scheduler",
+    "reset_extraction_scheduler",
     # Retry logic
     "RetryExhausted",
     "ExtractionRetryPolicy",
@@ -157,6 +175,9 @@ __all__ = [
     "get_property_schema_for_type",
     # Worker
     "process_extraction",
+    "schedule_extraction",
+    "schedule_page_extraction",
+    "run_scheduled_extractions",
     "ExtractionWorkerError",
     "ProcessNotFoundError",
     "PageContentNotFoundError",
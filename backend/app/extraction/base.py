@@ -171,6 +171,14 @@ class BaseExtractionService(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """Release network resources held by the service.
+
+        Services are cached and reused across extractions; this is called
+        when a cached service is evicted. The default does nothing.
+        """
+        return None
+
 
 class ExtractionError(Exception):
     """Base exception for extraction errors.
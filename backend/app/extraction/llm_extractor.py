@@ -173,6 +173,20 @@ def get_rate_limiter() -> RateLimiter:
     return _rate_limiter
 
 
+# Anthropic client, reused across calls on the worker's persistent loop
+_anthropic_client: Any = None
+
+
+def _get_anthropic_client() -> Any:
+    """Get or create the shared Anthropic client."""
+    global _anthropic_client
+    if _anthropic_client is None:
+        import anthropic
+
+        _anthropic_client = anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    return _anthropic_client
+
+
 def extract_entities_with_llm(
     text: str,
     tenant_id: str,
@@ -191,14 +205,10 @@ def extract_entities_with_llm(
     Returns:
         List of extracted entity dictionaries
     """
-    # Run async function in event loop
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    from app.worker.runtime import run_async
 
-    return loop.run_until_complete(
+    # Run on the worker's persistent loop so the Anthropic client is reused
+    return run_async(
         extract_entities_with_llm_async(text, tenant_id, max_text_length)
     )
 
@@ -233,14 +243,16 @@ async def extract_entities_with_llm_async(
         logger.debug("Text too short for LLM extraction")
         return []
 
+    # Imported here (not at module level) so the SDK stays optional; the
+    # except clauses below need it bound
+    import anthropic
+
     # Rate limiting
     rate_limiter = get_rate_limiter()
     await rate_limiter.acquire(tenant_id)
 
     try:
-        import anthropic
-
-        client = anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        client = _get_anthropic_client()
 
         # Call Claude with tool use
         response = await client.messages.create(
@@ -3,6 +3,9 @@ Ollama-based entity extraction service.
 
 Uses pydantic-ai with Ollama's OpenAI-compatible API for
 structured entity and relationship extraction from documentation.
+extract_streaming() instead streams the response through
+OllamaProvider.infer_stream() and hands entities to a sink as they
+complete (see app.extraction.streaming).
 """
 
 import logging
@@ -10,13 +13,40 @@ import time
 from uuid import UUID
 
 import httpx
+from pydantic import ValidationError
 from pydantic_ai import Agent
 from pydantic_ai.exceptions import UnexpectedModelBehavior
 from pydantic_ai.models.openai import OpenAIModel
 
+from app.core.concurrency import (
+    ConcurrencyLimitExceeded,
+    concurrency_slot,
+    get_concurrency_limiter,
+)
 from app.core.config import settings
-from app.extraction.prompts import DocumentationType, build_user_prompt, get_system_prompt
-from app.extraction.schemas import ExtractionResult
+from app.core.tokenization import get_tokenizer, truncate_to_tokens
+from app.extraction.prompts import (
+    PROMPT_VERSION,
+    DocumentationType,
+    build_user_prompt,
+    get_system_prompt,
+)
+from app.extraction.result_cache import (
+    ExtractionCacheKey,
+    ExtractionResultCache,
+    fingerprint,
+    get_extraction_result_cache,
+)
+from app.extraction.schemas import ExtractedEntitySchema, ExtractionResult
+from app.extraction.streaming import (
+    EntitySink,
+    EntityStreamParser,
+    build_streaming_prompt,
+    parse_entity,
+    parse_streamed_result,
+)
+from app.inference.providers.base import InferenceRequest
+from app.inference.providers.ollama import OllamaProvider
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +78,8 @@ class OllamaExtractionService:
     - Use specified model (gemma3:12b by default)
     - Produce validated Pydantic output
     - Handle extraction errors gracefully
+    - Reuse cached results for previously extracted content (if a
+      result cache is configured)
 
     Example:
         service = OllamaExtractionService()
@@ -65,6 +97,8 @@ class OllamaExtractionService:
         model: str | None = None,
         timeout: int | None = None,
         doc_type: DocumentationType = DocumentationType.GENERAL,
+        result_cache: ExtractionResultCache | None = None,
+        adaptive_concurrency: bool = False,
     ):
         """Initialize the Ollama extraction service.
 
@@ -73,11 +107,19 @@ class OllamaExtractionService:
             model: Model name (defaults to settings.OLLAMA_MODEL)
             timeout: Request timeout in seconds (defaults to settings.OLLAMA_TIMEOUT)
             doc_type: Default documentation type for prompt selection
+            result_cache: Optional extraction result cache checked before
+                calling the model
+            adaptive_concurrency: Bound in-flight requests to the Ollama
+                server with its shared adaptive concurrency limiter
         """
         self._base_url = base_url or settings.OLLAMA_BASE_URL
         self._model = model or settings.OLLAMA_MODEL
         self._timeout = timeout or settings.OLLAMA_TIMEOUT
         self._default_doc_type = doc_type
+        self._result_cache = result_cache
+        self._concurrency_limiter = (
+            get_concurrency_limiter(f"ollama:{self._base_url}") if adaptive_concurrency else None
+        )
 
         # Create custom httpx client with logging event hooks
         self._http_client = httpx.AsyncClient(
@@ -107,6 +149,13 @@ class OllamaExtractionService:
             result_retries=3,  # Allow up to 3 validation retries
         )
 
+        # Native streaming endpoint for extract_streaming()
+        self._stream_provider = OllamaProvider(
+            base_url=self._base_url,
+            default_model=self._model,
+            timeout=self._timeout,
+        )
+
         logger.info(
             "OllamaExtractionService initialized",
             extra={
@@ -197,6 +246,61 @@ class OllamaExtractionService:
             additional_context=additional_context,
         )
 
+    def _truncate(self, content: str, max_length: int | None) -> tuple[str, bool]:
+        """Cut content to the character limit and the token budget.
+
+        Args:
+            content: Page content
+            max_length: Max characters (defaults to settings.OLLAMA_MAX_CONTEXT_LENGTH)
+
+        Returns:
+            Tuple of (content, whether it was truncated)
+        """
+        max_len = max_length or settings.OLLAMA_MAX_CONTEXT_LENGTH
+        truncated = len(content) > max_len
+        content = content[:max_len]
+        if settings.OLLAMA_MAX_CONTEXT_TOKENS > 0:
+            content, cut = truncate_to_tokens(
+                content,
+                settings.OLLAMA_MAX_CONTEXT_TOKENS,
+                get_tokenizer(settings.CHUNK_TOKENIZER),
+            )
+            truncated = truncated or cut
+        return content, truncated
+
+    def result_cache_key(
+        self,
+        content: str,
+        max_length: int | None = None,
+        doc_type: DocumentationType | None = None,
+        additional_context: str | None = None,
+    ) -> ExtractionCacheKey:
+        """Build the result cache key for an extraction call.
+
+        The key covers the (truncated) content and every input that shapes
+        the prompt: the system prompt's doc type, the per-call doc type and
+        additional context. The page URL is excluded so mirrored pages hit.
+
+        Args:
+            content: Page content to analyze
+            max_length: Max content length (defaults to settings.OLLAMA_MAX_CONTEXT_LENGTH)
+            doc_type: Documentation type hint
+            additional_context: Optional additional context for extraction
+
+        Returns:
+            ExtractionCacheKey for the call
+        """
+        effective_doc_type = doc_type or self._default_doc_type
+        prompt_inputs = fingerprint(
+            self._default_doc_type.value, effective_doc_type.value, additional_context
+        )
+        return ExtractionCacheKey.build(
+            self._truncate(content, max_length)[0],
+            provider="ollama",
+            model=self._model,
+            prompt_version=f"{PROMPT_VERSION}:{prompt_inputs}",
+        )
+
     async def extract(
         self,
         content: str,
@@ -205,6 +309,7 @@ class OllamaExtractionService:
         doc_type: DocumentationType | None = None,
         additional_context: str | None = None,
         tenant_id: UUID | None = None,
+        use_cache: bool = True,
     ) -> ExtractionResult:
         """Extract entities and relationships from content.
 
@@ -216,6 +321,8 @@ class OllamaExtractionService:
             additional_context: Optional additional context for extraction guidance.
             tenant_id: Optional tenant ID for rate limiting. If provided, rate limiting
                 will be enforced before extraction.
+            use_cache: Check and fill the result cache, if one is configured.
+                Callers that manage the cache themselves pass False.
 
         Returns:
             ExtractionResult with entities and relationships
@@ -223,7 +330,20 @@ class OllamaExtractionService:
         Raises:
             ExtractionError: If extraction fails due to connection, timeout, or validation errors
             RateLimitExceeded: If tenant_id is provided and rate limit is exceeded
+            ConcurrencyLimitExceeded: If no concurrency slot frees up in time
         """
+        # Cache hits skip the model and don't count against the rate limit
+        cache_key = None
+        if use_cache and self._result_cache is not None:
+            cache_key = self.result_cache_key(content, max_length, doc_type, additional_context)
+            cached = await self._result_cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    "Extraction served from result cache",
+                    extra={"page_url": page_url, "entity_count": cached.entity_count},
+                )
+                return cached
+
         # Check rate limit if tenant_id is provided
         if tenant_id is not None:
             from app.extraction.rate_limiter import get_rate_limiter
@@ -231,17 +351,14 @@ class OllamaExtractionService:
             rate_limiter = get_rate_limiter()
             await rate_limiter.acquire(tenant_id)
 
-        max_len = max_length or settings.OLLAMA_MAX_CONTEXT_LENGTH
         effective_doc_type = doc_type or self._default_doc_type
 
         # Truncate content if needed
-        truncated = False
-        if len(content) > max_len:
-            content = content[:max_len]
-            truncated = True
+        content, truncated = self._truncate(content, max_length)
+        if truncated:
             logger.debug(
                 "Content truncated for extraction",
-                extra={"max_length": max_len, "page_url": page_url},
+                extra={"max_length": len(content), "page_url": page_url},
             )
 
         # Build user prompt with doc type and context
@@ -270,7 +387,8 @@ class OllamaExtractionService:
 
             # Run extraction with pydantic-ai
             # pydantic-ai handles structured output validation
-            result = await self._agent.run(prompt)
+            async with concurrency_slot(self._concurrency_limiter):
+                data = (await self._agent.run(prompt)).data
 
             elapsed_seconds = time.time() - start_time
 
@@ -278,8 +396,8 @@ class OllamaExtractionService:
                 "Extraction completed successfully",
                 extra={
                     "page_url": page_url,
-                    "entity_count": result.data.entity_count,
-                    "relationship_count": result.data.relationship_count,
+                    "entity_count": data.entity_count,
+                    "relationship_count": data.relationship_count,
                     "truncated": truncated,
                     "doc_type": effective_doc_type.value,
                     "elapsed_seconds": round(elapsed_seconds, 2),
@@ -287,7 +405,14 @@ class OllamaExtractionService:
                 },
             )
 
-            return result.data
+            if cache_key is not None:
+                await self._result_cache.set(cache_key, data)
+
+            return data
+
+        except ConcurrencyLimitExceeded:
+            # Carries retry_after; callers retry like a rate limit
+            raise
 
         except httpx.HTTPStatusError as e:
             # Log HTTP errors (4xx/5xx) with full context
@@ -342,6 +467,148 @@ class OllamaExtractionService:
             )
             raise ExtractionError(f"Extraction failed: {e}", cause=e) from e
 
+    async def extract_streaming(
+        self,
+        content: str,
+        page_url: str,
+        sink: EntitySink,
+        max_length: int | None = None,
+        doc_type: DocumentationType | None = None,
+        additional_context: str | None = None,
+        use_cache: bool = True,
+    ) -> ExtractionResult:
+        """Extract entities, passing each to a sink as soon as it is complete.
+
+        The model is asked for the result as a bare JSON object through
+        OllamaProvider.infer_stream(), and EntityStreamParser hands each
+        item of its entities array to sink.add() while the rest of the
+        response is still being generated. The complete response is then
+        validated as usual. If the stream fails or the response does not
+        validate, the sink retracts its entities and the content is
+        extracted with extract(), whose validation retries apply.
+
+        Either way, the entities added to the sink and not retracted are
+        exactly the entities of the returned result.
+
+        Args:
+            content: Page content to analyze
+            page_url: URL of the page (for context)
+            sink: Receives entities as they are parsed
+            max_length: Max content length (defaults to settings.OLLAMA_MAX_CONTEXT_LENGTH)
+            doc_type: Documentation type for prompt optimization
+            additional_context: Optional additional context for extraction guidance
+            use_cache: Check and fill the result cache, if one is configured
+
+        Returns:
+            ExtractionResult with entities and relationships
+
+        Raises:
+            ExtractionError: If the non-streaming fallback fails
+            ConcurrencyLimitExceeded: If no concurrency slot frees up in time
+        """
+        cache_key = None
+        if use_cache and self._result_cache is not None:
+            cache_key = self.result_cache_key(content, max_length, doc_type, additional_context)
+            cached = await self._result_cache.get(cache_key)
+            if cached is not None:
+                for entity in cached.entities:
+                    await sink.add(entity)
+                return cached
+
+        effective_doc_type = doc_type or self._default_doc_type
+        truncated_content, truncated = self._truncate(content, max_length)
+        prompt = build_streaming_prompt(
+            self._build_prompt(
+                content=truncated_content,
+                page_url=page_url,
+                doc_type=effective_doc_type,
+                additional_context=additional_context,
+            )
+        )
+
+        parser = EntityStreamParser()
+        streamed: list[ExtractedEntitySchema] = []
+        pieces: list[str] = []
+        start_time = time.time()
+
+        try:
+            request = InferenceRequest(
+                prompt=prompt,
+                model=self._model,
+                system_prompt=self._get_system_prompt(),
+                temperature=settings.OLLAMA_TEMPERATURE,
+                max_tokens=settings.EXTRACTION_STREAMING_MAX_TOKENS,
+            )
+            async with concurrency_slot(self._concurrency_limiter):
+                async for chunk in self._stream_provider.infer_stream(request):
+                    if chunk.error:
+                        raise ExtractionError(chunk.error)
+                    pieces.append(chunk.content)
+                    for item in parser.feed(chunk.content):
+                        entity = parse_entity(item)
+                        if entity is not None:
+                            streamed.append(entity)
+                            await sink.add(entity)
+            data = parse_streamed_result("".join(pieces))
+
+        except (ExtractionError, ValidationError) as e:
+            logger.warning(
+                "Streaming extraction failed, extracting without streaming",
+                extra={
+                    "page_url": page_url,
+                    "streamed_entities": len(streamed),
+                    "error": str(e)[:500],
+                    "error_type": type(e).__name__,
+                },
+            )
+            if streamed:
+                await sink.retract(f"streamed response failed validation: {type(e).__name__}")
+                streamed = []
+            data = await self.extract(
+                content,
+                page_url,
+                max_length=max_length,
+                doc_type=doc_type,
+                additional_context=additional_context,
+                use_cache=use_cache,
+            )
+            for entity in data.entities:
+                await sink.add(entity)
+            return data
+
+        # The parser does not see the response as the validator does (a
+        # repeated "entities" key, say); record the validated entities
+        # afresh if they do not start with the streamed ones
+        if data.entities[: len(streamed)] != streamed:
+            await sink.retract("streamed entities differ from the validated response")
+            streamed = []
+        for entity in data.entities[len(streamed) :]:
+            await sink.add(entity)
+
+        logger.info(
+            "Streaming extraction completed successfully",
+            extra={
+                "page_url": page_url,
+                "entity_count": data.entity_count,
+                "relationship_count": data.relationship_count,
+                "streamed_entities": len(streamed),
+                "truncated": truncated,
+                "doc_type": effective_doc_type.value,
+                "elapsed_seconds": round(time.time() - start_time, 2),
+                "content_length": len(truncated_content),
+            },
+        )
+
+        if cache_key is not None:
+            await self._result_cache.set(cache_key, data)
+
+        return data
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx clients."""
+        await self._http_client.aclose()
+        await self._stream_provider.close()
+
     async def health_check(self) -> dict:
         """Check Ollama connectivity and model availability.
 
@@ -420,7 +687,9 @@ def get_ollama_extraction_service() -> OllamaExtractionService:
     """
     global _service
     if _service is None:
-        _service = OllamaExtractionService()
+        _service = OllamaExtractionService(
+            result_cache=get_extraction_result_cache(), adaptive_concurrency=True
+        )
     return _service
 
 
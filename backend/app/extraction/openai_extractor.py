@@ -5,6 +5,7 @@ Uses OpenAI's Chat Completions API with structured outputs (JSON mode)
 for entity and relationship extraction from documentation.
 """
 
+import hashlib
 import json
 import logging
 import time
@@ -14,6 +15,11 @@ import httpx
 from openai import AsyncOpenAI, APIError, APIConnectionError, RateLimitError
 from pydantic import ValidationError
 
+from app.core.concurrency import (
+    ConcurrencyLimitExceeded,
+    concurrency_slot,
+    get_concurrency_limiter,
+)
 from app.extraction.base import BaseExtractionService, ExtractionError
 from app.extraction.prompts import DocumentationType, build_user_prompt, get_system_prompt
 from app.extraction.schemas import ExtractionResult
@@ -57,6 +63,7 @@ class OpenAIExtractionService(BaseExtractionService):
         max_context_length: int = 8000,
         temperature: float = 0.1,
         doc_type: DocumentationType = DocumentationType.GENERAL,
+        adaptive_concurrency: bool = False,
     ):
         """Initialize the OpenAI extraction service.
 
@@ -67,6 +74,8 @@ class OpenAIExtractionService(BaseExtractionService):
             max_context_length: Maximum content length
             temperature: Sampling temperature (lower = more deterministic)
             doc_type: Default documentation type for prompt selection
+            adaptive_concurrency: Bound in-flight requests per model and API
+                key with a shared adaptive concurrency limiter
         """
         self._api_key = api_key
         self._model = model
@@ -75,6 +84,12 @@ class OpenAIExtractionService(BaseExtractionService):
         self._temperature = temperature
         self._default_doc_type = doc_type
 
+        # OpenAI rate limits apply per organization (API key) and model
+        key_id = hashlib.sha256(api_key.encode()).hexdigest()[:8]
+        self._concurrency_limiter = (
+            get_concurrency_limiter(f"openai:{model}:{key_id}") if adaptive_concurrency else None
+        )
+
         # Initialize async client
         self._client = AsyncOpenAI(
             api_key=api_key,
@@ -210,7 +225,8 @@ IMPORTANT: You MUST respond with valid JSON that conforms to this schema:
                 request_kwargs["temperature"] = self._temperature
 
             # Use structured outputs (JSON mode)
-            response = await self._client.chat.completions.create(**request_kwargs)
+            async with concurrency_slot(self._concurrency_limiter):
+                response = await self._client.chat.completions.create(**request_kwargs)
 
             elapsed_seconds = time.time() - start_time
 
@@ -250,6 +266,10 @@ IMPORTANT: You MUST respond with valid JSON that conforms to this schema:
 
             return result
 
+        except ConcurrencyLimitExceeded:
+            # Carries retry_after; callers retry like a rate limit
+            raise
+
         except ValidationError as e:
             preview = json_content[:3000] if json_content else "None"
             logger.error(
@@ -295,6 +315,10 @@ IMPORTANT: You MUST respond with valid JSON that conforms to this schema:
             )
             raise OpenAIExtractionError(f"Extraction failed: {e}", cause=e)
 
+    async def aclose(self) -> None:
+        """Close the underlying OpenAI HTTP client."""
+        await self._client.close()
+
     async def health_check(self) -> dict:
         """Check OpenAI API connectivity.
 
@@ -76,6 +76,10 @@ _RELATIONSHIP_TYPES: list[str] = [
     "instantiates",
 ]
 
+# Version of the prompts below. Part of the extraction result cache key, so
+# bump it whenever prompt wording or expected output changes.
+PROMPT_VERSION = "1"
+
 
 SYSTEM_PROMPT_BASE = '''You are an expert technical documentation analyzer specializing in Python libraries and frameworks.
 
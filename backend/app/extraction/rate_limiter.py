@@ -128,7 +128,8 @@ class OllamaRateLimiter:
             # Count requests in window
             await pipe.zcard(key)
             # Add current request (use timestamp as both score and member for uniqueness)
-            await pipe.zadd(key, {str(now): now})
+            member = str(now)
+            await pipe.zadd(key, {member: now})
             # Set expiry to clean up old keys
             await pipe.expire(key, self._window)
 
@@ -136,6 +137,9 @@ class OllamaRateLimiter:
             request_count = results[1]
 
         if request_count >= self._rpm:
+            # Rejected requests must not occupy a slot in the window
+            await r.zrem(key, member)
+
             # Get oldest request to calculate retry time
             oldest = await r.zrange(key, 0, 0, withscores=True)
             if oldest:
@@ -103,6 +103,7 @@ class OllamaServiceCreator(ExtractionServiceCreator):
         tenant_id: UUID,
     ) -> BaseExtractionService:
         from app.extraction.ollama_extractor import OllamaExtractionService
+        from app.extraction.result_cache import get_extraction_result_cache
 
         base_url = config.get("base_url")
         model = provider.default_model or config.get("model")
@@ -120,6 +121,8 @@ class OllamaServiceCreator(ExtractionServiceCreator):
             base_url=base_url,
             model=model,
             timeout=provider.timeout_seconds,
+            result_cache=get_extraction_result_cache(),
+            adaptive_concurrency=True,
         )
 
     def validate_config(self, config: dict) -> list[str]:
@@ -162,6 +165,7 @@ class OpenAIServiceCreator(ExtractionServiceCreator):
             timeout=provider.timeout_seconds,
             max_context_length=provider.max_context_length,
             temperature=temperature,
+            adaptive_concurrency=True,
         )
 
     def validate_config(self, config: dict) -> list[str]:
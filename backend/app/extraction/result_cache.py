@@ -0,0 +1,311 @@
+"""
+Content-addressed cache of LLM extraction results.
+
+Re-crawls, mirrored pages and boilerplate-heavy sites send byte-identical
+cleaned text to the LLM again and again. This cache stores validated
+ExtractionResult payloads in Redis so identical chunks skip the LLM.
+
+Architecture:
+    - Entries: extraction_result:{digest} -> ExtractionResult JSON, with TTL
+    - Index: extraction_result:index sorted set (digest scored by write time),
+      trimmed to EXTRACTION_RESULT_CACHE_MAX_ENTRIES oldest-first
+    - Digest: sha256 over (normalized text hash, provider, model,
+      schema version, prompt version)
+
+The key deliberately excludes tenant and page URL: extraction is a function
+of the text and the prompt, and mirrored pages under different URLs are
+exactly the duplicates worth catching. Like the embedding cache, every
+Redis failure degrades to a miss.
+
+Example usage:
+    >>> cache = get_extraction_result_cache()
+    >>> key = ExtractionCacheKey.build(text, provider="ollama", model="gemma3:12b")
+    >>> result = await cache.get(key)
+    >>> if result is None:
+    ...     result = await service.extract(content=text, page_url=url)
+    ...     await cache.set(key, result)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from prometheus_client import Counter
+
+from app.core.config import settings
+from app.extraction.prompts import PROMPT_VERSION
+from app.extraction.schemas import ExtractionResult
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# Cache key pattern: extraction_result:{digest}
+CACHE_KEY_PREFIX = "extraction_result"
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Hit rate: sum(rate(...{result="hit"})) / sum(rate(...{result=~"hit|miss"}))
+extraction_cache_lookups_total = Counter(
+    name="extraction_cache_lookups_total",
+    documentation="Extraction result cache lookups by provider and outcome",
+    labelnames=["provider", "result"],
+)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize chunk text before hashing.
+
+    Applies NFC normalization and collapses whitespace runs, so text that
+    differs only in line wrapping or indentation shares a cache entry.
+
+    Args:
+        text: Cleaned chunk text
+
+    Returns:
+        Normalized text
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def fingerprint(*parts: object) -> str:
+    """
+    Short stable digest of prompt inputs (schemas, custom prompts, context).
+
+    Args:
+        parts: JSON-serializable values; None is allowed
+
+    Returns:
+        16-character hex digest
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class ExtractionCacheKey:
+    """Identity of one extraction: what was sent, to which model, with which prompt."""
+
+    content_hash: str
+    provider: str
+    model: str
+    schema_version: str = "default"
+    prompt_version: str = PROMPT_VERSION
+
+    @classmethod
+    def build(
+        cls,
+        text: str,
+        provider: str,
+        model: str,
+        schema_version: str = "default",
+        prompt_version: str = PROMPT_VERSION,
+    ) -> "ExtractionCacheKey":
+        """
+        Build a key from raw chunk text.
+
+        Args:
+            text: Chunk text exactly as it would be sent (after truncation)
+            provider: Provider name (e.g., "ollama")
+            model: Model name
+            schema_version: Domain schema version, or a fingerprint of it
+            prompt_version: Prompt version, optionally with a fingerprint of
+                per-call prompt inputs
+
+        Returns:
+            ExtractionCacheKey
+        """
+        content_hash = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+        return cls(content_hash, provider, model, schema_version, prompt_version)
+
+    @property
+    def digest(self) -> str:
+        """Digest over all key components."""
+        return hashlib.sha256(
+            "\x1f".join(
+                (
+                    self.content_hash,
+                    self.provider,
+                    self.model,
+                    self.schema_version,
+                    self.prompt_version,
+                )
+            ).encode("utf-8")
+        ).hexdigest()
+
+
+class ExtractionResultCache:
+    """
+    Redis-backed cache of validated extraction results.
+
+    Entries expire after ttl_seconds. A sorted-set index of write times
+    bounds the cache to max_entries; the oldest entries are evicted first.
+
+    Attributes:
+        ttl_seconds: Time-to-live for cached results
+        max_entries: Maximum number of cached results
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Redis] = None,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        key_prefix: str = CACHE_KEY_PREFIX,
+    ):
+        """
+        Initialize the extraction result cache.
+
+        Args:
+            redis_client: Async Redis client (defaults to the shared client,
+                resolved on first use)
+            ttl_seconds: Entry TTL (defaults to settings)
+            max_entries: Entry limit (defaults to settings)
+            key_prefix: Prefix for cache keys
+        """
+        self._redis = redis_client
+        self.ttl_seconds = ttl_seconds or settings.EXTRACTION_RESULT_CACHE_TTL
+        self.max_entries = max_entries or settings.EXTRACTION_RESULT_CACHE_MAX_ENTRIES
+        self._key_prefix = key_prefix
+        self._index_key = f"{key_prefix}:index"
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+
+    async def _get_redis(self) -> Optional[Redis]:
+        if self._redis is None:
+            from app.core.cache import get_redis_client
+
+            self._redis = await get_redis_client()
+        return self._redis
+
+    def _cache_key(self, digest: str) -> str:
+        return f"{self._key_prefix}:{digest}"
+
+    async def get(self, key: ExtractionCacheKey) -> Optional[ExtractionResult]:
+        """
+        Get a cached extraction result.
+
+        Args:
+            key: Extraction cache key
+
+        Returns:
+            Validated ExtractionResult if cached, None otherwise
+        """
+        redis = await self._get_redis()
+        if redis is None:
+            return None
+
+        try:
+            data = await redis.get(self._cache_key(key.digest))
+        except Exception as e:
+            logger.warning(f"Extraction cache get failed: {e}")
+            extraction_cache_lookups_total.labels(key.provider, "error").inc()
+            return None
+
+        if data is not None:
+            try:
+                result = ExtractionResult.model_validate_json(data)
+            except ValueError as e:
+                # Schema changed under the entry; treat as a miss and overwrite later
+                logger.warning(f"Discarding invalid cached extraction result: {e}")
+            else:
+                self._hits += 1
+                extraction_cache_lookups_total.labels(key.provider, "hit").inc()
+                return result
+
+        self._misses += 1
+        extraction_cache_lookups_total.labels(key.provider, "miss").inc()
+        return None
+
+    async def set(self, key: ExtractionCacheKey, result: ExtractionResult) -> bool:
+        """
+        Cache an extraction result and evict the oldest entries over the limit.
+
+        Args:
+            key: Extraction cache key
+            result: Validated extraction result
+
+        Returns:
+            True if cached successfully
+        """
+        redis = await self._get_redis()
+        if redis is None:
+            return False
+
+        digest = key.digest
+        now = time.time()
+
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(self._cache_key(digest), result.model_dump_json(), ex=self.ttl_seconds)
+                pipe.zadd(self._index_key, {digest: now})
+                # Entries past their TTL are gone already; drop them from the index
+                pipe.zremrangebyscore(self._index_key, "-inf", now - self.ttl_seconds)
+                pipe.zcard(self._index_key)
+                *_, size = await pipe.execute()
+
+            if size > self.max_entries:
+                await self._evict(redis, size - self.max_entries)
+
+            return True
+
+        except Exception as e:
+            logger.warning(f"Extraction cache set failed: {e}")
+            return False
+
+    async def _evict(self, redis: Redis, count: int) -> None:
+        """Remove the count oldest entries."""
+        evicted = await redis.zpopmin(self._index_key, count)
+        if evicted:
+            await redis.delete(*(self._cache_key(digest) for digest, _ in evicted))
+            logger.debug(f"Evicted {len(evicted)} extraction cache entries")
+
+    def get_cache_stats(self) -> dict:
+        """
+        Get cache statistics for this process.
+
+        Returns:
+            Dict with hits, misses and hit_rate
+        """
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total > 0 else 0.0,
+        }
+
+
+# Global cache instance
+_cache: Optional[ExtractionResultCache] = None
+
+
+def get_extraction_result_cache() -> Optional[ExtractionResultCache]:
+    """
+    Get the process-wide extraction result cache.
+
+    Returns:
+        ExtractionResultCache, or None if disabled in settings
+    """
+    global _cache
+    if not settings.EXTRACTION_RESULT_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = ExtractionResultCache()
+    return _cache
+
+
+def reset_extraction_result_cache() -> None:
+    """Drop the global cache instance (primarily for testing)."""
+    global _cache
+    _cache = None
@@ -0,0 +1,586 @@
+"""
+Fair scheduler for LLM extraction jobs.
+
+Instead of rejecting work when a tenant hits its rate limit, extraction jobs
+are queued in Redis and workers pull the next eligible job:
+
+- Per-tenant queues per priority; interactive jobs are always dispatched
+  before bulk jobs.
+- Weighted fair sharing between tenants: each tenant has a virtual time
+  that advances by 1/weight per dispatched job, and the tenant with the
+  lowest virtual time goes next. Tenants joining the queue start at the
+  current minimum, so idle periods don't bank credit.
+- A per-tenant token bucket (OLLAMA_RATE_LIMIT_RPM, burst
+  EXTRACTION_SCHEDULER_BURST) skips tenants that are out of tokens.
+- A global concurrency cap matched to the LLM's parallel slots. Slots are
+  leases that expire, so a crashed worker cannot leak one.
+- A dispatched job is moved to an in-flight record under its lease in the
+  same script that pops it. release() drops the record; a lease that
+  expires first (the worker died) puts the job back at the head of its
+  tenant's queue, so a job is never lost between dispatch and completion.
+- The worker running a job restarts its lease when it begins (the lease
+  clock otherwise includes the time spent waiting in the broker) and
+  renews it while it runs. Page jobs also claim their page under the
+  lease, so a requeued job whose first run is still alive is refused.
+
+Every operation is a single Lua script, so decisions are atomic across
+workers and use the Redis server clock. Scripts build tenant keys from a
+prefix, which requires a single Redis node (as the rate limiter does).
+
+Example:
+    scheduler = get_extraction_scheduler()
+    await scheduler.submit(tenant_id, {"process_id": str(process_id)})
+
+    job = await scheduler.next_job(timeout=30)
+    if job:
+        try:
+            ...  # run the extraction
+        except Exception:
+            await scheduler.requeue(job)
+            raise
+        await scheduler.release(job)
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.extraction.rate_limiter import RateLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionPriority(str, Enum):
+    """Dispatch priority; listed in dispatch order."""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+# =============================================================================
+# Lua Scripts
+# =============================================================================
+
+_REDIS_NOW = """
+local function redis_now()
+    local t = redis.call('TIME')
+    return tonumber(t[1]) + tonumber(t[2]) / 1000000
+end
+"""
+
+# Token bucket shared by the acquire and dispatch scripts. Returns 0 and
+# consumes a token, or the milliseconds until a token is available.
+_TAKE_TOKEN = _REDIS_NOW + """
+local function take_token(key, rate, capacity, now, ttl)
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1])
+    local ts = tonumber(state[2])
+    if tokens == nil or ts == nil then
+        tokens = capacity
+        ts = now
+    end
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    local wait = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+    else
+        wait = math.ceil((1 - tokens) / rate * 1000)
+    end
+    redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+    redis.call('EXPIRE', key, ttl)
+    return wait
+end
+"""
+
+# Puts an in-flight job back at the head of its tenant's queue and drops
+# its lease. A tenant that left the active set rejoins at the current
+# minimum virtual time, like a newly queued tenant.
+_REQUEUE = """
+local function requeue(prefix, lease)
+    local inflight = prefix .. ':inflight'
+    local record = redis.call('HGET', inflight, lease)
+    if record then
+        local job = cjson.decode(record)
+        local active = prefix .. ':active:' .. job.priority
+        redis.call('LPUSH', prefix .. ':queue:' .. job.priority .. ':' .. job.tenant, job.payload)
+        if not redis.call('ZSCORE', active, job.tenant) then
+            local head = redis.call('ZRANGE', active, 0, 0, 'WITHSCORES')
+            local vtime = 0
+            if head[2] then
+                vtime = tonumber(head[2])
+            end
+            redis.call('ZADD', active, vtime, job.tenant)
+        end
+        redis.call('HDEL', inflight, lease)
+    end
+    redis.call('ZREM', prefix .. ':leases', lease)
+    return record and 1 or 0
+end
+"""
+
+# KEYS: bucket; ARGV: rate, capacity, ttl
+_ACQUIRE_SCRIPT = _TAKE_TOKEN + """
+return take_token(KEYS[1], tonumber(ARGV[1]), tonumber(ARGV[2]), redis_now(), tonumber(ARGV[3]))
+"""
+
+# KEYS: queue, active set; ARGV: tenant, payload
+_ENQUEUE_SCRIPT = """
+redis.call('RPUSH', KEYS[1], ARGV[2])
+if not redis.call('ZSCORE', KEYS[2], ARGV[1]) then
+    local head = redis.call('ZRANGE', KEYS[2], 0, 0, 'WITHSCORES')
+    local vtime = 0
+    if head[2] then
+        vtime = tonumber(head[2])
+    end
+    redis.call('ZADD', KEYS[2], vtime, ARGV[1])
+end
+return redis.call('LLEN', KEYS[1])
+"""
+
+# ARGV: prefix, lease id; returns 1 if the job was requeued
+_REQUEUE_SCRIPT = _REQUEUE + """
+return requeue(ARGV[1], ARGV[2])
+"""
+
+# KEYS: leases, in-flight records[, page claim]; ARGV: lease id
+_RELEASE_SCRIPT = """
+redis.call('ZREM', KEYS[1], ARGV[1])
+if KEYS[3] and redis.call('GET', KEYS[3]) == ARGV[1] then
+    redis.call('DEL', KEYS[3])
+end
+return redis.call('HDEL', KEYS[2], ARGV[1])
+"""
+
+# Extends a live lease to now + lease seconds and (re)claims its page. An
+# expired lease is lost even before dispatch requeues its job.
+# KEYS: leases[, page claim]; ARGV: lease id, lease seconds
+# Returns 1 if held, 0 if the lease is lost, -1 if another live lease
+# holds the page
+_HOLD_SCRIPT = _REDIS_NOW + """
+local now = redis_now()
+local expiry = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not expiry or tonumber(expiry) < now then
+    return 0
+end
+local lease_seconds = tonumber(ARGV[2])
+if KEYS[2] then
+    local holder = redis.call('GET', KEYS[2])
+    if holder and holder ~= ARGV[1] then
+        local held = redis.call('ZSCORE', KEYS[1], holder)
+        if held and tonumber(held) >= now then
+            return -1
+        end
+    end
+    redis.call('SET', KEYS[2], ARGV[1], 'EX', lease_seconds)
+end
+redis.call('ZADD', KEYS[1], 'XX', now + lease_seconds, ARGV[1])
+return 1
+"""
+
+# KEYS: leases, weights, in-flight records
+# ARGV: prefix, rate, capacity, bucket ttl, max slots, lease seconds, lease id,
+#       priorities...
+# Returns {1, tenant, priority, payload} or {0, wait ms (-1: no hint)}
+_DISPATCH_SCRIPT = _TAKE_TOKEN + _REQUEUE + """
+local prefix = ARGV[1]
+local rate = tonumber(ARGV[2])
+local capacity = tonumber(ARGV[3])
+local bucket_ttl = tonumber(ARGV[4])
+local max_slots = tonumber(ARGV[5])
+local lease_seconds = tonumber(ARGV[6])
+local now = redis_now()
+
+for _, lease in ipairs(redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now)) do
+    requeue(prefix, lease)
+end
+if redis.call('ZCARD', KEYS[1]) >= max_slots then
+    return {0, -1}
+end
+
+local min_wait = -1
+for i = 8, #ARGV do
+    local priority = ARGV[i]
+    local active = prefix .. ':active:' .. priority
+    local tenants = redis.call('ZRANGE', active, 0, -1, 'WITHSCORES')
+    for j = 1, #tenants, 2 do
+        local tenant = tenants[j]
+        local queue = prefix .. ':queue:' .. priority .. ':' .. tenant
+        if redis.call('LLEN', queue) == 0 then
+            redis.call('ZREM', active, tenant)
+        else
+            local wait = take_token(prefix .. ':bucket:' .. tenant, rate, capacity, now, bucket_ttl)
+            if wait == 0 then
+                local payload = redis.call('LPOP', queue)
+                if redis.call('LLEN', queue) == 0 then
+                    redis.call('ZREM', active, tenant)
+                else
+                    local weight = math.max(tonumber(redis.call('HGET', KEYS[2], tenant) or '1'), 0.01)
+                    redis.call('ZADD', active, tonumber(tenants[j + 1]) + 1 / weight, tenant)
+                end
+                redis.call('ZADD', KEYS[1], now + lease_seconds, ARGV[7])
+                redis.call('HSET', KEYS[3], ARGV[7], cjson.encode({
+                    tenant = tenant, priority = priority, payload = payload
+                }))
+                return {1, tenant, priority, payload}
+            end
+            if min_wait < 0 or wait < min_wait then
+                min_wait = wait
+            end
+        end
+    end
+end
+return {0, min_wait}
+"""
+
+
+class LeaseState(int, Enum):
+    """Result of holding a dispatched job's lease."""
+
+    HELD = 1
+    LOST = 0
+    PAGE_BUSY = -1
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    """A dispatched job holding one of the global concurrency slots."""
+
+    tenant_id: UUID
+    priority: ExtractionPriority
+    payload: dict[str, Any]
+    lease_id: str
+
+
+class ExtractionScheduler:
+    """Redis-backed weighted fair scheduler for extraction jobs.
+
+    Attributes:
+        max_concurrency: Global cap on dispatched (leased) jobs
+        rate: Tokens per second per tenant
+        burst: Token bucket capacity per tenant
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        max_concurrency: int | None = None,
+        rpm: int | None = None,
+        burst: int | None = None,
+        lease_seconds: int | None = None,
+        key_prefix: str = "extraction_sched",
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            redis_url: Redis connection URL (defaults to settings.REDIS_URL)
+            max_concurrency: Global slot count (defaults to settings)
+            rpm: Requests per minute per tenant (defaults to settings.OLLAMA_RATE_LIMIT_RPM)
+            burst: Token bucket capacity (defaults to settings)
+            lease_seconds: Slot lease duration (defaults to settings)
+            key_prefix: Prefix for Redis keys
+        """
+        self._redis_url = redis_url or settings.REDIS_URL
+        self.max_concurrency = max_concurrency or settings.EXTRACTION_SCHEDULER_MAX_CONCURRENCY
+        self.rate = (rpm or settings.OLLAMA_RATE_LIMIT_RPM) / 60
+        self.burst = burst or settings.EXTRACTION_SCHEDULER_BURST
+        self._lease_seconds = lease_seconds or settings.EXTRACTION_SCHEDULER_LEASE_SECONDS
+        self._prefix = key_prefix
+        self._redis: redis.Redis | None = None
+        self._scripts: dict[str, Any] = {}
+
+    async def _get_redis(self) -> redis.Redis:
+        """Get or create the Redis connection and register scripts."""
+        if self._redis is None:
+            self._redis = redis.from_url(self._redis_url, decode_responses=True)
+            self._scripts = {
+                "acquire": self._redis.register_script(_ACQUIRE_SCRIPT),
+                "enqueue": self._redis.register_script(_ENQUEUE_SCRIPT),
+                "dispatch": self._redis.register_script(_DISPATCH_SCRIPT),
+                "release": self._redis.register_script(_RELEASE_SCRIPT),
+                "requeue": self._redis.register_script(_REQUEUE_SCRIPT),
+                "hold": self._redis.register_script(_HOLD_SCRIPT),
+            }
+        return self._redis
+
+    @property
+    def _bucket_ttl(self) -> int:
+        # Long enough for an empty bucket to refill completely
+        return int(self.burst / self.rate) + 60
+
+    def _queue_key(self, priority: ExtractionPriority, tenant_id: UUID) -> str:
+        return f"{self._prefix}:queue:{priority.value}:{tenant_id}"
+
+    def _active_key(self, priority: ExtractionPriority) -> str:
+        return f"{self._prefix}:active:{priority.value}"
+
+    def _page_key(self, page_id: UUID | str) -> str:
+        return f"{self._prefix}:page:{page_id}"
+
+    async def acquire(self, tenant_id: UUID) -> None:
+        """Take a token from the tenant's bucket for an immediate request.
+
+        Args:
+            tenant_id: Tenant making the request
+
+        Raises:
+            RateLimitExceeded: If the bucket is empty (no token is consumed)
+        """
+        await self._get_redis()
+        wait_ms = await self._scripts["acquire"](
+            keys=[f"{self._prefix}:bucket:{tenant_id}"],
+            args=[self.rate, self.burst, self._bucket_ttl],
+        )
+        if int(wait_ms) > 0:
+            raise RateLimitExceeded(tenant_id, int(wait_ms) / 1000)
+
+    async def submit(
+        self,
+        tenant_id: UUID,
+        payload: dict[str, Any],
+        priority: ExtractionPriority = ExtractionPriority.BULK,
+    ) -> int:
+        """Queue a job for the tenant.
+
+        Args:
+            tenant_id: Tenant owning the job
+            payload: JSON-serializable job description
+            priority: Dispatch priority
+
+        Returns:
+            Tenant queue depth after enqueueing
+        """
+        await self._get_redis()
+        depth = await self._scripts["enqueue"](
+            keys=[self._queue_key(priority, tenant_id), self._active_key(priority)],
+            args=[str(tenant_id), json.dumps(payload)],
+        )
+        logger.debug(
+            "Extraction job queued",
+            extra={"tenant_id": str(tenant_id), "priority": priority.value, "depth": depth},
+        )
+        return int(depth)
+
+    async def try_dispatch(self) -> tuple[ScheduledJob | None, float | None]:
+        """Dispatch the next eligible job, if any.
+
+        Returns:
+            (job, None) when a job was dispatched; otherwise (None, seconds
+            until the earliest queued tenant has a token, or None if no hint)
+        """
+        await self._get_redis()
+        lease_id = uuid.uuid4().hex
+        result = await self._scripts["dispatch"](
+            keys=[
+                f"{self._prefix}:leases",
+                f"{self._prefix}:weights",
+                f"{self._prefix}:inflight",
+            ],
+            args=[
+                self._prefix,
+                self.rate,
+                self.burst,
+                self._bucket_ttl,
+                self.max_concurrency,
+                self._lease_seconds,
+                lease_id,
+                *(priority.value for priority in ExtractionPriority),
+            ],
+        )
+
+        if int(result[0]) == 1:
+            _, tenant, priority, payload = result
+            job = ScheduledJob(
+                tenant_id=UUID(tenant),
+                priority=ExtractionPriority(priority),
+                payload=json.loads(payload),
+                lease_id=lease_id,
+            )
+            return job, None
+
+        wait_ms = int(result[1])
+        return None, wait_ms / 1000 if wait_ms >= 0 else None
+
+    async def next_job(self, timeout: float | None = None) -> ScheduledJob | None:
+        """Wait for the next eligible job.
+
+        Sleeps until the earliest token is due (capped by the poll interval,
+        since slots may free up or jobs arrive sooner) rather than retrying
+        rejected requests.
+
+        Args:
+            timeout: Seconds to wait before giving up (None waits indefinitely)
+
+        Returns:
+            The dispatched job, or None on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        poll = settings.EXTRACTION_SCHEDULER_POLL_INTERVAL
+
+        while True:
+            job, wait = await self.try_dispatch()
+            if job is not None:
+                return job
+
+            delay = poll if wait is None else min(wait, poll)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+
+    async def release(self, job: ScheduledJob) -> None:
+        """Finish a dispatched job and return its concurrency slot.
+
+        Args:
+            job: Job returned by next_job()/try_dispatch()
+        """
+        await self.release_lease(job.lease_id)
+
+    async def release_lease(self, lease_id: str, page_id: UUID | str | None = None) -> None:
+        """Finish the job dispatched under a lease and return its slot.
+
+        For workers that were handed only the lease ID of a job.
+
+        Args:
+            lease_id: ScheduledJob.lease_id of the finished job
+            page_id: Page claimed with hold_lease(), if any
+        """
+        await self._get_redis()
+        keys = [f"{self._prefix}:leases", f"{self._prefix}:inflight"]
+        if page_id is not None:
+            keys.append(self._page_key(page_id))
+        await self._scripts["release"](keys=keys, args=[lease_id])
+
+    async def hold_lease(self, lease_id: str, page_id: UUID | str | None = None) -> LeaseState:
+        """Extend a dispatched job's lease by a full lease period.
+
+        Called when the job starts running (so time spent in the broker
+        does not count) and periodically while it runs. With a page_id,
+        the page is claimed under the lease; a page claimed by another
+        live lease is reported as PAGE_BUSY and the lease is not extended.
+
+        Args:
+            lease_id: ScheduledJob.lease_id of the running job
+            page_id: Page the job extracts, if it is a page job
+
+        Returns:
+            HELD, LOST (the lease expired; its job is requeued) or PAGE_BUSY
+        """
+        await self._get_redis()
+        keys = [f"{self._prefix}:leases"]
+        if page_id is not None:
+            keys.append(self._page_key(page_id))
+        state = await self._scripts["hold"](keys=keys, args=[lease_id, self._lease_seconds])
+        return LeaseState(int(state))
+
+    async def keep_lease(self, lease_id: str, page_id: UUID | str | None = None) -> None:
+        """Renew a lease every third of the lease period until cancelled.
+
+        Returns early once the lease is no longer held. Renewal errors are
+        logged and retried at the next interval.
+
+        Args:
+            lease_id: ScheduledJob.lease_id of the running job
+            page_id: Page claimed under the lease, if any
+        """
+        interval = self._lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                state = await self.hold_lease(lease_id, page_id)
+            except Exception as e:
+                logger.warning(f"Failed to renew extraction lease {lease_id}: {e}")
+                continue
+            if state != LeaseState.HELD:
+                logger.warning(
+                    "Extraction lease lost while running",
+                    extra={"lease_id": lease_id, "state": state.name},
+                )
+                return
+
+    async def requeue(self, job: ScheduledJob) -> None:
+        """Put a dispatched job back at the head of its queue and free its slot.
+
+        Used when a job could not run (open circuit, failed hand-off); the
+        job keeps its place ahead of the tenant's newer jobs.
+
+        Args:
+            job: Job returned by next_job()/try_dispatch()
+        """
+        await self._get_redis()
+        requeued = await self._scripts["requeue"](args=[self._prefix, job.lease_id])
+        if not int(requeued):
+            # The lease already expired and the job was requeued by dispatch
+            logger.warning(
+                "Extraction job lease expired before requeue",
+                extra={"tenant_id": str(job.tenant_id), "lease_id": job.lease_id},
+            )
+
+    async def set_tenant_weight(self, tenant_id: UUID, weight: float) -> None:
+        """Set a tenant's fair-share weight (default 1.0).
+
+        A tenant with weight 2 is dispatched twice as often as a tenant
+        with weight 1 while both have queued work.
+
+        Args:
+            tenant_id: Tenant to configure
+            weight: Relative share, > 0
+        """
+        if weight <= 0:
+            raise ValueError(f"weight must be > 0, got {weight}")
+        r = await self._get_redis()
+        await r.hset(f"{self._prefix}:weights", str(tenant_id), weight)
+
+    async def queue_depth(self, tenant_id: UUID) -> dict[str, int]:
+        """Get the tenant's queued job count per priority.
+
+        Args:
+            tenant_id: Tenant to inspect
+
+        Returns:
+            Mapping of priority to queue length
+        """
+        r = await self._get_redis()
+        return {
+            priority.value: await r.llen(self._queue_key(priority, tenant_id))
+            for priority in ExtractionPriority
+        }
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self._redis:
+            await self._redis.close()
+            self._redis = None
+            self._scripts = {}
+
+
+# Global instance
+_scheduler: ExtractionScheduler | None = None
+
+
+def get_extraction_scheduler() -> ExtractionScheduler:
+    """Get the global extraction scheduler instance.
+
+    Returns:
+        The global ExtractionScheduler instance
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = ExtractionScheduler()
+    return _scheduler
+
+
+def reset_extraction_scheduler() -> None:
+    """Reset the global scheduler instance (primarily for testing)."""
+    global _scheduler
+    _scheduler = None
@@ -0,0 +1,170 @@
+"""
+Per-process cache of configured extraction services.
+
+Building an extraction service decrypts the provider's API key and creates
+an HTTP client (and, for Ollama, a pydantic-ai Agent). Reusing the service
+across tasks keeps its connection pool, keep-alive connections and TLS
+sessions warm, provided every call runs on the same event loop (see
+app.worker.runtime).
+
+Entries are keyed by (provider id, config version). The version is the
+provider's updated_at timestamp, so editing a provider's configuration
+yields a new key and the stale service is evicted on next use. Entries
+also expire after EXTRACTION_SERVICE_CACHE_TTL seconds, which bounds how
+long a rotated API key keeps being used, and the cache holds at most
+EXTRACTION_SERVICE_CACHE_SIZE services (least recently used evicted).
+
+Example:
+    service = get_extraction_service_cache().get(provider, tenant_id)
+    result = run_async(service.extract(content=text, page_url=url))
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID
+
+from app.core.config import settings
+from app.extraction.base import BaseExtractionService
+
+if TYPE_CHECKING:
+    from app.models.extraction_provider import ExtractionProvider
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[UUID, Optional[str]]
+
+
+def provider_cache_key(provider: "ExtractionProvider") -> CacheKey:
+    """
+    Build the cache key for a provider configuration.
+
+    Args:
+        provider: ExtractionProvider model instance
+
+    Returns:
+        (provider id, config version) tuple
+    """
+    version = provider.updated_at or provider.created_at
+    return provider.id, version.isoformat() if version else None
+
+
+class ExtractionServiceCache:
+    """Thread-safe LRU + TTL cache of extraction service instances."""
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum cached services (defaults to settings)
+            ttl_seconds: Seconds before a service is rebuilt (defaults to settings)
+        """
+        self._max_size = max_size or settings.EXTRACTION_SERVICE_CACHE_SIZE
+        self._ttl = ttl_seconds or settings.EXTRACTION_SERVICE_CACHE_TTL
+        self._entries: OrderedDict[CacheKey, tuple[BaseExtractionService, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, provider: "ExtractionProvider", tenant_id: UUID) -> BaseExtractionService:
+        """
+        Get the cached service for a provider, creating it on a miss.
+
+        Args:
+            provider: ExtractionProvider model instance
+            tenant_id: Tenant ID for key decryption
+
+        Returns:
+            Configured extraction service
+
+        Raises:
+            ProviderConfigError: If configuration is invalid
+            ProviderNotRegisteredError: If provider type is not registered
+        """
+        from app.extraction.registry import get_extraction_provider_registry
+
+        key = provider_cache_key(provider)
+        now = time.monotonic()
+        evicted: list[BaseExtractionService] = []
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] < self._ttl:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+            # Drop expired entry and older versions of the same provider
+            for cached_key in [k for k in self._entries if k[0] == provider.id]:
+                evicted.append(self._entries.pop(cached_key)[0])
+
+            service = get_extraction_provider_registry().create_service(provider, tenant_id)
+            self._entries[key] = (service, now)
+
+            while len(self._entries) > self._max_size:
+                _, (oldest, _) = self._entries.popitem(last=False)
+                evicted.append(oldest)
+
+        for stale in evicted:
+            _close_service(stale)
+
+        logger.debug(
+            "Extraction service cached",
+            extra={"provider_id": str(provider.id), "cache_size": len(self._entries)},
+        )
+        return service
+
+    def clear(self) -> None:
+        """Evict and close all cached services."""
+        with self._lock:
+            services = [service for service, _ in self._entries.values()]
+            self._entries.clear()
+
+        for service in services:
+            _close_service(service)
+
+
+def _close_service(service: Any) -> None:
+    """Close an evicted service's clients on the loop they are bound to."""
+    aclose = getattr(service, "aclose", None)
+    if aclose is None:
+        return
+
+    from app.worker.runtime import get_async_runtime
+
+    future = get_async_runtime().submit(aclose())
+    future.add_done_callback(_log_close_failure)
+
+
+def _log_close_failure(future: Any) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f"Failed to close evicted extraction service: {future.exception()}")
+
+
+# Global cache instance
+_cache: Optional[ExtractionServiceCache] = None
+
+
+def get_extraction_service_cache() -> ExtractionServiceCache:
+    """Get the process-wide extraction service cache."""
+    global _cache
+    if _cache is None:
+        _cache = ExtractionServiceCache()
+    return _cache
+
+
+def reset_extraction_service_cache() -> None:
+    """Clear and drop the global cache (primarily for testing)."""
+    global _cache
+    if _cache is not None:
+        _cache.clear()
+    _cache = None
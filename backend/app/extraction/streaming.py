@@ -0,0 +1,202 @@
+"""
+Incremental parsing of streamed extraction output.
+
+Streaming extraction asks the model for the ExtractionResult as a plain
+JSON object and reads it token by token (see
+OllamaExtractionService.extract_streaming()). EntityStreamParser scans the
+text as it arrives and returns each item of the top-level "entities" array
+as soon as its closing brace is seen, so an EntitySink can record entities
+long before the response is complete. The complete response is still
+validated at the end; if it fails, the sink retracts what it recorded.
+
+Example:
+    parser = EntityStreamParser()
+    async for chunk in provider.infer_stream(request):
+        for item in parser.feed(chunk.content):
+            entity = parse_entity(item)
+            if entity is not None:
+                await sink.add(entity)
+"""
+
+import json
+import logging
+from typing import Any, Protocol
+
+from pydantic import ValidationError
+
+from app.extraction.schemas import ExtractedEntitySchema, ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+
+class EntitySink(Protocol):
+    """Receives entities while an extraction response streams in.
+
+    When extract_streaming() returns, the entities added and not retracted
+    are exactly the entities of the returned result, in order.
+    """
+
+    async def add(self, entity: ExtractedEntitySchema) -> None:
+        """Record an entity as soon as it has been parsed."""
+        ...
+
+    async def retract(self, reason: str) -> None:
+        """Withdraw every entity added so far."""
+        ...
+
+
+class EntityStreamParser:
+    """Incremental scanner for the "entities" array of a JSON object.
+
+    The parser tracks string and nesting state character by character.
+    Text before the object (such as a Markdown code fence) is ignored. It
+    does not validate the JSON; malformed items are skipped and left to
+    the final validation of the complete response.
+    """
+
+    def __init__(self, array_key: str = "entities"):
+        """
+        Initialize the parser.
+
+        Args:
+            array_key: Top-level key of the array to stream items from
+        """
+        self._array_key = array_key
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key_chars: list[str] | None = None
+        self._last_string: str | None = None
+        self._current_key: str | None = None
+        self._in_array = False
+        self._item: list[str] | None = None
+        self.items_parsed = 0
+
+    def feed(self, text: str) -> list[dict[str, Any]]:
+        """
+        Consume the next piece of streamed text.
+
+        Args:
+            text: Text following everything fed so far
+
+        Returns:
+            Items of the array completed within this text, in order
+        """
+        completed: list[dict[str, Any]] = []
+        for char in text:
+            if self._item is not None:
+                self._item.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key_chars is not None:
+                        self._last_string = "".join(self._key_chars)
+                        self._key_chars = None
+                if self._key_chars is not None:
+                    self._key_chars.append(char)
+                continue
+
+            if self._depth == 0 and char != "{":
+                continue
+
+            if char == '"':
+                self._in_string = True
+                # Strings directly in the top-level object may be keys
+                if self._depth == 1:
+                    self._key_chars = []
+            elif char == ":" and self._depth == 1:
+                self._current_key = self._last_string
+            elif char in "{[":
+                self._depth += 1
+                if char == "[" and self._depth == 2 and self._current_key == self._array_key:
+                    self._in_array = True
+                elif char == "{" and self._depth == 3 and self._in_array:
+                    self._item = ["{"]
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 2 and self._item is not None:
+                    item = self._finish_item("".join(self._item))
+                    self._item = None
+                    if item is not None:
+                        completed.append(item)
+                elif self._depth == 1:
+                    self._in_array = False
+        return completed
+
+    def _finish_item(self, text: str) -> dict[str, Any] | None:
+        try:
+            item = json.loads(text)
+        except json.JSONDecodeError:
+            logger.debug("Skipping unparseable streamed item")
+            return None
+        if not isinstance(item, dict):
+            return None
+        self.items_parsed += 1
+        return item
+
+
+def parse_entity(item: dict[str, Any]) -> ExtractedEntitySchema | None:
+    """
+    Validate one streamed entity.
+
+    Args:
+        item: Entity object from EntityStreamParser
+
+    Returns:
+        The validated entity, or None if it does not validate
+    """
+    try:
+        return ExtractedEntitySchema.model_validate(item)
+    except ValidationError as e:
+        logger.debug(f"Skipping streamed entity that failed validation: {e}")
+        return None
+
+
+def build_streaming_prompt(prompt: str) -> str:
+    """
+    Ask for the extraction result as a bare JSON object.
+
+    Args:
+        prompt: User prompt of a regular extraction
+
+    Returns:
+        The prompt followed by the ExtractionResult JSON schema
+    """
+    schema = json.dumps(ExtractionResult.model_json_schema())
+    return (
+        f"{prompt}\n\n"
+        "Respond with a single JSON object and nothing else. It must match this "
+        f"JSON schema, with the entities array first:\n{schema}"
+    )
+
+
+def parse_streamed_result(text: str) -> ExtractionResult:
+    """
+    Validate a complete streamed response.
+
+    Args:
+        text: Everything the model streamed
+
+    Returns:
+        The validated extraction result
+
+    Raises:
+        ValidationError: If the response is not a valid ExtractionResult
+    """
+    # Models sometimes wrap the object in a Markdown code fence
+    start, end = text.find("{"), text.rfind("}")
+    return ExtractionResult.model_validate_json(text[start : end + 1] if start >= 0 else text)
+
+
+__all__ = [
+    "EntitySink",
+    "EntityStreamParser",
+    "build_streaming_prompt",
+    "parse_entity",
+    "parse_streamed_result",
+]
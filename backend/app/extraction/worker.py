@@ -9,21 +9,34 @@ The worker is designed to be called from various contexts:
 - Background task queue processing
 - Direct invocation from API endpoints
 - Scheduled extraction jobs
+
+Extractions can also be queued with schedule_extraction() (extraction
+processes) or schedule_page_extraction() (scraped pages) and processed by
+run_scheduled_extractions(), which pulls jobs from the fair scheduler
+instead of rejecting them when a tenant is rate limited.
+
+With EXTRACTION_STREAMING_ENABLED, process_extraction() records entities
+while the LLM response streams in and saves them periodically through a
+ProcessEntitySink, so they are visible before extraction completes.
 """
 
 import logging
 import time
+from collections.abc import Callable
+from itertools import chain
 from uuid import UUID
 
 from sqlalchemy import select
 
+from app.core.concurrency import ConcurrencyLimitExceeded
+from app.core.config import settings
 from app.core.context import set_current_tenant, clear_current_tenant
 from app.core.database import AsyncSessionLocal
 from app.eventsourcing.aggregates.extraction import (
     ExtractionProcess,
     create_extraction_process_repository,
 )
-from app.eventsourcing.stores.factory import get_event_store
+from app.eventsourcing.stores.factory import get_event_store, get_snapshot_store
 from app.extraction.circuit_breaker import (
     CircuitOpen,
     get_circuit_breaker,
@@ -36,6 +49,13 @@ from app.extraction.rate_limiter import (
     RateLimitExceeded,
     get_rate_limiter,
 )
+from app.extraction.schemas import ExtractedEntitySchema
+from app.extraction.scheduler import (
+    ExtractionPriority,
+    ExtractionScheduler,
+    ScheduledJob,
+    get_extraction_scheduler,
+)
 from app.models.scraped_page import ScrapedPage
 
 logger = logging.getLogger(__name__)
@@ -85,6 +105,93 @@ class PageContentNotFoundError(ExtractionWorkerError):
         self.page_id = page_id
 
 
+def _entity_record(entity: ExtractedEntitySchema) -> dict:
+    """Keyword arguments of ExtractionProcess.record_entity() for an entity."""
+    return {
+        "entity_type": entity.entity_type,
+        "name": entity.name,
+        "normalized_name": entity.name.lower().strip(),
+        "properties": entity.properties,
+        "confidence_score": entity.confidence,
+        "description": entity.description,
+        "source_text": entity.source_text,
+    }
+
+
+class ProcessEntitySink:
+    """EntitySink that records streamed entities on an ExtractionProcess.
+
+    Entities are buffered and recorded as one EntitiesRecordedBatch, and the
+    process saved, at most every flush_seconds (the first entity is saved
+    right away), so projections show them while the response streams in.
+    retract() withdraws every recorded entity with one EntitiesRetracted
+    event.
+
+    Attributes:
+        saved: Whether the sink has saved the process
+    """
+
+    def __init__(self, process: ExtractionProcess, repo, flush_seconds: float):
+        """
+        Initialize the sink.
+
+        Args:
+            process: Started extraction process
+            repo: Repository the process is saved with
+            flush_seconds: Minimum time between saves
+        """
+        self._process = process
+        self._repo = repo
+        self._flush_seconds = flush_seconds
+        self._pending: list[ExtractedEntitySchema] = []
+        self._recorded: list[UUID] = []
+        self._last_flush: float | None = None
+        self.saved = False
+
+    async def add(self, entity: ExtractedEntitySchema) -> None:
+        self._pending.append(entity)
+        if self._last_flush is None or time.monotonic() - self._last_flush >= self._flush_seconds:
+            await self.flush()
+
+    async def retract(self, reason: str) -> None:
+        if self.withdraw(reason):
+            await self._repo.save(self._process)
+
+    async def flush(self, save: bool = True) -> None:
+        """
+        Record buffered entities on the process.
+
+        Args:
+            save: Save the process afterwards
+        """
+        if self._pending:
+            self._recorded.extend(
+                self._process.record_entities([_entity_record(e) for e in self._pending])
+            )
+            self._pending.clear()
+        if save:
+            await self._repo.save(self._process)
+            self.saved = True
+        self._last_flush = time.monotonic()
+
+    def withdraw(self, reason: str) -> bool:
+        """
+        Drop buffered entities and retract recorded ones, without saving.
+
+        Args:
+            reason: Why the entities are withdrawn
+
+        Returns:
+            True if an EntitiesRetracted event was recorded
+        """
+        self._pending.clear()
+        if not self._recorded:
+            return False
+        self._process.retract_entities(self._recorded, reason)
+        self._recorded = []
+        return True
+
+
 async def _get_page_content(page_id: UUID, tenant_id: UUID) -> str | None:
     """Retrieve page content from the database.
 
@@ -110,6 +217,7 @@ async def process_extraction(
     process_id: UUID,
     tenant_id: UUID,
     worker_id: str = "async-worker",
+    skip_rate_limit: bool = False,
 ) -> dict:
     """Process an extraction request.
 
@@ -121,6 +229,8 @@ async def process_extraction(
         process_id: UUID of the ExtractionProcess aggregate
         tenant_id: Tenant identifier
         worker_id: Identifier for the worker processing this extraction
+        skip_rate_limit: Skip the rate limit check (the scheduler already
+            took a token for dispatched jobs)
 
     Returns:
         dict with extraction results:
@@ -169,27 +279,31 @@ async def process_extraction(
             }
 
         # Check rate limit
-        rate_limiter = get_rate_limiter()
-        try:
-            await rate_limiter.acquire(tenant_id)
-        except RateLimitExceeded as e:
-            logger.warning(
-                "Rate limit exceeded, extraction deferred",
-                extra={
+        if not skip_rate_limit:
+            rate_limiter = get_rate_limiter()
+            try:
+                await rate_limiter.acquire(tenant_id)
+            except RateLimitExceeded as e:
+                logger.warning(
+                    "Rate limit exceeded, extraction deferred",
+                    extra={
+                        "process_id": str(process_id),
+                        "tenant_id": str(tenant_id),
+                        "retry_after": e.retry_after,
+                    },
+                )
+                return {
+                    "status": "rate_limited",
                     "process_id": str(process_id),
-                    "tenant_id": str(tenant_id),
                     "retry_after": e.retry_after,
-                },
-            )
-            return {
-                "status": "rate_limited",
-                "process_id": str(process_id),
-                "retry_after": e.retry_after,
-            }
+                }
 
-        # Get event store and create repository
+        # Get event store and create repository; snapshots keep loads flat
+        # however many entities the process has recorded
         event_store = await get_event_store()
-        repo = create_extraction_process_repository(event_store)
+        repo = create_extraction_process_repository(
+            event_store, snapshot_store=await get_snapshot_store()
+        )
 
         # Load the extraction process aggregate
         try:
@@ -224,37 +338,47 @@ async def process_extraction(
         process.start(worker_id=worker_id)
 
         start_time = time.time()
+        sink = (
+            ProcessEntitySink(process, repo, settings.EXTRACTION_STREAMING_FLUSH_SECONDS)
+            if settings.EXTRACTION_STREAMING_ENABLED
+            else None
+        )
 
         try:
             # Extract using Ollama service
             service = get_ollama_extraction_service()
-            extraction_result = await service.extract(
-                content=content,
-                page_url=process.state.page_url,
-            )
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            # Record entities
-            for entity in extraction_result.entities:
-                process.record_entity(
-                    entity_type=entity.entity_type,
-                    name=entity.name,
-                    normalized_name=entity.name.lower().strip(),
-                    properties=entity.properties,
-                    confidence_score=entity.confidence,
-                    description=entity.description,
-                    source_text=entity.source_text,
+            if sink is not None:
+                # Entities are recorded (and saved) as the response streams in
+                extraction_result = await service.extract_streaming(
+                    content=content,
+                    page_url=process.state.page_url,
+                    sink=sink,
                 )
-
-            # Record relationships
-            for rel in extraction_result.relationships:
-                process.record_relationship(
-                    source_entity_name=rel.source_name,
-                    target_entity_name=rel.target_name,
-                    relationship_type=rel.relationship_type,
-                    confidence_score=rel.confidence,
-                    context=rel.context,
+                await sink.flush(save=False)
+            else:
+                extraction_result = await service.extract(
+                    content=content,
+                    page_url=process.state.page_url,
+                )
+                # Record entities with one event
+                process.record_entities(
+                    [_entity_record(entity) for entity in extraction_result.entities]
                 )
+            duration_ms = int((time.time() - start_time) * 1000)
+
+            # Record relationships with one event
+            process.record_relationships(
+                [
+                    {
+                        "source_entity_name": rel.source_name,
+                        "target_entity_name": rel.target_name,
+                        "relationship_type": rel.relationship_type,
+                        "confidence_score": rel.confidence,
+                        "context": rel.context,
+                    }
+                    for rel in extraction_result.relationships
+                ]
+            )
 
             # Complete extraction
             process.complete(duration_ms=duration_ms, extraction_method="llm_ollama")
@@ -282,11 +406,49 @@ async def process_extraction(
                 "duration_ms": duration_ms,
             }
 
+        except ConcurrencyLimitExceeded as e:
+            if sink is not None and sink.saved:
+                # The start was saved with streamed entities, so the process
+                # cannot be deferred; fail it as retryable instead
+                sink.withdraw("extraction deferred by the concurrency limit")
+                process.fail(
+                    error_message=str(e),
+                    error_type=type(e).__name__,
+                    retryable=True,
+                )
+                await repo.save(process)
+                return {
+                    "status": "failed",
+                    "process_id": str(process_id),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "retryable": True,
+                }
+
+            # No LLM slot freed up in time; the endpoint is busy, not
+            # failing, so defer like a rate limit without touching the
+            # circuit or the process (its start is not saved)
+            logger.warning(
+                "Concurrency limit reached, extraction deferred",
+                extra={
+                    "process_id": str(process_id),
+                    "tenant_id": str(tenant_id),
+                    "retry_after": e.retry_after,
+                },
+            )
+            return {
+                "status": "rate_limited",
+                "process_id": str(process_id),
+                "retry_after": e.retry_after,
+            }
+
         except ExtractionError as e:
             # Extraction failed - record failure and circuit breaker
             duration_ms = int((time.time() - start_time) * 1000)
             await circuit.record_failure()
 
+            if sink is not None:
+                sink.withdraw(f"extraction failed: {type(e).__name__}")
             process.fail(
                 error_message=str(e),
                 error_type=type(e).__name__,
@@ -318,6 +480,8 @@ async def process_extraction(
             duration_ms = int((time.time() - start_time) * 1000)
             await circuit.record_failure()
 
+            if sink is not None:
+                sink.withdraw(f"extraction failed: {type(e).__name__}")
             process.fail(
                 error_message=str(e),
                 error_type=type(e).__name__,
@@ -350,8 +514,198 @@ async def process_extraction(
         clear_current_tenant()
 
 
+async def schedule_extraction(
+    process_id: UUID,
+    tenant_id: UUID,
+    priority: ExtractionPriority = ExtractionPriority.BULK,
+) -> int:
+    """Queue an extraction process with the fair scheduler.
+
+    Args:
+        process_id: UUID of the ExtractionProcess aggregate
+        tenant_id: Tenant identifier
+        priority: INTERACTIVE for user-facing requests, BULK for crawls
+
+    Returns:
+        Tenant queue depth after enqueueing
+    """
+    scheduler = get_extraction_scheduler()
+    return await scheduler.submit(tenant_id, {"process_id": str(process_id)}, priority)
+
+
+async def schedule_page_extraction(
+    page_id: UUID | str,
+    tenant_id: UUID | str,
+    priority: ExtractionPriority = ExtractionPriority.BULK,
+) -> int:
+    """Queue a scraped page for extraction with the fair scheduler.
+
+    Args:
+        page_id: UUID of the scraped page
+        tenant_id: Tenant identifier
+        priority: INTERACTIVE for user-facing requests, BULK for crawls
+
+    Returns:
+        Tenant queue depth after enqueueing
+    """
+    scheduler = get_extraction_scheduler()
+    return await scheduler.submit(UUID(str(tenant_id)), {"page_id": str(page_id)}, priority)
+
+
+async def _dispatch_page_batch(
+    scheduler: ExtractionScheduler,
+    jobs: list[ScheduledJob],
+    dispatch_pages: Callable[[list[ScheduledJob]], None] | None,
+) -> bool:
+    """Hand page jobs to dispatch_pages, one call per tenant.
+
+    Jobs that were not handed off are requeued; an error from the
+    dispatcher is re-raised after that.
+
+    Returns:
+        False if there is no dispatcher (the jobs were requeued)
+    """
+    if dispatch_pages is None:
+        logger.error(
+            "No dispatcher for scheduled page extraction",
+            extra={"page_ids": [job.payload["page_id"] for job in jobs]},
+        )
+        for job in jobs:
+            await scheduler.requeue(job)
+        return False
+
+    by_tenant: dict[UUID, list[ScheduledJob]] = {}
+    for job in jobs:
+        by_tenant.setdefault(job.tenant_id, []).append(job)
+
+    batches = list(by_tenant.values())
+    for i, batch in enumerate(batches):
+        try:
+            dispatch_pages(batch)
+        except Exception:
+            for job in chain.from_iterable(batches[i:]):
+                await scheduler.requeue(job)
+            raise
+    return True
+
+
+async def run_scheduled_extractions(
+    worker_id: str = "scheduler-worker",
+    idle_timeout: float | None = None,
+    max_jobs: int | None = None,
+    dispatch_pages: Callable[[list[ScheduledJob]], None] | None = None,
+    page_batch_size: int | None = None,
+) -> dict:
+    """Process queued extractions until the scheduler has nothing eligible.
+
+    Extraction process jobs run here and hold a global concurrency slot
+    until they finish. Page jobs are collected into batches: after the
+    first page job, further jobs that are eligible right away are taken
+    until the batch is full, and the batch is handed to dispatch_pages
+    once per tenant. The dispatcher takes over the jobs' leases; whoever
+    runs the pages releases them.
+
+    A job that cannot run (open circuit, rate limited, failed hand-off or
+    an unexpected error) is requeued at the head of its tenant's queue;
+    jobs that fail for good are released. If the circuit breaker is open
+    the worker stops pulling work.
+
+    Args:
+        worker_id: Identifier for the worker processing extractions
+        idle_timeout: Seconds to wait for an eligible job before returning
+            (defaults to settings.EXTRACTION_SCHEDULER_IDLE_TIMEOUT)
+        max_jobs: Stop after this many jobs (None for no limit)
+        dispatch_pages: Starts the extraction of page jobs (payload
+            "page_id") of one tenant, passing on their lease IDs
+        page_batch_size: Page jobs per batch (defaults to
+            settings.EXTRACTION_SCHEDULER_PAGE_BATCH_SIZE)
+
+    Returns:
+        dict with the number of jobs processed and a count per status
+    """
+    scheduler = get_extraction_scheduler()
+    timeout = (
+        idle_timeout if idle_timeout is not None else settings.EXTRACTION_SCHEDULER_IDLE_TIMEOUT
+    )
+    batch_size = page_batch_size or settings.EXTRACTION_SCHEDULER_PAGE_BATCH_SIZE
+    processed = 0
+    statuses: dict[str, int] = {}
+    job: ScheduledJob | None = None
+
+    while max_jobs is None or processed < max_jobs:
+        if job is None:
+            job = await scheduler.next_job(timeout=timeout)
+            if job is None:
+                break
+
+        if "page_id" in job.payload:
+            batch = [job]
+            job = None
+            limit = batch_size if max_jobs is None else min(batch_size, max_jobs - processed)
+            while len(batch) < limit:
+                job, _ = await scheduler.try_dispatch()
+                if job is None or "page_id" not in job.payload:
+                    break
+                batch.append(job)
+                job = None
+
+            try:
+                dispatched = await _dispatch_page_batch(scheduler, batch, dispatch_pages)
+            except Exception:
+                if job is not None:
+                    await scheduler.requeue(job)
+                raise
+            if not dispatched:
+                if job is not None:
+                    await scheduler.requeue(job)
+                break
+            processed += len(batch)
+            statuses["dispatched"] = statuses.get("dispatched", 0) + len(batch)
+            continue
+
+        try:
+            result = await process_extraction(
+                UUID(job.payload["process_id"]),
+                job.tenant_id,
+                worker_id=worker_id,
+                skip_rate_limit=True,
+            )
+            status = result["status"]
+        except ExtractionWorkerError as e:
+            logger.error(
+                "Scheduled extraction failed",
+                extra={"process_id": job.payload.get("process_id"), "error": str(e)},
+            )
+            status = "error"
+        except Exception:
+            await scheduler.requeue(job)
+            raise
+
+        if status in ("circuit_open", "rate_limited"):
+            await scheduler.requeue(job)
+        else:
+            await scheduler.release(job)
+        job = None
+
+        processed += 1
+        statuses[status] = statuses.get(status, 0) + 1
+
+        if status == "circuit_open":
+            break
+
+    if job is not None:
+        # Taken while filling the last page batch but over max_jobs
+        await scheduler.requeue(job)
+
+    return {"processed": processed, "statuses": statuses}
+
+
 __all__ = [
     "process_extraction",
+    "schedule_extraction",
+    "schedule_page_extraction",
+    "run_scheduled_extractions",
+    "ProcessEntitySink",
     "ExtractionWorkerError",
     "ProcessNotFoundError",
     "PageContentNotFoundError",
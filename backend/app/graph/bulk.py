@@ -0,0 +1,531 @@
+"""
+Bulk export and import of tenant graphs.
+
+Rebuilding a tenant's Neo4j graph through per-entity sync tasks costs one
+task, one Postgres round trip and one Neo4j transaction per entity. This
+module instead streams canonical entities and relationships out of
+PostgreSQL with a server-side cursor in fixed-size chunks and loads each
+chunk into Neo4j with a single statement:
+
+- When NEO4J_IMPORT_DIR is set (a directory shared with Neo4j's import
+  directory), each chunk is written as a CSV file and loaded with
+  ``LOAD CSV`` + ``CALL { } IN TRANSACTIONS``.
+- Otherwise each chunk is sent as a parameter and loaded with ``UNWIND``
+  in one managed transaction.
+
+Both paths MERGE on the entity/relationship id, so reloading a chunk is
+idempotent. Chunks are read in id order, so a rebuild can resume from the
+last loaded id (see RebuildCheckpoint).
+
+The same chunk stream backs the CSV export API (GET /graph/export/{kind}).
+
+Example:
+    with TenantWorkerContext(tenant_id) as ctx:
+        summary = rebuild_tenant_graph(ctx.db, tenant_id, clear=True)
+"""
+
+import csv
+import io
+import json
+import logging
+import os
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+from uuid import UUID
+
+from neo4j import Driver
+from sqlalchemy import Select, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.core.database import SyncSessionLocal
+from app.core.neo4j import get_sync_driver, sync_session
+from app.models.extracted_entity import EntityRelationship, ExtractedEntity
+
+logger = logging.getLogger(__name__)
+
+ENTITIES = "entities"
+RELATIONSHIPS = "relationships"
+
+# CSV column order for each export kind
+ENTITY_COLUMNS = (
+    "id",
+    "tenant_id",
+    "name",
+    "normalized_name",
+    "type",
+    "type_label",
+    "description",
+    "confidence_score",
+    "extraction_method",
+    "properties",
+)
+
+RELATIONSHIP_COLUMNS = (
+    "id",
+    "tenant_id",
+    "source_id",
+    "target_id",
+    "type",
+    "confidence_score",
+    "properties",
+)
+
+EXPORT_COLUMNS = {
+    ENTITIES: ENTITY_COLUMNS,
+    RELATIONSHIPS: RELATIONSHIP_COLUMNS,
+}
+
+# Per-row Cypher shared by the UNWIND and LOAD CSV paths. LOAD CSV yields
+# strings only, so numbers are converted and empty descriptions become null.
+_ENTITY_MERGE = """
+    MERGE (e:Entity {id: row.id})
+    SET e.tenant_id = row.tenant_id,
+        e.name = row.name,
+        e.normalized_name = row.normalized_name,
+        e.type = row.type,
+        e.description = CASE row.description WHEN '' THEN null ELSE row.description END,
+        e.confidence_score = toFloat(row.confidence_score),
+        e.extraction_method = row.extraction_method,
+        e.properties = row.properties,
+        e.updated_at = datetime()
+    WITH e, row
+    CALL apoc.create.addLabels(e, [row.type_label]) YIELD node
+"""
+
+_RELATIONSHIP_MERGE = """
+    MATCH (source:Entity {id: row.source_id})
+    MATCH (target:Entity {id: row.target_id})
+    WITH source, target, row, {
+        tenant_id: row.tenant_id,
+        confidence_score: toFloat(row.confidence_score),
+        properties: row.properties,
+        updated_at: datetime()
+    } AS props
+    CALL apoc.merge.relationship(source, row.type, {id: row.id}, props, target, props)
+    YIELD rel
+"""
+
+_MERGE_BODIES = {
+    ENTITIES: _ENTITY_MERGE,
+    RELATIONSHIPS: _RELATIONSHIP_MERGE,
+}
+
+
+@dataclass
+class RebuildCheckpoint:
+    """Position of a rebuild: the phase and the last id loaded in it."""
+
+    phase: str = ENTITIES
+    after_id: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Serialize for task arguments and progress metadata."""
+        return {"phase": self.phase, "after_id": self.after_id}
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "RebuildCheckpoint":
+        """Restore a checkpoint; an empty value means start from scratch."""
+        if not data:
+            return cls()
+        return cls(phase=data.get("phase", ENTITIES), after_id=data.get("after_id"))
+
+
+# =============================================================================
+# Export (PostgreSQL)
+# =============================================================================
+
+
+def export_query(kind: str, tenant_id: UUID, after_id: Optional[UUID] = None) -> Select:
+    """
+    Build the id-ordered export query for one kind of graph element.
+
+    Only canonical entities are exported; relationships are exported when
+    both endpoints are canonical.
+
+    Args:
+        kind: ENTITIES or RELATIONSHIPS
+        tenant_id: Tenant UUID
+        after_id: Resume after this id (exclusive)
+
+    Returns:
+        SQLAlchemy select returning export columns
+
+    Raises:
+        ValueError: If kind is unknown
+    """
+    if kind == ENTITIES:
+        query = select(
+            ExtractedEntity.id,
+            ExtractedEntity.tenant_id,
+            ExtractedEntity.name,
+            ExtractedEntity.normalized_name,
+            ExtractedEntity.entity_type,
+            ExtractedEntity.description,
+            ExtractedEntity.confidence_score,
+            ExtractedEntity.extraction_method,
+            ExtractedEntity.properties,
+        ).where(
+            ExtractedEntity.tenant_id == tenant_id,
+            ExtractedEntity.is_canonical == True,  # noqa: E712
+        )
+        id_column = ExtractedEntity.id
+    elif kind == RELATIONSHIPS:
+        source = aliased(ExtractedEntity)
+        target = aliased(ExtractedEntity)
+        query = (
+            select(
+                EntityRelationship.id,
+                EntityRelationship.tenant_id,
+                EntityRelationship.source_entity_id,
+                EntityRelationship.target_entity_id,
+                EntityRelationship.relationship_type,
+                EntityRelationship.confidence_score,
+                EntityRelationship.properties,
+            )
+            .join(source, source.id == EntityRelationship.source_entity_id)
+            .join(target, target.id == EntityRelationship.target_entity_id)
+            .where(
+                EntityRelationship.tenant_id == tenant_id,
+                source.is_canonical == True,  # noqa: E712
+                target.is_canonical == True,  # noqa: E712
+            )
+        )
+        id_column = EntityRelationship.id
+    else:
+        raise ValueError(f"Unknown export kind: {kind}")
+
+    if after_id is not None:
+        query = query.where(id_column > after_id)
+
+    return query.order_by(id_column)
+
+
+def _enum_value(value: Any) -> str:
+    return value.value if hasattr(value, "value") else str(value)
+
+
+def export_row(kind: str, row: Any) -> dict[str, Any]:
+    """
+    Convert an export query row to a flat dict of CSV/Cypher values.
+
+    Args:
+        kind: ENTITIES or RELATIONSHIPS
+        row: Row returned by export_query
+
+    Returns:
+        Dict keyed by the kind's export columns
+    """
+    if kind == ENTITIES:
+        entity_type = _enum_value(row[4])
+        return {
+            "id": str(row[0]),
+            "tenant_id": str(row[1]),
+            "name": row[2],
+            "normalized_name": row[3],
+            "type": entity_type,
+            "type_label": entity_type.capitalize(),
+            "description": row[5] or "",
+            "confidence_score": row[6],
+            "extraction_method": _enum_value(row[7]),
+            "properties": json.dumps(row[8]) if row[8] else "{}",
+        }
+
+    return {
+        "id": str(row[0]),
+        "tenant_id": str(row[1]),
+        "source_id": str(row[2]),
+        "target_id": str(row[3]),
+        "type": row[4].upper().replace(" ", "_"),
+        "confidence_score": row[5],
+        "properties": json.dumps(row[6]) if row[6] else "{}",
+    }
+
+
+def iter_export_chunks(
+    db: Session,
+    kind: str,
+    tenant_id: UUID,
+    chunk_size: Optional[int] = None,
+    after_id: Optional[UUID] = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Stream export rows in chunks using a server-side cursor.
+
+    Args:
+        db: Sync session (tenant context set)
+        kind: ENTITIES or RELATIONSHIPS
+        tenant_id: Tenant UUID
+        chunk_size: Rows per chunk (defaults to settings)
+        after_id: Resume after this id (exclusive)
+
+    Yields:
+        Lists of export row dicts, in id order
+    """
+    chunk_size = chunk_size or settings.GRAPH_BULK_CHUNK_SIZE
+    result = db.execute(
+        export_query(kind, tenant_id, after_id).execution_options(yield_per=chunk_size)
+    )
+    for partition in result.partitions():
+        yield [export_row(kind, row) for row in partition]
+
+
+async def aiter_export_chunks(
+    db: AsyncSession,
+    kind: str,
+    tenant_id: UUID,
+    chunk_size: Optional[int] = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Async counterpart of iter_export_chunks for the export API.
+
+    Args:
+        db: Async session (tenant context set)
+        kind: ENTITIES or RELATIONSHIPS
+        tenant_id: Tenant UUID
+        chunk_size: Rows per chunk (defaults to settings)
+
+    Yields:
+        Lists of export row dicts, in id order
+    """
+    chunk_size = chunk_size or settings.GRAPH_BULK_CHUNK_SIZE
+    result = await db.stream(
+        export_query(kind, tenant_id).execution_options(yield_per=chunk_size)
+    )
+    async for partition in result.partitions():
+        yield [export_row(kind, row) for row in partition]
+
+
+def rows_to_csv(kind: str, rows: Iterable[dict[str, Any]], header: bool = True) -> str:
+    """
+    Render export rows as CSV text.
+
+    Args:
+        kind: ENTITIES or RELATIONSHIPS
+        rows: Export row dicts
+        header: Whether to include the header line
+
+    Returns:
+        CSV text
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS[kind], lineterminator="\n")
+    if header:
+        writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+# =============================================================================
+# Import (Neo4j)
+# =============================================================================
+
+
+def unwind_query(kind: str) -> str:
+    """Build the statement that loads a chunk passed as $rows."""
+    return f"UNWIND $rows AS row {_MERGE_BODIES[kind]} RETURN count(*) AS loaded"
+
+
+def load_csv_query(kind: str, rows_per_transaction: int) -> str:
+    """Build the statement that loads a CSV chunk file from $url."""
+    return (
+        f"LOAD CSV WITH HEADERS FROM $url AS row "
+        f"CALL {{ WITH row {_MERGE_BODIES[kind]} RETURN count(*) AS loaded }} "
+        f"IN TRANSACTIONS OF {int(rows_per_transaction)} ROWS "
+        f"RETURN sum(loaded) AS loaded"
+    )
+
+
+class GraphBulkLoader:
+    """
+    Loads export chunks into Neo4j.
+
+    Uses LOAD CSV when an import directory shared with Neo4j is configured,
+    and UNWIND with parameters otherwise.
+    """
+
+    def __init__(
+        self,
+        driver: Optional[Driver] = None,
+        import_dir: Optional[str] = None,
+        rows_per_transaction: Optional[int] = None,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            driver: Sync Neo4j driver (defaults to the shared driver)
+            import_dir: Local path of Neo4j's import directory (defaults to settings)
+            rows_per_transaction: Rows per inner transaction for LOAD CSV
+        """
+        self._driver = driver or get_sync_driver()
+        self._import_dir = import_dir if import_dir is not None else settings.NEO4J_IMPORT_DIR
+        self._rows_per_transaction = (
+            rows_per_transaction or settings.GRAPH_BULK_ROWS_PER_TRANSACTION
+        )
+
+    def load(self, kind: str, rows: list[dict[str, Any]]) -> int:
+        """
+        Load one chunk of export rows.
+
+        Args:
+            kind: ENTITIES or RELATIONSHIPS
+            rows: Export row dicts
+
+        Returns:
+            Number of rows loaded (relationships with missing endpoints are skipped)
+        """
+        if not rows:
+            return 0
+        if self._import_dir:
+            return self._load_csv(kind, rows)
+        return self._load_unwind(kind, rows)
+
+    def _load_unwind(self, kind: str, rows: list[dict[str, Any]]) -> int:
+        def work(tx) -> int:
+            record = tx.run(unwind_query(kind), rows=rows).single()
+            return record["loaded"] if record else 0
+
+        with sync_session(self._driver) as session:
+            return session.execute_write(work)
+
+    def _load_csv(self, kind: str, rows: list[dict[str, Any]]) -> int:
+        filename = f"{kind}-{uuid.uuid4().hex}.csv"
+        path = os.path.join(self._import_dir, filename)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(rows_to_csv(kind, rows))
+
+        try:
+            # CALL { } IN TRANSACTIONS must run in an auto-commit transaction
+            with sync_session(self._driver) as session:
+                record = session.run(
+                    load_csv_query(kind, self._rows_per_transaction),
+                    url=f"file:///{filename}",
+                ).single()
+                return record["loaded"] if record else 0
+        finally:
+            os.remove(path)
+
+    def clear_tenant(self, tenant_id: UUID) -> int:
+        """
+        Delete a tenant's graph in batches.
+
+        Args:
+            tenant_id: Tenant UUID
+
+        Returns:
+            Number of deleted entity nodes
+        """
+        with sync_session(self._driver) as session:
+            record = session.run(
+                f"""
+                MATCH (e:Entity {{tenant_id: $tenant_id}})
+                CALL {{ WITH e DETACH DELETE e RETURN 1 AS deleted }}
+                IN TRANSACTIONS OF {int(self._rows_per_transaction)} ROWS
+                RETURN count(deleted) AS deleted
+                """,
+                tenant_id=str(tenant_id),
+            ).single()
+            return record["deleted"] if record else 0
+
+
+# =============================================================================
+# Rebuild
+# =============================================================================
+
+
+def mark_synced(tenant_id: UUID, kind: str, ids: list[str]) -> None:
+    """
+    Mark bulk-loaded rows as synced in their own committed transaction.
+
+    The export stream holds a server-side cursor open on the rebuild's
+    session, so flags are written on a separate session and survive a
+    later failure of the rebuild.
+
+    Args:
+        tenant_id: Tenant UUID
+        kind: ENTITIES or RELATIONSHIPS
+        ids: Ids of the loaded rows
+    """
+    model = ExtractedEntity if kind == ENTITIES else EntityRelationship
+    now = datetime.now(timezone.utc)
+    values = {"synced_to_neo4j": True, "updated_at": now}
+    if kind == ENTITIES:
+        values["synced_at"] = now
+
+    with SyncSessionLocal() as db:
+        db.execute(
+            text("SELECT set_config('app.current_tenant_id', :tenant_id, TRUE)"),
+            {"tenant_id": str(tenant_id)},
+        )
+        db.execute(
+            update(model)
+            .where(model.id.in_([UUID(id_) for id_ in ids]))
+            .values(**values)
+        )
+        db.commit()
+
+
+def rebuild_tenant_graph(
+    db: Session,
+    tenant_id: UUID,
+    *,
+    clear: bool = False,
+    checkpoint: Optional[RebuildCheckpoint] = None,
+    loader: Optional[GraphBulkLoader] = None,
+    chunk_size: Optional[int] = None,
+    on_chunk: Optional[Callable[[str, list[str], RebuildCheckpoint, dict], None]] = None,
+) -> dict:
+    """
+    Rebuild a tenant's Neo4j graph from PostgreSQL.
+
+    Loads all canonical entities, then all relationships between them,
+    chunk by chunk. After each chunk ``on_chunk`` is called with the kind,
+    the loaded ids, the checkpoint to resume from and running totals, which
+    callers use to report progress and mark rows as synced.
+
+    Args:
+        db: Sync session (tenant context set) used for the export stream
+        tenant_id: Tenant UUID
+        clear: Delete the tenant's existing graph first (ignored when resuming)
+        checkpoint: Resume position from a previous, interrupted rebuild
+        loader: Neo4j loader (defaults to a GraphBulkLoader on the shared driver)
+        chunk_size: Rows per chunk (defaults to settings)
+        on_chunk: Progress callback
+
+    Returns:
+        dict: Rebuild summary with entity and relationship totals
+    """
+    loader = loader or GraphBulkLoader()
+    checkpoint = checkpoint or RebuildCheckpoint()
+    totals = {"entities": 0, "relationships": 0, "cleared": 0}
+
+    if clear and checkpoint.phase == ENTITIES and checkpoint.after_id is None:
+        totals["cleared"] = loader.clear_tenant(tenant_id)
+
+    phases = [ENTITIES, RELATIONSHIPS]
+    for kind in phases[phases.index(checkpoint.phase):]:
+        after_id = None
+        if checkpoint.phase == kind and checkpoint.after_id:
+            after_id = UUID(checkpoint.after_id)
+
+        for rows in iter_export_chunks(db, kind, tenant_id, chunk_size, after_id):
+            totals[kind] += loader.load(kind, rows)
+            ids = [row["id"] for row in rows]
+            checkpoint = RebuildCheckpoint(phase=kind, after_id=ids[-1])
+
+            if on_chunk is not None:
+                on_chunk(kind, ids, checkpoint, totals)
+
+        checkpoint = RebuildCheckpoint(phase=kind)
+
+    logger.info(
+        "Tenant graph rebuilt",
+        extra={"tenant_id": str(tenant_id), **totals},
+    )
+
+    return totals
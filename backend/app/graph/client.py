@@ -5,20 +5,41 @@ Provides a tenant-aware interface to Neo4j for:
 - Entity node operations
 - Relationship operations
 - Graph queries
+
+Drivers come from the shared connection layer in app.core.neo4j, so the
+sync (Celery) path shares one pooled, instrumented driver per process and
+writes run as managed transactions that are retried on transient errors.
 """
 
 import logging
-from typing import Any, Optional
+from collections.abc import Callable, Sequence
+from typing import Any, Optional, TypeVar
 from uuid import UUID
 
-from neo4j import AsyncGraphDatabase, GraphDatabase
+from neo4j import ManagedTransaction
 from neo4j.exceptions import ServiceUnavailable
 
 from app.core.config import settings
+from app.core.neo4j import (
+    Statement,
+    async_session,
+    create_async_driver,
+    create_sync_driver,
+    get_sync_driver,
+    run_statements,
+    sync_session,
+)
 from app.models.extracted_entity import ExtractedEntity, EntityRelationship
+from app.services.entity_search import (
+    ENTITY_FULLTEXT_INDEX,
+    SearchMode,
+    build_fulltext_query,
+)
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # Global client instance
 _neo4j_client: Optional["Neo4jClient"] = None
@@ -45,41 +66,56 @@ class Neo4jClient:
     with tenant_id properties for filtering.
     """
 
-    def __init__(self, uri: str, user: str, password: str):
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+    ):
         """
         Initialize Neo4j client.
 
+        With the configured server and credentials the client uses the
+        worker process's shared sync driver; other values get a driver of
+        their own, closed by close().
+
         Args:
-            uri: Neo4j connection URI
-            user: Neo4j username
-            password: Neo4j password
+            uri: Neo4j connection URI (defaults to settings)
+            user: Neo4j username (defaults to settings)
+            password: Neo4j password (defaults to settings)
         """
-        self.uri = uri
-        self.user = user
-        self.password = password
-
-        # Create sync driver for Celery tasks
-        self._sync_driver = GraphDatabase.driver(
-            uri,
-            auth=(user, password),
-            max_connection_lifetime=3600,
-            max_connection_pool_size=50,
+        self.uri = uri or settings.NEO4J_URI
+        self.user = user or settings.NEO4J_USER
+        self.password = password or settings.NEO4J_PASSWORD
+
+        # Sync driver for Celery tasks
+        self._owns_sync_driver = (self.uri, self.user, self.password) != (
+            settings.NEO4J_URI,
+            settings.NEO4J_USER,
+            settings.NEO4J_PASSWORD,
         )
+        if self._owns_sync_driver:
+            self._sync_driver = create_sync_driver(
+                self.uri, auth=(self.user, self.password)
+            )
+        else:
+            self._sync_driver = get_sync_driver()
 
-        # Create async driver for API operations
-        self._async_driver = AsyncGraphDatabase.driver(
-            uri,
-            auth=(user, password),
-            max_connection_lifetime=3600,
-            max_connection_pool_size=50,
-        )
+        # Async driver for API operations
+        self._async_driver = create_async_driver(self.uri, auth=(self.user, self.password))
 
-        logger.info(f"Neo4j client initialized: {uri}")
+        logger.info(f"Neo4j client initialized: {self.uri}")
 
     def close(self) -> None:
-        """Close all database connections."""
-        self._sync_driver.close()
-        logger.info("Neo4j sync driver closed")
+        """
+        Close the client's own sync driver.
+
+        The shared process driver is left open for other users; it is
+        closed with app.core.neo4j.close_sync_driver() on shutdown.
+        """
+        if self._owns_sync_driver:
+            self._sync_driver.close()
+            logger.info("Neo4j sync driver closed")
 
     async def close_async(self) -> None:
         """Close async database connection."""
@@ -95,6 +131,47 @@ class Neo4jClient:
             logger.error(f"Neo4j connectivity check failed: {e}")
             return False
 
+    # =========================================================================
+    # Transactions (Sync - for Celery)
+    # =========================================================================
+
+    def execute_write(
+        self,
+        work: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run a unit of work in a managed write transaction.
+
+        The driver retries the unit of work on transient errors within
+        NEO4J_MAX_TRANSACTION_RETRY_TIME, so it must be idempotent.
+
+        Args:
+            work: Function taking a ManagedTransaction first
+            *args: Extra positional arguments for work
+            **kwargs: Extra keyword arguments for work
+
+        Returns:
+            Return value of work
+        """
+        with sync_session(self._sync_driver) as session:
+            return session.execute_write(work, *args, **kwargs)
+
+    def run_statements(self, statements: Sequence[Statement]) -> list[list[dict]]:
+        """
+        Run several write statements in one managed transaction.
+
+        Args:
+            statements: (cypher, parameters) pairs, run in order
+
+        Returns:
+            Records of each statement as lists of dicts
+        """
+        if not statements:
+            return []
+        return self.execute_write(run_statements, statements)
+
     # =========================================================================
     # Entity Operations (Sync - for Celery)
     # =========================================================================
@@ -109,36 +186,8 @@ class Neo4jClient:
         Returns:
             Neo4j element ID of the node
         """
-        with self._sync_driver.session() as session:
-            result = session.run(
-                """
-                MERGE (e:Entity {id: $id})
-                SET e.tenant_id = $tenant_id,
-                    e.name = $name,
-                    e.normalized_name = $normalized_name,
-                    e.type = $type,
-                    e.description = $description,
-                    e.confidence_score = $confidence,
-                    e.extraction_method = $method,
-                    e.properties = $properties,
-                    e.updated_at = datetime()
-                WITH e
-                CALL apoc.create.addLabels(e, [$type_label]) YIELD node
-                RETURN elementId(node) as node_id
-                """,
-                id=str(entity.id),
-                tenant_id=str(entity.tenant_id),
-                name=entity.name,
-                normalized_name=entity.normalized_name,
-                type=entity.entity_type.value,
-                type_label=entity.entity_type.value.capitalize(),
-                description=entity.description,
-                confidence=entity.confidence_score,
-                method=entity.extraction_method.value,
-                properties=_serialize_properties(entity.properties),
-            )
-            record = result.single()
-            return record["node_id"] if record else None
+        (records,) = self.run_statements([_entity_statement(entity)])
+        return records[0]["node_id"] if records else None
 
     def sync_relationship(
         self,
@@ -157,30 +206,37 @@ class Neo4jClient:
         Returns:
             Neo4j element ID of the relationship
         """
-        with self._sync_driver.session() as session:
-            # Create relationship with dynamic type
-            rel_type = relationship.relationship_type.upper().replace(" ", "_")
+        (records,) = self.run_statements([_relationship_statement(relationship)])
+        return records[0]["rel_id"] if records else None
 
-            result = session.run(
-                f"""
-                MATCH (source:Entity {{id: $source_id}})
-                MATCH (target:Entity {{id: $target_id}})
-                MERGE (source)-[r:{rel_type} {{id: $rel_id}}]->(target)
-                SET r.tenant_id = $tenant_id,
-                    r.confidence_score = $confidence,
-                    r.properties = $properties,
-                    r.updated_at = datetime()
-                RETURN elementId(r) as rel_id
-                """,
-                source_id=str(relationship.source_entity_id),
-                target_id=str(relationship.target_entity_id),
-                rel_id=str(relationship.id),
-                tenant_id=str(relationship.tenant_id),
-                confidence=relationship.confidence_score,
-                properties=_serialize_properties(relationship.properties),
-            )
-            record = result.single()
-            return record["rel_id"] if record else None
+    def sync_relationship_with_entities(
+        self,
+        relationship: EntityRelationship,
+        entities: Sequence[ExtractedEntity],
+    ) -> tuple[dict[UUID, str], Optional[str]]:
+        """
+        Create or update entity nodes and a relationship between them in one transaction.
+
+        Used when the relationship's endpoints are not synced yet, so the
+        nodes and the relationship are written (and retried) together.
+
+        Args:
+            relationship: EntityRelationship from PostgreSQL
+            entities: Endpoint entities to write before the relationship
+
+        Returns:
+            Neo4j element IDs by entity ID, and the relationship's element ID
+        """
+        statements = [_entity_statement(entity) for entity in entities]
+        statements.append(_relationship_statement(relationship))
+        *entity_records, rel_records = self.run_statements(statements)
+
+        node_ids = {
+            entity.id: records[0]["node_id"]
+            for entity, records in zip(entities, entity_records, strict=True)
+            if records
+        }
+        return node_ids, rel_records[0]["rel_id"] if rel_records else None
 
     def delete_entity(self, entity_id: UUID, tenant_id: UUID) -> bool:
         """
@@ -193,8 +249,8 @@ class Neo4jClient:
         Returns:
             True if deleted, False otherwise
         """
-        with self._sync_driver.session() as session:
-            result = session.run(
+        def work(tx: ManagedTransaction) -> bool:
+            result = tx.run(
                 """
                 MATCH (e:Entity {id: $id, tenant_id: $tenant_id})
                 DETACH DELETE e
@@ -206,6 +262,8 @@ class Neo4jClient:
             record = result.single()
             return record["deleted"] > 0 if record else False
 
+        return self.execute_write(work)
+
     # =========================================================================
     # Query Operations (Async - for API)
     # =========================================================================
@@ -229,7 +287,7 @@ class Neo4jClient:
         Returns:
             dict with 'nodes' and 'edges' lists
         """
-        async with self._async_driver.session() as session:
+        async with async_session(self._async_driver) as session:
             result = await session.run(
                 """
                 MATCH (center:Entity {id: $id, tenant_id: $tenant_id})
@@ -280,38 +338,43 @@ class Neo4jClient:
         query: str,
         entity_types: list[str] = None,
         limit: int = 20,
+        mode: SearchMode = SearchMode.FUZZY,
     ) -> list[dict]:
         """
-        Search entities by name.
+        Search entities by name using the entity full-text index.
 
         Args:
             tenant_id: Tenant UUID
             query: Search query string
             entity_types: Optional list of entity types to filter
             limit: Maximum results
+            mode: Fuzzy (typo-tolerant) or prefix (typeahead) matching
 
         Returns:
-            List of matching entity dictionaries
+            List of matching entity dictionaries ordered by relevance
         """
+        search_query = build_fulltext_query(query, str(tenant_id), mode)
+        if search_query is None:
+            return []
+
         type_filter = ""
         if entity_types:
             labels = " OR ".join(f"e:{t.capitalize()}" for t in entity_types)
             type_filter = f"AND ({labels})"
 
-        async with self._async_driver.session() as session:
+        async with async_session(self._async_driver) as session:
             result = await session.run(
                 f"""
-                MATCH (e:Entity)
+                CALL db.index.fulltext.queryNodes('{ENTITY_FULLTEXT_INDEX}', $search_query)
+                YIELD node AS e, score
                 WHERE e.tenant_id = $tenant_id
-                AND (e.name CONTAINS $query OR e.normalized_name CONTAINS $query_lower)
                 {type_filter}
-                RETURN e
-                ORDER BY e.confidence_score DESC
+                RETURN e, score
+                ORDER BY score DESC, e.confidence_score DESC
                 LIMIT $limit
                 """,
                 tenant_id=str(tenant_id),
-                query=query,
-                query_lower=query.lower(),
+                search_query=search_query,
                 limit=limit,
             )
 
@@ -324,6 +387,7 @@ class Neo4jClient:
                     "type": node.get("type"),
                     "description": node.get("description"),
                     "confidence": node.get("confidence_score"),
+                    "score": record["score"],
                 })
 
             return entities
@@ -352,7 +416,7 @@ class Neo4jClient:
         else:
             pattern = "(e)-[r]-(other)"
 
-        async with self._async_driver.session() as session:
+        async with async_session(self._async_driver) as session:
             result = await session.run(
                 f"""
                 MATCH (e:Entity {{id: $id, tenant_id: $tenant_id}})
@@ -400,7 +464,7 @@ class Neo4jClient:
             """,
         ]
 
-        with self._sync_driver.session() as session:
+        with sync_session(self._sync_driver) as session:
             for index_query in indexes:
                 try:
                     session.run(index_query)
@@ -418,7 +482,7 @@ class Neo4jClient:
             """,
         ]
 
-        with self._sync_driver.session() as session:
+        with sync_session(self._sync_driver) as session:
             for constraint_query in constraints:
                 try:
                     session.run(constraint_query)
@@ -428,6 +492,65 @@ class Neo4jClient:
         logger.info("Neo4j constraints created")
 
 
+def _entity_statement(entity: ExtractedEntity) -> Statement:
+    """Build the MERGE statement for an entity node."""
+    return (
+        """
+        MERGE (e:Entity {id: $id})
+        SET e.tenant_id = $tenant_id,
+            e.name = $name,
+            e.normalized_name = $normalized_name,
+            e.type = $type,
+            e.description = $description,
+            e.confidence_score = $confidence,
+            e.extraction_method = $method,
+            e.properties = $properties,
+            e.updated_at = datetime()
+        WITH e
+        CALL apoc.create.addLabels(e, [$type_label]) YIELD node
+        RETURN elementId(node) as node_id
+        """,
+        {
+            "id": str(entity.id),
+            "tenant_id": str(entity.tenant_id),
+            "name": entity.name,
+            "normalized_name": entity.normalized_name,
+            "type": entity.entity_type.value,
+            "type_label": entity.entity_type.value.capitalize(),
+            "description": entity.description,
+            "confidence": entity.confidence_score,
+            "method": entity.extraction_method.value,
+            "properties": _serialize_properties(entity.properties),
+        },
+    )
+
+
+def _relationship_statement(relationship: EntityRelationship) -> Statement:
+    """Build the MERGE statement for a relationship between two entity nodes."""
+    # Create relationship with dynamic type
+    rel_type = relationship.relationship_type.upper().replace(" ", "_")
+    return (
+        f"""
+        MATCH (source:Entity {{id: $source_id}})
+        MATCH (target:Entity {{id: $target_id}})
+        MERGE (source)-[r:{rel_type} {{id: $rel_id}}]->(target)
+        SET r.tenant_id = $tenant_id,
+            r.confidence_score = $confidence,
+            r.properties = $properties,
+            r.updated_at = datetime()
+        RETURN elementId(r) as rel_id
+        """,
+        {
+            "source_id": str(relationship.source_entity_id),
+            "target_id": str(relationship.target_entity_id),
+            "rel_id": str(relationship.id),
+            "tenant_id": str(relationship.tenant_id),
+            "confidence": relationship.confidence_score,
+            "properties": _serialize_properties(relationship.properties),
+        },
+    )
+
+
 def _serialize_properties(props: dict) -> str:
     """Serialize properties dict to JSON string for Neo4j."""
     import json
@@ -19,6 +19,8 @@ Models:
     - EntityType: Enum of entity types
     - ExtractionMethod: Enum of extraction methods
     - EntityRelationship: Relationship between entities
+    - GraphStatistics: Precomputed per-tenant knowledge graph statistics
+    - ProcessedContentHash: Page content that has triggered extraction
     - ExtractionProvider: Extraction provider configuration (OpenAI, Ollama, etc.)
     - ExtractionProviderType: Enum of extraction provider types
     - InferenceProvider: LLM inference provider configuration
@@ -40,6 +42,7 @@ from app.models.extracted_entity import (
     ExtractedEntity,
     ExtractionMethod,
 )
+from app.models.graph_statistics import GraphStatistics
 from app.models.merge_history import MergeEventType, MergeHistory
 from app.models.merge_review_queue import MergeReviewItem, MergeReviewStatus
 from app.models.extraction_provider import (
@@ -52,6 +55,7 @@ from app.models.inference_provider import (
 )
 from app.models.inference_request import InferenceRequest, InferenceStatus
 from app.models.oauth_provider import OAuthProvider, ProviderType
+from app.models.processed_content_hash import ProcessedContentHash
 from app.models.scraped_page import ScrapedPage
 from app.models.scraping_job import JobStatus, ScrapingJob
 from app.models.tenant import Tenant
@@ -74,6 +78,8 @@ __all__ = [
     "EntityType",
     "ExtractionMethod",
     "EntityRelationship",
+    "GraphStatistics",
+    "ProcessedContentHash",
     # Consolidation models
     "ConsolidationConfig",
     "DEFAULT_AUTO_MERGE_THRESHOLD",
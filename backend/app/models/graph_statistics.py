@@ -0,0 +1,149 @@
+"""
+Graph statistics model for precomputed per-tenant knowledge graph stats.
+
+This module defines the GraphStatistics model, a one-row-per-tenant read
+model that lets dashboards fetch graph statistics in constant time instead
+of aggregating over every node and relationship on each request.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+
+if TYPE_CHECKING:
+    from app.models.tenant import Tenant
+
+
+class GraphStatistics(Base):
+    """
+    Precomputed knowledge graph statistics for a tenant.
+
+    Entity and relationship counts are maintained incrementally by the
+    projection handlers. Degree distribution and top hubs cannot be
+    maintained cheaply per event, so they are refreshed (together with a
+    full recount that corrects any drift) by the periodic reconcile task.
+
+    Attributes:
+        tenant_id: Primary key and foreign key to tenant
+        total_entities: Number of canonical entities
+        total_relationships: Number of relationships
+        entity_counts: Canonical entity count by entity type
+        relationship_counts: Relationship count by relationship type
+        degree_histogram: Entity count by degree bucket (e.g. "2-4")
+        top_hubs: Highest-degree entities with id, name, entity_type, degree
+        reconciled_at: When statistics were last fully recomputed
+        created_at: When the stats row was created
+        updated_at: When the stats row was last updated
+    """
+
+    __tablename__ = "graph_statistics"
+
+    # Exclude inherited id column - this table uses tenant_id as primary key
+    id = None
+
+    # Primary key is tenant_id (one stats row per tenant)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Tenant these statistics belong to",
+    )
+
+    # Totals
+    total_entities: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Number of canonical entities",
+    )
+
+    total_relationships: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Number of relationships",
+    )
+
+    # Breakdowns (stored as JSONB maps / lists)
+    entity_counts: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        comment="Canonical entity count by entity type",
+    )
+
+    relationship_counts: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        comment="Relationship count by relationship type",
+    )
+
+    degree_histogram: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        comment="Entity count by degree bucket (maintained by reconcile)",
+    )
+
+    top_hubs: Mapped[list] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=list,
+        comment="Highest-degree entities (maintained by reconcile)",
+    )
+
+    # Timestamps
+    reconciled_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When statistics were last fully recomputed",
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default="now()",
+        comment="When the stats row was created",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default="now()",
+        onupdate=lambda: datetime.now(timezone.utc),
+        comment="When the stats row was last updated",
+    )
+
+    # Relationships
+    tenant: Mapped["Tenant"] = relationship(
+        "Tenant",
+        doc="Tenant these statistics belong to",
+    )
+
+    def __init__(self, **kwargs):
+        """Initialize statistics with empty counts."""
+        kwargs.setdefault("total_entities", 0)
+        kwargs.setdefault("total_relationships", 0)
+        kwargs.setdefault("entity_counts", {})
+        kwargs.setdefault("relationship_counts", {})
+        kwargs.setdefault("degree_histogram", {})
+        kwargs.setdefault("top_hubs", [])
+        super().__init__(**kwargs)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<GraphStatistics tenant={self.tenant_id} "
+            f"entities={self.total_entities} relationships={self.total_relationships}>"
+        )
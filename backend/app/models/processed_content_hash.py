@@ -0,0 +1,73 @@
+"""
+Processed content hash model for extraction trigger idempotency.
+
+This module defines the ProcessedContentHash model, the durable index of
+page content that has already triggered an extraction process. It lets
+ExtractionTriggerHandler skip duplicate content across restarts, replays
+and replicas.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ProcessedContentHash(Base):
+    """
+    Page content that has triggered an extraction process.
+
+    Rows are claimed with INSERT ... ON CONFLICT DO NOTHING, so only one
+    handler instance wins for each tenant and content hash.
+
+    Attributes:
+        tenant_id: Tenant the content belongs to (primary key part)
+        content_hash: Hash of the scraped page content (primary key part)
+        process_id: ExtractionProcess triggered for the content
+        created_at: When the content was claimed for extraction
+    """
+
+    __tablename__ = "processed_content_hashes"
+
+    # Exclude inherited columns - keyed by (tenant_id, content_hash), never updated
+    id = None
+    updated_at = None
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Tenant the content belongs to",
+    )
+
+    content_hash: Mapped[str] = mapped_column(
+        String(128),
+        primary_key=True,
+        comment="Hash of the scraped page content",
+    )
+
+    process_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=False,
+        comment="ExtractionProcess triggered for the content",
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default="now()",
+        comment="When the content was claimed for extraction",
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<ProcessedContentHash tenant={self.tenant_id} "
+            f"hash={self.content_hash} process={self.process_id}>"
+        )
@@ -47,7 +47,12 @@ from app.preprocessing import mergers  # noqa: E402, F401
 from app.preprocessing import preprocessors  # noqa: E402, F401
 
 # Import pipeline after all factories are populated
-from app.preprocessing.pipeline import PipelineConfig, PipelineResult, PreprocessingPipeline
+from app.preprocessing.pipeline import (
+    PipelineConfig,
+    PipelineDocument,
+    PipelineResult,
+    PreprocessingPipeline,
+)
 
 __all__ = [
     # Protocols
@@ -71,6 +76,7 @@ __all__ = [
     # Pipeline
     "PreprocessingPipeline",
     "PipelineConfig",
+    "PipelineDocument",
     "PipelineResult",
     # Exceptions
     "PreprocessingError",
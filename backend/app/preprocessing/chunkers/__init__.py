@@ -3,13 +3,16 @@ Chunker implementations for document splitting.
 
 This module provides concrete implementations of the Chunker protocol:
 - SlidingWindowChunker: Fixed-size windows with configurable overlap
+- TokenChunker: Windows sized in model tokens, with token overlap
 
 Chunkers are registered via decorators and created via ChunkerFactory.
 """
 
 # Import implementations to trigger registration
 from app.preprocessing.chunkers.sliding_window_chunker import SlidingWindowChunker
+from app.preprocessing.chunkers.token_chunker import TokenChunker
 
 __all__ = [
     "SlidingWindowChunker",
+    "TokenChunker",
 ]
@@ -0,0 +1,199 @@
+"""
+Token-aware text chunker.
+
+Sizes chunks by tokens of the extraction model instead of characters, so
+chunks fill the model's context equally well in every language. Chunk ends
+snap back to the last sentence or paragraph boundary inside the window.
+"""
+
+import logging
+import re
+from bisect import bisect_left, bisect_right
+
+from app.core.config import settings
+from app.core.tokenization import Tokenizer, get_tokenizer
+from app.preprocessing.exceptions import ChunkSizeError
+from app.preprocessing.factory import ChunkerFactory, ChunkerType
+from app.preprocessing.schemas import Chunk, ChunkingResult
+
+logger = logging.getLogger(__name__)
+
+
+@ChunkerFactory.register(ChunkerType.TOKEN)
+class TokenChunker:
+    """Chunker that sizes windows in tokens, with token overlap.
+
+    The text is tokenized once and sentence boundaries are found in the
+    same single regex pass over the text; each window then snaps its end
+    to the last boundary in its latter half, using binary search over
+    the precomputed positions.
+
+    Unlike character chunkers, max_chunk_size and overlap_size are token
+    counts for this chunker.
+
+    Attributes:
+        default_chunk_size: Default maximum tokens per chunk
+        default_overlap: Default tokens of overlap between chunks
+        tokenizer: Tokenizer used to count tokens
+
+    Example:
+        chunker = TokenChunker(default_chunk_size=2048, default_overlap=64)
+        result = chunker.chunk(long_text)
+        for chunk in result.chunks:
+            print(chunk.chunk_index, chunk.metadata["token_count"])
+    """
+
+    # Sentence end (punctuation incl. CJK full stops) or paragraph break;
+    # group 1 is the end of the sentence, match end the start of the next
+    BOUNDARIES = re.compile(r"([.!?。！？])\s+|()\n\s*\n")
+
+    def __init__(
+        self,
+        default_chunk_size: int | None = None,
+        default_overlap: int | None = None,
+        tokenizer: Tokenizer | None = None,
+        tokenizer_name: str | None = None,
+        snap_to_sentences: bool = True,
+    ):
+        """Initialize token chunker.
+
+        Args:
+            default_chunk_size: Default maximum tokens per chunk
+                (defaults to settings.CHUNK_MAX_TOKENS)
+            default_overlap: Default tokens of overlap between chunks
+                (defaults to settings.CHUNK_OVERLAP_TOKENS)
+            tokenizer: Tokenizer instance (overrides tokenizer_name)
+            tokenizer_name: tokenizer.json path or Hub model ID
+                (defaults to settings.CHUNK_TOKENIZER)
+            snap_to_sentences: End chunks at sentence boundaries when possible
+
+        Raises:
+            ChunkSizeError: If configuration is invalid
+        """
+        chunk_size = default_chunk_size or settings.CHUNK_MAX_TOKENS
+        overlap = default_overlap if default_overlap is not None else settings.CHUNK_OVERLAP_TOKENS
+        if overlap < 0:
+            raise ChunkSizeError(f"default_overlap ({overlap}) must be >= 0")
+        if overlap >= chunk_size:
+            raise ChunkSizeError(
+                f"default_overlap ({overlap}) must be < default_chunk_size ({chunk_size})"
+            )
+
+        self._default_chunk_size = chunk_size
+        self._default_overlap = overlap
+        self._tokenizer = tokenizer or get_tokenizer(
+            tokenizer_name if tokenizer_name is not None else settings.CHUNK_TOKENIZER
+        )
+        self._snap = snap_to_sentences
+
+        logger.info(
+            "TokenChunker initialized",
+            extra={
+                "default_chunk_size": chunk_size,
+                "default_overlap": overlap,
+                "tokenizer": self._tokenizer.name,
+            },
+        )
+
+    @property
+    def tokenizer(self) -> Tokenizer:
+        """Return the tokenizer used to count tokens."""
+        return self._tokenizer
+
+    @property
+    def chunker_type(self) -> str:
+        """Return the type identifier for this chunker."""
+        return ChunkerType.TOKEN.value
+
+    def chunk(
+        self,
+        text: str,
+        max_chunk_size: int | None = None,
+        overlap_size: int | None = None,
+    ) -> ChunkingResult:
+        """Split text into overlapping token windows.
+
+        Args:
+            text: Text to chunk
+            max_chunk_size: Maximum tokens per chunk (uses default if None)
+            overlap_size: Tokens of overlap (uses default if None)
+
+        Returns:
+            ChunkingResult; each chunk's metadata holds its token_count
+
+        Raises:
+            ChunkSizeError: If provided configuration is invalid
+        """
+        max_tokens = max_chunk_size or self._default_chunk_size
+        overlap = overlap_size if overlap_size is not None else self._default_overlap
+        if overlap >= max_tokens:
+            raise ChunkSizeError(f"overlap_size ({overlap}) must be < max_chunk_size ({max_tokens})")
+
+        spans = self._tokenizer.token_spans(text) if text and text.strip() else []
+        if not spans:
+            return ChunkingResult(
+                chunks=[],
+                total_chunks=0,
+                original_length=len(text),
+                chunking_method=self.chunker_type,
+                overlap_size=overlap,
+            )
+
+        starts = [start for start, _ in spans]
+        sentence_ends: list[int] = []
+        next_starts: list[int] = []
+        if self._snap:
+            for match in self.BOUNDARIES.finditer(text):
+                sentence_ends.append(match.end(1) if match.group(1) else match.start())
+                next_starts.append(match.end())
+
+        chunks: list[Chunk] = []
+        first = 0
+        previous_end = 0
+        while first < len(spans):
+            last = min(first + max_tokens, len(spans))  # exclusive
+            start_char = spans[first][0]
+            end_char = spans[last - 1][1]
+            next_first = last
+
+            if last < len(spans) and sentence_ends:
+                # Last boundary inside the window's second half
+                b = bisect_right(sentence_ends, end_char) - 1
+                midpoint = spans[first + (last - first) // 2][0]
+                if b >= 0 and sentence_ends[b] > midpoint:
+                    end_char = sentence_ends[b]
+                    next_first = bisect_left(starts, next_starts[b])
+
+            chunks.append(
+                Chunk(
+                    text=text[start_char:end_char],
+                    chunk_index=len(chunks),
+                    start_char=start_char,
+                    end_char=end_char,
+                    overlap_with_previous=max(0, previous_end - start_char) if chunks else 0,
+                    metadata={"token_count": next_first - first},
+                )
+            )
+            if next_first >= len(spans):
+                break
+            previous_end = end_char
+            first = max(next_first - overlap, first + 1)
+
+        logger.info(
+            "Chunking complete",
+            extra={
+                "original_length": len(text),
+                "total_tokens": len(spans),
+                "total_chunks": len(chunks),
+                "max_tokens": max_tokens,
+                "overlap": overlap,
+            },
+        )
+
+        return ChunkingResult(
+            chunks=chunks,
+            total_chunks=len(chunks),
+            original_length=len(text),
+            chunking_method=self.chunker_type,
+            overlap_size=overlap if len(chunks) > 1 else 0,
+        )
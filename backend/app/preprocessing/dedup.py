@@ -0,0 +1,294 @@
+"""
+Near-duplicate chunk detection with MinHash and LSH.
+
+Template text that survives boilerplate removal (footers, sidebars,
+syndicated paragraphs) produces nearly identical chunks on every page of a
+crawl. The exact-match result cache misses them because a date or a link
+differs. ChunkDeduplicator estimates Jaccard similarity of word shingles
+with MinHash signatures and finds candidates with LSH banding:
+
+- signatures and band buckets are kept per scope (normally a scraping job)
+  in Redis with a TTL, so every worker sees the chunks already extracted
+  for that job
+- only chunks that were extracted are indexed, so the index holds one
+  representative per cluster of near-duplicates
+- candidates from the same source page are ignored, so re-extracting a
+  page never matches its own earlier chunks
+
+Example:
+    dedup = await get_chunk_deduplicator()
+    signature = dedup.signature(chunk.text)
+    if await dedup.find_duplicate(job_id, signature, source=url):
+        ...  # skip extraction
+    else:
+        ...  # extract, then
+        await dedup.add(job_id, signature, source=url, chunk_index=0)
+"""
+
+import hashlib
+import logging
+from typing import Any, Optional
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Universal hashing modulo a prime just above 2^32 keeps products of 32-bit
+# values within uint64
+_PRIME = np.uint64(4294967311)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+
+class ChunkDeduplicator:
+    """MinHash/LSH near-duplicate index for chunks, shared through Redis.
+
+    Attributes:
+        threshold: Minimum estimated Jaccard similarity for a duplicate
+        num_perm: MinHash signature length
+        bands: LSH bands (num_perm must be divisible by bands)
+    """
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        threshold: Optional[float] = None,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 5,
+        ttl_seconds: Optional[int] = None,
+        key_prefix: str = "chunk_dedup",
+        seed: int = 1,
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            redis_client: Async Redis client (None disables the shared index)
+            threshold: Similarity threshold (defaults to settings.CHUNK_DEDUP_THRESHOLD)
+            num_perm: Number of MinHash permutations
+            bands: Number of LSH bands; 16 bands of 4 rows find pairs above
+                0.85 similarity with >99% probability
+            shingle_size: Words per shingle
+            ttl_seconds: Lifetime of a scope's index (defaults to settings.CHUNK_DEDUP_TTL)
+            key_prefix: Prefix for Redis keys
+            seed: Seed for the permutation coefficients (must match across workers)
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self._redis = redis_client
+        self.threshold = threshold if threshold is not None else settings.CHUNK_DEDUP_THRESHOLD
+        self.num_perm = num_perm
+        self.bands = bands
+        self._rows = num_perm // bands
+        self._shingle_size = shingle_size
+        self._ttl = ttl_seconds or settings.CHUNK_DEDUP_TTL
+        self._prefix = key_prefix
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2**32, size=num_perm, dtype=np.uint64)
+
+    # =========================================================================
+    # Signatures
+    # =========================================================================
+
+    def _shingles(self, text: str) -> np.ndarray:
+        words = text.casefold().split()
+        size = min(self._shingle_size, len(words)) or 1
+        shingles = {
+            " ".join(words[i : i + size]) for i in range(max(1, len(words) - size + 1))
+        }
+        return np.fromiter(
+            (
+                int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "little")
+                for s in shingles
+            ),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Chunk text
+
+        Returns:
+            uint32 array of length num_perm
+        """
+        hashes = self._shingles(text)
+        # (num_perm, num_shingles) permuted hashes, min over shingles
+        permuted = ((np.outer(self._a, hashes) % _PRIME) + self._b[:, None]) % _PRIME
+        return (permuted & _MAX_HASH).min(axis=1).astype(np.uint32)
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.mean(a == b))
+
+    def band_hashes(self, signature: np.ndarray) -> list[str]:
+        """Hash each LSH band of a signature."""
+        return [
+            hashlib.blake2b(band.tobytes(), digest_size=8).hexdigest()
+            for band in signature.reshape(self.bands, self._rows)
+        ]
+
+    # =========================================================================
+    # Shared Index
+    # =========================================================================
+
+    def _band_key(self, scope: str, band: int, band_hash: str) -> str:
+        return f"{self._prefix}:{scope}:b{band}:{band_hash}"
+
+    def _signatures_key(self, scope: str) -> str:
+        return f"{self._prefix}:{scope}:sigs"
+
+    async def find_duplicate(
+        self, scope: str, signature: np.ndarray, source: str | None = None
+    ) -> Optional[str]:
+        """
+        Find an indexed chunk similar to the signature.
+
+        Args:
+            scope: Index scope (e.g., scraping job ID)
+            signature: Signature from signature()
+            source: Source of the chunk (e.g., page URL); chunks indexed
+                from the same source are ignored
+
+        Returns:
+            Member ID ("<source>#<chunk index>") of the most similar chunk
+            above the threshold, or None. Redis errors count as no match.
+        """
+        if self._redis is None:
+            return None
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for band, band_hash in enumerate(self.band_hashes(signature)):
+                    pipe.smembers(self._band_key(scope, band, band_hash))
+                buckets = await pipe.execute()
+
+            candidates = sorted(
+                {
+                    member
+                    for bucket in buckets
+                    for member in bucket
+                    if source is None or member.rpartition("#")[0] != source
+                }
+            )
+            if not candidates:
+                return None
+
+            stored = await self._redis.hmget(self._signatures_key(scope), candidates)
+        except Exception as e:
+            logger.warning(f"Chunk dedup lookup failed: {e}")
+            return None
+
+        best, best_score = None, self.threshold
+        for member, value in zip(candidates, stored, strict=True):
+            if value is None:
+                continue
+            score = self.similarity(signature, np.frombuffer(bytes.fromhex(value), dtype="<u4"))
+            if score >= best_score:
+                best, best_score = member, score
+        return best
+
+    async def add(
+        self, scope: str, signature: np.ndarray, source: str | None, chunk_index: int
+    ) -> None:
+        """
+        Index an extracted chunk.
+
+        Args:
+            scope: Index scope (e.g., scraping job ID)
+            signature: Signature from signature()
+            source: Source of the chunk (e.g., page URL)
+            chunk_index: Index of the chunk within its source
+        """
+        if self._redis is None:
+            return
+        member = f"{source or ''}#{chunk_index}"
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hset(
+                    self._signatures_key(scope),
+                    member,
+                    signature.astype("<u4").tobytes().hex(),
+                )
+                pipe.expire(self._signatures_key(scope), self._ttl)
+                for band, band_hash in enumerate(self.band_hashes(signature)):
+                    key = self._band_key(scope, band, band_hash)
+                    pipe.sadd(key, member)
+                    pipe.expire(key, self._ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Chunk dedup indexing failed: {e}")
+
+
+class LocalLSHIndex:
+    """In-memory LSH index for chunks of a single pipeline run."""
+
+    def __init__(self, deduplicator: ChunkDeduplicator):
+        """
+        Initialize the index.
+
+        Args:
+            deduplicator: Provides band hashing, similarity and threshold
+        """
+        self._dedup = deduplicator
+        self._buckets: dict[tuple[int, str], list[int]] = {}
+        self._signatures: dict[int, np.ndarray] = {}
+
+    def query(self, signature: np.ndarray) -> Optional[int]:
+        """Return the key of the most similar indexed chunk above the threshold."""
+        candidates = {
+            key
+            for band, band_hash in enumerate(self._dedup.band_hashes(signature))
+            for key in self._buckets.get((band, band_hash), ())
+        }
+        best, best_score = None, self._dedup.threshold
+        for key in sorted(candidates):
+            score = self._dedup.similarity(signature, self._signatures[key])
+            if score >= best_score:
+                best, best_score = key, score
+        return best
+
+    def add(self, key: int, signature: np.ndarray) -> None:
+        """Index a chunk under a caller-chosen key."""
+        self._signatures[key] = signature
+        for band, band_hash in enumerate(self._dedup.band_hashes(signature)):
+            self._buckets.setdefault((band, band_hash), []).append(key)
+
+
+# Singleton instance
+_deduplicator: Optional[ChunkDeduplicator] = None
+
+
+async def get_chunk_deduplicator() -> Optional[ChunkDeduplicator]:
+    """
+    Get the chunk deduplicator singleton.
+
+    Returns:
+        ChunkDeduplicator, or None if disabled in settings. Without Redis
+        it still deduplicates within a pipeline run.
+    """
+    global _deduplicator
+    if not settings.CHUNK_DEDUP_ENABLED:
+        return None
+    if _deduplicator is None:
+        from app.core.cache import get_redis_client
+
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            # Local-only until Redis is reachable
+            return ChunkDeduplicator()
+        _deduplicator = ChunkDeduplicator(redis_client=redis_client)
+    return _deduplicator
+
+
+def reset_chunk_deduplicator() -> None:
+    """Reset the singleton (primarily for testing)."""
+    global _deduplicator
+    _deduplicator = None
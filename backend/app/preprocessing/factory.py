@@ -56,6 +56,7 @@ class ChunkerType(str, Enum):
     SLIDING_WINDOW = "sliding_window"
     SENTENCE = "sentence"
     FIXED_SIZE = "fixed_size"
+    TOKEN = "token"
 
 
 class EntityMergerType(str, Enum):
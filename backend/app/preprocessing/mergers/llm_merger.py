@@ -9,7 +9,6 @@ import logging
 from collections import defaultdict
 
 import httpx
-from jellyfish import jaro_winkler_similarity
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
@@ -19,6 +18,7 @@ from app.preprocessing.exceptions import EntityResolutionError
 from app.preprocessing.factory import EntityMergerFactory, EntityMergerType
 from app.preprocessing.mergers.simple_merger import SimpleMerger
 from app.preprocessing.schemas import EntityMergeCandidate, EntityMergeDecision
+from app.services.consolidation.blocking import block_entities, similar_pairs
 
 logger = logging.getLogger(__name__)
 
@@ -376,46 +376,53 @@ Pair {idx}:
 
         Ambiguous = similarity between low_threshold and high_threshold
 
+        Pairs are only compared within blocks (same type, name prefix or
+        soundex code) and when a vectorized bound says they can reach
+        low_threshold.
+
         Args:
             entities: List of entities after simple merge
 
         Returns:
             List of ambiguous candidate pairs
         """
+        names = [entity.get("name", "").lower() for entity in entities]
+        blocks = block_entities(
+            names,
+            [(entity.get("type") or "").lower() for entity in entities],
+            min_prefix_length=SimpleMerger.BLOCKING_PREFIX_LENGTH,
+        )
+        pairs = similar_pairs(names, self._low_threshold, blocks)
+
         candidates = []
         seen_pairs: set[tuple] = set()
 
-        for i, entity_a in enumerate(entities):
-            for j, entity_b in enumerate(entities[i + 1 :], i + 1):
-                name_a = entity_a.get("name", "").lower()
-                name_b = entity_b.get("name", "").lower()
-
-                # Skip if we've seen this pair
-                pair_key = tuple(sorted([name_a, name_b]))
-                if pair_key in seen_pairs:
-                    continue
-                seen_pairs.add(pair_key)
-
-                # Calculate similarity
-                similarity = jaro_winkler_similarity(name_a, name_b)
-
-                # Check if it's in the ambiguous range
-                if self._low_threshold <= similarity < self._high_threshold:
-                    candidates.append(
-                        EntityMergeCandidate(
-                            entity_a_name=entity_a.get("name", ""),
-                            entity_a_type=entity_a.get("type", ""),
-                            entity_a_chunk_index=entity_a.get("_chunk_index", 0),
-                            entity_a_context=entity_a.get("source_text"),
-                            entity_a_description=entity_a.get("description"),
-                            entity_b_name=entity_b.get("name", ""),
-                            entity_b_type=entity_b.get("type", ""),
-                            entity_b_chunk_index=entity_b.get("_chunk_index", 0),
-                            entity_b_context=entity_b.get("source_text"),
-                            entity_b_description=entity_b.get("description"),
-                            similarity_score=similarity,
-                        )
+        for (i, j), similarity in sorted(pairs.items()):
+            entity_a, entity_b = entities[i], entities[j]
+
+            # Skip if we've seen this pair
+            pair_key = tuple(sorted([names[i], names[j]]))
+            if pair_key in seen_pairs:
+                continue
+            seen_pairs.add(pair_key)
+
+            # Check if it's in the ambiguous range
+            if similarity < self._high_threshold:
+                candidates.append(
+                    EntityMergeCandidate(
+                        entity_a_name=entity_a.get("name", ""),
+                        entity_a_type=entity_a.get("type", ""),
+                        entity_a_chunk_index=entity_a.get("_chunk_index", 0),
+                        entity_a_context=entity_a.get("source_text"),
+                        entity_a_description=entity_a.get("description"),
+                        entity_b_name=entity_b.get("name", ""),
+                        entity_b_type=entity_b.get("type", ""),
+                        entity_b_chunk_index=entity_b.get("_chunk_index", 0),
+                        entity_b_context=entity_b.get("source_text"),
+                        entity_b_description=entity_b.get("description"),
+                        similarity_score=similarity,
                     )
+                )
 
         return candidates
 
@@ -11,10 +11,12 @@ Useful for:
 import logging
 from collections import defaultdict
 
-from jellyfish import jaro_winkler_similarity
-
 from app.preprocessing.factory import EntityMergerFactory, EntityMergerType
 from app.preprocessing.schemas import EntityMergeCandidate, EntityMergeDecision
+from app.services.consolidation.blocking import (
+    block_entities,
+    similar_pairs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,10 @@ class SimpleMerger:
         )
     """
 
+    # Extracted names are short, so block on shorter prefixes than the
+    # consolidation engine does
+    BLOCKING_PREFIX_LENGTH = 3
+
     def __init__(
         self,
         similarity_threshold: float = 0.92,
@@ -233,6 +239,11 @@ class SimpleMerger:
     def _fuzzy_merge(self, entities: list[dict]) -> list[dict]:
         """Apply fuzzy matching to merge similar entities.
 
+        Only entities sharing a block are compared: the same type when
+        types must match, otherwise the same type, name prefix or soundex
+        code. Within a block, a vectorized similarity bound skips pairs
+        that cannot reach the threshold.
+
         Args:
             entities: List of pre-grouped entities
 
@@ -242,6 +253,27 @@ class SimpleMerger:
         if len(entities) <= 1:
             return entities
 
+        names = [entity.get("name", "") for entity in entities]
+        if not self._case_sensitive:
+            names = [name.lower() for name in names]
+        types = [(entity.get("type") or "").lower() for entity in entities]
+        if self._require_type_match:
+            # Block on the type directly: block_entities() gives untyped
+            # entities no type key, but they still match each other
+            by_type: dict[str, list[int]] = defaultdict(list)
+            for index, entity_type in enumerate(types):
+                by_type[entity_type].append(index)
+            blocks = [members for members in by_type.values() if len(members) > 1]
+        else:
+            blocks = block_entities(
+                names, types, min_prefix_length=self.BLOCKING_PREFIX_LENGTH
+            )
+
+        # Later entities similar to each entity, in entity order
+        similar_to: dict[int, list[int]] = defaultdict(list)
+        for i, j in sorted(similar_pairs(names, self._similarity_threshold, blocks)):
+            similar_to[i].append(j)
+
         # Build list of entities that haven't been merged yet
         result: list[dict] = []
         merged_indices: set[int] = set()
@@ -253,30 +285,11 @@ class SimpleMerger:
             # Find similar entities
             similar_entities = [entity_a]
 
-            for j, entity_b in enumerate(entities[i + 1 :], i + 1):
+            for j in similar_to[i]:
                 if j in merged_indices:
                     continue
-
-                # Check type match if required
-                if self._require_type_match:
-                    type_a = entity_a.get("type", "").lower()
-                    type_b = entity_b.get("type", "").lower()
-                    if type_a != type_b:
-                        continue
-
-                # Calculate similarity
-                name_a = entity_a.get("name", "")
-                name_b = entity_b.get("name", "")
-
-                if not self._case_sensitive:
-                    name_a = name_a.lower()
-                    name_b = name_b.lower()
-
-                similarity = jaro_winkler_similarity(name_a, name_b)
-
-                if similarity >= self._similarity_threshold:
-                    similar_entities.append(entity_b)
-                    merged_indices.add(j)
+                similar_entities.append(entities[j])
+                merged_indices.add(j)
 
             # Merge similar entities
             merged = self._merge_group(similar_entities)
@@ -0,0 +1,191 @@
+"""
+Packing of small chunks into shared extraction requests.
+
+Every extraction request pays for the system prompt, the domain schema and
+the JSON output schema, so a 300-character chunk costs almost as much as a
+full one. ChunkPacker groups small chunks (from one document or from
+several small pages of the same job) into a single request whose content
+is a sequence of delimited sections. split_packed_result() then assigns
+each returned entity and relationship back to the section(s) it came from.
+
+Attribution is textual: an entity belongs to the sections that mention its
+name or source text. This needs no change to the extraction schema and
+works with any extractor.
+
+Example:
+    packer = ChunkPacker(max_size=3000, small_chunk_chars=1000)
+    for group in packer.pack([chunk.text for chunk in chunks]):
+        texts = [chunks[i].text for i in group]
+        result = await extractor.extract(content=build_packed_content(texts), ...)
+        per_section = split_packed_result(result, texts)
+"""
+
+import copy
+import re
+from collections.abc import Callable
+from typing import Any
+
+SECTION_HEADER = "### Section {number}"
+
+PACKED_PREAMBLE = (
+    "The content below consists of {count} independent sections, each starting "
+    "with a '### Section N' header. Extract entities and relationships from every "
+    "section. Only relate entities that appear in the same section."
+)
+
+_WORD = re.compile(r"\w+")
+
+
+class ChunkPacker:
+    """Groups small texts into packs that fit in one extraction request.
+
+    Packing is next-fit in input order, so neighbouring chunks (and pages
+    crawled together) share a request. Texts at or above small_chunk_chars
+    always get their own request.
+
+    The pack budget is measured with size_of, so a packer for a token
+    chunker can bound packs in tokens rather than characters.
+
+    Attributes:
+        max_size: Maximum combined size of a pack, as measured by size_of
+        small_chunk_chars: Texts shorter than this are eligible for packing
+        max_sections: Maximum texts per pack
+        size_of: Size of a text (characters by default)
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        small_chunk_chars: int,
+        max_sections: int = 8,
+        size_of: Callable[[str], int] = len,
+    ):
+        """
+        Initialize the packer.
+
+        Args:
+            max_size: Maximum combined size of a pack, as measured by size_of
+            small_chunk_chars: Texts shorter than this are eligible for packing
+            max_sections: Maximum texts per pack
+            size_of: Size of a text (characters by default)
+        """
+        self.max_size = max_size
+        self.small_chunk_chars = small_chunk_chars
+        self.max_sections = max_sections
+        self.size_of = size_of
+
+    def pack(self, texts: list[str]) -> list[list[int]]:
+        """
+        Group texts into packs.
+
+        Args:
+            texts: Texts to extract, in order
+
+        Returns:
+            Groups of indexes into texts; single-element groups are sent
+            on their own, larger ones as packed requests
+        """
+        groups: list[list[int]] = []
+        current: list[int] = []
+        current_size = 0
+
+        for index, text in enumerate(texts):
+            if len(text) >= self.small_chunk_chars:
+                groups.append([index])
+                continue
+            size = self.size_of(text)
+            if current and (
+                current_size + size > self.max_size or len(current) >= self.max_sections
+            ):
+                groups.append(current)
+                current, current_size = [], 0
+            current.append(index)
+            current_size += size
+
+        if current:
+            groups.append(current)
+        return groups
+
+
+def build_packed_content(texts: list[str]) -> str:
+    """
+    Build the content of a packed extraction request.
+
+    Args:
+        texts: Section texts, in order
+
+    Returns:
+        Preamble followed by the numbered sections
+    """
+    parts = [PACKED_PREAMBLE.format(count=len(texts))]
+    for number, text in enumerate(texts, start=1):
+        parts.append(f"{SECTION_HEADER.format(number=number)}\n{text.strip()}")
+    return "\n\n".join(parts)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+def _locate(entity: Any, sections: list[str]) -> list[int]:
+    """Find the sections an entity came from.
+
+    Sections mentioning the entity's name or source text win; otherwise the
+    section sharing the most words with the name is used.
+    """
+    needles = [
+        _normalize(value)
+        for value in (getattr(entity, "name", ""), getattr(entity, "source_text", None))
+        if value
+    ]
+    found = [i for i, section in enumerate(sections) if any(n in section for n in needles)]
+    if found:
+        return found
+
+    words = set(_WORD.findall(needles[0])) if needles else set()
+    overlaps = [len(words & set(_WORD.findall(section))) for section in sections]
+    return [overlaps.index(max(overlaps))]
+
+
+def split_packed_result(result: Any, texts: list[str]) -> list[Any]:
+    """
+    Split the result of a packed request into one result per section.
+
+    Entities go to every section that mentions them. A relationship goes
+    to the sections containing both endpoints, falling back to the
+    sections of its source (then target) entity.
+
+    Args:
+        result: Extraction result with entities and relationships
+        texts: Section texts passed to build_packed_content()
+
+    Returns:
+        Shallow copies of result, one per section, each holding only that
+        section's entities and relationships
+    """
+    sections = [_normalize(text) for text in texts]
+    entities: list[list[Any]] = [[] for _ in texts]
+    relationships: list[list[Any]] = [[] for _ in texts]
+    sections_by_name: dict[str, set[int]] = {}
+
+    for entity in getattr(result, "entities", None) or []:
+        located = _locate(entity, sections)
+        sections_by_name.setdefault(_normalize(getattr(entity, "name", "")), set()).update(
+            located
+        )
+        for index in located:
+            entities[index].append(entity)
+
+    for rel in getattr(result, "relationships", None) or []:
+        source = sections_by_name.get(_normalize(getattr(rel, "source_name", "")), set())
+        target = sections_by_name.get(_normalize(getattr(rel, "target_name", "")), set())
+        for index in sorted((source & target) or source or target or {0}):
+            relationships[index].append(rel)
+
+    split = []
+    for section_entities, section_relationships in zip(entities, relationships, strict=True):
+        part = copy.copy(result)
+        part.entities = section_entities
+        part.relationships = section_relationships
+        split.append(part)
+    return split
@@ -5,13 +5,16 @@ Coordinates preprocessors, chunkers, and entity mergers into
 a complete document processing pipeline.
 """
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any, Protocol
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Protocol
 from uuid import UUID
 
 from app.preprocessing.base import Chunker, EntityMerger, Preprocessor
+from app.preprocessing.dedup import ChunkDeduplicator, LocalLSHIndex
 from app.preprocessing.exceptions import PipelineConfigError, PipelineError
 from app.preprocessing.factory import (
     ChunkerFactory,
@@ -21,15 +24,29 @@ from app.preprocessing.factory import (
     PreprocessorFactory,
     PreprocessorType,
 )
-from app.preprocessing.schemas import PipelineMetrics
+from app.preprocessing.packing import ChunkPacker, build_packed_content, split_packed_result
+from app.preprocessing.schemas import Chunk, PipelineMetrics
+
+if TYPE_CHECKING:
+    from app.extraction.result_cache import ExtractionResultCache
 
 logger = logging.getLogger(__name__)
 
+# Outcome of a chunk skipped as a near-duplicate of one extracted earlier
+_DUPLICATE_RESULT = SimpleNamespace(entities=[], relationships=[])
+
 
 class Extractor(Protocol):
     """Protocol for extraction services.
 
     Defines the interface expected by the pipeline for LLM extraction.
+    Extractors that enforce a rate limit signal it by raising an exception
+    with a ``retry_after`` attribute (seconds), such as RateLimitExceeded;
+    the pipeline waits and retries those chunks.
+
+    Extractors that can be cached also provide ``result_cache_key(content)``
+    and accept ``use_cache=False`` in extract(); the pipeline then checks
+    its result cache per chunk and only calls extract() on a miss.
     """
 
     async def extract(
@@ -56,6 +73,8 @@ class PipelineConfig:
         chunker_type: Type of chunker to use
         chunk_size: Maximum characters per chunk
         chunk_overlap: Characters of overlap between chunks
+        chunk_tokens: Maximum tokens per chunk (token chunker only)
+        chunk_overlap_tokens: Tokens of overlap between chunks (token chunker only)
         chunker_config: Additional config for chunker
         merger_type: Type of entity merger to use
         use_llm_merging: Whether to use LLM for ambiguous merges
@@ -63,6 +82,12 @@ class PipelineConfig:
         skip_preprocessing: Skip the preprocessing step
         skip_chunking: Skip the chunking step (use full content)
         max_chunks: Safety limit on number of chunks
+        max_concurrent_extractions: Chunks extracted concurrently
+        rate_limit_retries: Retries per chunk when the extractor is rate limited
+        pack_chunks_below: Chunks shorter than this (characters) share packed
+            extraction requests of up to chunk_size characters (chunk_tokens
+            tokens with the token chunker); 0 disables
+        max_chunks_per_pack: Maximum chunks in one packed request
     """
 
     # Preprocessor settings
@@ -73,6 +98,8 @@ class PipelineConfig:
     chunker_type: ChunkerType = ChunkerType.SLIDING_WINDOW
     chunk_size: int = 3000
     chunk_overlap: int = 200
+    chunk_tokens: int = 2048
+    chunk_overlap_tokens: int = 64
     chunker_config: dict[str, Any] = field(default_factory=dict)
 
     # Entity merger settings
@@ -84,6 +111,10 @@ class PipelineConfig:
     skip_preprocessing: bool = False
     skip_chunking: bool = False
     max_chunks: int = 20  # Safety limit
+    max_concurrent_extractions: int = 1  # Size per provider capacity
+    rate_limit_retries: int = 3
+    pack_chunks_below: int = 0  # Disabled by default
+    max_chunks_per_pack: int = 8
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -97,8 +128,29 @@ class PipelineConfig:
             raise PipelineConfigError(
                 f"chunk_overlap ({self.chunk_overlap}) must be < chunk_size ({self.chunk_size})"
             )
+        if not 0 <= self.chunk_overlap_tokens < self.chunk_tokens:
+            raise PipelineConfigError(
+                f"chunk_overlap_tokens ({self.chunk_overlap_tokens}) must be >= 0 and "
+                f"< chunk_tokens ({self.chunk_tokens})"
+            )
         if self.max_chunks <= 0:
             raise PipelineConfigError(f"max_chunks must be > 0, got {self.max_chunks}")
+        if self.max_concurrent_extractions <= 0:
+            raise PipelineConfigError(
+                f"max_concurrent_extractions must be > 0, got {self.max_concurrent_extractions}"
+            )
+        if self.rate_limit_retries < 0:
+            raise PipelineConfigError(
+                f"rate_limit_retries must be >= 0, got {self.rate_limit_retries}"
+            )
+        if self.pack_chunks_below < 0:
+            raise PipelineConfigError(
+                f"pack_chunks_below must be >= 0, got {self.pack_chunks_below}"
+            )
+        if self.max_chunks_per_pack < 2:
+            raise PipelineConfigError(
+                f"max_chunks_per_pack must be >= 2, got {self.max_chunks_per_pack}"
+            )
 
 
 @dataclass
@@ -136,7 +188,9 @@ class PreprocessingPipeline:
     The pipeline processes documents through four stages:
     1. Preprocess: Clean HTML, remove boilerplate
     2. Chunk: Split into smaller pieces
-    3. Extract: Run LLM extraction on each chunk
+    3. Extract: Run LLM extraction on each chunk (up to
+       max_concurrent_extractions at a time), skipping chunks found
+       in the result cache and packing small chunks into shared requests
     4. Merge: Combine entities across chunks
 
     Example:
@@ -152,13 +206,22 @@ class PreprocessingPipeline:
         print(f"Extracted {len(result.entities)} entities from {result.num_chunks} chunks")
     """
 
-    def __init__(self, config: PipelineConfig | None = None):
+    def __init__(
+        self,
+        config: PipelineConfig | None = None,
+        result_cache: "ExtractionResultCache | None" = None,
+        deduplicator: ChunkDeduplicator | None = None,
+    ):
         """Initialize the preprocessing pipeline.
 
         Args:
             config: Pipeline configuration (uses defaults if None)
+            result_cache: Optional extraction result cache checked per chunk
+            deduplicator: Optional near-duplicate chunk index
         """
         self._config = config or PipelineConfig()
+        self._result_cache = result_cache
+        self._deduplicator = deduplicator
 
         # Create components (lazy - only create when needed)
         self._preprocessor: Preprocessor | None = None
@@ -191,11 +254,36 @@ class PreprocessingPipeline:
         """Get or create chunker instance."""
         if self._chunker is None:
             config = self._config.chunker_config.copy()
-            config.setdefault("default_chunk_size", self._config.chunk_size)
-            config.setdefault("default_overlap", self._config.chunk_overlap)
+            if self._sizes_by_tokens:
+                config.setdefault("default_chunk_size", self._config.chunk_tokens)
+                config.setdefault("default_overlap", self._config.chunk_overlap_tokens)
+            else:
+                config.setdefault("default_chunk_size", self._config.chunk_size)
+                config.setdefault("default_overlap", self._config.chunk_overlap)
             self._chunker = ChunkerFactory.create(self._config.chunker_type, config)
         return self._chunker
 
+    @property
+    def _sizes_by_tokens(self) -> bool:
+        """Whether the chunker sizes chunks in tokens rather than characters."""
+        return self._config.chunker_type == ChunkerType.TOKEN
+
+    def _packer(self) -> ChunkPacker:
+        """Create a packer whose budget uses the chunker's size unit."""
+        if self._sizes_by_tokens:
+            tokenizer = self.chunker.tokenizer
+            return ChunkPacker(
+                max_size=self._config.chunk_tokens,
+                small_chunk_chars=self._config.pack_chunks_below,
+                max_sections=self._config.max_chunks_per_pack,
+                size_of=lambda text: len(tokenizer.token_spans(text)),
+            )
+        return ChunkPacker(
+            max_size=self._config.chunk_size,
+            small_chunk_chars=self._config.pack_chunks_below,
+            max_sections=self._config.max_chunks_per_pack,
+        )
+
     @property
     def merger(self) -> EntityMerger:
         """Get or create entity merger instance."""
@@ -212,6 +300,7 @@ class PreprocessingPipeline:
         content_type: str = "text/html",
         url: str | None = None,
         tenant_id: UUID | None = None,
+        dedup_scope: str | None = None,
     ) -> PipelineResult:
         """Run the complete preprocessing pipeline.
 
@@ -221,6 +310,8 @@ class PreprocessingPipeline:
             content_type: MIME type of content
             url: Source URL
             tenant_id: Tenant ID for rate limiting
+            dedup_scope: Scope of the shared near-duplicate index (e.g.,
+                scraping job ID); None limits deduplication to this call
 
         Returns:
             PipelineResult with merged entities and relationships
@@ -228,15 +319,77 @@ class PreprocessingPipeline:
         Raises:
             PipelineError: If processing fails unrecoverably
         """
+        results = await self.process_batch(
+            [PipelineDocument(content=content, content_type=content_type, url=url)],
+            extractor,
+            tenant_id=tenant_id,
+            dedup_scope=dedup_scope,
+        )
+        return results[0]
+
+    async def process_batch(
+        self,
+        documents: list["PipelineDocument"],
+        extractor: Extractor,
+        tenant_id: UUID | None = None,
+        dedup_scope: str | None = None,
+    ) -> list[PipelineResult]:
+        """Run the pipeline over several documents with shared extraction.
+
+        Documents are preprocessed and chunked one by one. Their chunks are
+        then extracted together, so small chunks from different documents
+        can share a packed request (see PipelineConfig.pack_chunks_below).
+        Each document is merged separately. Callers should only batch
+        documents that belong together, such as small pages of the same
+        job and domain.
+
+        Args:
+            documents: Documents to process
+            extractor: Extraction service with async extract() method
+            tenant_id: Tenant ID for rate limiting
+            dedup_scope: Scope of the shared near-duplicate index
+
+        Returns:
+            One PipelineResult per document, in input order. Extraction time
+            covers the whole batch.
+        """
+        total_start = time.time()
+        prepared = [self._prepare(document) for document in documents]
+
+        # =================================================================
+        # Step 3: Extract from each chunk
+        # =================================================================
+        extract_start = time.time()
+
+        jobs = [
+            _ChunkJob(chunk=chunk, url=document.url, metrics=document.metrics)
+            for document in prepared
+            for chunk in document.chunks
+        ]
+        outcomes = await self._extract_chunks(jobs, extractor, tenant_id, dedup_scope)
+        extraction_time_ms = (time.time() - extract_start) * 1000
+
+        results = []
+        offset = 0
+        for document in prepared:
+            document_outcomes = outcomes[offset : offset + len(document.chunks)]
+            offset += len(document.chunks)
+            document.metrics.extraction_time_ms = extraction_time_ms
+            results.append(await self._finish(document, document_outcomes, total_start))
+        return results
+
+    def _prepare(self, document: "PipelineDocument") -> "_PreparedDocument":
+        """Preprocess and chunk one document (steps 1 and 2)."""
+        content = document.content
+        url = document.url
         metrics = PipelineMetrics()
         original_length = len(content)
-        total_start = time.time()
 
         logger.info(
             "Starting preprocessing pipeline",
             extra={
                 "content_length": original_length,
-                "content_type": content_type,
+                "content_type": document.content_type,
                 "url": url,
             },
         )
@@ -250,7 +403,7 @@ class PreprocessingPipeline:
             try:
                 preprocess_result = self.preprocessor.preprocess(
                     content=content,
-                    content_type=content_type,
+                    content_type=document.content_type,
                     url=url,
                 )
                 clean_text = preprocess_result.clean_text
@@ -280,19 +433,28 @@ class PreprocessingPipeline:
         # =================================================================
         chunk_start = time.time()
 
-        if not self._config.skip_chunking and preprocessed_length > self._config.chunk_size:
+        # Character length says nothing about token count, so token-sized
+        # chunkers always see the text
+        if not self._config.skip_chunking and (
+            self._sizes_by_tokens or preprocessed_length > self._config.chunk_size
+        ):
             try:
-                chunking_result = self.chunker.chunk(
-                    text=clean_text,
-                    max_chunk_size=self._config.chunk_size,
-                    overlap_size=self._config.chunk_overlap,
-                )
+                if self._sizes_by_tokens:
+                    chunking_result = self.chunker.chunk(
+                        text=clean_text,
+                        max_chunk_size=self._config.chunk_tokens,
+                        overlap_size=self._config.chunk_overlap_tokens,
+                    )
+                else:
+                    chunking_result = self.chunker.chunk(
+                        text=clean_text,
+                        max_chunk_size=self._config.chunk_size,
+                        overlap_size=self._config.chunk_overlap,
+                    )
                 chunks = chunking_result.chunks[: self._config.max_chunks]
                 chunking_method = chunking_result.chunking_method
             except Exception as e:
                 logger.error(f"Chunking failed: {e}, using single chunk")
-                from app.preprocessing.schemas import Chunk
-
                 chunks = [
                     Chunk(
                         text=clean_text,
@@ -303,8 +465,6 @@ class PreprocessingPipeline:
                 ]
                 chunking_method = "failed"
         else:
-            from app.preprocessing.schemas import Chunk
-
             chunks = [
                 Chunk(
                     text=clean_text,
@@ -315,73 +475,51 @@ class PreprocessingPipeline:
             ]
             chunking_method = "skipped" if self._config.skip_chunking else "single_chunk"
 
-        num_chunks = len(chunks)
         metrics.chunking_time_ms = (time.time() - chunk_start) * 1000
 
         logger.info(
             "Chunking complete",
             extra={
-                "num_chunks": num_chunks,
+                "num_chunks": len(chunks),
                 "method": chunking_method,
                 "chunk_sizes": [c.length for c in chunks],
             },
         )
 
-        # =================================================================
-        # Step 3: Extract from each chunk
-        # =================================================================
-        extract_start = time.time()
+        return _PreparedDocument(
+            url=url,
+            clean_text=clean_text,
+            chunks=chunks,
+            metrics=metrics,
+            original_length=original_length,
+            preprocessing_method=preprocessing_method,
+            chunking_method=chunking_method,
+        )
+
+    async def _finish(
+        self,
+        document: "_PreparedDocument",
+        outcomes: list[Any],
+        total_start: float,
+    ) -> PipelineResult:
+        """Collect per-chunk outcomes and merge them (steps 3 and 4)."""
+        metrics = document.metrics
+        url = document.url
+        clean_text = document.clean_text
 
         entities_by_chunk: dict[int, list[dict]] = {}
         relationships_by_chunk: dict[int, list[dict]] = {}
         entities_per_chunk: list[int] = []
         chunk_errors: list[str] = []
 
-        for chunk in chunks:
+        for chunk, outcome in zip(document.chunks, outcomes, strict=True):
             try:
-                result = await extractor.extract(
-                    content=chunk.text,
-                    page_url=url or "",
-                    tenant_id=tenant_id,
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                chunk_entities, chunk_relationships = _result_to_dicts(
+                    outcome, chunk.chunk_index
                 )
 
-                # Convert extraction result to dicts
-                chunk_entities = []
-                chunk_relationships = []
-
-                # Handle different result types
-                if hasattr(result, "entities"):
-                    for entity in result.entities:
-                        entity_dict = {
-                            "name": getattr(entity, "name", ""),
-                            "type": getattr(entity, "entity_type", ""),
-                            "description": getattr(entity, "description", None),
-                            "confidence": getattr(entity, "confidence", 1.0),
-                            "properties": getattr(entity, "properties", {}) or {},
-                            "source_text": getattr(entity, "source_text", None),
-                            "_chunk_index": chunk.chunk_index,
-                        }
-                        # Handle enum types
-                        if hasattr(entity_dict["type"], "value"):
-                            entity_dict["type"] = entity_dict["type"].value
-                        chunk_entities.append(entity_dict)
-
-                if hasattr(result, "relationships"):
-                    for rel in result.relationships:
-                        rel_dict = {
-                            "source_name": getattr(rel, "source_name", ""),
-                            "target_name": getattr(rel, "target_name", ""),
-                            "relationship_type": getattr(rel, "relationship_type", ""),
-                            "confidence": getattr(rel, "confidence", 1.0),
-                            "context": getattr(rel, "context", None),
-                            "properties": getattr(rel, "properties", {}) or {},
-                            "_chunk_index": chunk.chunk_index,
-                        }
-                        # Handle enum types
-                        if hasattr(rel_dict["relationship_type"], "value"):
-                            rel_dict["relationship_type"] = rel_dict["relationship_type"].value
-                        chunk_relationships.append(rel_dict)
-
                 entities_by_chunk[chunk.chunk_index] = chunk_entities
                 relationships_by_chunk[chunk.chunk_index] = chunk_relationships
                 entities_per_chunk.append(len(chunk_entities))
@@ -398,7 +536,6 @@ class PreprocessingPipeline:
                 chunk_errors.append(f"Chunk {chunk.chunk_index}: {str(e)}")
                 metrics.chunks_failed += 1
 
-        metrics.extraction_time_ms = (time.time() - extract_start) * 1000
         metrics.entities_before_merge = sum(
             len(e) for e in entities_by_chunk.values()
         )
@@ -411,6 +548,9 @@ class PreprocessingPipeline:
             extra={
                 "chunks_processed": metrics.chunks_processed,
                 "chunks_failed": metrics.chunks_failed,
+                "chunks_from_cache": metrics.chunks_from_cache,
+                "chunks_packed": metrics.chunks_packed,
+                "chunks_deduplicated": metrics.chunks_deduplicated,
                 "entities_extracted": metrics.entities_before_merge,
                 "relationships_extracted": metrics.relationships_before_merge,
             },
@@ -469,12 +609,361 @@ class PreprocessingPipeline:
             entities=merged_entities,
             relationships=merged_relationships,
             metrics=metrics,
-            original_length=original_length,
-            preprocessed_length=preprocessed_length,
-            num_chunks=num_chunks,
-            preprocessing_method=preprocessing_method,
-            chunking_method=chunking_method,
+            original_length=document.original_length,
+            preprocessed_length=len(clean_text),
+            num_chunks=len(document.chunks),
+            preprocessing_method=document.preprocessing_method,
+            chunking_method=document.chunking_method,
             merging_method=merging_method,
             entities_per_chunk=entities_per_chunk,
             chunk_errors=chunk_errors,
         )
+
+    async def _extract_chunks(
+        self,
+        jobs: list["_ChunkJob"],
+        extractor: Extractor,
+        tenant_id: UUID | None,
+        dedup_scope: str | None = None,
+    ) -> list[Any]:
+        """Extract all chunks, using the result cache, deduplication and packing.
+
+        Cached chunks are returned without calling the extractor. With a
+        deduplicator, near-duplicates of chunks already extracted in the
+        scope are skipped (empty result) and near-duplicates within this
+        call reuse the result of the first such chunk. The rest are grouped
+        into requests (small chunks packed together when packing is
+        enabled) that run concurrently, bounded by
+        max_concurrent_extractions. Fresh results are written back to the
+        cache per chunk.
+
+        Args:
+            jobs: Chunks to extract with their source URL and metrics
+            extractor: Extraction service
+            tenant_id: Tenant ID for rate limiting
+            dedup_scope: Scope of the shared near-duplicate index
+
+        Returns:
+            One raw extraction result or exception per job, in job order
+        """
+        outcomes: list[Any] = [None] * len(jobs)
+        keys: list[Any] = [None] * len(jobs)
+        extract_kwargs: dict[str, Any] = {}
+
+        key_for = getattr(extractor, "result_cache_key", None)
+        if self._result_cache is not None and key_for is not None:
+            keys = [key_for(job.chunk.text) for job in jobs]
+            cached = await asyncio.gather(*(self._result_cache.get(key) for key in keys))
+            for index, hit in enumerate(cached):
+                if hit is not None:
+                    outcomes[index] = hit
+                    jobs[index].metrics.chunks_from_cache += 1
+            # The pipeline fills the cache itself
+            extract_kwargs["use_cache"] = False
+
+        pending = [index for index, outcome in enumerate(outcomes) if outcome is None]
+        duplicate_of: dict[int, int] = {}
+        signatures: dict[int, Any] = {}
+        if self._deduplicator is not None and pending:
+            pending, duplicate_of, signatures = await self._deduplicate(
+                jobs, pending, outcomes, dedup_scope
+            )
+
+        if self._config.pack_chunks_below > 0:
+            packer = self._packer()
+            groups = [
+                [pending[i] for i in group]
+                for group in packer.pack([jobs[index].chunk.text for index in pending])
+            ]
+        else:
+            groups = [[index] for index in pending]
+
+        # Requests run concurrently (bounded by the semaphore); outcomes are
+        # stored by job index so per-chunk output stays deterministic
+        semaphore = asyncio.Semaphore(self._config.max_concurrent_extractions)
+        group_outcomes = await asyncio.gather(
+            *(
+                self._extract_group(
+                    [jobs[index] for index in group],
+                    extractor,
+                    semaphore,
+                    tenant_id,
+                    extract_kwargs,
+                )
+                for group in groups
+            ),
+            return_exceptions=True,
+        )
+
+        writes = []
+        for group, group_outcome in zip(groups, group_outcomes, strict=True):
+            for position, index in enumerate(group):
+                if isinstance(group_outcome, BaseException):
+                    outcomes[index] = group_outcome
+                    continue
+                outcomes[index] = group_outcome[position]
+                if keys[index] is not None and not isinstance(outcomes[index], BaseException):
+                    writes.append(self._result_cache.set(keys[index], outcomes[index]))
+                if dedup_scope is not None and index in signatures:
+                    if not isinstance(outcomes[index], BaseException):
+                        writes.append(
+                            self._deduplicator.add(
+                                dedup_scope,
+                                signatures[index],
+                                jobs[index].url,
+                                jobs[index].chunk.chunk_index,
+                            )
+                        )
+        await asyncio.gather(*writes)
+
+        for index, original in duplicate_of.items():
+            outcomes[index] = outcomes[original]
+
+        return outcomes
+
+    async def _deduplicate(
+        self,
+        jobs: list["_ChunkJob"],
+        pending: list[int],
+        outcomes: list[Any],
+        dedup_scope: str | None,
+    ) -> tuple[list[int], dict[int, int], dict[int, Any]]:
+        """Set aside pending chunks that are near-duplicates.
+
+        Chunks matching the shared index of the scope get an empty outcome.
+        Of the remaining chunks, each one similar to an earlier chunk of
+        this call is mapped to it.
+
+        Returns:
+            Tuple of (job indexes still to extract, duplicate index ->
+            original index, signature by job index still to extract)
+        """
+        dedup = self._deduplicator
+        signatures = {index: dedup.signature(jobs[index].chunk.text) for index in pending}
+        if dedup_scope is not None:
+            matches = await asyncio.gather(
+                *(
+                    dedup.find_duplicate(dedup_scope, signatures[index], source=jobs[index].url)
+                    for index in pending
+                )
+            )
+        else:
+            matches = [None] * len(pending)
+
+        local = LocalLSHIndex(dedup)
+        remaining: list[int] = []
+        duplicate_of: dict[int, int] = {}
+        for index, match in zip(pending, matches, strict=True):
+            if match is not None:
+                outcomes[index] = _DUPLICATE_RESULT
+            else:
+                original = local.query(signatures[index])
+                if original is None:
+                    local.add(index, signatures[index])
+                    remaining.append(index)
+                    continue
+                duplicate_of[index] = original
+            jobs[index].metrics.chunks_deduplicated += 1
+            del signatures[index]
+
+        return remaining, duplicate_of, signatures
+
+    async def _extract_group(
+        self,
+        jobs: list["_ChunkJob"],
+        extractor: Extractor,
+        semaphore: asyncio.Semaphore,
+        tenant_id: UUID | None,
+        extract_kwargs: dict[str, Any],
+    ) -> list[Any]:
+        """Extract one chunk, or several small chunks in one packed request.
+
+        If a packed request fails for a reason other than rate limiting,
+        its chunks are extracted one by one so a single bad response does
+        not fail them all.
+
+        Returns:
+            One result (or exception, after a packed fallback) per job
+        """
+        if len(jobs) == 1:
+            job = jobs[0]
+            result = await self._call_extractor(
+                job.chunk.text,
+                job.url,
+                f"Chunk {job.chunk.chunk_index}",
+                extractor,
+                semaphore,
+                tenant_id,
+                extract_kwargs,
+            )
+            return [result]
+
+        texts = [job.chunk.text for job in jobs]
+        try:
+            result = await self._call_extractor(
+                build_packed_content(texts),
+                jobs[0].url,
+                f"Pack of {len(jobs)} chunks",
+                extractor,
+                semaphore,
+                tenant_id,
+                extract_kwargs,
+            )
+        except Exception as e:
+            if getattr(e, "retry_after", None) is not None:
+                raise
+            logger.warning(
+                f"Packed extraction of {len(jobs)} chunks failed: {e}, extracting separately",
+                extra={"url": jobs[0].url},
+            )
+            singles = await asyncio.gather(
+                *(
+                    self._extract_group([job], extractor, semaphore, tenant_id, extract_kwargs)
+                    for job in jobs
+                ),
+                return_exceptions=True,
+            )
+            return [
+                outcome if isinstance(outcome, BaseException) else outcome[0]
+                for outcome in singles
+            ]
+
+        for job in jobs:
+            job.metrics.chunks_packed += 1
+        return split_packed_result(result, texts)
+
+    async def _call_extractor(
+        self,
+        content: str,
+        url: str | None,
+        label: str,
+        extractor: Extractor,
+        semaphore: asyncio.Semaphore,
+        tenant_id: UUID | None,
+        extract_kwargs: dict[str, Any],
+    ) -> Any:
+        """Call the extractor while holding a concurrency slot.
+
+        Rate-limited attempts (exceptions carrying ``retry_after``) are
+        retried after the advised delay, without holding a slot while
+        waiting. Other errors propagate to the caller.
+
+        Args:
+            content: Content to extract from
+            url: Source URL
+            label: Description of the request for logs
+            extractor: Extraction service
+            semaphore: Bounds concurrent extractor calls
+            tenant_id: Tenant ID for rate limiting
+            extract_kwargs: Extra keyword arguments for extract()
+
+        Returns:
+            Raw extraction result
+        """
+        attempts = 0
+        while True:
+            async with semaphore:
+                try:
+                    return await extractor.extract(
+                        content=content,
+                        page_url=url or "",
+                        tenant_id=tenant_id,
+                        **extract_kwargs,
+                    )
+                except Exception as e:
+                    retry_after = getattr(e, "retry_after", None)
+                    if retry_after is None or attempts >= self._config.rate_limit_retries:
+                        raise
+
+            attempts += 1
+            logger.info(
+                f"{label} rate limited, retrying in {retry_after:.1f}s",
+                extra={"url": url, "attempt": attempts},
+            )
+            await asyncio.sleep(retry_after)
+
+
+@dataclass
+class PipelineDocument:
+    """A document to run through the pipeline.
+
+    Attributes:
+        content: Raw HTML or text content
+        content_type: MIME type of content
+        url: Source URL
+    """
+
+    content: str
+    content_type: str = "text/html"
+    url: str | None = None
+
+
+@dataclass
+class _PreparedDocument:
+    """A document after preprocessing and chunking."""
+
+    url: str | None
+    clean_text: str
+    chunks: list[Chunk]
+    metrics: PipelineMetrics
+    original_length: int
+    preprocessing_method: str
+    chunking_method: str
+
+
+@dataclass
+class _ChunkJob:
+    """A chunk awaiting extraction, with the metrics of its document."""
+
+    chunk: Chunk
+    url: str | None
+    metrics: PipelineMetrics
+
+
+def _result_to_dicts(result: Any, chunk_index: int) -> tuple[list[dict], list[dict]]:
+    """Convert an extraction result to entity and relationship dicts.
+
+    Args:
+        result: Extraction result with entities/relationships attributes
+        chunk_index: Index of the chunk the result came from
+
+    Returns:
+        Tuple of (entities, relationships) tagged with _chunk_index
+    """
+    chunk_entities = []
+    chunk_relationships = []
+
+    # Handle different result types
+    if hasattr(result, "entities"):
+        for entity in result.entities:
+            entity_dict = {
+                "name": getattr(entity, "name", ""),
+                "type": getattr(entity, "entity_type", ""),
+                "description": getattr(entity, "description", None),
+                "confidence": getattr(entity, "confidence", 1.0),
+                "properties": getattr(entity, "properties", {}) or {},
+                "source_text": getattr(entity, "source_text", None),
+                "_chunk_index": chunk_index,
+            }
+            # Handle enum types
+            if hasattr(entity_dict["type"], "value"):
+                entity_dict["type"] = entity_dict["type"].value
+            chunk_entities.append(entity_dict)
+
+    if hasattr(result, "relationships"):
+        for rel in result.relationships:
+            rel_dict = {
+                "source_name": getattr(rel, "source_name", ""),
+                "target_name": getattr(rel, "target_name", ""),
+                "relationship_type": getattr(rel, "relationship_type", ""),
+                "confidence": getattr(rel, "confidence", 1.0),
+                "context": getattr(rel, "context", None),
+                "properties": getattr(rel, "properties", {}) or {},
+                "_chunk_index": chunk_index,
+            }
+            # Handle enum types
+            if hasattr(rel_dict["relationship_type"], "value"):
+                rel_dict["relationship_type"] = rel_dict["relationship_type"].value
+            chunk_relationships.append(rel_dict)
+
+    return chunk_entities, chunk_relationships
@@ -135,6 +135,9 @@ class PipelineMetrics:
 
     chunks_processed: int = 0
     chunks_failed: int = 0
+    chunks_from_cache: int = 0
+    chunks_packed: int = 0  # Extracted in a request shared with other chunks
+    chunks_deduplicated: int = 0  # Near-duplicates skipped or answered from another chunk
 
     entities_before_merge: int = 0
     entities_after_merge: int = 0
@@ -524,3 +524,43 @@ class GraphQueryResponse(BaseModel):
         default=False,
         description="Whether results were truncated",
     )
+
+
+class GraphHub(BaseModel):
+    """A highly connected entity in the graph statistics response."""
+
+    id: UUID = Field(..., description="Entity ID")
+    name: str = Field(..., description="Entity name")
+    entity_type: str = Field(..., description="Entity type")
+    degree: int = Field(..., description="Number of relationships touching the entity")
+
+
+class GraphStatsResponse(BaseModel):
+    """Precomputed statistics for a tenant's knowledge graph."""
+
+    total_entities: int = Field(..., description="Number of canonical entities")
+    total_relationships: int = Field(..., description="Number of relationships")
+    entity_counts: dict[str, int] = Field(
+        default_factory=dict,
+        description="Canonical entity count by entity type",
+    )
+    relationship_counts: dict[str, int] = Field(
+        default_factory=dict,
+        description="Relationship count by relationship type",
+    )
+    degree_histogram: dict[str, int] = Field(
+        default_factory=dict,
+        description="Entity count by degree bucket (refreshed by periodic reconcile)",
+    )
+    top_hubs: list[GraphHub] = Field(
+        default_factory=list,
+        description="Highest-degree entities (refreshed by periodic reconcile)",
+    )
+    reconciled_at: Optional[datetime] = Field(
+        None,
+        description="When statistics were last fully recomputed",
+    )
+    updated_at: Optional[datetime] = Field(
+        None,
+        description="When statistics were last updated",
+    )
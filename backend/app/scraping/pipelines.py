@@ -237,7 +237,8 @@ class ExtractionQueuePipeline:
     """
     Pipeline for queueing pages for entity extraction.
 
-    Queues Celery tasks for async entity extraction.
+    Queues pages with the extraction scheduler, which starts their
+    extraction tasks in fair order across tenants.
     """
 
     def process_item(self, item: ScrapedPageItem, spider: Spider) -> ScrapedPageItem:
@@ -253,10 +254,11 @@ class ExtractionQueuePipeline:
             return item
 
         try:
-            from app.tasks.extraction import extract_entities
+            from app.extraction.worker import schedule_page_extraction
+            from app.worker.runtime import run_async
 
-            # Queue extraction task
-            extract_entities.delay(page_id, str(tenant_id))
+            # Queue extraction job
+            run_async(schedule_page_extraction(page_id, tenant_id))
 
             logger.debug(
                 f"Queued extraction for page: {page_id}",
@@ -269,7 +271,7 @@ class ExtractionQueuePipeline:
 
         except Exception as e:
             logger.error(
-                f"Failed to queue extraction task: {e}",
+                f"Failed to queue extraction job: {e}",
                 extra={"page_id": page_id},
             )
 
@@ -26,6 +26,10 @@ from app.services.neo4j_queries import (
     GraphQueryService,
     get_graph_query_service,
 )
+from app.services.graph_stats import (
+    GraphStatisticsService,
+    get_graph_statistics_service,
+)
 from app.services.sync_status import (
     SyncStatusService,
     get_sync_status_service,
@@ -57,6 +61,9 @@ __all__ = [
     # Neo4j graph query utilities
     "GraphQueryService",
     "get_graph_query_service",
+    # Precomputed graph statistics
+    "GraphStatisticsService",
+    "get_graph_statistics_service",
     # Sync status tracking
     "SyncStatusService",
     "get_sync_status_service",
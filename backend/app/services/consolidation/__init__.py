@@ -62,6 +62,8 @@ from app.services.consolidation.blocking import (
     BlockingEngine,
     BlockingResult,
     BlockingStrategy,
+    block_entities,
+    similar_pairs,
 )
 from app.services.consolidation.merge_service import (
     DEFAULT_PROPERTY_STRATEGIES,
@@ -106,6 +108,8 @@ __all__ = [
     "BlockingEngine",
     "BlockingResult",
     "BlockingStrategy",
+    "block_entities",
+    "similar_pairs",
     # String Similarity (Stage 2)
     "StringSimilarityService",
     "compute_string_similarity",
@@ -17,18 +17,25 @@ Blocking Strategies:
 
 Each strategy leverages database indexes created in P1-005 for
 efficient O(log n) lookups instead of full table scans.
+
+The same keys also block in-memory entity lists (block_entities), which
+the preprocessing mergers combine with a vectorized Jaro-Winkler bound
+(similar_pairs) so only plausible pairs within a block are scored.
 """
 
 from __future__ import annotations
 
 import logging
 import time
+from collections import defaultdict
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 import jellyfish
+import numpy as np
 from sqlalchemy import or_, select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
@@ -574,3 +581,134 @@ class BlockingEngine:
             "max_block_size": self.max_block_size,
             "min_prefix_length": self.min_prefix_length,
         }
+
+
+# =============================================================================
+# In-Memory Blocking
+# =============================================================================
+
+# Tolerance for floating point error in the similarity upper bound
+_BOUND_EPSILON = 1e-9
+# Elements of the (rows x block x alphabet) array per kernel step
+_KERNEL_BUDGET = 4_000_000
+
+
+def block_entities(
+    names: Sequence[str],
+    entity_types: Sequence[str] | None = None,
+    strategies: Sequence[BlockingStrategy] | None = None,
+    min_prefix_length: int = 5,
+) -> list[list[int]]:
+    """
+    Group in-memory entities into blocks that share a blocking key.
+
+    Uses the keys of BlockingEngine: name prefix, entity type and soundex
+    code. An entity belongs to one block per key, so a pair of entities
+    is a candidate if any key matches.
+
+    Args:
+        names: Normalized entity names (prefix keys are taken as given)
+        entity_types: Entity types, parallel to names (required for
+            ENTITY_TYPE blocking)
+        strategies: Keys to block on (defaults to PREFIX, ENTITY_TYPE, SOUNDEX;
+            TRIGRAM and COMBINED are database-only and ignored)
+        min_prefix_length: Names shorter than this get no prefix key
+
+    Returns:
+        Blocks of two or more entity indexes, each in ascending order
+    """
+    strategies = strategies or [
+        BlockingStrategy.PREFIX,
+        BlockingStrategy.ENTITY_TYPE,
+        BlockingStrategy.SOUNDEX,
+    ]
+    blocks: dict[tuple[str, str], list[int]] = defaultdict(list)
+    for index, name in enumerate(names):
+        for strategy in strategies:
+            if strategy == BlockingStrategy.PREFIX:
+                key = name[:min_prefix_length] if len(name) >= min_prefix_length else ""
+            elif strategy == BlockingStrategy.ENTITY_TYPE and entity_types is not None:
+                key = entity_types[index] or ""
+            elif strategy == BlockingStrategy.SOUNDEX:
+                key = BlockingEngine.compute_soundex(name)
+            else:
+                continue
+            if key:
+                blocks[(strategy.value, key)].append(index)
+    return [members for members in blocks.values() if len(members) > 1]
+
+
+def jaro_winkler_upper_bounds(names: Sequence[str]) -> np.ndarray:
+    """
+    Upper bounds of pairwise Jaro-Winkler similarity, computed in bulk.
+
+    Jaro similarity is at most (m/|a| + m/|b| + 1) / 3, where the number of
+    matching characters m cannot exceed the characters the two names
+    share as multisets. The Winkler prefix bonus (up to 0.4 * (1 - jaro))
+    only applies above a Jaro similarity of 0.7.
+
+    Args:
+        names: Names to compare
+
+    Returns:
+        Symmetric (n, n) array; entry [i, j] >= jaro_winkler(names[i], names[j])
+    """
+    n = len(names)
+    alphabet: dict[str, int] = {}
+    codes = [alphabet.setdefault(char, len(alphabet)) for name in names for char in name]
+    lengths = np.fromiter((len(name) for name in names), dtype=np.float64, count=n)
+
+    counts = np.zeros((n, max(len(alphabet), 1)), dtype=np.int32)
+    rows = np.repeat(np.arange(n), lengths.astype(np.int64))
+    np.add.at(counts, (rows, np.asarray(codes, dtype=np.int64)), 1)
+
+    common = np.empty((n, n), dtype=np.float64)
+    step = max(1, _KERNEL_BUDGET // max(1, n * counts.shape[1]))
+    for start in range(0, n, step):
+        common[start : start + step] = np.minimum(
+            counts[start : start + step, None, :], counts[None, :, :]
+        ).sum(axis=2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        jaro = (common / lengths[:, None] + common / lengths[None, :] + 1.0) / 3.0
+    jaro = np.where(common > 0, jaro, 0.0)
+    return np.where(jaro > 0.7, jaro + 0.4 * (1.0 - jaro), jaro)
+
+
+def similar_pairs(
+    names: Sequence[str],
+    threshold: float,
+    blocks: Sequence[Sequence[int]],
+) -> dict[tuple[int, int], float]:
+    """
+    Find pairs within blocks whose Jaro-Winkler similarity meets a threshold.
+
+    Each block is screened with jaro_winkler_upper_bounds(); the exact
+    similarity is computed only for pairs whose bound reaches the
+    threshold, and once per pair even if it shares several blocks.
+
+    Args:
+        names: Names to compare
+        threshold: Minimum Jaro-Winkler similarity
+        blocks: Blocks of indexes into names, e.g. from block_entities()
+
+    Returns:
+        Map of (i, j) with i < j to similarity, for pairs >= threshold
+    """
+    pairs: dict[tuple[int, int], float] = {}
+    scored: set[tuple[int, int]] = set()
+    for block in blocks:
+        if len(block) < 2:
+            continue
+        members = sorted(block)
+        bounds = jaro_winkler_upper_bounds([names[index] for index in members])
+        rows, cols = np.nonzero(np.triu(bounds >= threshold - _BOUND_EPSILON, k=1))
+        for row, col in zip(rows.tolist(), cols.tolist(), strict=True):
+            pair = (members[row], members[col])
+            if pair in scored:
+                continue
+            scored.add(pair)
+            similarity = jellyfish.jaro_winkler_similarity(names[pair[0]], names[pair[1]])
+            if similarity >= threshold:
+                pairs[pair] = similarity
+    return pairs
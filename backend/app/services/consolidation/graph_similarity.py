@@ -22,8 +22,10 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 from uuid import UUID
 
 from app.schemas.similarity import (
@@ -84,6 +86,51 @@ class GraphNeighborhood:
         return set(self.relationship_types.values())
 
 
+# Fetches outgoing and incoming neighbor ids (with relationship types) for a
+# whole block of entities in one round trip. Each CALL subquery aggregates,
+# so it yields exactly one row per entity even when it has no neighbors.
+NEIGHBORHOODS_QUERY = """
+UNWIND $entity_ids AS entity_id
+MATCH (e:Entity {id: entity_id})
+CALL {
+    WITH e
+    MATCH (e)-[r]->(neighbor:Entity)
+    WITH r, neighbor LIMIT $limit
+    RETURN collect([neighbor.id, type(r)]) AS outgoing
+}
+CALL {
+    WITH e
+    MATCH (neighbor:Entity)-[r]->(e)
+    WITH r, neighbor LIMIT $limit
+    RETURN collect([neighbor.id, type(r)]) AS incoming
+}
+RETURN entity_id, outgoing, incoming
+"""
+
+
+class _EncodedNeighborhood(NamedTuple):
+    """Integer-encoded neighbor and relationship type sets for fast set math."""
+
+    neighbors: frozenset[int]
+    relationship_types: frozenset[int]
+
+
+def _set_jaccard(set_a: AbstractSet, set_b: AbstractSet) -> float:
+    """Jaccard similarity of two sets, neutral (0.5) when both are empty."""
+    # Both empty - consider neutral (0.5)
+    # This prevents entities with no relationships from having 0 similarity
+    if not set_a and not set_b:
+        return 0.5
+
+    intersection = len(set_a & set_b)
+    union = len(set_a) + len(set_b) - intersection
+
+    if not union:
+        return 0.0
+
+    return intersection / union
+
+
 class GraphSimilarityService:
     """
     Service for computing graph-based similarity between entities.
@@ -91,6 +138,12 @@ class GraphSimilarityService:
     Uses neighborhood overlap and relationship patterns to measure
     structural similarity in the knowledge graph.
 
+    Neighborhoods are loaded in batches (one query per block of entities)
+    and cached on the service, with neighbor ids and relationship types
+    interned to integers so similarity is plain set arithmetic in Python.
+    Create one service per consolidation run (or call clear_cache()) so
+    that cached neighborhoods do not outlive the run.
+
     Attributes:
         neo4j_driver: Async Neo4j driver for graph queries
     """
@@ -103,70 +156,119 @@ class GraphSimilarityService:
             neo4j_driver: Async Neo4j driver
         """
         self._driver = neo4j_driver
+        # (entity_id, max_neighbors) -> loaded neighborhood, or None if the
+        # entity does not exist in the graph
+        self._cache: dict[
+            tuple[UUID, int], tuple[GraphNeighborhood, _EncodedNeighborhood] | None
+        ] = {}
+        self._node_index: dict[UUID, int] = {}
+        self._type_index: dict[str, int] = {}
+
+    def clear_cache(self) -> None:
+        """Drop all cached neighborhoods (e.g. at the end of a consolidation run)."""
+        self._cache.clear()
+        self._node_index.clear()
+        self._type_index.clear()
+
+    def _encode(self, neighborhood: GraphNeighborhood) -> _EncodedNeighborhood:
+        """Intern a neighborhood's neighbor ids and relationship types to integers."""
+        node_index = self._node_index
+        type_index = self._type_index
+        return _EncodedNeighborhood(
+            neighbors=frozenset(
+                node_index.setdefault(n, len(node_index))
+                for n in neighborhood.all_neighbors
+            ),
+            relationship_types=frozenset(
+                type_index.setdefault(t, len(type_index))
+                for t in neighborhood.relationship_type_set
+            ),
+        )
 
-    async def get_neighborhood(
+    async def _load(
         self,
-        entity_id: UUID,
-        max_neighbors: int = 100,
-    ) -> GraphNeighborhood:
+        entity_ids: Iterable[UUID],
+        max_neighbors: int,
+    ) -> dict[UUID, tuple[GraphNeighborhood, _EncodedNeighborhood]]:
         """
-        Get entity's neighborhood from Neo4j.
-
-        Retrieves both outgoing and incoming neighbors with their
-        relationship types. Limits results for performance.
+        Load neighborhoods for entities, querying Neo4j only for uncached ones.
 
         Args:
-            entity_id: Entity ID to query
+            entity_ids: Entity IDs to load
             max_neighbors: Maximum neighbors to retrieve per direction
 
         Returns:
-            GraphNeighborhood with neighbor sets and relationship types
+            Dict mapping entity ID to (neighborhood, encoded sets) for
+            entities that exist in the graph
         """
-        async with self._driver.session() as session:
-            # Get outgoing relationships
-            outgoing_result = await session.run(
-                """
-                MATCH (e:Entity {id: $entity_id})-[r]->(neighbor:Entity)
-                RETURN neighbor.id AS neighbor_id, type(r) AS rel_type
-                LIMIT $limit
-                """,
-                entity_id=str(entity_id),
-                limit=max_neighbors,
-            )
-            outgoing_records = await outgoing_result.data()
-
-            # Get incoming relationships
-            incoming_result = await session.run(
-                """
-                MATCH (neighbor:Entity)-[r]->(e:Entity {id: $entity_id})
-                RETURN neighbor.id AS neighbor_id, type(r) AS rel_type
-                LIMIT $limit
-                """,
-                entity_id=str(entity_id),
-                limit=max_neighbors,
+        entity_ids = list(dict.fromkeys(entity_ids))
+        missing = [eid for eid in entity_ids if (eid, max_neighbors) not in self._cache]
+
+        if missing:
+            async with self._driver.session() as session:
+                result = await session.run(
+                    NEIGHBORHOODS_QUERY,
+                    entity_ids=[str(eid) for eid in missing],
+                    limit=max_neighbors,
+                )
+                records = await result.data()
+
+            # Entities without a row are not in the graph
+            for eid in missing:
+                self._cache[(eid, max_neighbors)] = None
+
+            for record in records:
+                try:
+                    eid = UUID(record["entity_id"])
+                except (ValueError, TypeError):
+                    continue
+                neighborhood = self._build_neighborhood(
+                    eid, record["outgoing"], record["incoming"]
+                )
+                self._cache[(eid, max_neighbors)] = (
+                    neighborhood,
+                    self._encode(neighborhood),
+                )
+
+            logger.debug(
+                f"Loaded {len(records)} graph neighborhoods "
+                f"({len(entity_ids) - len(missing)} cached)"
             )
-            incoming_records = await incoming_result.data()
 
+        loaded = {}
+        for eid in entity_ids:
+            entry = self._cache[(eid, max_neighbors)]
+            if entry is not None:
+                loaded[eid] = entry
+        return loaded
+
+    @staticmethod
+    def _build_neighborhood(
+        entity_id: UUID,
+        outgoing: list[list[str]],
+        incoming: list[list[str]],
+    ) -> GraphNeighborhood:
+        """Build a GraphNeighborhood from [neighbor_id, rel_type] pairs."""
         outgoing_neighbors: set[UUID] = set()
         incoming_neighbors: set[UUID] = set()
         relationship_types: dict[UUID, str] = {}
 
-        for record in outgoing_records:
+        for neighbor_id_str, rel_type in outgoing:
             try:
-                neighbor_id = UUID(record["neighbor_id"])
-                outgoing_neighbors.add(neighbor_id)
-                relationship_types[neighbor_id] = record["rel_type"]
+                neighbor_id = UUID(neighbor_id_str)
             except (ValueError, TypeError):
                 continue
+            outgoing_neighbors.add(neighbor_id)
+            relationship_types[neighbor_id] = rel_type
 
-        for record in incoming_records:
+        for neighbor_id_str, rel_type in incoming:
             try:
-                neighbor_id = UUID(record["neighbor_id"])
-                incoming_neighbors.add(neighbor_id)
-                if neighbor_id not in relationship_types:
-                    relationship_types[neighbor_id] = record["rel_type"]
+                neighbor_id = UUID(neighbor_id_str)
             except (ValueError, TypeError):
                 continue
+            incoming_neighbors.add(neighbor_id)
+            if neighbor_id not in relationship_types:
+                relationship_types[neighbor_id] = rel_type
 
         return GraphNeighborhood(
             entity_id=entity_id,
@@ -175,6 +277,52 @@ class GraphSimilarityService:
             relationship_types=relationship_types,
         )
 
+    async def get_neighborhoods(
+        self,
+        entity_ids: Iterable[UUID],
+        max_neighbors: int = 100,
+    ) -> dict[UUID, GraphNeighborhood]:
+        """
+        Get neighborhoods for a block of entities with a single query.
+
+        Already-cached neighborhoods are served without querying Neo4j.
+        Entities that do not exist in the graph get an empty neighborhood.
+
+        Args:
+            entity_ids: Entity IDs to query
+            max_neighbors: Maximum neighbors to retrieve per direction
+
+        Returns:
+            Dict mapping entity ID to GraphNeighborhood
+        """
+        entity_ids = list(entity_ids)
+        loaded = await self._load(entity_ids, max_neighbors)
+        return {
+            eid: loaded[eid][0] if eid in loaded else GraphNeighborhood(entity_id=eid)
+            for eid in entity_ids
+        }
+
+    async def get_neighborhood(
+        self,
+        entity_id: UUID,
+        max_neighbors: int = 100,
+    ) -> GraphNeighborhood:
+        """
+        Get entity's neighborhood from Neo4j.
+
+        Retrieves both outgoing and incoming neighbors with their
+        relationship types. Limits results for performance.
+
+        Args:
+            entity_id: Entity ID to query
+            max_neighbors: Maximum neighbors to retrieve per direction
+
+        Returns:
+            GraphNeighborhood with neighbor sets and relationship types
+        """
+        neighborhoods = await self.get_neighborhoods([entity_id], max_neighbors)
+        return neighborhoods[entity_id]
+
     def compute_jaccard_similarity(
         self,
         neighborhood_a: GraphNeighborhood,
@@ -193,25 +341,11 @@ class GraphSimilarityService:
         Returns:
             Jaccard similarity in range [0, 1]
         """
-        neighbors_a = neighborhood_a.all_neighbors
-        neighbors_b = neighborhood_b.all_neighbors
-
-        # Both have no neighbors - consider neutral (0.5)
-        # This prevents entities with no relationships from having 0 similarity
-        if not neighbors_a and not neighbors_b:
-            return 0.5
-
-        intersection = neighbors_a & neighbors_b
-        union = neighbors_a | neighbors_b
-
-        if not union:
-            return 0.0
-
-        jaccard = len(intersection) / len(union)
+        jaccard = _set_jaccard(neighborhood_a.all_neighbors, neighborhood_b.all_neighbors)
 
         logger.debug(
-            f"Jaccard similarity: |A|={len(neighbors_a)}, |B|={len(neighbors_b)}, "
-            f"|A intersection B|={len(intersection)}, J={jaccard:.3f}"
+            f"Jaccard similarity: |A|={neighborhood_a.neighbor_count}, "
+            f"|B|={neighborhood_b.neighbor_count}, J={jaccard:.3f}"
         )
 
         return jaccard
@@ -235,20 +369,10 @@ class GraphSimilarityService:
         Returns:
             Relationship type similarity in range [0, 1]
         """
-        types_a = neighborhood_a.relationship_type_set
-        types_b = neighborhood_b.relationship_type_set
-
-        # Both have no relationships - consider neutral
-        if not types_a and not types_b:
-            return 0.5
-
-        intersection = types_a & types_b
-        union = types_a | types_b
-
-        if not union:
-            return 0.0
-
-        return len(intersection) / len(union)
+        return _set_jaccard(
+            neighborhood_a.relationship_type_set,
+            neighborhood_b.relationship_type_set,
+        )
 
     async def compute_similarity(
         self,
@@ -270,9 +394,12 @@ class GraphSimilarityService:
         Returns:
             Combined graph similarity in range [0, 1]
         """
-        # Get neighborhoods
-        neighborhood_a = await self.get_neighborhood(entity_a_id, max_neighbors)
-        neighborhood_b = await self.get_neighborhood(entity_b_id, max_neighbors)
+        # Get neighborhoods (one query for both, cached for later pairs)
+        neighborhoods = await self.get_neighborhoods(
+            [entity_a_id, entity_b_id], max_neighbors
+        )
+        neighborhood_a = neighborhoods[entity_a_id]
+        neighborhood_b = neighborhoods[entity_b_id]
 
         # Compute similarities
         jaccard = self.compute_jaccard_similarity(neighborhood_a, neighborhood_b)
@@ -313,11 +440,14 @@ class GraphSimilarityService:
         start_time = time.perf_counter()
 
         # Get neighborhoods
-        neighborhood_a = await self.get_neighborhood(entity_a_id, max_neighbors)
-        neighborhood_b = await self.get_neighborhood(entity_b_id, max_neighbors)
+        neighborhoods = await self.get_neighborhoods(
+            [entity_a_id, entity_b_id], max_neighbors
+        )
 
         # Compute Jaccard similarity
-        jaccard = self.compute_jaccard_similarity(neighborhood_a, neighborhood_b)
+        jaccard = self.compute_jaccard_similarity(
+            neighborhoods[entity_a_id], neighborhoods[entity_b_id]
+        )
 
         computation_time_ms = (time.perf_counter() - start_time) * 1000
 
@@ -342,131 +472,85 @@ class GraphSimilarityService:
         self,
         entity_a_id: UUID,
         entity_b_id: UUID,
+        max_neighbors: int = 100,
     ) -> float:
         """
-        Compute graph similarity using single Cypher query.
+        Compute graph neighbor (Jaccard) similarity for a single pair.
 
-        More efficient than separate neighborhood queries for single pair.
+        Loads both neighborhoods in one query and compares them in Python.
 
         Args:
             entity_a_id: First entity ID
             entity_b_id: Second entity ID
+            max_neighbors: Maximum neighbors to consider per direction
 
         Returns:
             Graph similarity in range [0, 1]
         """
-        async with self._driver.session() as session:
-            result = await session.run(
-                """
-                // Get neighbors of entity A
-                MATCH (a:Entity {id: $entity_a_id})
-                OPTIONAL MATCH (a)-[r1]-(neighbor1:Entity)
-                WITH a, collect(DISTINCT neighbor1.id) AS neighbors_a
-
-                // Get neighbors of entity B
-                MATCH (b:Entity {id: $entity_b_id})
-                OPTIONAL MATCH (b)-[r2]-(neighbor2:Entity)
-                WITH neighbors_a, collect(DISTINCT neighbor2.id) AS neighbors_b
-
-                // Compute Jaccard
-                WITH neighbors_a, neighbors_b,
-                     [x IN neighbors_a WHERE x IN neighbors_b] AS intersection,
-                     neighbors_a + [x IN neighbors_b WHERE NOT x IN neighbors_a] AS union_set
-
-                RETURN
-                    size(intersection) AS intersection_size,
-                    size(union_set) AS union_size,
-                    CASE WHEN size(union_set) = 0 THEN 0.5
-                         ELSE toFloat(size(intersection)) / size(union_set)
-                    END AS jaccard_similarity
-                """,
-                entity_a_id=str(entity_a_id),
-                entity_b_id=str(entity_b_id),
-            )
-
-            record = await result.single()
-
-            if record:
-                similarity = record["jaccard_similarity"]
-                logger.debug(
-                    f"Direct graph similarity: {entity_a_id} <-> {entity_b_id} = {similarity:.3f}"
-                )
-                return similarity
+        loaded = await self._load([entity_a_id, entity_b_id], max_neighbors)
 
+        if entity_a_id not in loaded or entity_b_id not in loaded:
             # No data - neutral score
             return 0.5
 
+        similarity = _set_jaccard(
+            loaded[entity_a_id][1].neighbors,
+            loaded[entity_b_id][1].neighbors,
+        )
+        logger.debug(
+            f"Direct graph similarity: {entity_a_id} <-> {entity_b_id} = {similarity:.3f}"
+        )
+        return similarity
+
     async def compute_similarities_batch(
         self,
         entity_id: UUID,
         candidate_ids: list[UUID],
+        max_neighbors: int = 100,
     ) -> dict[UUID, float]:
         """
         Compute graph similarity between entity and multiple candidates.
 
-        Optimized batch query for efficiency.
+        Loads the source and all candidate neighborhoods in a single query
+        (skipping any already cached) and computes Jaccard similarity of
+        the integer-encoded neighbor sets in Python.
 
         Args:
             entity_id: Source entity ID
             candidate_ids: List of candidate entity IDs
+            max_neighbors: Maximum neighbors to consider per direction
 
         Returns:
-            Dict mapping candidate_id to similarity score
+            Dict mapping candidate_id to similarity score. Candidates (or a
+            source) that do not exist in the graph are omitted.
         """
         if not candidate_ids:
             return {}
 
         start_time = time.perf_counter()
 
-        async with self._driver.session() as session:
-            result = await session.run(
-                """
-                // Get source entity neighbors
-                MATCH (source:Entity {id: $source_id})
-                OPTIONAL MATCH (source)-[]-(neighbor:Entity)
-                WITH source, collect(DISTINCT neighbor.id) AS source_neighbors
-
-                // For each candidate, compute Jaccard
-                UNWIND $candidate_ids AS candidate_id
-                MATCH (candidate:Entity {id: candidate_id})
-                OPTIONAL MATCH (candidate)-[]-(neighbor:Entity)
-                WITH candidate_id, source_neighbors,
-                     collect(DISTINCT neighbor.id) AS candidate_neighbors
-
-                WITH candidate_id, source_neighbors, candidate_neighbors,
-                     [x IN source_neighbors WHERE x IN candidate_neighbors] AS intersection
-
-                RETURN
-                    candidate_id,
-                    CASE
-                        WHEN size(source_neighbors) = 0 AND size(candidate_neighbors) = 0 THEN 0.5
-                        WHEN size(source_neighbors) + size(candidate_neighbors) - size(intersection) = 0 THEN 0.0
-                        ELSE toFloat(size(intersection)) /
-                             (size(source_neighbors) + size(candidate_neighbors) - size(intersection))
-                    END AS similarity
-                """,
-                source_id=str(entity_id),
-                candidate_ids=[str(cid) for cid in candidate_ids],
-            )
+        loaded = await self._load([entity_id, *candidate_ids], max_neighbors)
 
-            records = await result.data()
+        source = loaded.get(entity_id)
+        if source is None:
+            return {}
 
-            similarities: dict[UUID, float] = {}
-            for record in records:
-                try:
-                    cid = UUID(record["candidate_id"])
-                    similarities[cid] = record["similarity"]
-                except (ValueError, TypeError):
-                    continue
+        source_neighbors = source[1].neighbors
+        similarities: dict[UUID, float] = {}
+        for cid in candidate_ids:
+            candidate = loaded.get(cid)
+            if candidate is None:
+                continue
+            similarities[cid] = _set_jaccard(source_neighbors, candidate[1].neighbors)
 
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            logger.debug(
-                f"Batch graph similarity for {entity_id}: "
-                f"computed {len(similarities)} candidates, "
-                f"time={elapsed_ms:.2f}ms"
-            )
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        logger.debug(
+            f"Batch graph similarity for {entity_id}: "
+            f"computed {len(similarities)} candidates, "
+            f"time={elapsed_ms:.2f}ms"
+        )
 
-            return similarities
+        return similarities
 
     async def compute_batch_scores(
         self,
@@ -22,6 +22,7 @@ Example usage:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import hashlib
 import logging
 from typing import TYPE_CHECKING
@@ -30,6 +31,7 @@ import httpx
 import numpy as np
 
 if TYPE_CHECKING:
+    from app.core.concurrency import AdaptiveConcurrencyLimiter
     from app.core.config import Settings
 
 logger = logging.getLogger(__name__)
@@ -80,6 +82,7 @@ class OllamaEmbeddingService:
         timeout: float = 30.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
     ):
         """
         Initialize Ollama embedding service.
@@ -90,12 +93,14 @@ class OllamaEmbeddingService:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts on transient failures
             retry_delay: Delay between retries in seconds
+            concurrency_limiter: Optional adaptive limit on in-flight requests
         """
         self._base_url = base_url.rstrip("/")
         self._model = model
         self._timeout = timeout
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._concurrency_limiter = concurrency_limiter
         self._client: httpx.AsyncClient | None = None
         self._embedding_dimension: int | None = None
         self._is_initialized = False
@@ -170,6 +175,12 @@ class OllamaEmbeddingService:
             logger.error(f"Failed to check model availability: {e}")
             return False
 
+    def _slot(self) -> contextlib.AbstractAsyncContextManager:
+        """Concurrency slot for one request (no-op without a limiter)."""
+        if self._concurrency_limiter is None:
+            return contextlib.nullcontext()
+        return self._concurrency_limiter.slot()
+
     async def encode(self, text: str) -> np.ndarray:
         """
         Encode single text into embedding vector.
@@ -193,14 +204,15 @@ class OllamaEmbeddingService:
         last_error = None
         for attempt in range(self._max_retries):
             try:
-                response = await client.post(
-                    "/api/embeddings",
-                    json={
-                        "model": self._model,
-                        "prompt": text.strip(),
-                    },
-                )
-                response.raise_for_status()
+                async with self._slot():
+                    response = await client.post(
+                        "/api/embeddings",
+                        json={
+                            "model": self._model,
+                            "prompt": text.strip(),
+                        },
+                    )
+                    response.raise_for_status()
 
                 data = response.json()
 
@@ -358,11 +370,16 @@ class EmbeddingServiceFactory:
 
                 settings = app_settings
 
+            from app.core.concurrency import get_concurrency_limiter
+
             cls._instance = OllamaEmbeddingService(
                 base_url=settings.OLLAMA_BASE_URL,
                 model=settings.OLLAMA_EMBEDDING_MODEL,
                 timeout=settings.OLLAMA_EMBEDDING_TIMEOUT,
                 max_retries=settings.OLLAMA_MAX_RETRIES,
+                concurrency_limiter=get_concurrency_limiter(
+                    f"ollama-embeddings:{settings.OLLAMA_BASE_URL.rstrip('/')}"
+                ),
             )
 
             logger.info(
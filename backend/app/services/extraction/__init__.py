@@ -3,9 +3,17 @@
 from app.services.extraction.orchestrator import (
     ExtractionOrchestrator,
     ExtractionResult,
+    PageExtractionRequest,
+)
+from app.services.extraction.persistence import (
+    PersistedExtraction,
+    persist_page_extraction,
 )
 
 __all__ = [
     "ExtractionOrchestrator",
     "ExtractionResult",
+    "PageExtractionRequest",
+    "PersistedExtraction",
+    "persist_page_extraction",
 ]
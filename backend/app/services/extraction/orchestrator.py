@@ -9,19 +9,24 @@ Follows the Single Responsibility Principle by focusing solely on extraction
 orchestration, delegating persistence and event emission to callers.
 """
 
-import asyncio
 import logging
 import time
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Protocol
+from urllib.parse import urlparse
 from uuid import UUID
 
 from app.core.config import settings
 from app.models.extracted_entity import ExtractionMethod
+from app.worker.runtime import get_process_pool, run_async, shutdown_process_pool
 
 if TYPE_CHECKING:
     from app.models.extraction_provider import ExtractionProvider, ExtractionProviderType
     from app.models.scraped_page import ScrapedPage
+    from app.preprocessing.pipeline import PipelineResult, PreprocessingPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +46,53 @@ class ExtractionResult:
         return len(self.entities)
 
 
+@dataclass
+class PageExtractionRequest:
+    """A page to extract in a batch, with the settings of its job."""
+
+    page: "ScrapedPage"
+    extraction_provider: "ExtractionProvider | None" = None
+    use_llm_extraction: bool = True
+
+
+def _parse_structured_data(schema_org_data: list | None, open_graph_data: dict | None) -> list[dict]:
+    """
+    Extract entities from a page's Schema.org/JSON-LD and Open Graph data.
+
+    Module-level, so extract_from_pages() can run it in the worker's
+    process pool.
+
+    Args:
+        schema_org_data: The page's JSON-LD items
+        open_graph_data: The page's Open Graph properties
+
+    Returns:
+        Schema.org entities followed by Open Graph entities
+    """
+    from app.extraction.schema_org import (
+        extract_entities_from_open_graph,
+        extract_entities_from_schema_org,
+    )
+
+    entities: list[dict] = []
+    if schema_org_data:
+        entities.extend(extract_entities_from_schema_org(schema_org_data))
+    if open_graph_data:
+        entities.extend(extract_entities_from_open_graph(open_graph_data))
+    return entities
+
+
+def _parse_result(future: "Future[list[dict]] | None", args: tuple) -> list[dict]:
+    """Return a pooled parse's entities, parsing inline without one or if the pool broke."""
+    if future is not None:
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            # A pool process died; start a new pool on next use
+            shutdown_process_pool()
+    return _parse_structured_data(*args)
+
+
 class ExtractorProtocol(Protocol):
     """Protocol for extraction services."""
 
@@ -78,6 +130,7 @@ class ExtractionOrchestrator:
         tenant_id: str,
         extraction_provider: "ExtractionProvider | None" = None,
         use_llm_extraction: bool = True,
+        skip_rate_limit: bool = False,
     ) -> ExtractionResult:
         """
         Run extraction pipeline on a page.
@@ -87,34 +140,54 @@ class ExtractionOrchestrator:
             tenant_id: Tenant ID for context
             extraction_provider: Optional specific provider to use
             use_llm_extraction: Whether to run LLM extraction
+            skip_rate_limit: Skip the per-call tenant rate limit (the
+                extraction scheduler already took a token for the page)
 
         Returns:
             ExtractionResult with entities and relationships
         """
-        entities: list[dict] = []
-        relationships: list[dict] = []
-        schema_org_count = 0
-        llm_count = 0
+        # 1. Extract from Schema.org/JSON-LD and Open Graph
+        structured = _parse_structured_data(page.schema_org_data, page.open_graph_data)
+
+        return self._extract_page(
+            page,
+            structured,
+            tenant_id=tenant_id,
+            extraction_provider=extraction_provider,
+            use_llm_extraction=use_llm_extraction,
+            skip_rate_limit=skip_rate_limit,
+        )
 
-        # 1. Extract from Schema.org/JSON-LD
-        if page.schema_org_data:
-            schema_entities = self._extract_schema_org(page.schema_org_data)
-            entities.extend(schema_entities)
-            schema_org_count = len(schema_entities)
+    def _extract_page(
+        self,
+        page: "ScrapedPage",
+        structured: list[dict],
+        tenant_id: str,
+        extraction_provider: "ExtractionProvider | None",
+        use_llm_extraction: bool,
+        skip_rate_limit: bool,
+        llm_output: tuple[list[dict], list[dict]] | None = None,
+    ) -> ExtractionResult:
+        """
+        Run LLM extraction on a page whose structured data is already parsed.
 
-        # 2. Extract from Open Graph
-        if page.open_graph_data:
-            og_entities = self._extract_open_graph(page.open_graph_data)
-            entities.extend(og_entities)
-            schema_org_count += len(og_entities)
+        llm_output is the page's (entities, relationships) when a batch
+        already ran LLM extraction for it.
+        """
+        entities: list[dict] = list(structured)
+        relationships: list[dict] = []
+        schema_org_count = len(structured)
+        llm_count = 0
 
-        # 3. LLM extraction (if enabled)
+        # 2. LLM extraction (if enabled)
         if use_llm_extraction and page.html_content:
-            llm_entities, llm_relationships = self._extract_with_llm(
+            llm_entities, llm_relationships = llm_output or self._extract_with_llm(
                 text=page.html_content,
                 tenant_id=tenant_id,
                 page_url=page.url,
                 extraction_provider=extraction_provider,
+                dedup_scope=str(page.job_id) if page.job_id else None,
+                skip_rate_limit=skip_rate_limit,
             )
             entities.extend(llm_entities)
             relationships.extend(llm_relationships)
@@ -130,17 +203,184 @@ class ExtractionOrchestrator:
             llm_count=llm_count,
         )
 
-    def _extract_schema_org(self, data: list) -> list[dict]:
-        """Extract entities from Schema.org JSON-LD data."""
-        from app.extraction.schema_org import extract_entities_from_schema_org
+    def extract_from_pages(
+        self,
+        requests: Sequence[PageExtractionRequest],
+        tenant_id: str,
+        max_concurrency: int | None = None,
+        skip_rate_limit: bool = False,
+    ) -> list[ExtractionResult | Exception]:
+        """
+        Run the extraction pipeline on several pages concurrently.
+
+        Structured data (Schema.org, Open Graph) is parsed first. Parsing
+        is CPU-bound, so when several pages have structured data it runs in
+        the worker's process pool (see get_process_pool()); threads would
+        hold the GIL. LLM extraction is I/O-bound and runs on a thread pool
+        whose LLM calls all run on the worker's persistent event loop, so at
+        most max_concurrency pages (or page groups) wait on the LLM at once.
+        Pages of the same job and domain go through the preprocessing
+        pipeline together when chunk packing is enabled, so their small
+        chunks share LLM requests (see _group_pages_for_packing()). A page
+        that fails does not affect the others.
+
+        Args:
+            requests: Pages with their extraction settings
+            tenant_id: Tenant ID for context
+            max_concurrency: Pages extracted at once (defaults to
+                settings.EXTRACTION_SCHEDULER_MAX_CONCURRENCY, the LLM's
+                parallel slots)
+            skip_rate_limit: Skip the per-call tenant rate limit (the
+                extraction scheduler already took a token for each page)
 
-        return extract_entities_from_schema_org(data)
+        Returns:
+            ExtractionResult or the raised exception, in request order
+        """
+        if not requests:
+            return []
 
-    def _extract_open_graph(self, data: dict) -> list[dict]:
-        """Extract entities from Open Graph data."""
-        from app.extraction.schema_org import extract_entities_from_open_graph
+        parsed = self._parse_structured_pages([request.page for request in requests])
+        groups = self._group_pages_for_packing(requests)
 
-        return extract_entities_from_open_graph(data)
+        workers = min(
+            len(groups),
+            max_concurrency or settings.EXTRACTION_SCHEDULER_MAX_CONCURRENCY,
+        )
+
+        def _extract(
+            request: PageExtractionRequest,
+            structured: list[dict] | Exception,
+            llm_output: tuple[list[dict], list[dict]] | None,
+        ) -> ExtractionResult | Exception:
+            try:
+                if isinstance(structured, Exception):
+                    raise structured
+                return self._extract_page(
+                    request.page,
+                    structured,
+                    tenant_id=tenant_id,
+                    extraction_provider=request.extraction_provider,
+                    use_llm_extraction=request.use_llm_extraction,
+                    skip_rate_limit=skip_rate_limit,
+                    llm_output=llm_output,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Extraction failed for page {request.page.id}: "
+                    f"{type(e).__name__}: {e}"
+                )
+                return e
+
+        def _extract_group(group: list[int]) -> list[ExtractionResult | Exception]:
+            outputs: list[tuple[list[dict], list[dict]]] | None = None
+            if len(group) > 1:
+                # None if the batch failed; its pages are then extracted one by one
+                outputs = self._extract_batch_with_preprocessing_pipeline(
+                    [requests[index].page for index in group],
+                    tenant_id,
+                    skip_rate_limit=skip_rate_limit,
+                )
+            return [
+                _extract(requests[index], parsed[index], outputs[position] if outputs else None)
+                for position, index in enumerate(group)
+            ]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract") as pool:
+            group_results = list(pool.map(_extract_group, groups))
+
+        results: dict[int, ExtractionResult | Exception] = {}
+        for group, extracted in zip(groups, group_results, strict=True):
+            results.update(zip(group, extracted, strict=True))
+        return [results[index] for index in range(len(requests))]
+
+    def _group_pages_for_packing(
+        self, requests: Sequence[PageExtractionRequest]
+    ) -> list[list[int]]:
+        """
+        Group pages whose small chunks can share packed LLM requests.
+
+        Pages of the same job and domain that use the preprocessing
+        pipeline are grouped, at most CHUNK_PACK_MAX_SECTIONS pages per
+        group. Other pages, and all pages when packing is disabled, get a
+        group of their own.
+
+        Args:
+            requests: Pages with their extraction settings
+
+        Returns:
+            Groups of indexes into requests, in order of their first page
+        """
+        groups: list[list[int]] = []
+        by_site: dict[tuple[UUID, str], list[int]] = {}
+        for index, request in enumerate(requests):
+            page = request.page
+            if (
+                request.use_llm_extraction
+                and request.extraction_provider is None
+                and page.html_content
+                and page.job_id
+            ):
+                key = (page.job_id, urlparse(page.url).netloc)
+                if key not in by_site:
+                    by_site[key] = []
+                    groups.append(by_site[key])
+                by_site[key].append(index)
+            else:
+                groups.append([index])
+
+        packing = (
+            any(len(group) > 1 for group in by_site.values())
+            and settings.OLLAMA_BASE_URL
+            and settings.PREPROCESSING_ENABLED
+            and settings.CHUNK_PACK_BELOW > 0
+        )
+        if not packing:
+            return [[index] for index in range(len(requests))]
+
+        size = max(settings.CHUNK_PACK_MAX_SECTIONS, 1)
+        return [
+            group[start : start + size]
+            for group in groups
+            for start in range(0, len(group), size)
+        ]
+
+    def _parse_structured_pages(
+        self, pages: Sequence["ScrapedPage"]
+    ) -> list[list[dict] | Exception]:
+        """
+        Parse the structured data of several pages.
+
+        Uses the worker's process pool when more than one page has
+        structured data, and parses inline otherwise or when the pool is
+        unavailable or broken.
+
+        Args:
+            pages: Pages to parse
+
+        Returns:
+            Entities or the raised exception, in page order
+        """
+        data = [(page.schema_org_data, page.open_graph_data) for page in pages]
+        pool = get_process_pool() if sum(1 for args in data if any(args)) > 1 else None
+
+        futures: list[Future[list[dict]] | None] = [None] * len(data)
+        if pool is not None:
+            try:
+                futures = [
+                    pool.submit(_parse_structured_data, *args) if any(args) else None
+                    for args in data
+                ]
+            except (BrokenProcessPool, RuntimeError) as e:
+                logger.warning(f"Process pool unavailable, parsing inline: {e}")
+                shutdown_process_pool()
+
+        parsed: list[list[dict] | Exception] = []
+        for args, future in zip(data, futures, strict=True):
+            try:
+                parsed.append(_parse_result(future, args))
+            except Exception as e:
+                parsed.append(e)
+        return parsed
 
     def _extract_with_llm(
         self,
@@ -148,6 +388,8 @@ class ExtractionOrchestrator:
         tenant_id: str,
         page_url: str = "",
         extraction_provider: "ExtractionProvider | None" = None,
+        dedup_scope: str | None = None,
+        skip_rate_limit: bool = False,
     ) -> tuple[list[dict], list[dict]]:
         """
         Extract entities and relationships using LLM.
@@ -162,6 +404,8 @@ class ExtractionOrchestrator:
             tenant_id: Tenant ID
             page_url: URL of the page
             extraction_provider: Optional specific provider
+            dedup_scope: Scope for skipping near-duplicate chunks (job ID)
+            skip_rate_limit: Skip the per-call tenant rate limit
 
         Returns:
             Tuple of (entities, relationships)
@@ -183,7 +427,11 @@ class ExtractionOrchestrator:
         # Use preprocessing pipeline if enabled
         if settings.PREPROCESSING_ENABLED:
             return self._extract_with_preprocessing_pipeline(
-                text, tenant_id, page_url
+                text,
+                tenant_id,
+                page_url,
+                dedup_scope=dedup_scope,
+                skip_rate_limit=skip_rate_limit,
             )
         else:
             return self._extract_with_llm_legacy(text, tenant_id, page_url)
@@ -198,8 +446,9 @@ class ExtractionOrchestrator:
         """
         Extract using a specific configured provider.
 
-        Uses the ExtractionProviderFactory to create the appropriate service
-        and run extraction.
+        Reuses a cached service for the provider configuration (see
+        app.extraction.service_cache) and runs extraction on the worker's
+        persistent event loop, so HTTP connections stay warm across pages.
 
         Args:
             text: HTML content to extract from
@@ -211,10 +460,8 @@ class ExtractionOrchestrator:
             Tuple of (entities, relationships)
         """
         from app.extraction.base import ExtractionError
-        from app.extraction.factory import (
-            ExtractionProviderFactory,
-            ProviderConfigError,
-        )
+        from app.extraction.factory import ProviderConfigError
+        from app.extraction.service_cache import get_extraction_service_cache
 
         logger.info(
             "Starting provider-based extraction",
@@ -230,14 +477,14 @@ class ExtractionOrchestrator:
         start_time = time.time()
 
         try:
-            # Create service from provider config
-            service = ExtractionProviderFactory.create_service(
+            # Reuse the service built for this provider configuration
+            service = get_extraction_service_cache().get(
                 extraction_provider,
                 UUID(tenant_id),
             )
 
-            # Run async extraction in sync context
-            result = asyncio.run(service.extract(content=text, page_url=page_url))
+            # Run async extraction on the worker's persistent loop
+            result = run_async(service.extract(content=text, page_url=page_url))
 
             elapsed = time.time() - start_time
 
@@ -319,7 +566,12 @@ class ExtractionOrchestrator:
         return method_map.get(provider_type, ExtractionMethod.LLM_OLLAMA)
 
     def _extract_with_preprocessing_pipeline(
-        self, text: str, tenant_id: str, page_url: str = ""
+        self,
+        text: str,
+        tenant_id: str,
+        page_url: str = "",
+        dedup_scope: str | None = None,
+        skip_rate_limit: bool = False,
     ) -> tuple[list[dict], list[dict]]:
         """
         Extract using the full preprocessing pipeline.
@@ -330,16 +582,14 @@ class ExtractionOrchestrator:
         3. Extract (Ollama): Run LLM on each chunk
         4. Merge (LLM-assisted): Combine entities across chunks
 
+        Chunks that nearly duplicate a chunk already extracted in
+        dedup_scope are skipped. The tenant is rate limited per chunk
+        unless skip_rate_limit is set.
+
         Returns:
             Tuple of (entities, relationships)
         """
         from app.extraction.ollama_extractor import get_ollama_extraction_service
-        from app.preprocessing.factory import (
-            ChunkerType,
-            EntityMergerType,
-            PreprocessorType,
-        )
-        from app.preprocessing.pipeline import PipelineConfig, PreprocessingPipeline
 
         logger.info(
             "Starting preprocessing pipeline extraction",
@@ -356,84 +606,179 @@ class ExtractionOrchestrator:
         start_time = time.time()
 
         try:
-            # Build pipeline configuration from settings
-            config = PipelineConfig(
-                preprocessor_type=PreprocessorType(settings.PREPROCESSOR_TYPE),
-                preprocessor_config={
-                    "favor_recall": settings.PREPROCESSOR_FAVOR_RECALL,
-                    "include_tables": settings.PREPROCESSOR_INCLUDE_TABLES,
-                },
-                chunker_type=ChunkerType(settings.CHUNKER_TYPE),
-                chunk_size=settings.CHUNK_SIZE,
-                chunk_overlap=settings.CHUNK_OVERLAP,
-                merger_type=EntityMergerType(settings.MERGER_TYPE),
-                use_llm_merging=settings.MERGER_USE_LLM,
-                merger_config={
-                    "high_threshold": settings.MERGER_HIGH_SIMILARITY_THRESHOLD,
-                    "low_threshold": settings.MERGER_LOW_SIMILARITY_THRESHOLD,
-                    "batch_size": settings.MERGER_LLM_BATCH_SIZE,
-                },
-                skip_preprocessing=not settings.PREPROCESSING_ENABLED,
-                skip_chunking=not settings.CHUNKING_ENABLED,
-                max_chunks=settings.MAX_CHUNKS_PER_DOCUMENT,
-            )
-
-            # Create pipeline and extractor
-            pipeline = PreprocessingPipeline(config)
+            pipeline = self._create_preprocessing_pipeline()
             extractor = get_ollama_extraction_service()
 
-            # Run pipeline (async in sync context)
-            result = asyncio.run(
+            # Run pipeline on the worker's persistent loop
+            result = run_async(
                 pipeline.process(
                     content=text,
                     extractor=extractor,
                     content_type="text/html",
                     url=page_url,
-                    tenant_id=UUID(tenant_id) if tenant_id else None,
+                    tenant_id=(
+                        UUID(tenant_id) if tenant_id and not skip_rate_limit else None
+                    ),
+                    dedup_scope=dedup_scope,
                 )
             )
 
             elapsed = time.time() - start_time
+            entities = self._log_pipeline_result(result, page_url, elapsed)
 
-            # Add extraction method to entities
-            entities = []
-            for entity in result.entities:
-                entity_copy = entity.copy()
-                entity_copy["method"] = ExtractionMethod.LLM_OLLAMA
-                entities.append(entity_copy)
+            return entities, result.relationships
 
-            logger.info(
-                "Preprocessing pipeline extraction completed",
+        except Exception as e:
+            elapsed = time.time() - start_time
+            logger.warning(
+                "Preprocessing pipeline extraction failed, falling back to legacy",
                 extra={
                     "page_url": page_url,
-                    "entities_count": len(entities),
-                    "relationships_count": len(result.relationships),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
                     "elapsed_seconds": round(elapsed, 2),
-                    "original_length": result.original_length,
-                    "preprocessed_length": result.preprocessed_length,
-                    "num_chunks": result.num_chunks,
-                    "preprocessing_method": result.preprocessing_method,
-                    "chunking_method": result.chunking_method,
-                    "merging_method": result.merging_method,
-                    "entities_per_chunk": result.entities_per_chunk,
                 },
             )
+            # Fall back to legacy extraction on pipeline failure
+            return self._extract_with_llm_legacy(text, tenant_id, page_url)
 
-            return entities, result.relationships
+    def _extract_batch_with_preprocessing_pipeline(
+        self,
+        pages: Sequence["ScrapedPage"],
+        tenant_id: str,
+        skip_rate_limit: bool = False,
+    ) -> list[tuple[list[dict], list[dict]]] | None:
+        """
+        Extract several pages of one job and domain in one pipeline run.
+
+        The pages are preprocessed and merged separately, but their chunks
+        are extracted together, so small chunks of different pages share
+        packed requests (see PreprocessingPipeline.process_batch()).
+
+        Args:
+            pages: Pages of the same job and domain
+            tenant_id: Tenant ID
+            skip_rate_limit: Skip the per-call tenant rate limit
+
+        Returns:
+            (entities, relationships) per page in page order, or None if
+            the batch failed and the pages should be extracted one by one
+        """
+        from app.extraction.ollama_extractor import get_ollama_extraction_service
+        from app.preprocessing.pipeline import PipelineDocument
+
+        start_time = time.time()
+
+        try:
+            pipeline = self._create_preprocessing_pipeline()
+            extractor = get_ollama_extraction_service()
+
+            results = run_async(
+                pipeline.process_batch(
+                    [
+                        PipelineDocument(
+                            content=page.html_content, content_type="text/html", url=page.url
+                        )
+                        for page in pages
+                    ],
+                    extractor=extractor,
+                    tenant_id=(
+                        UUID(tenant_id) if tenant_id and not skip_rate_limit else None
+                    ),
+                    dedup_scope=str(pages[0].job_id),
+                )
+            )
+
+            elapsed = time.time() - start_time
+            return [
+                (self._log_pipeline_result(result, page.url, elapsed), result.relationships)
+                for page, result in zip(pages, results, strict=True)
+            ]
 
         except Exception as e:
             elapsed = time.time() - start_time
             logger.warning(
-                "Preprocessing pipeline extraction failed, falling back to legacy",
+                "Batched preprocessing pipeline extraction failed, extracting pages one by one",
                 extra={
-                    "page_url": page_url,
+                    "page_count": len(pages),
                     "error": str(e),
                     "error_type": type(e).__name__,
                     "elapsed_seconds": round(elapsed, 2),
                 },
             )
-            # Fall back to legacy extraction on pipeline failure
-            return self._extract_with_llm_legacy(text, tenant_id, page_url)
+            return None
+
+    def _create_preprocessing_pipeline(self) -> "PreprocessingPipeline":
+        """Create a preprocessing pipeline configured from settings."""
+        from app.extraction.result_cache import get_extraction_result_cache
+        from app.preprocessing.dedup import get_chunk_deduplicator
+        from app.preprocessing.factory import (
+            ChunkerType,
+            EntityMergerType,
+            PreprocessorType,
+        )
+        from app.preprocessing.pipeline import PipelineConfig, PreprocessingPipeline
+
+        config = PipelineConfig(
+            preprocessor_type=PreprocessorType(settings.PREPROCESSOR_TYPE),
+            preprocessor_config={
+                "favor_recall": settings.PREPROCESSOR_FAVOR_RECALL,
+                "include_tables": settings.PREPROCESSOR_INCLUDE_TABLES,
+            },
+            chunker_type=ChunkerType(settings.CHUNKER_TYPE),
+            chunk_size=settings.CHUNK_SIZE,
+            chunk_overlap=settings.CHUNK_OVERLAP,
+            chunk_tokens=settings.CHUNK_MAX_TOKENS,
+            chunk_overlap_tokens=settings.CHUNK_OVERLAP_TOKENS,
+            merger_type=EntityMergerType(settings.MERGER_TYPE),
+            use_llm_merging=settings.MERGER_USE_LLM,
+            merger_config={
+                "high_threshold": settings.MERGER_HIGH_SIMILARITY_THRESHOLD,
+                "low_threshold": settings.MERGER_LOW_SIMILARITY_THRESHOLD,
+                "batch_size": settings.MERGER_LLM_BATCH_SIZE,
+            },
+            skip_preprocessing=not settings.PREPROCESSING_ENABLED,
+            skip_chunking=not settings.CHUNKING_ENABLED,
+            max_chunks=settings.MAX_CHUNKS_PER_DOCUMENT,
+            max_concurrent_extractions=settings.EXTRACTION_CHUNK_CONCURRENCY.get("ollama", 1),
+            pack_chunks_below=settings.CHUNK_PACK_BELOW,
+            max_chunks_per_pack=settings.CHUNK_PACK_MAX_SECTIONS,
+        )
+
+        return PreprocessingPipeline(
+            config,
+            result_cache=get_extraction_result_cache(),
+            deduplicator=run_async(get_chunk_deduplicator()),
+        )
+
+    def _log_pipeline_result(
+        self, result: "PipelineResult", page_url: str, elapsed: float
+    ) -> list[dict]:
+        """Log a page's pipeline result and return its entities tagged with the method."""
+        # Add extraction method to entities
+        entities = []
+        for entity in result.entities:
+            entity_copy = entity.copy()
+            entity_copy["method"] = ExtractionMethod.LLM_OLLAMA
+            entities.append(entity_copy)
+
+        logger.info(
+            "Preprocessing pipeline extraction completed",
+            extra={
+                "page_url": page_url,
+                "entities_count": len(entities),
+                "relationships_count": len(result.relationships),
+                "elapsed_seconds": round(elapsed, 2),
+                "original_length": result.original_length,
+                "preprocessed_length": result.preprocessed_length,
+                "num_chunks": result.num_chunks,
+                "preprocessing_method": result.preprocessing_method,
+                "chunking_method": result.chunking_method,
+                "merging_method": result.merging_method,
+                "entities_per_chunk": result.entities_per_chunk,
+            },
+        )
+        return entities
 
     def _extract_with_llm_legacy(
         self, text: str, tenant_id: str, page_url: str = ""
@@ -465,8 +810,8 @@ class ExtractionOrchestrator:
 
         try:
             service = get_ollama_extraction_service()
-            # Run async extraction in sync context
-            result = asyncio.run(service.extract(content=text, page_url=page_url))
+            # Run async extraction on the worker's persistent loop
+            result = run_async(service.extract(content=text, page_url=page_url))
 
             elapsed = time.time() - start_time
 
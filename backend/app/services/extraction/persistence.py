@@ -0,0 +1,180 @@
+"""
+Bulk persistence of extraction results.
+
+Writes all entities and relationships of a page with one multi-row INSERT
+per table instead of adding ORM objects one by one. Entity IDs are
+generated client-side, so relationship endpoints are resolved in memory
+without flushing or reading the entities back. The page status, the
+job's entity counter and the tenant's graph_statistics counts are updated
+in the same transaction.
+
+Example:
+    persisted = persist_page_extraction(db, page, tenant_id, extraction_result)
+    db.commit()
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert, text, update
+from sqlalchemy.orm import Session
+
+from app.models.extracted_entity import EntityRelationship, ExtractedEntity
+from app.models.scraped_page import ScrapedPage
+from app.models.scraping_job import ScrapingJob
+from app.services.extraction.orchestrator import ExtractionOrchestrator, ExtractionResult
+from app.services.graph_stats import stats_delta_sql
+
+logger = logging.getLogger(__name__)
+
+# Count deltas for the rows inserted above. Every row is new (plain INSERT
+# of client-generated IDs), so the inserted types are known without
+# reading them back.
+_ENTITY_STATS_SQL = text("""
+    WITH new_entities AS (
+        SELECT CAST(:tenant_id AS uuid) AS tenant_id, entity_type
+        FROM unnest(CAST(:types AS text[])) AS t(entity_type)
+    )
+""" + stats_delta_sql("new_entities", "entity"))
+
+_RELATIONSHIP_STATS_SQL = text("""
+    WITH new_relationships AS (
+        SELECT CAST(:tenant_id AS uuid) AS tenant_id, relationship_type
+        FROM unnest(CAST(:types AS text[])) AS t(relationship_type)
+    )
+""" + stats_delta_sql("new_relationships", "relationship"))
+
+
+@dataclass
+class PersistedExtraction:
+    """Outcome of persisting a page's extraction result.
+
+    Attributes:
+        entity_ids: Entity ID by normalized name
+        entity_count: Entities written
+        relationship_count: Relationships written
+        unresolved_relationships: Relationships skipped because an
+            endpoint is not among the page's entities
+    """
+
+    entity_ids: dict[str, UUID] = field(default_factory=dict)
+    entity_count: int = 0
+    relationship_count: int = 0
+    unresolved_relationships: int = 0
+
+
+def persist_page_extraction(
+    db: Session,
+    page: ScrapedPage,
+    tenant_id: UUID,
+    result: ExtractionResult,
+) -> PersistedExtraction:
+    """
+    Write a page's extraction result and mark the page as extracted.
+
+    Does not commit; the caller commits once so entities, relationships,
+    page status, job counter and graph statistics land atomically.
+
+    Args:
+        db: Sync database session
+        page: Page the result was extracted from
+        tenant_id: Tenant ID
+        result: Extraction result from ExtractionOrchestrator
+
+    Returns:
+        PersistedExtraction with counts and the name to ID mapping
+    """
+    normalize = ExtractionOrchestrator.normalize_name
+    now = datetime.now(UTC)
+    persisted = PersistedExtraction()
+
+    entity_rows = []
+    for entity_data in result.entities:
+        entity_id = uuid4()
+        normalized_name = normalize(entity_data["name"])
+        entity_rows.append(
+            {
+                "id": entity_id,
+                "tenant_id": tenant_id,
+                "source_page_id": page.id,
+                "entity_type": entity_data["type"],
+                "name": entity_data["name"],
+                "normalized_name": normalized_name,
+                "description": entity_data.get("description"),
+                "external_ids": {},
+                "properties": entity_data.get("properties", {}),
+                "extraction_method": entity_data["method"],
+                "confidence_score": entity_data.get("confidence", 1.0),
+                "source_text": entity_data.get("source_text"),
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+        # Later entities win, as with the previous per-object inserts
+        persisted.entity_ids[normalized_name] = entity_id
+
+    relationship_rows = []
+    for rel_data in result.relationships:
+        source_id = persisted.entity_ids.get(normalize(rel_data["source_name"]))
+        target_id = persisted.entity_ids.get(normalize(rel_data["target_name"]))
+        if not (source_id and target_id):
+            persisted.unresolved_relationships += 1
+            continue
+        relationship_rows.append(
+            {
+                "id": uuid4(),
+                "tenant_id": tenant_id,
+                "source_entity_id": source_id,
+                "target_entity_id": target_id,
+                "relationship_type": rel_data["relationship_type"].upper(),
+                "properties": rel_data.get("properties", {}),
+                "confidence_score": rel_data.get("confidence", 1.0),
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+
+    # executemany with a list of rows is batched into multi-row INSERTs
+    if entity_rows:
+        db.execute(insert(ExtractedEntity), entity_rows)
+        db.execute(
+            _ENTITY_STATS_SQL,
+            {"tenant_id": tenant_id, "types": [row["entity_type"] for row in entity_rows]},
+        )
+    if relationship_rows:
+        db.execute(insert(EntityRelationship), relationship_rows)
+        db.execute(
+            _RELATIONSHIP_STATS_SQL,
+            {
+                "tenant_id": tenant_id,
+                "types": [row["relationship_type"] for row in relationship_rows],
+            },
+        )
+
+    page.extraction_status = "completed"
+    page.extracted_at = now
+    page.updated_at = now
+
+    if entity_rows:
+        db.execute(
+            update(ScrapingJob)
+            .where(ScrapingJob.id == page.job_id)
+            .values(
+                entities_extracted=ScrapingJob.entities_extracted + len(entity_rows),
+                updated_at=now,
+            )
+        )
+
+    persisted.entity_count = len(entity_rows)
+    persisted.relationship_count = len(relationship_rows)
+    if persisted.unresolved_relationships:
+        logger.warning(
+            "Skipped relationships with unresolved endpoints",
+            extra={
+                "page_id": str(page.id),
+                "unresolved": persisted.unresolved_relationships,
+            },
+        )
+    return persisted
@@ -0,0 +1,309 @@
+"""
+Precomputed per-tenant knowledge graph statistics.
+
+This module maintains the graph_statistics read model so that graph
+statistics can be served in constant time instead of aggregating over all
+of a tenant's nodes and relationships on every request.
+
+Statistics are kept current in two ways:
+- Incrementally: projection handlers fold per-type count deltas into the
+  stats row in the same statement that writes the entity/relationship,
+  using the SQL built by ``stats_delta_sql``. Only rows that were actually
+  inserted (or demoted from canonical) contribute, so event replay is
+  idempotent.
+- Periodically: the ``reconcile_graph_statistics`` Celery beat task runs
+  ``RECONCILE_STATS_SQL`` per tenant, recomputing every count from the
+  source tables, correcting drift, and refreshing the degree histogram and
+  top hubs (which are not maintained per event).
+
+Example:
+    from app.services.graph_stats import GraphStatisticsService
+
+    service = GraphStatisticsService(session)
+    stats = await service.get_stats(tenant_id)
+    print(stats["total_entities"], stats["entity_counts"])
+"""
+
+import logging
+from typing import Any, Literal
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.graph_statistics import GraphStatistics
+
+logger = logging.getLogger(__name__)
+
+# Degree distribution buckets as (label, lower bound inclusive, upper bound exclusive)
+DEGREE_BUCKETS: tuple[tuple[str, int, int | None], ...] = (
+    ("0", 0, 1),
+    ("1", 1, 2),
+    ("2-4", 2, 5),
+    ("5-9", 5, 10),
+    ("10-49", 10, 50),
+    ("50-99", 50, 100),
+    ("100+", 100, None),
+)
+
+# Columns updated for each kind of count delta: (total column, counts column, type column)
+_DELTA_COLUMNS = {
+    "entity": ("total_entities", "entity_counts", "entity_type"),
+    "relationship": ("total_relationships", "relationship_counts", "relationship_type"),
+}
+
+
+def stats_delta_sql(source: str, kind: Literal["entity", "relationship"], sign: int = 1) -> str:
+    """Build a statement that folds rows from ``source`` into graph_statistics.
+
+    ``source`` must name a relation (usually a CTE) exposing ``tenant_id`` and
+    the type column for ``kind`` (``entity_type`` or ``relationship_type``).
+    Each row counts as one entity/relationship of that type. The returned SQL
+    is meant to be appended after a ``WITH`` clause so the stats update runs
+    in the same statement (and transaction) as the write it accounts for.
+
+    Additions upsert the tenant's stats row. Subtractions only update an
+    existing row; a missing row is left for the reconcile task to create.
+
+    Args:
+        source: Name of the relation providing the rows to count
+        kind: Which counters to update ("entity" or "relationship")
+        sign: 1 to add the rows, -1 to subtract them
+
+    Returns:
+        SQL string for the graph_statistics INSERT/UPDATE
+    """
+    total_column, counts_column, type_column = _DELTA_COLUMNS[kind]
+
+    deltas = f"""
+        SELECT tenant_id, sum(n)::bigint AS total, jsonb_object_agg({type_column}, n) AS counts
+        FROM (
+            SELECT tenant_id, {type_column}, count(*) AS n
+            FROM {source}
+            GROUP BY tenant_id, {type_column}
+        ) type_deltas
+        GROUP BY tenant_id
+    """
+
+    if sign == 1:
+        return f"""
+            INSERT INTO graph_statistics AS gs (
+                tenant_id, {total_column}, {counts_column}, created_at, updated_at
+            )
+            SELECT tenant_id, total, counts, NOW(), NOW()
+            FROM ({deltas}) deltas
+            ON CONFLICT (tenant_id) DO UPDATE SET
+                {total_column} = gs.{total_column} + EXCLUDED.{total_column},
+                {counts_column} = graph_stats_merge_counts(
+                    gs.{counts_column}, EXCLUDED.{counts_column}
+                ),
+                updated_at = NOW()
+        """
+
+    if sign == -1:
+        return f"""
+            UPDATE graph_statistics AS gs SET
+                {total_column} = GREATEST(gs.{total_column} - deltas.total, 0),
+                {counts_column} = graph_stats_merge_counts(
+                    gs.{counts_column},
+                    (SELECT jsonb_object_agg(key, -value::bigint)
+                     FROM jsonb_each_text(deltas.counts))
+                ),
+                updated_at = NOW()
+            FROM ({deltas}) deltas
+            WHERE gs.tenant_id = deltas.tenant_id
+        """
+
+    raise ValueError(f"sign must be 1 or -1, got {sign}")
+
+
+def _degree_bucket_case(column: str) -> str:
+    """Build a CASE expression mapping a degree column to its bucket label."""
+    branches = []
+    for label, _lower, upper in DEGREE_BUCKETS:
+        if upper is None:
+            branches.append(f"ELSE '{label}'")
+        else:
+            branches.append(f"WHEN {column} < {upper} THEN '{label}'")
+    return "CASE " + " ".join(branches) + " END"
+
+
+# Full recount of one tenant's statistics from the source tables.
+# Only canonical entities are counted; merged aliases are excluded.
+RECONCILE_STATS_SQL = f"""
+    WITH entity_type_counts AS (
+        SELECT entity_type, count(*) AS n
+        FROM extracted_entities
+        WHERE tenant_id = :tenant_id AND is_canonical
+        GROUP BY entity_type
+    ),
+    relationship_type_counts AS (
+        SELECT relationship_type, count(*) AS n
+        FROM entity_relationships
+        WHERE tenant_id = :tenant_id
+        GROUP BY relationship_type
+    ),
+    endpoint_degrees AS (
+        SELECT entity_id, count(*) AS degree
+        FROM (
+            SELECT source_entity_id AS entity_id
+            FROM entity_relationships WHERE tenant_id = :tenant_id
+            UNION ALL
+            SELECT target_entity_id
+            FROM entity_relationships WHERE tenant_id = :tenant_id
+        ) endpoints
+        GROUP BY entity_id
+    ),
+    entity_degrees AS (
+        SELECT e.id, e.name, e.entity_type, COALESCE(d.degree, 0) AS degree
+        FROM extracted_entities e
+        LEFT JOIN endpoint_degrees d ON d.entity_id = e.id
+        WHERE e.tenant_id = :tenant_id AND e.is_canonical
+    ),
+    degree_buckets AS (
+        SELECT {_degree_bucket_case("degree")} AS bucket, count(*) AS n
+        FROM entity_degrees
+        GROUP BY 1
+    ),
+    hubs AS (
+        SELECT id, name, entity_type, degree
+        FROM entity_degrees
+        WHERE degree > 0
+        ORDER BY degree DESC, name
+        LIMIT :top_hubs
+    )
+    INSERT INTO graph_statistics AS gs (
+        tenant_id,
+        total_entities,
+        total_relationships,
+        entity_counts,
+        relationship_counts,
+        degree_histogram,
+        top_hubs,
+        reconciled_at,
+        created_at,
+        updated_at
+    )
+    SELECT
+        CAST(:tenant_id AS uuid),
+        (SELECT COALESCE(sum(n), 0) FROM entity_type_counts)::bigint,
+        (SELECT COALESCE(sum(n), 0) FROM relationship_type_counts)::bigint,
+        (SELECT COALESCE(jsonb_object_agg(entity_type, n), '{{}}'::jsonb)
+            FROM entity_type_counts),
+        (SELECT COALESCE(jsonb_object_agg(relationship_type, n), '{{}}'::jsonb)
+            FROM relationship_type_counts),
+        (SELECT COALESCE(jsonb_object_agg(bucket, n), '{{}}'::jsonb)
+            FROM degree_buckets),
+        (SELECT COALESCE(
+            jsonb_agg(
+                jsonb_build_object(
+                    'id', id, 'name', name, 'entity_type', entity_type, 'degree', degree
+                )
+                ORDER BY degree DESC, name
+            ),
+            '[]'::jsonb
+        ) FROM hubs),
+        NOW(),
+        NOW(),
+        NOW()
+    ON CONFLICT (tenant_id) DO UPDATE SET
+        total_entities = EXCLUDED.total_entities,
+        total_relationships = EXCLUDED.total_relationships,
+        entity_counts = EXCLUDED.entity_counts,
+        relationship_counts = EXCLUDED.relationship_counts,
+        degree_histogram = EXCLUDED.degree_histogram,
+        top_hubs = EXCLUDED.top_hubs,
+        reconciled_at = EXCLUDED.reconciled_at,
+        updated_at = NOW()
+"""
+
+
+def empty_stats() -> dict[str, Any]:
+    """Return the statistics payload for a tenant with no stats row yet."""
+    return {
+        "total_entities": 0,
+        "total_relationships": 0,
+        "entity_counts": {},
+        "relationship_counts": {},
+        "degree_histogram": {label: 0 for label, _, _ in DEGREE_BUCKETS},
+        "top_hubs": [],
+        "reconciled_at": None,
+        "updated_at": None,
+    }
+
+
+class GraphStatisticsService:
+    """
+    Read access to precomputed graph statistics.
+
+    Serves the graph_statistics row for a tenant with a single primary key
+    lookup, regardless of how large the tenant's graph is.
+
+    Attributes:
+        _session: AsyncSession for database operations
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize the graph statistics service.
+
+        Args:
+            session: SQLAlchemy async session for database operations
+        """
+        self._session = session
+
+    async def get_stats(self, tenant_id: UUID) -> dict[str, Any]:
+        """
+        Get precomputed statistics for a tenant's knowledge graph.
+
+        Args:
+            tenant_id: UUID of the tenant
+
+        Returns:
+            Dictionary containing:
+            - total_entities: Number of canonical entities
+            - total_relationships: Number of relationships
+            - entity_counts: Dict mapping entity type to count
+            - relationship_counts: Dict mapping relationship type to count
+            - degree_histogram: Dict mapping degree bucket label to entity count
+            - top_hubs: List of highest-degree entities
+            - reconciled_at: When stats were last fully recomputed (or None)
+            - updated_at: When stats were last updated (or None)
+            Returns zeroed statistics if no row exists for the tenant yet.
+        """
+        result = await self._session.execute(
+            select(GraphStatistics).where(GraphStatistics.tenant_id == tenant_id)
+        )
+        row = result.scalar_one_or_none()
+
+        if row is None:
+            logger.debug(f"No graph statistics yet for tenant {tenant_id}")
+            return empty_stats()
+
+        # Fill in empty buckets so clients always see the full distribution
+        degree_histogram = {label: 0 for label, _, _ in DEGREE_BUCKETS}
+        degree_histogram.update(row.degree_histogram or {})
+
+        return {
+            "total_entities": row.total_entities,
+            "total_relationships": row.total_relationships,
+            "entity_counts": dict(row.entity_counts or {}),
+            "relationship_counts": dict(row.relationship_counts or {}),
+            "degree_histogram": degree_histogram,
+            "top_hubs": list(row.top_hubs or []),
+            "reconciled_at": row.reconciled_at,
+            "updated_at": row.updated_at,
+        }
+
+
+async def get_graph_statistics_service(session: AsyncSession) -> GraphStatisticsService:
+    """
+    Factory function to create a GraphStatisticsService instance.
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        Configured GraphStatisticsService instance
+    """
+    return GraphStatisticsService(session)
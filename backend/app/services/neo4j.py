@@ -3,19 +3,33 @@ Neo4j service layer for knowledge graph operations.
 
 This module provides an async interface to Neo4j for storing
 and querying extracted entities and relationships.
+
+Driver configuration (pool size, acquisition timeout, fetch size, retry
+budget) and pool metrics come from the shared connection layer in
+app.core.neo4j. Writes run as managed transactions, which the driver
+retries on transient errors.
 """
 
 import logging
+from collections.abc import Awaitable, Callable, Sequence
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Optional
+from typing import Any, AsyncIterator, Optional, TypeVar
 from uuid import UUID
 
-from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession
+from neo4j import AsyncDriver, AsyncManagedTransaction, AsyncSession
 
 from app.core.config import settings
+from app.core.neo4j import (
+    Statement,
+    async_session,
+    create_async_driver,
+    run_statements_async,
+)
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class Neo4jService:
     """Async service for Neo4j graph database operations.
@@ -67,18 +81,16 @@ class Neo4jService:
     async def connect(self) -> None:
         """Establish connection to Neo4j.
 
-        Creates an async driver with connection pooling configured
-        according to application settings.
+        Creates an async driver with the shared connection pool
+        configuration from app.core.neo4j.
         """
         if self._driver is not None:
             logger.warning("Neo4j driver already connected")
             return
 
-        self._driver = AsyncGraphDatabase.driver(
+        self._driver = create_async_driver(
             self._uri,
             auth=(self._user, self._password),
-            max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
-            connection_timeout=settings.NEO4J_CONNECTION_TIMEOUT,
         )
 
         # Verify connectivity
@@ -96,20 +108,84 @@ class Neo4jService:
     async def session(self) -> AsyncIterator[AsyncSession]:
         """Get a Neo4j session.
 
+        The session holds a tracked connection pool slot for its lifetime,
+        so keep it open across related statements rather than opening one
+        per statement.
+
         Yields:
             AsyncSession: Neo4j async session
 
         Raises:
             RuntimeError: If driver not connected
+            TimeoutError: If no connection frees up within the acquisition timeout
         """
         if self._driver is None:
             raise RuntimeError("Neo4j driver not connected. Call connect() first.")
 
-        session = self._driver.session(database=self._database)
-        try:
+        async with async_session(self._driver, self._database) as session:
             yield session
-        finally:
-            await session.close()
+
+    async def execute_write(
+        self,
+        work: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run a unit of work in a managed write transaction.
+
+        The driver retries the whole unit of work on transient errors
+        (deadlocks, leader changes) within NEO4J_MAX_TRANSACTION_RETRY_TIME,
+        so work must be idempotent and must consume its results inside
+        the function.
+
+        Args:
+            work: Async function taking an AsyncManagedTransaction first
+            *args: Extra positional arguments for work
+            **kwargs: Extra keyword arguments for work
+
+        Returns:
+            Return value of work
+        """
+        async with self.session() as session:
+            return await session.execute_write(work, *args, **kwargs)
+
+    async def execute_read(
+        self,
+        work: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run a unit of work in a managed read transaction (with retry).
+
+        Args:
+            work: Async function taking an AsyncManagedTransaction first
+            *args: Extra positional arguments for work
+            **kwargs: Extra keyword arguments for work
+
+        Returns:
+            Return value of work
+        """
+        async with self.session() as session:
+            return await session.execute_read(work, *args, **kwargs)
+
+    async def run_in_transaction(
+        self,
+        statements: Sequence[Statement],
+    ) -> list[list[dict[str, Any]]]:
+        """Run several write statements in one managed transaction.
+
+        All statements commit together or not at all, and the batch is
+        retried as a whole on transient errors.
+
+        Args:
+            statements: (cypher, parameters) pairs, run in order
+
+        Returns:
+            Records of each statement as lists of dicts
+        """
+        if not statements:
+            return []
+        return await self.execute_write(run_statements_async, statements)
 
     async def health_check(self) -> dict[str, Any]:
         """Check Neo4j connectivity and return status.
@@ -181,8 +257,8 @@ class Neo4jService:
         RETURN elementId(e) as node_id
         """
 
-        async with self.session() as session:
-            result = await session.run(
+        async def work(tx: AsyncManagedTransaction) -> str:
+            result = await tx.run(
                 query,
                 id=str(entity_id),
                 tenant_id=str(tenant_id),
@@ -194,6 +270,48 @@ class Neo4jService:
             record = await result.single()
             return record["node_id"]
 
+        return await self.execute_write(work)
+
+    async def create_entity_nodes(
+        self,
+        tenant_id: UUID,
+        entities: list[dict[str, Any]],
+    ) -> dict[str, str]:
+        """Create or merge many entity nodes in one transaction.
+
+        Same MERGE semantics as create_entity_node(), with one round trip
+        for the whole list.
+
+        Args:
+            tenant_id: Tenant for isolation
+            entities: Dicts with id, type, name, properties and description
+
+        Returns:
+            Neo4j element ID by entity ID (as string)
+        """
+        query = """
+        UNWIND $entities AS entity
+        MERGE (e:Entity {id: entity.id})
+        SET e.tenant_id = $tenant_id,
+            e.type = entity.type,
+            e.name = entity.name,
+            e.description = entity.description,
+            e.properties = entity.properties,
+            e.updated_at = datetime()
+        ON CREATE SET e.created_at = datetime()
+        RETURN entity.id AS entity_id, elementId(e) AS node_id
+        """
+
+        async def work(tx: AsyncManagedTransaction) -> dict[str, str]:
+            result = await tx.run(
+                query,
+                tenant_id=str(tenant_id),
+                entities=[{**entity, "id": str(entity["id"])} for entity in entities],
+            )
+            return {record["entity_id"]: record["node_id"] async for record in result}
+
+        return await self.execute_write(work)
+
     async def get_entity_node(
         self,
         entity_id: UUID,
@@ -242,8 +360,8 @@ class Neo4jService:
         RETURN count(e) as deleted
         """
 
-        async with self.session() as session:
-            result = await session.run(
+        async def work(tx: AsyncManagedTransaction) -> bool:
+            result = await tx.run(
                 query,
                 id=str(entity_id),
                 tenant_id=str(tenant_id),
@@ -251,6 +369,40 @@ class Neo4jService:
             record = await result.single()
             return record["deleted"] > 0
 
+        return await self.execute_write(work)
+
+    async def delete_entity_nodes(
+        self,
+        tenant_id: UUID,
+        entity_ids: list[UUID],
+    ) -> int:
+        """Delete many entity nodes and their relationships in one transaction.
+
+        Args:
+            tenant_id: Tenant for isolation
+            entity_ids: Entity identifiers
+
+        Returns:
+            Number of nodes deleted
+        """
+        query = """
+        MATCH (e:Entity {tenant_id: $tenant_id})
+        WHERE e.id IN $ids
+        DETACH DELETE e
+        RETURN count(e) as deleted
+        """
+
+        async def work(tx: AsyncManagedTransaction) -> int:
+            result = await tx.run(
+                query,
+                ids=[str(entity_id) for entity_id in entity_ids],
+                tenant_id=str(tenant_id),
+            )
+            record = await result.single()
+            return record["deleted"]
+
+        return await self.execute_write(work)
+
     # =========================================================================
     # Relationship Operations
     # =========================================================================
@@ -279,32 +431,43 @@ class Neo4jService:
         Returns:
             Neo4j element ID of relationship, or None if entities not found
         """
-        # Normalize relationship type to Neo4j convention (uppercase, underscores)
-        rel_type = relationship_type.upper().replace("-", "_")
-
-        query = f"""
-        MATCH (s:Entity {{id: $source_id, tenant_id: $tenant_id}})
-        MATCH (t:Entity {{id: $target_id, tenant_id: $tenant_id}})
-        MERGE (s)-[r:{rel_type} {{id: $rel_id}}]->(t)
-        SET r.confidence = $confidence,
-            r.properties = $properties,
-            r.updated_at = datetime()
-        ON CREATE SET r.created_at = datetime()
-        RETURN elementId(r) as rel_id
-        """
-
-        async with self.session() as session:
-            result = await session.run(
-                query,
-                source_id=str(source_entity_id),
-                target_id=str(target_entity_id),
-                tenant_id=str(tenant_id),
-                rel_id=str(relationship_id),
-                confidence=confidence_score,
+        (records,) = await self.run_in_transaction([
+            _relationship_statement(
+                relationship_id=relationship_id,
+                tenant_id=tenant_id,
+                source_entity_id=source_entity_id,
+                target_entity_id=target_entity_id,
+                relationship_type=relationship_type,
                 properties=properties,
+                confidence_score=confidence_score,
             )
-            record = await result.single()
-            return record["rel_id"] if record else None
+        ])
+        return records[0]["rel_id"] if records else None
+
+    async def create_relationships(
+        self,
+        tenant_id: UUID,
+        relationships: Sequence[dict[str, Any]],
+    ) -> list[Optional[str]]:
+        """Create many relationships in one transaction.
+
+        Same MERGE semantics as create_relationship(); either all
+        relationships are written or none.
+
+        Args:
+            tenant_id: Tenant for isolation
+            relationships: Dicts with the keyword arguments of
+                create_relationship() (without tenant_id)
+
+        Returns:
+            Neo4j element ID per relationship, in order (None where an
+            entity was not found)
+        """
+        results = await self.run_in_transaction([
+            _relationship_statement(tenant_id=tenant_id, **relationship)
+            for relationship in relationships
+        ])
+        return [records[0]["rel_id"] if records else None for records in results]
 
     async def get_entity_relationships(
         self,
@@ -390,11 +553,49 @@ class Neo4jService:
         RETURN count(e) as deleted
         """
 
-        async with self.session() as session:
-            result = await session.run(query, tenant_id=str(tenant_id))
+        async def work(tx: AsyncManagedTransaction) -> int:
+            result = await tx.run(query, tenant_id=str(tenant_id))
             record = await result.single()
             return record["deleted"]
 
+        return await self.execute_write(work)
+
+
+def _relationship_statement(
+    relationship_id: UUID,
+    tenant_id: UUID,
+    source_entity_id: UUID,
+    target_entity_id: UUID,
+    relationship_type: str,
+    properties: dict[str, Any],
+    confidence_score: float = 1.0,
+) -> Statement:
+    """Build the MERGE statement for a relationship between two entities."""
+    # Normalize relationship type to Neo4j convention (uppercase, underscores)
+    rel_type = relationship_type.upper().replace("-", "_")
+
+    query = f"""
+    MATCH (s:Entity {{id: $source_id, tenant_id: $tenant_id}})
+    MATCH (t:Entity {{id: $target_id, tenant_id: $tenant_id}})
+    MERGE (s)-[r:{rel_type} {{id: $rel_id}}]->(t)
+    SET r.confidence = $confidence,
+        r.properties = $properties,
+        r.updated_at = datetime()
+    ON CREATE SET r.created_at = datetime()
+    RETURN elementId(r) as rel_id
+    """
+    return (
+        query,
+        {
+            "source_id": str(source_entity_id),
+            "target_id": str(target_entity_id),
+            "tenant_id": str(tenant_id),
+            "rel_id": str(relationship_id),
+            "confidence": confidence_score,
+            "properties": properties,
+        },
+    )
+
 
 # =========================================================================
 # Global Service Instance
@@ -39,6 +39,10 @@ from app.services.neo4j import Neo4jService, get_neo4j_service
 
 logger = logging.getLogger(__name__)
 
+# Shared neighbors with more relationships than this are not expanded when
+# finding similar entities (hub nodes carry little similarity signal)
+DEFAULT_MAX_SHARED_DEGREE = 500
+
 
 class GraphQueryService:
     """Utilities for querying the knowledge graph.
@@ -217,16 +221,22 @@ class GraphQueryService:
         entity_id: UUID,
         tenant_id: UUID,
         limit: int = 10,
+        max_shared_degree: int = DEFAULT_MAX_SHARED_DEGREE,
     ) -> list[dict[str, Any]]:
         """Find entities similar based on shared connections.
 
         Identifies entities that share the most connections with the
         specified entity, ranked by the number of shared relationships.
 
+        Shared neighbors with more than max_shared_degree relationships
+        (hubs) are skipped: they connect to almost everything, so they add
+        little signal while making the expansion cost grow with hub size.
+
         Args:
             entity_id: UUID of the entity to find similarities for
             tenant_id: UUID of the tenant for isolation
             limit: Maximum number of similar entities to return (default 10)
+            max_shared_degree: Maximum degree of a shared neighbor to expand
 
         Returns:
             List of entity dicts, each containing:
@@ -244,6 +254,8 @@ class GraphQueryService:
         query = """
         MATCH (e:Entity {id: $entity_id, tenant_id: $tenant_id})-[r]-(shared:Entity)
         WHERE shared.tenant_id = $tenant_id
+        WITH DISTINCT e, shared
+        WHERE COUNT { (shared)--() } <= $max_shared_degree
         MATCH (similar:Entity {tenant_id: $tenant_id})-[r2]-(shared)
         WHERE similar.id <> e.id
         WITH similar, count(DISTINCT shared) as shared_count
@@ -254,7 +266,8 @@ class GraphQueryService:
 
         logger.debug(
             f"Finding entities similar to {entity_id} "
-            f"(limit={limit}) for tenant {tenant_id}"
+            f"(limit={limit}, max_shared_degree={max_shared_degree}) "
+            f"for tenant {tenant_id}"
         )
 
         async with self._service.session() as session:
@@ -263,6 +276,7 @@ class GraphQueryService:
                 entity_id=str(entity_id),
                 tenant_id=str(tenant_id),
                 limit=limit,
+                max_shared_degree=max_shared_degree,
             )
             return [dict(record["similar"]) async for record in result]
 
@@ -272,6 +286,9 @@ class GraphQueryService:
         Computes aggregate statistics about the tenant's knowledge graph
         including total entity count and breakdown by entity type.
 
+        This aggregates over the whole graph on every call. For dashboards,
+        prefer the precomputed statistics served by GraphStatisticsService.
+
         Args:
             tenant_id: UUID of the tenant
 
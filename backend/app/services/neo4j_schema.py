@@ -78,6 +78,16 @@ INDEXES = {
     """,
 }
 
+# Full-text index definitions (Lucene-backed, queried via db.index.fulltext.queryNodes)
+# tenant_id is indexed alongside name so searches are scoped to a tenant
+# inside the index query rather than filtered afterwards.
+FULLTEXT_INDEXES = {
+    "entity_name_fulltext": """
+        CREATE FULLTEXT INDEX entity_name_fulltext IF NOT EXISTS
+        FOR (e:Entity) ON EACH [e.name, e.tenant_id]
+    """,
+}
+
 
 # =============================================================================
 # Schema Setup Functions
@@ -90,6 +100,7 @@ async def setup_neo4j_schema(service: Neo4jService | None = None) -> dict[str, A
     Creates:
     - Uniqueness constraint on Entity.id
     - Indexes for common query patterns (tenant_id, type, name, composite)
+    - Full-text index on Entity.name for ranked search
 
     Args:
         service: Optional Neo4jService instance. If not provided, gets the
@@ -133,7 +144,7 @@ async def setup_neo4j_schema(service: Neo4jService | None = None) -> dict[str, A
         # =====================================================================
         logger.info("Setting up Neo4j indexes...")
 
-        for index_name, index_query in INDEXES.items():
+        for index_name, index_query in {**INDEXES, **FULLTEXT_INDEXES}.items():
             try:
                 await session.run(index_query)
                 indexes_created.append(index_name)
@@ -202,7 +213,7 @@ async def verify_schema(service: Neo4jService | None = None) -> dict[str, Any]:
 
     # Calculate expected vs actual
     expected_constraints = list(CONSTRAINTS.keys())
-    expected_indexes = list(INDEXES.keys())
+    expected_indexes = list(INDEXES.keys()) + list(FULLTEXT_INDEXES.keys())
 
     missing_constraints = [c for c in expected_constraints if c not in constraints]
     missing_indexes = [i for i in expected_indexes if i not in indexes]
@@ -252,7 +263,7 @@ async def drop_schema(service: Neo4jService | None = None) -> dict[str, Any]:
         # =====================================================================
         logger.info("Dropping Neo4j indexes...")
 
-        for index_name in INDEXES.keys():
+        for index_name in [*INDEXES.keys(), *FULLTEXT_INDEXES.keys()]:
             try:
                 await session.run(f"DROP INDEX {index_name} IF EXISTS")
                 indexes_dropped.append(index_name)
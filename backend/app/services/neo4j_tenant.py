@@ -175,35 +175,52 @@ class TenantScopedNeo4jService:
         query_text: str,
         entity_type: str | None = None,
         limit: int = 10,
+        mode: str = "fuzzy",
     ) -> list[dict[str, Any]]:
         """Search entities within tenant scope.
 
-        Performs a case-insensitive search on entity names within the
-        tenant's data. Optionally filters by entity type.
+        Performs a ranked, case-insensitive search on entity names using the
+        entity full-text index. The tenant restriction is part of the index
+        query, so latency does not grow with the size of other tenants' data.
+        Exact name matches rank first, followed by Lucene relevance score.
 
         Args:
             query_text: Text to search for in entity names
             entity_type: Optional type filter (e.g., "FUNCTION", "CLASS")
             limit: Maximum number of results to return (default 10)
+            mode: "fuzzy" for typo-tolerant matching, "prefix" for typeahead
+                  (see app.services.entity_search.SearchMode)
 
         Returns:
-            List of matching entity dicts ordered by name
+            List of matching entity dicts (with search_score) ordered by relevance
         """
+        from app.services.entity_search import (
+            ENTITY_FULLTEXT_INDEX,
+            SearchMode,
+            build_fulltext_query,
+        )
+
+        mode = SearchMode(mode)
+        search_query = build_fulltext_query(query_text, str(self._tenant_id), mode)
+        if search_query is None:
+            return []
+
         type_filter = "AND e.type = $entity_type" if entity_type else ""
 
         query = f"""
-        MATCH (e:Entity)
+        CALL db.index.fulltext.queryNodes('{ENTITY_FULLTEXT_INDEX}', $search_query)
+        YIELD node AS e, score
         WHERE e.tenant_id = $tenant_id
-        AND toLower(e.name) CONTAINS toLower($query_text)
         {type_filter}
-        RETURN e {{.*, node_id: elementId(e)}} as entity
-        ORDER BY e.name
+        RETURN e {{.*, node_id: elementId(e), search_score: score}} as entity
+        ORDER BY toLower(e.name) = toLower($query_text) DESC, score DESC, e.name
         LIMIT $limit
         """
 
         params: dict[str, Any] = {
             "tenant_id": str(self._tenant_id),
             "query_text": query_text,
+            "search_query": search_query,
             "limit": limit,
         }
         if entity_type:
@@ -211,7 +228,7 @@ class TenantScopedNeo4jService:
 
         logger.debug(
             f"Searching entities with query '{query_text}' "
-            f"(type={entity_type}, limit={limit}) "
+            f"(type={entity_type}, mode={mode.value}, limit={limit}) "
             f"for tenant {self._tenant_id}"
         )
 
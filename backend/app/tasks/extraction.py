@@ -14,21 +14,30 @@ Tasks handle:
 
 import logging
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from celery import shared_task
+from celery.exceptions import Retry
 from sqlalchemy import func, select
 
 from app.eventsourcing.events.scraping import (
     EntitiesExtractedBatch,
     ExtractionFailed,
 )
-from app.models.extracted_entity import EntityRelationship, ExtractedEntity
 from app.models.scraped_page import ScrapedPage
 from app.models.scraping_job import JobStage, ScrapingJob
-from app.services.extraction import ExtractionOrchestrator
+from app.services.extraction import (
+    ExtractionOrchestrator,
+    ExtractionResult,
+    PageExtractionRequest,
+    persist_page_extraction,
+)
 from app.worker.context import TenantWorkerContext
 
+if TYPE_CHECKING:
+    from app.extraction.scheduler import ScheduledJob
+
 logger = logging.getLogger(__name__)
 
 # Shared orchestrator instance (stateless)
@@ -42,23 +51,94 @@ _orchestrator = ExtractionOrchestrator()
     default_retry_delay=30,
     acks_late=True,
 )
-def extract_entities(self, page_id: str, tenant_id: str) -> dict:
+def extract_entities(
+    self,
+    page_id: str,
+    tenant_id: str,
+    lease_id: str | None = None,
+) -> dict:
     """
     Extract entities from a single scraped page.
 
     This task:
     1. Loads page content from the database
     2. Delegates extraction to ExtractionOrchestrator
-    3. Stores extracted entities and relationships
+    3. Stores extracted entities and relationships in bulk, together
+       with the page status and job entity count
     4. Emits domain events
 
+    Pages queued with the extraction scheduler are started by
+    drain_extraction_queue with the lease of their job. The scheduler
+    already took the tenant's rate limit token. The lease is restarted
+    when the task begins, renewed while it runs and checked again before
+    the results are stored; it is released once the page is done (kept
+    across retries). A page already being extracted under another live
+    lease is skipped, and a run whose lease expired stops without storing
+    anything, since the scheduler has requeued its job.
+
     Args:
         page_id: UUID of the scraped page
         tenant_id: UUID of the tenant
+        lease_id: Scheduler lease of the page's job, if it was scheduled
 
     Returns:
         dict: Extraction summary
     """
+    if lease_id is None:
+        return _extract_page(self, page_id, tenant_id)
+
+    from app.extraction.scheduler import LeaseState, get_extraction_scheduler
+    from app.worker.runtime import get_async_runtime, run_async
+
+    scheduler = get_extraction_scheduler()
+    state = run_async(scheduler.hold_lease(lease_id, page_id))
+    if state == LeaseState.LOST:
+        logger.warning(
+            "Extraction lease expired before the task started",
+            extra={"page_id": page_id, "lease_id": lease_id},
+        )
+        return {"status": "skipped", "message": "Lease expired"}
+    if state == LeaseState.PAGE_BUSY:
+        logger.info(f"Page already being extracted: {page_id}")
+        _release_scheduler_lease(lease_id)
+        return {"status": "skipped", "message": "Already processing"}
+
+    release = True
+    heartbeat = get_async_runtime().submit(scheduler.keep_lease(lease_id, page_id))
+    try:
+        return _extract_page(self, page_id, tenant_id, lease_id=lease_id)
+    except Retry:
+        release = False
+        raise
+    except _LeaseLost:
+        logger.warning(
+            "Extraction lease expired while running, results discarded",
+            extra={"page_id": page_id, "lease_id": lease_id},
+        )
+        release = False
+        return {"status": "skipped", "message": "Lease expired"}
+    finally:
+        heartbeat.cancel()
+        if release:
+            _release_scheduler_lease(lease_id, page_id)
+
+
+class _LeaseLost(Exception):
+    """The scheduler lease of a running page expired; its job was requeued."""
+
+
+def _check_scheduler_lease(lease_id: str, page_id: str) -> None:
+    """Renew a page's lease before storing results, or raise _LeaseLost."""
+    from app.extraction.scheduler import LeaseState, get_extraction_scheduler
+    from app.worker.runtime import run_async
+
+    state = run_async(get_extraction_scheduler().hold_lease(lease_id, page_id))
+    if state != LeaseState.HELD:
+        raise _LeaseLost(lease_id)
+
+
+def _extract_page(task, page_id: str, tenant_id: str, lease_id: str | None = None) -> dict:
+    """Run extract_entities for one page (see there)."""
     logger.info(
         "Starting entity extraction",
         extra={"page_id": page_id, "tenant_id": tenant_id},
@@ -102,77 +182,27 @@ def extract_entities(self, page_id: str, tenant_id: str) -> dict:
                 tenant_id=tenant_id,
                 extraction_provider=job.extraction_provider if job else None,
                 use_llm_extraction=job.use_llm_extraction if job else False,
+                skip_rate_limit=lease_id is not None,
             )
 
-            # Save entities and build name->id mapping for relationships
-            entity_name_to_id: dict[str, UUID] = {}
-            for entity_data in extraction_result.entities:
-                entity = ExtractedEntity(
-                    tenant_id=UUID(tenant_id),
-                    source_page_id=page.id,
-                    entity_type=entity_data["type"],
-                    name=entity_data["name"],
-                    normalized_name=_orchestrator.normalize_name(entity_data["name"]),
-                    description=entity_data.get("description"),
-                    properties=entity_data.get("properties", {}),
-                    extraction_method=entity_data["method"],
-                    confidence_score=entity_data.get("confidence", 1.0),
-                    source_text=entity_data.get("source_text"),
-                )
-                ctx.db.add(entity)
-                # Track entity name to ID for relationship resolution
-                entity_name_to_id[
-                    _orchestrator.normalize_name(entity_data["name"])
-                ] = entity.id
-
-            # Flush to ensure entities have IDs before creating relationships
-            ctx.db.flush()
-
-            # Save relationships
-            relationship_count = 0
-            for rel_data in extraction_result.relationships:
-                source_name = _orchestrator.normalize_name(rel_data["source_name"])
-                target_name = _orchestrator.normalize_name(rel_data["target_name"])
-
-                source_id = entity_name_to_id.get(source_name)
-                target_id = entity_name_to_id.get(target_name)
-
-                if source_id and target_id:
-                    relationship = EntityRelationship(
-                        tenant_id=UUID(tenant_id),
-                        source_entity_id=source_id,
-                        target_entity_id=target_id,
-                        relationship_type=rel_data["relationship_type"].upper(),
-                        properties=rel_data.get("properties", {}),
-                        confidence_score=rel_data.get("confidence", 1.0),
-                    )
-                    ctx.db.add(relationship)
-                    relationship_count += 1
-                else:
-                    logger.warning(
-                        f"Could not resolve relationship: "
-                        f"{rel_data['source_name']} -> {rel_data['target_name']}"
-                    )
-
-            # Update page status
-            page.extraction_status = "completed"
-            page.extracted_at = datetime.now(UTC)
-            page.updated_at = datetime.now(UTC)
-            ctx.db.commit()
+            if lease_id is not None:
+                _check_scheduler_lease(lease_id, page_id)
 
-            # Update job entity count
-            _update_job_entity_count(
-                ctx.db, page.job_id, extraction_result.total_entities
+            # Save entities and relationships in bulk, and mark the page
+            # and job in the same transaction as the batch event
+            persisted = persist_page_extraction(
+                ctx.db, page, UUID(tenant_id), extraction_result
             )
-
-            # Emit batch event
+            relationship_count = persisted.relationship_count
             _emit_batch_extracted_event(
+                ctx,
                 page,
                 tenant_id,
                 extraction_result.total_entities,
                 extraction_result.schema_org_count,
                 extraction_result.llm_count,
             )
+            ctx.db.commit()
 
             logger.info(
                 "Entity extraction completed",
@@ -194,55 +224,69 @@ def extract_entities(self, page_id: str, tenant_id: str) -> dict:
                 "llm_count": extraction_result.llm_count,
             }
 
+        except _LeaseLost:
+            raise
         except Exception as e:
             logger.exception(
                 "Entity extraction failed",
                 extra={"page_id": page_id, "error": str(e)},
             )
 
-            # Update page status
+            # Update page status and emit failed event
             page.extraction_status = "failed"
             page.extraction_error = str(e)
             page.updated_at = datetime.now(UTC)
+            _emit_extraction_failed_event(ctx, page, tenant_id, e)
             ctx.db.commit()
 
-            # Emit failed event
-            _emit_extraction_failed_event(page, tenant_id, e)
-
             # Retry if appropriate
-            if self.request.retries < self.max_retries:
-                raise self.retry(exc=e) from e
+            if task.request.retries < task.max_retries:
+                raise task.retry(exc=e) from e
 
             return {"status": "failed", "error": str(e)}
 
 
-def _update_job_entity_count(db, job_id: UUID, count: int) -> None:
-    """Update job's entity count."""
-    from sqlalchemy import update
+def _release_scheduler_lease(lease_id: str, page_id: str | None = None) -> None:
+    """Return a scheduled page's concurrency slot to the extraction scheduler."""
+    from app.extraction.scheduler import get_extraction_scheduler
+    from app.worker.runtime import run_async
+
+    try:
+        run_async(get_extraction_scheduler().release_lease(lease_id, page_id))
+    except Exception as e:
+        # The lease expires on its own; the job is then requeued
+        logger.warning(f"Failed to release extraction lease {lease_id}: {e}")
+
+
+def _dispatch_scheduled_pages(jobs: list["ScheduledJob"]) -> None:
+    """Start the extraction of page jobs of one tenant dispatched by the scheduler.
 
-    db.execute(
-        update(ScrapingJob)
-        .where(ScrapingJob.id == job_id)
-        .values(
-            entities_extracted=ScrapingJob.entities_extracted + count,
-            updated_at=datetime.now(UTC),
+    A single page runs as extract_entities, several as one
+    extract_entities_batch task.
+    """
+    tenant_id = str(jobs[0].tenant_id)
+    if len(jobs) == 1:
+        extract_entities.apply_async(
+            args=(jobs[0].payload["page_id"], tenant_id),
+            kwargs={"lease_id": jobs[0].lease_id},
         )
+        return
+    extract_entities_batch.apply_async(
+        args=([job.payload["page_id"] for job in jobs], tenant_id),
+        kwargs={"lease_ids": [job.lease_id for job in jobs]},
     )
-    db.commit()
 
 
 def _emit_batch_extracted_event(
+    ctx: TenantWorkerContext,
     page: ScrapedPage,
     tenant_id: str,
     total: int,
     schema_org: int,
     llm: int,
 ) -> None:
-    """Emit EntitiesExtractedBatch event."""
+    """Add an EntitiesExtractedBatch event to the task's event batch (ctx.events)."""
     try:
-        from app.eventsourcing.stores.factory import get_event_store_sync
-
-        event_store = get_event_store_sync()
         event = EntitiesExtractedBatch(
             aggregate_id=str(page.id),
             tenant_id=tenant_id,
@@ -253,21 +297,19 @@ def _emit_batch_extracted_event(
             llm_extracted_count=llm,
             extracted_at=datetime.now(UTC),
         )
-        event_store.append_sync(event)
+        ctx.events.add(event)
     except Exception as e:
         logger.warning(f"Failed to emit EntitiesExtractedBatch event: {e}")
 
 
 def _emit_extraction_failed_event(
+    ctx: TenantWorkerContext,
     page: ScrapedPage,
     tenant_id: str,
     error: Exception,
 ) -> None:
-    """Emit ExtractionFailed event."""
+    """Add an ExtractionFailed event to the task's event batch (ctx.events)."""
     try:
-        from app.eventsourcing.stores.factory import get_event_store_sync
-
-        event_store = get_event_store_sync()
         event = ExtractionFailed(
             aggregate_id=str(page.id),
             tenant_id=tenant_id,
@@ -276,7 +318,7 @@ def _emit_extraction_failed_event(
             error_message=str(error),
             failed_at=datetime.now(UTC),
         )
-        event_store.append_sync(event)
+        ctx.events.add(event)
     except Exception as e:
         logger.warning(f"Failed to emit ExtractionFailed event: {e}")
 
@@ -285,16 +327,37 @@ def _emit_extraction_failed_event(
     name="app.tasks.extraction.extract_entities_batch",
     acks_late=True,
 )
-def extract_entities_batch(page_ids: list[str], tenant_id: str) -> dict:
+def extract_entities_batch(
+    page_ids: list[str],
+    tenant_id: str,
+    lease_ids: list[str] | None = None,
+) -> dict:
     """
-    Extract entities from multiple pages in batch.
+    Extract entities from multiple pages in one task.
+
+    This task:
+    1. Loads all pages and their jobs with one query each
+    2. Extracts the pages concurrently via ExtractionOrchestrator
+    3. Stores each page's results in bulk inside its own savepoint, so a
+       page that fails to persist is marked failed without losing the
+       others, and commits once together with the domain events of
+       every page
+
+    drain_extraction_queue starts this task for several scheduled pages
+    of a tenant, with the lease of each page's job. Each lease holds one
+    of the scheduler's slots, so all pages of the batch are extracted at
+    once without a second rate limit check. Leases are restarted, renewed
+    and checked before storing as in extract_entities; pages whose lease
+    is lost or that are being extracted under another live lease are
+    skipped. Leases are released once the batch is done.
 
     Args:
         page_ids: List of page UUIDs
         tenant_id: UUID of the tenant
+        lease_ids: Scheduler lease of each page's job, if they were scheduled
 
     Returns:
-        dict: Batch extraction summary
+        dict: Batch extraction summary with the status of each page
     """
     logger.info(
         "Starting batch entity extraction",
@@ -305,29 +368,173 @@ def extract_entities_batch(page_ids: list[str], tenant_id: str) -> dict:
         "total": len(page_ids),
         "completed": 0,
         "failed": 0,
+        "skipped": 0,
         "entities_extracted": 0,
+        "pages": dict.fromkeys(page_ids, "not_found"),
     }
 
-    for page_id in page_ids:
+    if lease_ids is None:
+        _extract_pages(page_ids, tenant_id, {}, results)
+    else:
+        from app.extraction.scheduler import LeaseState, get_extraction_scheduler
+        from app.worker.runtime import get_async_runtime, run_async
+
+        scheduler = get_extraction_scheduler()
+        leases: dict[str, str] = {}
+        for page_id, lease_id in zip(page_ids, lease_ids, strict=True):
+            state = run_async(scheduler.hold_lease(lease_id, page_id))
+            if state == LeaseState.HELD:
+                leases[page_id] = lease_id
+                continue
+            if state == LeaseState.PAGE_BUSY:
+                _release_scheduler_lease(lease_id)
+            results["pages"][page_id] = "skipped"
+            results["skipped"] += 1
+
+        runtime = get_async_runtime()
+        heartbeats = [
+            runtime.submit(scheduler.keep_lease(lease_id, page_id))
+            for page_id, lease_id in leases.items()
+        ]
         try:
-            result = extract_entities(page_id, tenant_id)
-            if result.get("status") == "completed":
-                results["completed"] += 1
-                results["entities_extracted"] += result.get("entities_count", 0)
-            elif result.get("status") == "failed":
-                results["failed"] += 1
-        except Exception as e:
-            logger.error(f"Batch extraction failed for page {page_id}: {e}")
-            results["failed"] += 1
+            _extract_pages(list(leases), tenant_id, leases, results)
+        finally:
+            for heartbeat in heartbeats:
+                heartbeat.cancel()
+            for page_id, lease_id in leases.items():
+                _release_scheduler_lease(lease_id, page_id)
 
     logger.info(
         "Batch entity extraction completed",
-        extra=results,
+        extra={key: value for key, value in results.items() if key != "pages"},
     )
 
     return results
 
 
+def _extract_pages(
+    page_ids: list[str],
+    tenant_id: str,
+    leases: dict[str, str],
+    results: dict,
+) -> None:
+    """Run extract_entities_batch for its pages (see there).
+
+    Pages whose lease is lost before storing are dropped from leases, so
+    the caller does not release them.
+    """
+    from sqlalchemy.orm import selectinload
+
+    if not page_ids:
+        return
+
+    with TenantWorkerContext(tenant_id) as ctx:
+        pages = (
+            ctx.db.execute(
+                select(ScrapedPage).where(
+                    ScrapedPage.id.in_([UUID(page_id) for page_id in page_ids])
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        pending = []
+        for page in pages:
+            if page.extraction_status == "completed":
+                results["pages"][str(page.id)] = "skipped"
+                results["skipped"] += 1
+                continue
+            page.extraction_status = "processing"
+            page.updated_at = datetime.now(UTC)
+            pending.append(page)
+        ctx.db.commit()
+
+        # Load the jobs of all pages for their extraction settings
+        jobs: dict[UUID, ScrapingJob] = {}
+        job_ids = {page.job_id for page in pending}
+        if job_ids:
+            job_result = ctx.db.execute(
+                select(ScrapingJob)
+                .options(selectinload(ScrapingJob.extraction_provider))
+                .where(ScrapingJob.id.in_(job_ids))
+            )
+            jobs = {job.id: job for job in job_result.scalars()}
+
+        requests = []
+        for page in pending:
+            job = jobs.get(page.job_id)
+            requests.append(
+                PageExtractionRequest(
+                    page=page,
+                    extraction_provider=job.extraction_provider if job else None,
+                    use_llm_extraction=job.use_llm_extraction if job else False,
+                )
+            )
+        if leases:
+            # Every page holds its own scheduler slot and rate limit token
+            outcomes = _orchestrator.extract_from_pages(
+                requests,
+                tenant_id,
+                max_concurrency=len(requests),
+                skip_rate_limit=True,
+            )
+        else:
+            outcomes = _orchestrator.extract_from_pages(requests, tenant_id)
+
+        extracted: list[tuple[ScrapedPage, ExtractionResult]] = []
+        failed: list[tuple[ScrapedPage, Exception]] = []
+        for page, outcome in zip(pending, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                failed.append((page, outcome))
+                continue
+            page_id = str(page.id)
+            try:
+                if page_id in leases:
+                    _check_scheduler_lease(leases[page_id], page_id)
+                with ctx.db.begin_nested():
+                    persist_page_extraction(ctx.db, page, UUID(tenant_id), outcome)
+            except _LeaseLost:
+                lease_id = leases.pop(page_id)
+                logger.warning(
+                    "Extraction lease expired while running, results discarded",
+                    extra={"page_id": page_id, "lease_id": lease_id},
+                )
+                results["pages"][page_id] = "skipped"
+                results["skipped"] += 1
+                continue
+            except Exception as e:
+                logger.exception(
+                    "Failed to persist extraction",
+                    extra={"page_id": page_id, "error": str(e)},
+                )
+                failed.append((page, e))
+                continue
+            extracted.append((page, outcome))
+
+        for page, extraction_result in extracted:
+            _emit_batch_extracted_event(
+                ctx,
+                page,
+                tenant_id,
+                extraction_result.total_entities,
+                extraction_result.schema_org_count,
+                extraction_result.llm_count,
+            )
+            results["pages"][str(page.id)] = "completed"
+            results["completed"] += 1
+            results["entities_extracted"] += extraction_result.total_entities
+
+        for page, error in failed:
+            page.extraction_status = "failed"
+            page.extraction_error = str(error)
+            page.updated_at = datetime.now(UTC)
+            _emit_extraction_failed_event(ctx, page, tenant_id, error)
+            results["pages"][str(page.id)] = "failed"
+            results["failed"] += 1
+        ctx.db.commit()
+
+
 @shared_task(
     name="app.tasks.extraction.process_pending_pages",
     acks_late=True,
@@ -336,8 +543,9 @@ def process_pending_pages(job_id: str, tenant_id: str, batch_size: int = 10) ->
     """
     Process pending pages for a job.
 
-    Finds pages with pending extraction status and queues them
-    for extraction.
+    Finds pages with pending extraction status and queues them with the
+    extraction scheduler, which starts them as the tenant's fair share
+    and the LLM's free slots allow (see drain_extraction_queue).
 
     Args:
         job_id: UUID of the job
@@ -358,10 +566,12 @@ def process_pending_pages(job_id: str, tenant_id: str, batch_size: int = 10) ->
         )
         pages = result.scalars().all()
 
-        queued = 0
+        from app.extraction.worker import schedule_page_extraction
+        from app.worker.runtime import run_async
+
         for page in pages:
-            extract_entities.delay(str(page.id), tenant_id)
-            queued += 1
+            run_async(schedule_page_extraction(page.id, tenant_id))
+        queued = len(pages)
 
         logger.info(
             "Queued pages for extraction",
@@ -517,3 +727,41 @@ def monitor_extraction_completion(self, job_id: str, tenant_id: str) -> dict:
             "failed_pages": failed_pages,
             "consolidation_task_id": task.id,
         }
+
+
+@shared_task(
+    bind=True,
+    name="app.tasks.extraction.drain_extraction_queue",
+    acks_late=True,
+)
+def drain_extraction_queue(self, max_jobs: int | None = None) -> dict:
+    """
+    Process extractions queued with the fair scheduler.
+
+    Pulls the next eligible job (by priority, tenant fair share and token
+    bucket) until nothing becomes eligible within the idle timeout. Page
+    jobs that are eligible together are started per tenant as one
+    extract_entities_batch task (extract_entities for a single page)
+    holding the jobs' leases, so at most the scheduler's global
+    concurrency cap of pages run at once.
+    Runs periodically from beat; concurrent drains share the cap.
+
+    Args:
+        max_jobs: Stop after this many jobs (None for no limit)
+
+    Returns:
+        dict: Number of jobs processed and a count per status
+    """
+    from app.extraction.worker import run_scheduled_extractions
+    from app.worker.runtime import run_async
+
+    summary = run_async(
+        run_scheduled_extractions(
+            worker_id=f"celery-{self.request.hostname}",
+            max_jobs=max_jobs,
+            dispatch_pages=_dispatch_scheduled_pages,
+        )
+    )
+
+    logger.info("Extraction queue drained", extra=summary)
+    return summary
@@ -5,6 +5,8 @@ This module provides tasks for:
 - Syncing entities to Neo4j
 - Syncing relationships to Neo4j
 - Batch synchronization
+- Bulk rebuilds of a tenant's graph
+- Reconciling precomputed graph statistics
 """
 
 import logging
@@ -12,7 +14,7 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 from celery import shared_task
-from sqlalchemy import select, update
+from sqlalchemy import select, text, update
 
 from app.worker.context import TenantWorkerContext
 from app.models.extracted_entity import ExtractedEntity, EntityRelationship
@@ -85,11 +87,9 @@ def sync_entity_to_neo4j(self, entity_id: str, tenant_id: str) -> dict:
             entity.synced_to_neo4j = True
             entity.synced_at = datetime.now(timezone.utc)
             entity.updated_at = datetime.now(timezone.utc)
+            _emit_entity_synced_event(ctx, entity, tenant_id, neo4j_node_id)
             ctx.db.commit()
 
-            # Emit success event
-            _emit_entity_synced_event(entity, tenant_id, neo4j_node_id)
-
             logger.info(
                 "Entity synced to Neo4j",
                 extra={
@@ -192,14 +192,12 @@ def sync_relationship_to_neo4j(self, relationship_id: str, tenant_id: str) -> di
             )
             return {"status": "error", "message": "Entity not found"}
 
-        # Sync entities first if needed
-        if not source_entity.synced_to_neo4j:
-            sync_entity_to_neo4j.delay(str(source_entity.id), tenant_id)
-            return {"status": "pending", "message": "Source entity sync queued"}
-
-        if not target_entity.synced_to_neo4j:
-            sync_entity_to_neo4j.delay(str(target_entity.id), tenant_id)
-            return {"status": "pending", "message": "Target entity sync queued"}
+        # Endpoints not synced yet are written in the same transaction
+        unsynced = [
+            entity
+            for entity in (source_entity, target_entity)
+            if not entity.synced_to_neo4j
+        ]
 
         try:
             # Import graph client
@@ -208,21 +206,33 @@ def sync_relationship_to_neo4j(self, relationship_id: str, tenant_id: str) -> di
             neo4j_client = get_neo4j_client()
 
             # Create relationship in Neo4j
-            neo4j_rel_id = neo4j_client.sync_relationship(
-                relationship,
-                source_entity.neo4j_node_id,
-                target_entity.neo4j_node_id,
-            )
+            if unsynced:
+                node_ids, neo4j_rel_id = neo4j_client.sync_relationship_with_entities(
+                    relationship, unsynced
+                )
+                now = datetime.now(timezone.utc)
+                for entity in unsynced:
+                    entity.neo4j_node_id = node_ids.get(entity.id)
+                    entity.synced_to_neo4j = True
+                    entity.synced_at = now
+                    entity.updated_at = now
+                    _emit_entity_synced_event(
+                        ctx, entity, tenant_id, entity.neo4j_node_id
+                    )
+            else:
+                neo4j_rel_id = neo4j_client.sync_relationship(
+                    relationship,
+                    source_entity.neo4j_node_id,
+                    target_entity.neo4j_node_id,
+                )
 
             # Update relationship
             relationship.neo4j_relationship_id = neo4j_rel_id
             relationship.synced_to_neo4j = True
             relationship.updated_at = datetime.now(timezone.utc)
+            _emit_relationship_synced_event(ctx, relationship, tenant_id, neo4j_rel_id)
             ctx.db.commit()
 
-            # Emit success event
-            _emit_relationship_synced_event(relationship, tenant_id, neo4j_rel_id)
-
             logger.info(
                 "Relationship synced to Neo4j",
                 extra={
@@ -351,15 +361,184 @@ def sync_pending_relationships(batch_size: int = 100) -> dict:
     return {"queued": queued}
 
 
+@shared_task(
+    name="app.tasks.graph.reconcile_graph_statistics",
+    acks_late=True,
+)
+def reconcile_graph_statistics() -> dict:
+    """
+    Queue a statistics reconcile for every active tenant.
+
+    This periodic task fans out one reconcile_tenant_graph_statistics
+    task per active tenant, so each tenant's recount runs in its own
+    tenant-scoped transaction.
+
+    Returns:
+        dict: Reconcile summary
+    """
+    from app.core.database import SyncSessionLocal
+    from app.models.tenant import Tenant
+
+    logger.info("Starting graph statistics reconcile")
+
+    queued = 0
+
+    with SyncSessionLocal() as db:
+        try:
+            result = db.execute(
+                select(Tenant.id).where(Tenant.is_active == True)  # noqa: E712
+            )
+            tenant_ids = result.scalars().all()
+
+            for tenant_id in tenant_ids:
+                reconcile_tenant_graph_statistics.delay(str(tenant_id))
+                queued += 1
+
+        except Exception:
+            logger.exception("Failed to queue graph statistics reconcile")
+            raise
+
+    logger.info(f"Queued graph statistics reconcile for {queued} tenants")
+    return {"queued": queued}
+
+
+@shared_task(
+    bind=True,
+    name="app.tasks.graph.reconcile_tenant_graph_statistics",
+    max_retries=3,
+    default_retry_delay=60,
+    acks_late=True,
+)
+def reconcile_tenant_graph_statistics(self, tenant_id: str) -> dict:
+    """
+    Recompute a tenant's precomputed graph statistics from PostgreSQL.
+
+    Recounts entities and relationships by type (correcting any drift in
+    the incrementally maintained counters) and refreshes the degree
+    histogram and top hubs, which are only maintained here.
+
+    Args:
+        tenant_id: UUID of the tenant
+
+    Returns:
+        dict: Reconcile summary
+    """
+    from app.services.graph_stats import RECONCILE_STATS_SQL
+
+    logger.info(
+        "Reconciling graph statistics",
+        extra={"tenant_id": tenant_id},
+    )
+
+    try:
+        with TenantWorkerContext(tenant_id) as ctx:
+            ctx.db.execute(
+                text(RECONCILE_STATS_SQL),
+                {
+                    "tenant_id": UUID(tenant_id),
+                    "top_hubs": settings.GRAPH_STATS_TOP_HUBS,
+                },
+            )
+
+    except Exception as e:
+        logger.exception(
+            "Failed to reconcile graph statistics",
+            extra={"tenant_id": tenant_id, "error": str(e)},
+        )
+
+        # Retry if appropriate
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=e)
+
+        return {"status": "failed", "error": str(e)}
+
+    return {"status": "completed", "tenant_id": tenant_id}
+
+
+@shared_task(
+    bind=True,
+    name="app.tasks.graph.rebuild_tenant_graph",
+    max_retries=5,
+    default_retry_delay=30,
+    acks_late=True,
+)
+def rebuild_tenant_graph(
+    self,
+    tenant_id: str,
+    clear: bool = False,
+    checkpoint: dict | None = None,
+) -> dict:
+    """
+    Bulk-load a tenant's graph from PostgreSQL into Neo4j.
+
+    Streams canonical entities and relationships in chunks and loads each
+    chunk with one Neo4j statement (see app.graph.bulk). Progress is
+    published as task state PROGRESS. On failure the task retries from the
+    last loaded chunk, and the same checkpoint can be passed to a new task
+    to resume manually.
+
+    Args:
+        tenant_id: UUID of the tenant
+        clear: Delete the tenant's existing graph before loading
+        checkpoint: Resume position from a previous run
+
+    Returns:
+        dict: Rebuild summary
+    """
+    from app.graph.bulk import RebuildCheckpoint, mark_synced
+    from app.graph.bulk import rebuild_tenant_graph as run_rebuild
+
+    logger.info(
+        "Rebuilding tenant graph",
+        extra={"tenant_id": tenant_id, "checkpoint": checkpoint},
+    )
+
+    progress = {"checkpoint": checkpoint}
+
+    def on_chunk(kind: str, ids: list[str], position, totals: dict) -> None:
+        mark_synced(UUID(tenant_id), kind, ids)
+        progress["checkpoint"] = position.to_dict()
+        self.update_state(
+            state="PROGRESS",
+            meta={"tenant_id": tenant_id, **totals, **progress},
+        )
+
+    try:
+        with TenantWorkerContext(tenant_id) as ctx:
+            totals = run_rebuild(
+                ctx.db,
+                UUID(tenant_id),
+                clear=clear,
+                checkpoint=RebuildCheckpoint.from_dict(checkpoint),
+                on_chunk=on_chunk,
+            )
+
+    except Exception as e:
+        logger.exception(
+            "Failed to rebuild tenant graph",
+            extra={"tenant_id": tenant_id, "error": str(e), **progress},
+        )
+
+        # Retry from the last loaded chunk
+        if self.request.retries < self.max_retries:
+            raise self.retry(
+                exc=e,
+                kwargs={"tenant_id": tenant_id, "clear": clear, **progress},
+            )
+
+        return {"status": "failed", "error": str(e), **progress}
+
+    return {"status": "completed", "tenant_id": tenant_id, **totals}
+
+
 def _emit_entity_synced_event(
+    ctx: TenantWorkerContext,
     entity: ExtractedEntity,
     tenant_id: str,
     neo4j_node_id: str,
 ) -> None:
-    """Emit EntitySyncedToNeo4j event."""
+    """Add an EntitySyncedToNeo4j event to the task's event batch (ctx.events)."""
     try:
-        from app.eventsourcing.stores.factory import get_event_store_sync
-        event_store = get_event_store_sync()
         event = EntitySyncedToNeo4j(
             aggregate_id=str(entity.id),
             tenant_id=tenant_id,
@@ -367,20 +546,19 @@ def _emit_entity_synced_event(
             neo4j_node_id=neo4j_node_id,
             synced_at=datetime.now(timezone.utc),
         )
-        event_store.append_sync(event)
+        ctx.events.add(event)
     except Exception as e:
         logger.warning(f"Failed to emit EntitySyncedToNeo4j event: {e}")
 
 
 def _emit_relationship_synced_event(
+    ctx: TenantWorkerContext,
     relationship: EntityRelationship,
     tenant_id: str,
     neo4j_rel_id: str,
 ) -> None:
-    """Emit RelationshipSyncedToNeo4j event."""
+    """Add a RelationshipSyncedToNeo4j event to the task's event batch (ctx.events)."""
     try:
-        from app.eventsourcing.stores.factory import get_event_store_sync
-        event_store = get_event_store_sync()
         event = RelationshipSyncedToNeo4j(
             aggregate_id=str(relationship.id),
             tenant_id=tenant_id,
@@ -388,7 +566,7 @@ def _emit_relationship_synced_event(
             neo4j_relationship_id=neo4j_rel_id,
             synced_at=datetime.now(timezone.utc),
         )
-        event_store.append_sync(event)
+        ctx.events.add(event)
     except Exception as e:
         logger.warning(f"Failed to emit RelationshipSyncedToNeo4j event: {e}")
 
@@ -0,0 +1,86 @@
+"""
+Celery tasks for event outbox maintenance.
+
+This module provides tasks for:
+- Creating upcoming daily partitions of the event_outbox table
+- Dropping or detaching published partitions past the retention window
+- Moving expired failed rows to event_outbox_failed
+"""
+
+import logging
+
+from celery import shared_task
+from sqlalchemy import text
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    name="app.tasks.outbox.maintain_outbox_partitions",
+    acks_late=True,
+)
+def maintain_outbox_partitions() -> dict:
+    """
+    Create upcoming outbox partitions and expire published ones.
+
+    Calls the event_outbox_maintain_partitions database function, which
+    creates the day partitions for the next OUTBOX_PARTITIONS_AHEAD days
+    and drops (or, with OUTBOX_RETENTION_DETACH, detaches for archiving)
+    day partitions older than OUTBOX_RETENTION_DAYS. Failed rows of those
+    partitions are moved to event_outbox_failed first; partitions still
+    holding pending rows are kept until the rows are published.
+
+    Returns:
+        dict: Partitions created, dropped and detached, rows deleted from
+            the default partition and failed rows moved out
+    """
+    from app.core.database import SyncSessionLocal
+
+    logger.info("Starting outbox partition maintenance")
+
+    summary: dict = {
+        "created": [],
+        "dropped": [],
+        "detached": [],
+        "deleted": 0,
+        "failed_moved": 0,
+    }
+
+    with SyncSessionLocal() as db:
+        try:
+            result = db.execute(
+                text(
+                    "SELECT partition_name, action, rows_affected "
+                    "FROM event_outbox_maintain_partitions(:days_ahead, :retain_days, :detach)"
+                ),
+                {
+                    "days_ahead": settings.OUTBOX_PARTITIONS_AHEAD,
+                    "retain_days": settings.OUTBOX_RETENTION_DAYS,
+                    "detach": settings.OUTBOX_RETENTION_DETACH,
+                },
+            )
+            for partition_name, action, rows_affected in result:
+                if action in ("deleted", "failed_moved"):
+                    summary[action] += rows_affected
+                else:
+                    summary[action].append(partition_name)
+            db.commit()
+
+        except Exception:
+            db.rollback()
+            logger.exception("Outbox partition maintenance failed")
+            raise
+
+    logger.info(
+        "Outbox partition maintenance completed",
+        extra={
+            "partitions_created": len(summary["created"]),
+            "partitions_dropped": len(summary["dropped"]),
+            "partitions_detached": len(summary["detached"]),
+            "default_rows_deleted": summary["deleted"],
+            "failed_rows_moved": summary["failed_moved"],
+        },
+    )
+    return summary
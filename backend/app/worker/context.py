@@ -8,7 +8,7 @@ by setting the appropriate session variable.
 
 import logging
 from contextlib import asynccontextmanager, contextmanager
-from typing import AsyncGenerator, Generator, Optional
+from typing import TYPE_CHECKING, AsyncGenerator, Generator, Optional
 from uuid import UUID
 
 from sqlalchemy import text
@@ -22,6 +22,9 @@ from app.core.context import (
 )
 from app.core.database import AsyncSessionLocal, SyncSessionLocal
 
+if TYPE_CHECKING:
+    from app.eventsourcing.stores.batch import SyncEventBatch
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +70,9 @@ class TenantWorkerContext:
     5. Commits changes on success
     6. Rolls back on exception
     7. Clears context on exit
+
+    Domain events added to ``ctx.events`` are appended when ``ctx.db``
+    commits, in the same transaction when the event store supports it.
     """
 
     def __init__(self, tenant_id: str | UUID):
@@ -80,6 +86,7 @@ class TenantWorkerContext:
             tenant_id = UUID(tenant_id)
         self.tenant_id = tenant_id
         self._db: Optional[Session] = None
+        self._events: Optional["SyncEventBatch"] = None
 
     def __enter__(self) -> "TenantWorkerContext":
         """Enter context and set up tenant isolation."""
@@ -131,6 +138,10 @@ class TenantWorkerContext:
                     )
         finally:
             # Always clean up
+            if self._events is not None:
+                self._events.close()
+                self._events = None
+
             if self._db is not None:
                 self._db.close()
                 self._db = None
@@ -145,6 +156,15 @@ class TenantWorkerContext:
             raise RuntimeError("Context not entered - use 'with' statement")
         return self._db
 
+    @property
+    def events(self) -> "SyncEventBatch":
+        """Get the batch of domain events appended when the session commits."""
+        if self._events is None:
+            from app.eventsourcing.stores.factory import get_event_store_sync
+
+            self._events = get_event_store_sync().batch(self.db)
+        return self._events
+
 
 class AsyncTenantWorkerContext:
     """
@@ -0,0 +1,247 @@
+"""
+Persistent async runtime for Celery worker processes.
+
+Celery tasks are synchronous, but extraction services are async. Running
+each call with ``asyncio.run()`` creates and closes an event loop per call,
+which discards everything bound to the loop: httpx connection pools,
+keep-alive connections and TLS sessions held by provider clients.
+
+This module keeps one event loop per worker process, running forever on a
+dedicated daemon thread. Sync code submits coroutines to it and blocks on
+the result, so loop-bound clients can be created once and reused by every
+task the process runs.
+
+CPU-bound work (parsing structured data of a page batch) gains nothing from
+threads because of the GIL, so the module also keeps one process pool per
+worker process, started on first use and shared by every task.
+
+Example:
+    from app.worker.runtime import run_async
+
+    result = run_async(service.extract(content=text, page_url=url))
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncRuntime:
+    """An event loop running on a dedicated thread with a sync bridge."""
+
+    def __init__(self, name: str = "async-runtime"):
+        """
+        Start the runtime thread and its event loop.
+
+        Args:
+            name: Name of the runtime thread
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name=name,
+            daemon=True,
+        )
+        self._thread.start()
+
+        logger.info("Async runtime started", extra={"runtime_thread": name})
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runtime's event loop."""
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the runtime thread is alive and accepting work."""
+        return self._thread.is_alive() and not self._loop.is_closed()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """
+        Schedule a coroutine on the runtime loop without waiting for it.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            concurrent.futures.Future for the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the runtime loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait before cancelling the coroutine
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from the runtime thread itself (would deadlock)
+            TimeoutError: If the coroutine does not finish within timeout
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("AsyncRuntime.run() cannot be called from the runtime loop")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Cancel pending tasks, stop the loop and join the thread.
+
+        Args:
+            timeout: Seconds to wait for the thread to stop
+        """
+        if self._loop.is_closed():
+            return
+
+        async def _cancel_pending() -> None:
+            current = asyncio.current_task()
+            tasks = [t for t in asyncio.all_tasks() if t is not current]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._thread.is_alive():
+            try:
+                self.submit(_cancel_pending()).result(timeout)
+            except Exception:
+                logger.warning("Pending tasks did not cancel cleanly on shutdown")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+
+        if not self._thread.is_alive():
+            self._loop.close()
+
+        logger.info("Async runtime stopped")
+
+
+# Process-wide runtime; recreated after fork since threads do not survive it
+_runtime: Optional[AsyncRuntime] = None
+_runtime_pid: Optional[int] = None
+_runtime_lock = threading.Lock()
+
+
+def get_async_runtime() -> AsyncRuntime:
+    """
+    Get the worker process's async runtime, starting it on first use.
+
+    Returns:
+        The process-wide AsyncRuntime
+    """
+    global _runtime, _runtime_pid
+
+    pid = os.getpid()
+    if _runtime is None or _runtime_pid != pid or not _runtime.is_running:
+        with _runtime_lock:
+            if _runtime is None or _runtime_pid != pid or not _runtime.is_running:
+                _runtime = AsyncRuntime(name=f"async-runtime-{pid}")
+                _runtime_pid = pid
+
+    return _runtime
+
+
+def run_async(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine on the worker's persistent loop from sync code.
+
+    Drop-in replacement for ``asyncio.run()`` in Celery tasks.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait before cancelling the coroutine
+
+    Returns:
+        The coroutine's result
+    """
+    return get_async_runtime().run(coro, timeout)
+
+
+def shutdown_async_runtime() -> None:
+    """Stop the process's async runtime if it was started in this process."""
+    global _runtime, _runtime_pid
+
+    with _runtime_lock:
+        if _runtime is not None and _runtime_pid == os.getpid():
+            _runtime.shutdown()
+        _runtime = None
+        _runtime_pid = None
+
+
+# Process-wide pool for CPU-bound work; recreated after fork like the runtime
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_pid: int | None = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor | None:
+    """
+    Get the worker process's pool for CPU-bound work, starting it on first use.
+
+    Pool processes are spawned, not forked, since the worker runs threads
+    (the async runtime, extraction thread pools) that fork would not copy.
+
+    Returns:
+        The process-wide ProcessPoolExecutor, or None if
+        settings.WORKER_PROCESS_POOL_SIZE is 0 or this process is daemonic
+        and may not start children
+    """
+    from app.core.config import settings
+
+    global _process_pool, _process_pool_pid
+
+    if settings.WORKER_PROCESS_POOL_SIZE <= 0 or multiprocessing.current_process().daemon:
+        return None
+
+    pid = os.getpid()
+    if _process_pool is None or _process_pool_pid != pid:
+        with _process_pool_lock:
+            if _process_pool is None or _process_pool_pid != pid:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=settings.WORKER_PROCESS_POOL_SIZE,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                _process_pool_pid = pid
+                logger.info(
+                    "Worker process pool started",
+                    extra={"max_workers": settings.WORKER_PROCESS_POOL_SIZE},
+                )
+
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Stop the process's pool if it was started in this process.
+
+    Also used to discard a broken pool; the next get_process_pool() call
+    starts a new one.
+    """
+    global _process_pool, _process_pool_pid
+
+    with _process_pool_lock:
+        if _process_pool is not None and _process_pool_pid == os.getpid():
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        _process_pool_pid = None
@@ -750,11 +750,11 @@ class TestExtractionTriggerE2E:
             # Second event should succeed
             await handler.handle_page_scraped(event2)
 
-        # First event's hash should NOT be in processed set (because save failed)
-        assert event1.content_hash not in handler._processed_content_hashes
+        # First event's hash should NOT be claimed (because save failed)
+        assert not await handler._content_hashes.contains(test_tenant_id, event1.content_hash)
 
-        # Second event's hash should be in processed set
-        assert event2.content_hash in handler._processed_content_hashes
+        # Second event's hash should be claimed
+        assert await handler._content_hashes.contains(test_tenant_id, event2.content_hash)
 
         # One successful save
         assert len(successful_saves) == 1
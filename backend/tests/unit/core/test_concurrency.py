@@ -0,0 +1,122 @@
+"""
+Unit tests for adaptive concurrency limits.
+
+Tests the Python side of AdaptiveConcurrencyLimiter (slot acquisition,
+outcome classification, timeouts, fail-open) with the Lua scripts mocked.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.core.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitExceeded,
+    concurrency_slot,
+    is_overload,
+)
+
+
+@pytest.fixture
+def limiter():
+    """Create a limiter whose Redis scripts are mocks."""
+    limiter = AdaptiveConcurrencyLimiter(
+        "ollama:http://gpu:11434",
+        redis_client=MagicMock(),
+        initial_limit=4,
+        acquire_timeout=0.2,
+    )
+    limiter._scripts = {
+        "acquire": AsyncMock(return_value=[1, "4", 1]),
+        "release": AsyncMock(return_value=["4.25", 0]),
+    }
+    return limiter
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://gpu:11434/api/chat")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+class TestIsOverload:
+    """Tests for is_overload."""
+
+    @pytest.mark.parametrize("status", [429, 500, 503])
+    def test_throttling_and_server_errors(self, status):
+        """Test 429 and 5xx responses count as overload."""
+        assert is_overload(_status_error(status))
+
+    def test_client_errors_and_timeouts(self):
+        """Test 4xx errors are not overload but timeouts are."""
+        assert not is_overload(_status_error(400))
+        assert not is_overload(ValueError("bad output"))
+        assert is_overload(httpx.ReadTimeout("slow"))
+
+
+class TestSlot:
+    """Tests for AdaptiveConcurrencyLimiter.slot."""
+
+    async def test_success_releases_with_latency(self, limiter):
+        """Test a completed request frees its lease and reports success."""
+        async with limiter.slot():
+            pass
+
+        acquire_args = limiter._scripts["acquire"].await_args.kwargs["args"]
+        release_args = limiter._scripts["release"].await_args.kwargs["args"]
+        assert release_args[0] == acquire_args[0]
+        assert release_args[1] == "success"
+        assert release_args[2] >= 0
+
+    async def test_overload_is_reported_and_reraised(self, limiter):
+        """Test a 429 shrinks the limit and still reaches the caller."""
+        with pytest.raises(httpx.HTTPStatusError):
+            async with limiter.slot():
+                raise _status_error(429)
+
+        assert limiter._scripts["release"].await_args.kwargs["args"][1] == "overload"
+
+    async def test_unrelated_errors_do_not_move_the_limit(self, limiter):
+        """Test errors that say nothing about load are ignored."""
+        with pytest.raises(ValueError):
+            async with limiter.slot():
+                raise ValueError("invalid JSON")
+
+        assert limiter._scripts["release"].await_args.kwargs["args"][1] == "ignore"
+
+    async def test_waits_for_a_free_slot(self, limiter):
+        """Test acquire polls until a slot is granted."""
+        limiter._scripts["acquire"].side_effect = [[0, "2", 2], [1, "2", 2]]
+
+        with patch("app.core.concurrency.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            lease_id = await limiter.acquire()
+
+        assert lease_id is not None
+        sleep.assert_awaited_once()
+
+    async def test_timeout_raises_with_retry_after(self, limiter):
+        """Test a saturated endpoint raises once the acquire timeout passes."""
+        limiter._scripts["acquire"].return_value = [0, "1", 1]
+
+        with pytest.raises(ConcurrencyLimitExceeded) as exc_info:
+            await limiter.acquire()
+
+        assert exc_info.value.retry_after > 0
+        assert exc_info.value.endpoint == "ollama:http://gpu:11434"
+
+    async def test_redis_errors_fail_open(self, limiter):
+        """Test Redis failures let requests through without a lease."""
+        limiter._scripts["acquire"].side_effect = ConnectionError("redis down")
+
+        async with limiter.slot():
+            pass
+
+        limiter._scripts["release"].assert_not_awaited()
+
+
+async def test_concurrency_slot_without_limiter_is_a_no_op():
+    """Test a disabled limiter yields a plain context."""
+    async with concurrency_slot(None):
+        pass
@@ -0,0 +1,201 @@
+"""
+Unit tests for the shared Neo4j connection layer.
+
+Tests driver configuration, pool slot tracking metrics and the
+multi-statement transaction helpers with mocked drivers.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.config import settings
+from app.core.neo4j import (
+    _AsyncPoolGate,
+    _SyncPoolGate,
+    async_session,
+    driver_options,
+    neo4j_pool_acquisition_seconds,
+    neo4j_pool_in_use,
+    neo4j_pool_waiters,
+    run_statements,
+    run_statements_async,
+    sync_session,
+)
+
+
+def _gauge_value(gauge, driver: str) -> float:
+    """Read the current value of a labelled gauge."""
+    return gauge.labels(driver=driver)._value.get()
+
+
+def _acquisition_count(driver: str) -> float:
+    """Read the number of observed acquisitions for a driver label."""
+    histogram = neo4j_pool_acquisition_seconds.labels(driver=driver)
+    return sum(bucket.get() for bucket in histogram._buckets)
+
+
+# =============================================================================
+# Driver Configuration Tests
+# =============================================================================
+
+
+class TestDriverOptions:
+    """Tests for driver_options."""
+
+    def test_options_come_from_settings(self):
+        """Test pool, timeout and fetch size options follow settings."""
+        options = driver_options()
+
+        assert options["auth"] == (settings.NEO4J_USER, settings.NEO4J_PASSWORD)
+        assert options["max_connection_pool_size"] == settings.NEO4J_MAX_CONNECTION_POOL_SIZE
+        assert (
+            options["connection_acquisition_timeout"]
+            == settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+        )
+        assert options["max_connection_lifetime"] == settings.NEO4J_MAX_CONNECTION_LIFETIME
+        assert (
+            options["max_transaction_retry_time"]
+            == settings.NEO4J_MAX_TRANSACTION_RETRY_TIME
+        )
+        assert options["fetch_size"] == settings.NEO4J_FETCH_SIZE
+
+
+# =============================================================================
+# Pool Gate Tests
+# =============================================================================
+
+
+class TestSyncPoolGate:
+    """Tests for sync pool slot tracking."""
+
+    def test_slot_tracks_in_use(self):
+        """Test a held slot is reported as in use and released on exit."""
+        gate = _SyncPoolGate(1)
+        before = _gauge_value(neo4j_pool_in_use, "sync")
+        observed = _acquisition_count("sync")
+
+        with gate.slot(timeout=1):
+            assert _gauge_value(neo4j_pool_in_use, "sync") == before + 1
+
+        assert _gauge_value(neo4j_pool_in_use, "sync") == before
+        assert _gauge_value(neo4j_pool_waiters, "sync") == 0
+        assert _acquisition_count("sync") == observed + 1
+
+    def test_exhausted_pool_times_out(self):
+        """Test waiting for a slot raises TimeoutError after the timeout."""
+        gate = _SyncPoolGate(1)
+
+        with gate.slot(timeout=1):
+            with pytest.raises(TimeoutError):
+                with gate.slot(timeout=0.01):
+                    pass
+
+        # The failed waiter must not leak a slot
+        with gate.slot(timeout=0.01):
+            pass
+
+    def test_sync_session_closes_session(self):
+        """Test sync_session opens a session on the configured database."""
+        driver = MagicMock()
+
+        with sync_session(driver) as session:
+            assert session is driver.session.return_value.__enter__.return_value
+
+        driver.session.assert_called_once_with(database=settings.NEO4J_DATABASE)
+        driver.session.return_value.__exit__.assert_called_once()
+
+
+class TestAsyncPoolGate:
+    """Tests for async pool slot tracking."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_reported(self):
+        """Test sessions blocked on a full pool are counted as waiters."""
+        gate = _AsyncPoolGate(1)
+        waiters_before = _gauge_value(neo4j_pool_waiters, "async")
+        release = asyncio.Event()
+
+        async def hold():
+            async with gate.slot(timeout=1):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        assert _gauge_value(neo4j_pool_waiters, "async") == waiters_before + 1
+
+        release.set()
+        await asyncio.gather(holder, waiter)
+
+        assert _gauge_value(neo4j_pool_waiters, "async") == waiters_before
+
+    @pytest.mark.asyncio
+    async def test_exhausted_pool_times_out(self):
+        """Test waiting for a slot raises TimeoutError after the timeout."""
+        gate = _AsyncPoolGate(1)
+        in_use_before = _gauge_value(neo4j_pool_in_use, "async")
+
+        async with gate.slot(timeout=1):
+            with pytest.raises(TimeoutError):
+                async with gate.slot(timeout=0.01):
+                    pass
+
+        assert _gauge_value(neo4j_pool_in_use, "async") == in_use_before
+
+    @pytest.mark.asyncio
+    async def test_async_session_closes_session(self):
+        """Test async_session closes the session on exit."""
+        driver = MagicMock()
+        session = AsyncMock()
+        driver.session.return_value = session
+
+        async with async_session(driver, "graph") as yielded:
+            assert yielded is session
+
+        driver.session.assert_called_once_with(database="graph")
+        session.close.assert_awaited_once()
+
+
+# =============================================================================
+# Transaction Helper Tests
+# =============================================================================
+
+
+class TestRunStatements:
+    """Tests for multi-statement transaction helpers."""
+
+    def test_runs_statements_in_order(self):
+        """Test every statement runs on the same transaction in order."""
+        tx = MagicMock()
+        tx.run.return_value.data.side_effect = [[{"n": 1}], []]
+
+        results = run_statements(
+            tx,
+            [("RETURN $n AS n", {"n": 1}), ("MERGE (e:Entity {id: $id})", {"id": "a"})],
+        )
+
+        assert results == [[{"n": 1}], []]
+        assert [call.args for call in tx.run.call_args_list] == [
+            ("RETURN $n AS n", {"n": 1}),
+            ("MERGE (e:Entity {id: $id})", {"id": "a"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_runs_statements_in_order(self):
+        """Test the async helper consumes each result before the next statement."""
+        tx = AsyncMock()
+        result = AsyncMock()
+        result.data.side_effect = [[{"n": 1}], [{"n": 2}]]
+        tx.run.return_value = result
+
+        results = await run_statements_async(
+            tx,
+            [("RETURN 1 AS n", {}), ("RETURN 2 AS n", {})],
+        )
+
+        assert results == [[{"n": 1}], [{"n": 2}]]
+        assert tx.run.await_count == 2
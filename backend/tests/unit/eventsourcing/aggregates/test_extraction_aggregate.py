@@ -6,6 +6,7 @@ state transitions, and invariant enforcement.
 """
 
 from datetime import datetime, timezone, timedelta
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -19,12 +20,15 @@ from app.eventsourcing.aggregates.extraction import (
     create_extraction_process_repository,
 )
 from app.eventsourcing.events.extraction import (
+    EntitiesRecordedBatch,
+    EntitiesRetracted,
     ExtractionCompleted,
     ExtractionProcessFailed,
     ExtractionRequested,
     ExtractionRetryScheduled,
     ExtractionStarted,
     RelationshipDiscovered,
+    RelationshipsRecordedBatch,
 )
 from app.eventsourcing.events.scraping import EntityExtracted
 
@@ -436,6 +440,118 @@ class TestRecordRelationship:
         assert rel.context is None
 
 
+class TestRecordBatches:
+    """Tests for record_entities and record_relationships command methods."""
+
+    def test_record_entities_emits_one_event(self, started_process):
+        """Test all entities of a page are recorded with a single event."""
+        initial_event_count = len(started_process.uncommitted_events)
+
+        entity_ids = started_process.record_entities(
+            [
+                {"entity_type": "CLASS", "name": "Foo", "normalized_name": "foo"},
+                {
+                    "entity_type": "FUNCTION",
+                    "name": "bar",
+                    "normalized_name": "bar",
+                    "confidence_score": 0.7,
+                    "properties": {"async": True},
+                },
+            ]
+        )
+
+        assert len(started_process.uncommitted_events) == initial_event_count + 1
+        event = started_process.uncommitted_events[-1]
+        assert isinstance(event, EntitiesRecordedBatch)
+        assert event.entity_ids == entity_ids
+        assert [entity.name for entity in started_process.state.entities] == ["Foo", "bar"]
+        assert started_process.state.entities[1].confidence_score == 0.7
+        assert started_process.state.entities[1].properties == {"async": True}
+
+    def test_record_relationships_emits_one_event(self, started_process):
+        """Test all relationships of a page are recorded with a single event."""
+        started_process.record_relationships(
+            [
+                {
+                    "source_entity_name": "A",
+                    "target_entity_name": "B",
+                    "relationship_type": "CALLS",
+                    "context": "A calls B",
+                },
+                {"source_entity_name": "B", "target_entity_name": "C", "relationship_type": "USES"},
+            ]
+        )
+
+        event = started_process.uncommitted_events[-1]
+        assert isinstance(event, RelationshipsRecordedBatch)
+        relationships = started_process.state.relationships
+        assert [rel.relationship_type for rel in relationships] == ["CALLS", "USES"]
+        assert relationships[0].context == "A calls B"
+        assert relationships[1].confidence_score == 1.0
+
+    def test_empty_batches_emit_nothing(self, started_process):
+        """Test recording no entities or relationships emits no event."""
+        initial_event_count = len(started_process.uncommitted_events)
+
+        assert started_process.record_entities([]) == []
+        assert started_process.record_relationships([]) == []
+        assert len(started_process.uncommitted_events) == initial_event_count
+
+    def test_record_entities_requires_in_progress(self, requested_process):
+        """Test batches cannot be recorded before extraction starts."""
+        with pytest.raises(ValueError, match="IN_PROGRESS"):
+            requested_process.record_entities(
+                [{"entity_type": "CLASS", "name": "Foo", "normalized_name": "foo"}]
+            )
+
+    def test_legacy_and_batch_events_replay_to_same_state(self, started_process):
+        """Test per-entity events from older streams replay like batches."""
+        started_process.record_entity(entity_type="CLASS", name="Old", normalized_name="old")
+        started_process.record_relationship(
+            source_entity_name="Old", target_entity_name="New", relationship_type="USES"
+        )
+        started_process.record_entities(
+            [{"entity_type": "CLASS", "name": "New", "normalized_name": "new"}]
+        )
+
+        replayed = ExtractionProcess(started_process.aggregate_id)
+        replayed.load_from_history(started_process.uncommitted_events)
+
+        assert replayed.state == started_process.state
+        assert [entity.name for entity in replayed.state.entities] == ["Old", "New"]
+
+    def test_retract_entities_removes_them_from_state(self, started_process):
+        """Test retracted entities are dropped with one event and on replay."""
+        kept, *retracted = started_process.record_entities(
+            [
+                {"entity_type": "CLASS", "name": name, "normalized_name": name.lower()}
+                for name in ("Keep", "Drop", "Gone")
+            ]
+        )
+
+        started_process.retract_entities(retracted, "invalid response")
+
+        event = started_process.uncommitted_events[-1]
+        assert isinstance(event, EntitiesRetracted)
+        assert event.entity_ids == retracted
+        assert event.reason == "invalid response"
+        assert [entity.entity_id for entity in started_process.state.entities] == [kept]
+
+        replayed = ExtractionProcess(started_process.aggregate_id)
+        replayed.load_from_history(started_process.uncommitted_events)
+        assert replayed.state == started_process.state
+
+    def test_retract_entities_rejects_unknown_ids(self, started_process):
+        """Test only entities recorded by the extraction can be retracted."""
+        initial_event_count = len(started_process.uncommitted_events)
+
+        started_process.retract_entities([], "nothing streamed")
+        with pytest.raises(ValueError, match="not recorded"):
+            started_process.retract_entities([uuid4()], "invalid response")
+
+        assert len(started_process.uncommitted_events) == initial_event_count
+
+
 class TestCompleteExtraction:
     """Tests for complete command method."""
 
@@ -1144,6 +1260,89 @@ class TestExtractionProcessRepository:
         assert isinstance(process, ExtractionProcess)
 
 
+class TestExtractionProcessSnapshots:
+    """Tests for loading ExtractionProcess aggregates from snapshots."""
+
+    async def _save_process(self, repo, entity_count: int):
+        process = repo.create_new(uuid4())
+        process.request_extraction(
+            page_id=uuid4(),
+            tenant_id=uuid4(),
+            page_url="https://example.com/page",
+            content_hash="abc123",
+        )
+        process.start(worker_id="worker-1")
+        for i in range(entity_count):
+            process.record_entity(
+                entity_type="CONCEPT", name=f"Entity {i}", normalized_name=f"entity {i}"
+            )
+        await repo.save(process)
+        return process
+
+    async def test_load_replays_only_events_after_snapshot(self):
+        """Test a process loads from its snapshot plus the tail events."""
+        from eventsource import InMemoryEventStore
+        from eventsource.snapshots import InMemorySnapshotStore
+
+        event_store = InMemoryEventStore()
+        snapshot_store = InMemorySnapshotStore()
+        repo = create_extraction_process_repository(
+            event_store, snapshot_store=snapshot_store,
+            snapshot_threshold=10,
+            snapshot_mode="sync",
+        )
+        process = await self._save_process(repo, entity_count=48)
+
+        snapshot = await snapshot_store.get_snapshot(process.aggregate_id, "ExtractionProcess")
+        assert snapshot is not None
+        assert snapshot.version == process.version == 50
+        assert snapshot.schema_version == ExtractionProcess.schema_version
+
+        # Two more entities after the snapshot
+        process = await repo.load(process.aggregate_id)
+        for i in range(2):
+            process.record_entity(
+                entity_type="CONCEPT", name=f"Late {i}", normalized_name=f"late {i}"
+            )
+        await repo.save(process)
+
+        with patch.object(event_store, "get_events", wraps=event_store.get_events) as spy:
+            loaded = await repo.load(process.aggregate_id)
+
+        assert spy.call_args.kwargs["from_version"] == 50
+        assert loaded.version == 52
+        assert loaded.state == process.state
+        assert len(loaded.state.entities) == 50
+
+    async def test_snapshot_with_old_schema_version_is_ignored(self):
+        """Test a snapshot of an older state schema falls back to full replay."""
+        from eventsource import InMemoryEventStore
+        from eventsource.snapshots import InMemorySnapshotStore, Snapshot
+
+        event_store = InMemoryEventStore()
+        snapshot_store = InMemorySnapshotStore()
+        repo = create_extraction_process_repository(
+            event_store, snapshot_store=snapshot_store,
+            snapshot_threshold=1000,
+            snapshot_mode="sync",
+        )
+        process = await self._save_process(repo, entity_count=3)
+        await snapshot_store.save_snapshot(
+            Snapshot(
+                aggregate_id=process.aggregate_id,
+                aggregate_type="ExtractionProcess",
+                version=process.version,
+                state={"unknown": "layout"},
+                schema_version=ExtractionProcess.schema_version - 1,
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+
+        loaded = await repo.load(process.aggregate_id)
+
+        assert loaded.state == process.state
+
+
 # =============================================================================
 # State Model Tests
 # =============================================================================
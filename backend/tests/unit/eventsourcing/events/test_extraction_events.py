@@ -11,6 +11,7 @@ from uuid import UUID, uuid4
 import pytest
 
 from app.eventsourcing.events.extraction import (
+    EntitiesRecordedBatch,
     ExtractionBatchCompleted,
     ExtractionBatchStarted,
     ExtractionCompleted,
@@ -19,7 +20,9 @@ from app.eventsourcing.events.extraction import (
     ExtractionRetryScheduled,
     ExtractionStarted,
     RelationshipDiscovered,
+    RelationshipsRecordedBatch,
 )
+from app.eventsourcing.events.scraping import EntityExtracted
 
 
 # =============================================================================
@@ -657,6 +660,110 @@ class TestRelationshipDiscovered:
         assert restored.context == original.context
 
 
+# =============================================================================
+# Recorded Batch Tests
+# =============================================================================
+
+
+def make_entity_event(base_kwargs: dict, page_id: UUID, name: str) -> EntityExtracted:
+    """Create a legacy per-entity event."""
+    return EntityExtracted(
+        **base_kwargs,
+        entity_id=uuid4(),
+        page_id=page_id,
+        job_id=page_id,
+        entity_type="CLASS",
+        name=name,
+        normalized_name=name.lower(),
+        extraction_method="llm_ollama",
+        confidence_score=0.9,
+        properties={"line": 1},
+    )
+
+
+class TestEntitiesRecordedBatch:
+    """Tests for EntitiesRecordedBatch event."""
+
+    def test_upcast_from_entity_events(self):
+        """Test legacy per-entity events convert into an equivalent batch."""
+        base_kwargs = make_base_event_kwargs()
+        page_id = uuid4()
+        events = [make_entity_event(base_kwargs, page_id, name) for name in ("Foo", "Bar")]
+
+        batch = EntitiesRecordedBatch.from_entity_events(events)
+
+        assert batch.event_type == "EntitiesRecordedBatch"
+        assert batch.aggregate_type == "ExtractionProcess"
+        assert batch.entity_count == 2
+        assert batch.extraction_method == "llm_ollama"
+        assert [entity["name"] for entity in batch.entities()] == ["Foo", "Bar"]
+        assert batch.entities()[0]["entity_id"] == events[0].entity_id
+        assert batch.entities()[1]["properties"] == {"line": 1}
+
+    def test_columns_must_have_equal_length(self):
+        """Test a batch with misaligned columns is rejected."""
+        with pytest.raises(ValueError, match="differ in length"):
+            EntitiesRecordedBatch(
+                **make_base_event_kwargs(),
+                page_id=uuid4(),
+                job_id=uuid4(),
+                extraction_method="llm",
+                entity_ids=[uuid4(), uuid4()],
+                entity_types=["CLASS"],
+                names=["A", "B"],
+                normalized_names=["a", "b"],
+                descriptions=[None, None],
+                properties=[{}, {}],
+                confidence_scores=[1.0, 1.0],
+                source_texts=[None, None],
+            )
+
+    def test_serialization_roundtrip(self):
+        """Test batch survives serialization and deserialization."""
+        base_kwargs = make_base_event_kwargs()
+        page_id = uuid4()
+        original = EntitiesRecordedBatch.from_entity_events(
+            [make_entity_event(base_kwargs, page_id, "Foo")]
+        )
+
+        restored = EntitiesRecordedBatch.model_validate(original.model_dump(mode="json"))
+
+        assert restored.entities() == original.entities()
+
+
+class TestRelationshipsRecordedBatch:
+    """Tests for RelationshipsRecordedBatch event."""
+
+    def test_upcast_from_relationship_events(self):
+        """Test legacy per-relationship events convert into an equivalent batch."""
+        base_kwargs = make_base_event_kwargs()
+        page_id = uuid4()
+        events = [
+            RelationshipDiscovered(
+                **base_kwargs,
+                relationship_id=uuid4(),
+                page_id=page_id,
+                source_entity_name=source,
+                target_entity_name=target,
+                relationship_type="CALLS",
+                confidence_score=0.8,
+            )
+            for source, target in (("A", "B"), ("B", "C"))
+        ]
+
+        batch = RelationshipsRecordedBatch.from_relationship_events(events)
+
+        assert batch.relationship_count == 2
+        assert batch.relationships()[1] == {
+            "relationship_id": events[1].relationship_id,
+            "source_entity_name": "B",
+            "target_entity_name": "C",
+            "relationship_type": "CALLS",
+            "confidence_score": 0.8,
+            "context": None,
+        }
+
+
 # =============================================================================
 # ExtractionBatchStarted Tests
 # =============================================================================
@@ -859,6 +966,8 @@ class TestEventRegistration:
             "RelationshipDiscovered",
             "ExtractionBatchStarted",
             "ExtractionBatchCompleted",
+            "EntitiesRecordedBatch",
+            "RelationshipsRecordedBatch",
         ]
 
         for event_type in registered_types:
@@ -30,11 +30,15 @@ def mock_driver():
     """Create a mock Neo4j async driver."""
     driver = MagicMock()
 
-    # Create mock session that can be used as async context manager
+    # Create mock session whose managed transactions run on the session
+    # itself, so statements show up as mock_session.run calls
     mock_session = AsyncMock()
     mock_session.run = AsyncMock()
-    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session.__aexit__ = AsyncMock(return_value=None)
+
+    async def execute_write(work, *args, **kwargs):
+        return await work(mock_session, *args, **kwargs)
+
+    mock_session.execute_write = AsyncMock(side_effect=execute_write)
 
     driver.session.return_value = mock_session
     return driver
@@ -474,13 +478,35 @@ class TestErrorHandling:
             await handler.handle(event)
 
     @pytest.mark.asyncio
-    async def test_transfer_outgoing_continues_on_failure(
+    async def test_merge_runs_in_one_transaction(
         self, mock_driver, mock_session, tenant_id, canonical_entity_id, merged_entity_ids
     ):
-        """Test that transfer outgoing failure is logged but doesn't stop processing."""
+        """Test all merge statements run in a single managed transaction."""
         handler = ConsolidationNeo4jSyncHandler(mock_driver)
 
-        # Make first run fail, then succeed for subsequent calls
+        event = EntitiesMerged(
+            aggregate_id=uuid.uuid4(),
+            tenant_id=tenant_id,
+            canonical_entity_id=canonical_entity_id,
+            merged_entity_ids=merged_entity_ids,
+            merge_reason="auto_high_confidence",
+            similarity_scores={},
+        )
+
+        await handler._handle_EntitiesMerged(event)
+
+        mock_driver.session.assert_called_once()
+        mock_session.execute_write.assert_awaited_once()
+        _, statements = mock_session.execute_write.await_args.args
+        assert len(statements) == 6
+        mock_session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_transfer_failure_aborts_the_merge(
+        self, mock_driver, mock_session, tenant_id, canonical_entity_id, merged_entity_ids
+    ):
+        """Test a failing statement fails the whole merge instead of applying part of it."""
+        handler = ConsolidationNeo4jSyncHandler(mock_driver)
         call_count = [0]
 
         async def mock_run(*args, **kwargs):
@@ -500,8 +526,7 @@ class TestErrorHandling:
             similarity_scores={},
         )
 
-        # Should not raise - continues with other operations
-        await handler._handle_EntitiesMerged(event)
+        with pytest.raises(Exception, match="Transfer failed"):
+            await handler._handle_EntitiesMerged(event)
 
-        # Verify we continued to call other operations
-        assert call_count[0] > 1
+        assert call_count[0] == 1
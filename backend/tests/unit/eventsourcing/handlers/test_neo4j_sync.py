@@ -11,7 +11,12 @@ from uuid import uuid4
 
 import pytest
 
-from app.eventsourcing.events.extraction import RelationshipDiscovered
+from app.eventsourcing.events.extraction import (
+    EntitiesRecordedBatch,
+    EntitiesRetracted,
+    RelationshipDiscovered,
+    RelationshipsRecordedBatch,
+)
 from app.eventsourcing.events.scraping import EntityExtracted
 from app.eventsourcing.projections.neo4j_sync import (
     Neo4jEntitySyncHandler,
@@ -238,6 +243,116 @@ class TestHandleEntityExtracted:
         assert params["synced_at"].tzinfo is not None  # Should be timezone-aware
 
 
+class TestHandleEntitiesRecordedBatch:
+    """Test suite for _handle_entities_recorded_batch event handler."""
+
+    def _create_batch(self, tenant_id, count=2):
+        """Helper to create an EntitiesRecordedBatch with `count` entities."""
+        page_id = uuid4()
+        return EntitiesRecordedBatch.from_entity_events(
+            [
+                EntityExtracted(
+                    aggregate_id=page_id,
+                    tenant_id=tenant_id,
+                    entity_id=uuid4(),
+                    page_id=page_id,
+                    job_id=uuid4(),
+                    entity_type="function",
+                    name=f"entity_{i}",
+                    normalized_name=f"entity_{i}",
+                    extraction_method="llm_ollama",
+                    confidence_score=0.9,
+                )
+                for i in range(count)
+            ]
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_synced_with_one_neo4j_call_and_one_update(self):
+        """Test a batch is merged in Neo4j and marked synced in one round trip each."""
+        handler = Neo4jEntitySyncHandler(session_factory=MagicMock())
+        tenant_id = uuid4()
+        event = self._create_batch(tenant_id)
+        entity_ids = [str(entity_id) for entity_id in event.entity_ids]
+
+        mock_conn = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.rowcount = 2
+        mock_conn.execute.return_value = mock_result
+
+        mock_neo4j_service = AsyncMock()
+        mock_neo4j_service.create_entity_nodes.return_value = {
+            entity_ids[0]: "4:abc:1",
+            entity_ids[1]: "4:abc:2",
+        }
+
+        with patch(
+            "app.eventsourcing.projections.neo4j_sync.get_neo4j_service",
+            new=AsyncMock(return_value=mock_neo4j_service),
+        ):
+            await handler._handle_entities_recorded_batch(mock_conn, event)
+
+        mock_neo4j_service.create_entity_node.assert_not_called()
+        call_kwargs = mock_neo4j_service.create_entity_nodes.call_args.kwargs
+        assert call_kwargs["tenant_id"] == tenant_id
+        assert [entity["type"] for entity in call_kwargs["entities"]] == ["FUNCTION"] * 2
+
+        mock_conn.execute.assert_called_once()
+        params = mock_conn.execute.call_args[0][1]
+        assert params["entity_ids"] == list(event.entity_ids)
+        assert params["node_ids"] == ["4:abc:1", "4:abc:2"]
+        assert params["tenant_id"] == tenant_id
+
+    @pytest.mark.asyncio
+    async def test_neo4j_failure_is_logged_not_raised(self):
+        """Test Neo4j errors leave the entities unsynced without failing the projection."""
+        handler = Neo4jEntitySyncHandler(session_factory=MagicMock())
+        event = self._create_batch(uuid4())
+
+        mock_conn = AsyncMock()
+        mock_neo4j_service = AsyncMock()
+        mock_neo4j_service.create_entity_nodes.side_effect = Exception("Neo4j down")
+
+        with patch(
+            "app.eventsourcing.projections.neo4j_sync.get_neo4j_service",
+            new=AsyncMock(return_value=mock_neo4j_service),
+        ), patch("app.eventsourcing.projections.neo4j_sync.logger") as mock_logger:
+            await handler._handle_entities_recorded_batch(mock_conn, event)
+
+        mock_conn.execute.assert_not_called()
+        mock_logger.error.assert_called_once()
+
+
+class TestHandleEntitiesRetracted:
+    """Test suite for _handle_entities_retracted event handler."""
+
+    @pytest.mark.asyncio
+    async def test_retracted_entities_are_deleted_from_neo4j(self):
+        """Test the nodes of retracted entities are deleted in one call."""
+        handler = Neo4jEntitySyncHandler(session_factory=MagicMock())
+        tenant_id = uuid4()
+        event = EntitiesRetracted(
+            aggregate_id=uuid4(),
+            tenant_id=tenant_id,
+            page_id=uuid4(),
+            entity_ids=[uuid4(), uuid4()],
+            reason="streamed response failed validation",
+        )
+
+        mock_neo4j_service = AsyncMock()
+        mock_neo4j_service.delete_entity_nodes.return_value = 2
+
+        with patch(
+            "app.eventsourcing.projections.neo4j_sync.get_neo4j_service",
+            new=AsyncMock(return_value=mock_neo4j_service),
+        ):
+            await handler._handle_entities_retracted(AsyncMock(), event)
+
+        mock_neo4j_service.delete_entity_nodes.assert_called_once_with(
+            tenant_id=tenant_id, entity_ids=event.entity_ids
+        )
+
+
 class TestErrorHandling:
     """Test suite for error handling behavior."""
 
@@ -923,6 +1038,129 @@ class TestHandleRelationshipDiscovered:
         assert call_args.kwargs["properties"] == {"context": "Important relationship context"}
 
 
+class TestHandleRelationshipsRecordedBatch:
+    """Test suite for _handle_relationships_recorded_batch event handler."""
+
+    def _create_batch(self, tenant_id, page_id):
+        """Helper to create a RelationshipsRecordedBatch with two relationships."""
+        return RelationshipsRecordedBatch(
+            aggregate_id=uuid4(),
+            tenant_id=tenant_id,
+            page_id=page_id,
+            relationship_ids=[uuid4(), uuid4()],
+            source_entity_names=["ClassA", "ClassB"],
+            target_entity_names=["ClassB", "ClassC"],
+            relationship_types=["USES", "IMPLEMENTS"],
+            confidence_scores=[0.9, 0.8],
+            contexts=["ClassA uses ClassB", None],
+        )
+
+    def _mock_conn(self, entity_ids):
+        """Helper to create a connection resolving entities by name."""
+
+        def mock_execute(sql, params=None):
+            result = MagicMock()
+            if "SELECT id, neo4j_node_id" in str(sql):
+                entity_id = entity_ids.get(params["name"])
+                if entity_id:
+                    row = MagicMock()
+                    row.id = entity_id
+                    row.neo4j_node_id = f"4:node:{params['name']}"
+                    result.fetchone.return_value = row
+                else:
+                    result.fetchone.return_value = None
+            else:
+                result.rowcount = 1
+            return result
+
+        mock_conn = AsyncMock()
+        mock_conn.execute = AsyncMock(side_effect=mock_execute)
+        return mock_conn
+
+    @pytest.mark.asyncio
+    async def test_relationships_synced_in_one_transaction(self):
+        """Test all relationships of the batch are created together."""
+        handler = Neo4jRelationshipSyncHandler(session_factory=MagicMock())
+        tenant_id = uuid4()
+        page_id = uuid4()
+        event = self._create_batch(tenant_id, page_id)
+        entity_ids = {name: uuid4() for name in ("ClassA", "ClassB", "ClassC")}
+        mock_conn = self._mock_conn(entity_ids)
+
+        mock_neo4j_service = AsyncMock()
+        mock_neo4j_service.create_relationships.return_value = ["5:rel:1", "5:rel:2"]
+
+        with patch(
+            "app.eventsourcing.projections.neo4j_sync.get_neo4j_service",
+            new=AsyncMock(return_value=mock_neo4j_service),
+        ):
+            await handler._handle_relationships_recorded_batch(mock_conn, event)
+
+        mock_neo4j_service.create_relationship.assert_not_called()
+        mock_neo4j_service.create_relationships.assert_awaited_once()
+        batch_tenant_id, created = mock_neo4j_service.create_relationships.call_args.args
+        assert batch_tenant_id == tenant_id
+        assert [
+            (c["relationship_id"], c["source_entity_id"], c["target_entity_id"])
+            for c in created
+        ] == [
+            (event.relationship_ids[0], entity_ids["ClassA"], entity_ids["ClassB"]),
+            (event.relationship_ids[1], entity_ids["ClassB"], entity_ids["ClassC"]),
+        ]
+        assert created[0]["properties"] == {"context": "ClassA uses ClassB"}
+        assert created[1]["properties"] == {}
+
+        updates = [
+            call.args[1]
+            for call in mock_conn.execute.call_args_list
+            if "UPDATE entity_relationships" in str(call.args[0])
+        ]
+        assert [params["rel_id"] for params in updates] == ["5:rel:1", "5:rel:2"]
+
+    @pytest.mark.asyncio
+    async def test_unresolved_relationship_skipped(self):
+        """Test a relationship with a missing entity is left out of the transaction."""
+        handler = Neo4jRelationshipSyncHandler(session_factory=MagicMock())
+        event = self._create_batch(uuid4(), uuid4())
+        entity_ids = {name: uuid4() for name in ("ClassA", "ClassB")}
+        mock_conn = self._mock_conn(entity_ids)
+
+        mock_neo4j_service = AsyncMock()
+        mock_neo4j_service.create_relationships.return_value = ["5:rel:1"]
+
+        with patch(
+            "app.eventsourcing.projections.neo4j_sync.get_neo4j_service",
+            new=AsyncMock(return_value=mock_neo4j_service),
+        ):
+            await handler._handle_relationships_recorded_batch(mock_conn, event)
+
+        _, created = mock_neo4j_service.create_relationships.call_args.args
+        assert [c["relationship_id"] for c in created] == [event.relationship_ids[0]]
+
+    @pytest.mark.asyncio
+    async def test_neo4j_failure_leaves_batch_unsynced(self):
+        """Test a failed transaction records no relationship as synced."""
+        handler = Neo4jRelationshipSyncHandler(session_factory=MagicMock())
+        event = self._create_batch(uuid4(), uuid4())
+        entity_ids = {name: uuid4() for name in ("ClassA", "ClassB", "ClassC")}
+        mock_conn = self._mock_conn(entity_ids)
+
+        mock_neo4j_service = AsyncMock()
+        mock_neo4j_service.create_relationships.side_effect = Exception("Neo4j down")
+
+        with patch(
+            "app.eventsourcing.projections.neo4j_sync.get_neo4j_service",
+            new=AsyncMock(return_value=mock_neo4j_service),
+        ):
+            # Should not raise
+            await handler._handle_relationships_recorded_batch(mock_conn, event)
+
+        assert not any(
+            "UPDATE entity_relationships" in str(call.args[0])
+            for call in mock_conn.execute.call_args_list
+        )
+
+
 class TestRelationshipSyncErrorHandling:
     """Test suite for relationship sync error handling behavior."""
 
@@ -0,0 +1,296 @@
+"""
+Unit tests for OutboxPublisher.
+
+The database session and Kafka bus are mocked; these tests cover batching,
+failure accounting and the wait/backoff loop.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.eventsourcing.outbox.publisher import OutboxPublisher
+
+
+def make_entry(
+    tenant_id=None, aggregate_type="ExtractionProcess", retry_count=0, created_at=None
+):
+    """Create an outbox entry stand-in."""
+    return SimpleNamespace(
+        id=uuid4(),
+        created_at=created_at or datetime.now(timezone.utc),
+        event_id=uuid4(),
+        tenant_id=tenant_id,
+        aggregate_type=aggregate_type,
+        event_type="ExtractionRequested",
+        event_data={},
+        retry_count=retry_count,
+    )
+
+
+def make_session(entries):
+    """Create a session whose first query returns the given entries."""
+    select_result = MagicMock()
+    select_result.scalars.return_value.all.return_value = entries
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[select_result] + [MagicMock()] * 10)
+    session.commit = AsyncMock()
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=context), session
+
+
+def make_publisher(bus=None, **kwargs):
+    """Create a publisher whose events are the entries themselves."""
+    publisher = OutboxPublisher(bus or AsyncMock(), listen=False, **kwargs)
+    publisher._reconstruct_event = lambda entry: entry
+    publisher._build_topic = lambda tenant_id, aggregate_type: f"t.{tenant_id}"
+    return publisher
+
+
+class TestPublishBatch:
+    """Tests for OutboxPublisher._publish_batch."""
+
+    @pytest.mark.asyncio
+    async def test_one_publish_per_topic_and_one_update(self):
+        """Test entries are published per topic and marked with one statement."""
+        tenant_a, tenant_b = uuid4(), uuid4()
+        entries = [make_entry(tenant_a), make_entry(tenant_b), make_entry(tenant_a)]
+        session_factory, session = make_session(entries)
+        bus = AsyncMock()
+        publisher = make_publisher(bus)
+
+        with patch("app.eventsourcing.outbox.publisher.AsyncSessionLocal", session_factory):
+            published = await publisher._publish_batch()
+
+        assert published == 3
+        published_by_topic = {
+            call.kwargs["topic"]: call.args[0] for call in bus.publish.await_args_list
+        }
+        assert published_by_topic == {
+            f"t.{tenant_a}": [entries[0], entries[2]],
+            f"t.{tenant_b}": [entries[1]],
+        }
+        # SELECT ... FOR UPDATE SKIP LOCKED, then one UPDATE for the batch
+        assert session.execute.await_count == 2
+        update_sql = str(session.execute.await_args_list[1].args[0])
+        assert "ANY" in update_sql
+        assert set(session.execute.await_args_list[1].args[1]["entry_ids"]) == {
+            entry.id for entry in entries
+        }
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_topic_does_not_block_others(self):
+        """Test a failing topic is retried without affecting other topics."""
+        tenant_ok, tenant_bad = uuid4(), uuid4()
+        ok_entry = make_entry(tenant_ok)
+        bad_entries = [make_entry(tenant_bad), make_entry(tenant_bad, retry_count=4)]
+        session_factory, session = make_session([ok_entry, *bad_entries])
+
+        async def publish(events, topic):
+            if topic == f"t.{tenant_bad}":
+                raise RuntimeError("broker unavailable")
+
+        publisher = make_publisher(AsyncMock(publish=AsyncMock(side_effect=publish)))
+
+        with patch(
+            "app.eventsourcing.outbox.publisher.AsyncSessionLocal", session_factory
+        ), patch("app.eventsourcing.outbox.publisher.logger") as mock_logger:
+            published = await publisher._publish_batch()
+
+        assert published == 1
+        failure_params = session.execute.await_args_list[1].args[1]
+        assert failure_params["entry_ids"] == [entry.id for entry in bad_entries]
+        published_params = session.execute.await_args_list[2].args[1]
+        assert published_params["entry_ids"] == [ok_entry.id]
+        # The second entry reaches max_retries (5) with this attempt
+        mock_logger.warning.assert_called_once()
+        mock_logger.error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_outbox_publishes_nothing(self):
+        """Test an empty outbox returns without publishing or committing."""
+        session_factory, session = make_session([])
+        bus = AsyncMock()
+        publisher = make_publisher(bus)
+
+        with patch("app.eventsourcing.outbox.publisher.AsyncSessionLocal", session_factory):
+            assert await publisher._publish_batch() == 0
+
+        bus.publish.assert_not_awaited()
+        session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_reads_oldest_first_and_bounds_update_by_created_at(self):
+        """Test the pending scan and status update follow the partition key."""
+        now = datetime.now(timezone.utc)
+        entries = [
+            make_entry(created_at=now - timedelta(seconds=30)),
+            make_entry(created_at=now - timedelta(seconds=2)),
+        ]
+        session_factory, session = make_session(entries)
+        publisher = make_publisher()
+
+        with patch(
+            "app.eventsourcing.outbox.publisher.AsyncSessionLocal", session_factory
+        ), patch(
+            "app.eventsourcing.outbox.publisher.outbox_publish_latency_seconds"
+        ) as latency:
+            assert await publisher._publish_batch() == 2
+
+        select_sql = str(session.execute.await_args_list[0].args[0])
+        assert "ORDER BY event_outbox.created_at, event_outbox.id" in select_sql
+        update_params = session.execute.await_args_list[1].args[1]
+        assert update_params["oldest_created_at"] == entries[0].created_at
+        observed = [call.args[0] for call in latency.observe.call_args_list]
+        assert len(observed) == 2
+        assert observed[0] >= 30 > observed[1] >= 2
+
+
+class TestRunLoop:
+    """Tests for the publisher's wait and backoff loop."""
+
+    async def _run(self, publisher, batch_results, notifications=()):
+        """Run the loop over scripted batch results, recording wait timeouts."""
+        results = iter(batch_results)
+        notified = iter(notifications)
+        timeouts = []
+
+        async def publish_batch():
+            try:
+                return next(results)
+            except StopIteration:
+                publisher._running = False
+                return 0
+
+        async def wait_for_wakeup(timeout):
+            timeouts.append(timeout)
+            return next(notified, False)
+
+        publisher._publish_batch = publish_batch
+        publisher._wait_for_wakeup = wait_for_wakeup
+        publisher._running = True
+        await publisher._run()
+        return timeouts
+
+    @pytest.mark.asyncio
+    async def test_idle_backoff_doubles_up_to_max(self):
+        """Test waits grow while the outbox stays empty."""
+        publisher = make_publisher(poll_interval=0.1, max_idle_interval=0.5)
+
+        timeouts = await self._run(publisher, [0, 0, 0, 0, 0])
+
+        assert timeouts[:5] == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_reads_again_without_waiting(self):
+        """Test a full batch is followed immediately by the next read."""
+        publisher = make_publisher(batch_size=10, poll_interval=0.1)
+
+        timeouts = await self._run(publisher, [10, 10, 3])
+
+        assert timeouts[0] == 0.1
+        assert len(timeouts) == 2  # after the partial batch and the final empty read
+
+    @pytest.mark.asyncio
+    async def test_notification_resets_backoff(self):
+        """Test a NOTIFY brings the wait back to the poll interval."""
+        publisher = make_publisher(poll_interval=0.1, max_idle_interval=1.0)
+
+        timeouts = await self._run(
+            publisher, [0, 0, 0, 0], notifications=[False, False, True, False]
+        )
+
+        assert timeouts[:4] == [0.1, 0.2, 0.4, 0.1]
+
+    @pytest.mark.asyncio
+    async def test_notify_callback_wakes_waiter(self):
+        """Test the asyncpg notification callback ends the wait."""
+        publisher = make_publisher()
+
+        waiter = asyncio.create_task(publisher._wait_for_wakeup(5.0))
+        await asyncio.sleep(0)
+        publisher._on_notify(None, 1, "event_outbox", "")
+
+        assert await waiter is True
+
+
+def make_listen_connection():
+    """Create a pooled connection stand-in and its asyncpg connection."""
+    driver_connection = MagicMock()
+    driver_connection.add_listener = AsyncMock()
+    driver_connection.remove_listener = AsyncMock()
+    driver_connection.is_closed.return_value = False
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(
+        return_value=SimpleNamespace(driver_connection=driver_connection)
+    )
+    connection.invalidate = AsyncMock()
+    connection.close = AsyncMock()
+    return connection, driver_connection
+
+
+class TestListenReconnect:
+    """Tests for re-establishing LISTEN after its connection is lost."""
+
+    @pytest.mark.asyncio
+    async def test_terminated_connection_is_replaced(self):
+        """Test the termination callback wakes the loop and LISTEN is set up again."""
+        publisher = OutboxPublisher(AsyncMock())
+        first, first_driver = make_listen_connection()
+        second, second_driver = make_listen_connection()
+
+        with patch("app.eventsourcing.outbox.publisher.engine") as engine:
+            engine.connect = AsyncMock(side_effect=[first, second])
+            await publisher._start_listening()
+            first_driver.add_termination_listener.call_args.args[0](first_driver)
+            assert publisher._wakeup.is_set()
+
+            await publisher._ensure_listening()
+
+        first.invalidate.assert_awaited_once()
+        second_driver.add_listener.assert_awaited_once()
+        assert publisher._listen_driver_connection is second_driver
+
+    @pytest.mark.asyncio
+    async def test_closed_connection_detected_on_check(self):
+        """Test a closed connection is noticed even without the callback."""
+        publisher = OutboxPublisher(AsyncMock())
+        first, first_driver = make_listen_connection()
+        second, second_driver = make_listen_connection()
+
+        with patch("app.eventsourcing.outbox.publisher.engine") as engine:
+            engine.connect = AsyncMock(side_effect=[first, second])
+            await publisher._start_listening()
+            await publisher._ensure_listening()
+            assert publisher._listen_driver_connection is first_driver
+
+            first_driver.is_closed.return_value = True
+            await publisher._ensure_listening()
+
+        assert publisher._listen_driver_connection is second_driver
+
+    @pytest.mark.asyncio
+    async def test_failed_reconnect_is_retried(self):
+        """Test LISTEN is retried on the next check after a failed reconnect."""
+        publisher = OutboxPublisher(AsyncMock())
+        first, first_driver = make_listen_connection()
+        second, second_driver = make_listen_connection()
+
+        with patch("app.eventsourcing.outbox.publisher.engine") as engine:
+            engine.connect = AsyncMock(side_effect=[first, OSError("refused"), second])
+            await publisher._start_listening()
+            publisher._on_listen_terminated(first_driver)
+
+            await publisher._ensure_listening()
+            assert publisher._listen_connection is None
+
+            await publisher._ensure_listening()
+
+        assert publisher._listen_driver_connection is second_driver
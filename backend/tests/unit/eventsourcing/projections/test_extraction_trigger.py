@@ -10,7 +10,7 @@ Tests cover:
 - Logging behavior
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -18,6 +18,7 @@ import pytest
 
 from app.eventsourcing.events.scraping import PageScraped
 from app.eventsourcing.projections.extraction_trigger import ExtractionTriggerHandler
+from app.eventsourcing.stores.content_hashes import InMemoryContentHashStore
 
 
 # =============================================================================
@@ -25,6 +26,17 @@ from app.eventsourcing.projections.extraction_trigger import ExtractionTriggerHa
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def content_hash_store():
+    """Replace the application's content hash store with an in-memory one."""
+    store = InMemoryContentHashStore()
+    with patch(
+        "app.eventsourcing.projections.extraction_trigger.get_content_hash_store",
+        new=AsyncMock(return_value=store),
+    ):
+        yield store
+
+
 @pytest.fixture
 def mock_event_store():
     """Create a mock event store."""
@@ -102,11 +114,14 @@ class TestExtractionTriggerHandlerInit:
 
         assert handler._event_store is mock_event_store
 
-    def test_handler_initializes_empty_processed_hashes(self, mock_event_store):
-        """Test that handler initializes with empty processed hashes set."""
+    @pytest.mark.asyncio
+    async def test_handler_defaults_to_application_hash_store(
+        self, mock_event_store, content_hash_store
+    ):
+        """Test that handler uses the application's content hash store by default."""
         handler = ExtractionTriggerHandler(event_store=mock_event_store)
 
-        assert handler._processed_content_hashes == set()
+        assert await handler._get_content_hashes() is content_hash_store
 
     def test_handler_accepts_optional_repos(self, mock_event_store):
         """Test that handler accepts optional checkpoint and DLQ repositories."""
@@ -122,16 +137,16 @@ class TestExtractionTriggerHandlerInit:
 
         assert handler is not None
 
-    def test_handler_accepts_custom_processed_hashes(self, mock_event_store):
-        """Test that handler accepts custom processed hashes set."""
-        custom_hashes = {"hash1", "hash2"}
+    def test_handler_accepts_custom_hash_store(self, mock_event_store):
+        """Test that handler accepts a custom content hash store."""
+        store = InMemoryContentHashStore()
 
         handler = ExtractionTriggerHandler(
             event_store=mock_event_store,
-            processed_content_hashes=custom_hashes,
+            content_hash_store=store,
         )
 
-        assert handler._processed_content_hashes == custom_hashes
+        assert handler._content_hashes is store
 
     def test_handler_logs_initialization(self, mock_event_store):
         """Test that handler logs initialization message."""
@@ -193,7 +208,9 @@ class TestHandlePageScraped:
         ):
             await handler.handle_page_scraped(page_scraped_event)
 
-        assert page_scraped_event.content_hash in handler._processed_content_hashes
+        assert await handler._content_hashes.contains(
+            page_scraped_event.tenant_id, page_scraped_event.content_hash
+        )
 
     @pytest.mark.asyncio
     async def test_logs_success_on_creation(self, mock_event_store, page_scraped_event):
@@ -274,8 +291,9 @@ class TestIdempotency:
         mock_repo.save = AsyncMock()
 
         content_hash = "duplicate_hash_123"
-        event1 = create_page_scraped_event(content_hash=content_hash)
-        event2 = create_page_scraped_event(content_hash=content_hash)
+        tenant_id = uuid4()
+        event1 = create_page_scraped_event(tenant_id=tenant_id, content_hash=content_hash)
+        event2 = create_page_scraped_event(tenant_id=tenant_id, content_hash=content_hash)
 
         with patch(
             "app.eventsourcing.projections.extraction_trigger.create_extraction_process_repository",
@@ -294,12 +312,13 @@ class TestIdempotency:
         """Test that handler logs debug message when skipping duplicate."""
         # Pre-populate with processed hash
         content_hash = "already_processed"
+        tenant_id = uuid4()
         handler = ExtractionTriggerHandler(
             event_store=mock_event_store,
-            processed_content_hashes={content_hash},
+            content_hash_store=InMemoryContentHashStore({(tenant_id, content_hash)}),
         )
 
-        event = create_page_scraped_event(content_hash=content_hash)
+        event = create_page_scraped_event(tenant_id=tenant_id, content_hash=content_hash)
 
         with patch(
             "app.eventsourcing.projections.extraction_trigger.logger"
@@ -342,28 +361,106 @@ class TestIdempotency:
         # All three should be processed
         assert mock_repo.save.call_count == 3
 
-    def test_is_content_already_processed_returns_true(self, mock_event_store):
-        """Test _is_content_already_processed returns True for known hash."""
-        handler = ExtractionTriggerHandler(
-            event_store=mock_event_store,
-            processed_content_hashes={"known_hash"},
+    @pytest.mark.asyncio
+    async def test_same_content_of_other_tenant_is_processed(self, mock_event_store):
+        """Test that content hashes are scoped to the tenant."""
+        handler = ExtractionTriggerHandler(event_store=mock_event_store)
+
+        mock_repo = MagicMock()
+        mock_repo.save = AsyncMock()
+
+        with patch(
+            "app.eventsourcing.projections.extraction_trigger.create_extraction_process_repository",
+            return_value=mock_repo,
+        ):
+            await handler.handle_page_scraped(create_page_scraped_event(content_hash="shared"))
+            await handler.handle_page_scraped(create_page_scraped_event(content_hash="shared"))
+
+        assert mock_repo.save.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_content_claimed_with_process_id(self, mock_event_store, page_scraped_event):
+        """Test that the claim is made before saving, for the saved process."""
+        store = MagicMock()
+        store.claim = AsyncMock(return_value=True)
+        handler = ExtractionTriggerHandler(event_store=mock_event_store, content_hash_store=store)
+
+        mock_repo = MagicMock()
+        mock_repo.save = AsyncMock()
+
+        with patch(
+            "app.eventsourcing.projections.extraction_trigger.create_extraction_process_repository",
+            return_value=mock_repo,
+        ):
+            await handler.handle_page_scraped(page_scraped_event)
+
+        tenant_id, content_hash, process_id = store.claim.call_args.args
+        assert (tenant_id, content_hash) == (
+            page_scraped_event.tenant_id,
+            page_scraped_event.content_hash,
         )
+        assert mock_repo.save.call_args.args[0].aggregate_id == process_id
 
-        assert handler._is_content_already_processed("known_hash") is True
+    @pytest.mark.asyncio
+    async def test_claimed_content_is_not_saved(self, mock_event_store, page_scraped_event):
+        """Test that content claimed elsewhere (e.g., another replica) is skipped."""
+        store = MagicMock()
+        store.claim = AsyncMock(return_value=False)
+        store.reclaim = AsyncMock(return_value=False)
+        handler = ExtractionTriggerHandler(event_store=mock_event_store, content_hash_store=store)
 
-    def test_is_content_already_processed_returns_false(self, mock_event_store):
-        """Test _is_content_already_processed returns False for unknown hash."""
-        handler = ExtractionTriggerHandler(event_store=mock_event_store)
+        with patch(
+            "app.eventsourcing.projections.extraction_trigger.create_extraction_process_repository",
+        ) as mock_create_repo:
+            await handler.handle_page_scraped(page_scraped_event)
 
-        assert handler._is_content_already_processed("unknown_hash") is False
+        mock_create_repo.assert_not_called()
 
-    def test_mark_content_processed_adds_hash(self, mock_event_store):
-        """Test _mark_content_processed adds hash to set."""
-        handler = ExtractionTriggerHandler(event_store=mock_event_store)
+    @pytest.mark.asyncio
+    async def test_stale_claim_without_process_is_reclaimed(
+        self, mock_event_store, page_scraped_event
+    ):
+        """Test content claimed by a handler that crashed before saving is extracted."""
+        store = InMemoryContentHashStore(claim_timeout=timedelta(0))
+        stale_process_id = uuid4()
+        await store.claim(
+            page_scraped_event.tenant_id, page_scraped_event.content_hash, stale_process_id
+        )
+        handler = ExtractionTriggerHandler(event_store=mock_event_store, content_hash_store=store)
+
+        mock_repo = MagicMock()
+        mock_repo.exists = AsyncMock(return_value=False)
+        mock_repo.save = AsyncMock()
+
+        with patch(
+            "app.eventsourcing.projections.extraction_trigger.create_extraction_process_repository",
+            return_value=mock_repo,
+        ):
+            await handler.handle_page_scraped(page_scraped_event)
+
+        mock_repo.exists.assert_awaited_once_with(stale_process_id)
+        mock_repo.save.assert_awaited_once()
 
-        handler._mark_content_processed("new_hash")
+    @pytest.mark.asyncio
+    async def test_stale_claim_with_process_is_skipped(
+        self, mock_event_store, page_scraped_event
+    ):
+        """Test an old claim whose process was saved still skips the content."""
+        store = InMemoryContentHashStore(claim_timeout=timedelta(0))
+        await store.claim(page_scraped_event.tenant_id, page_scraped_event.content_hash, uuid4())
+        handler = ExtractionTriggerHandler(event_store=mock_event_store, content_hash_store=store)
+
+        mock_repo = MagicMock()
+        mock_repo.exists = AsyncMock(return_value=True)
+        mock_repo.save = AsyncMock()
+
+        with patch(
+            "app.eventsourcing.projections.extraction_trigger.create_extraction_process_repository",
+            return_value=mock_repo,
+        ):
+            await handler.handle_page_scraped(page_scraped_event)
 
-        assert "new_hash" in handler._processed_content_hashes
+        mock_repo.save.assert_not_called()
 
 
 # =============================================================================
@@ -459,7 +556,9 @@ class TestErrorHandling:
             await handler.handle_page_scraped(page_scraped_event)
 
         # Content should NOT be marked as processed since save failed
-        assert page_scraped_event.content_hash not in handler._processed_content_hashes
+        assert not await handler._content_hashes.contains(
+            page_scraped_event.tenant_id, page_scraped_event.content_hash
+        )
 
     @pytest.mark.asyncio
     async def test_repository_creation_error_handled(
@@ -490,18 +589,19 @@ class TestReset:
     """Test suite for reset method."""
 
     @pytest.mark.asyncio
-    async def test_reset_clears_processed_hashes(self, mock_event_store):
-        """Test that reset clears processed content hashes."""
+    async def test_reset_keeps_processed_hashes(self, mock_event_store):
+        """Test that a replay after reset does not re-trigger processed content."""
+        tenant_id = uuid4()
         handler = ExtractionTriggerHandler(
             event_store=mock_event_store,
-            processed_content_hashes={"hash1", "hash2", "hash3"},
+            content_hash_store=InMemoryContentHashStore(
+                {(tenant_id, "hash1"), (tenant_id, "hash2"), (tenant_id, "hash3")}
+            ),
         )
 
-        assert len(handler._processed_content_hashes) == 3
-
         await handler.reset()
 
-        assert len(handler._processed_content_hashes) == 0
+        assert len(handler._content_hashes) == 3
 
     @pytest.mark.asyncio
     async def test_reset_logs_message(self, mock_event_store):
@@ -643,14 +743,18 @@ class TestFullLifecycle:
 
         # All 5 pages should be processed
         assert mock_repo.save.call_count == 5
-        assert len(handler._processed_content_hashes) == 5
+        assert len(handler._content_hashes) == 5
 
     @pytest.mark.asyncio
     async def test_mixed_success_and_failure(self, mock_event_store):
         """Test processing with some successes and some failures."""
         handler = ExtractionTriggerHandler(event_store=mock_event_store)
 
-        events = [create_page_scraped_event(content_hash=f"hash_{i}") for i in range(3)]
+        tenant_id = uuid4()
+        events = [
+            create_page_scraped_event(tenant_id=tenant_id, content_hash=f"hash_{i}")
+            for i in range(3)
+        ]
 
         call_count = 0
 
@@ -673,7 +777,7 @@ class TestFullLifecycle:
         # All 3 were attempted
         assert mock_repo.save.call_count == 3
         # Only 2 were marked as processed (first and third succeeded)
-        assert len(handler._processed_content_hashes) == 2
-        assert "hash_0" in handler._processed_content_hashes
-        assert "hash_1" not in handler._processed_content_hashes  # Failed
-        assert "hash_2" in handler._processed_content_hashes
+        assert len(handler._content_hashes) == 2
+        assert await handler._content_hashes.contains(tenant_id, "hash_0")
+        assert not await handler._content_hashes.contains(tenant_id, "hash_1")  # Failed
+        assert await handler._content_hashes.contains(tenant_id, "hash_2")
@@ -0,0 +1,302 @@
+"""
+Unit tests for PartitionedCatchUp.
+
+Events are read from the in-memory event store and applied to recording
+projection stand-ins; rebuild transactions run on a mocked session factory.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from eventsource import ExpectedVersion, InMemoryEventStore
+from eventsource.repositories.checkpoint import InMemoryCheckpointRepository
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.eventsourcing.events.extraction import (
+    EntitiesRecordedBatch,
+    RelationshipDiscovered,
+    RelationshipsRecordedBatch,
+)
+from app.eventsourcing.events.scraping import EntityExtracted
+from app.eventsourcing.projections.partitioned import (
+    PartitionedCatchUp,
+    coalesce_for_bulk,
+)
+
+JOB_ID = uuid4()
+
+
+def make_entity(tenant_id, page_id=None, entity_id=None):
+    """Create an EntityExtracted event."""
+    return EntityExtracted(
+        aggregate_id=uuid4(),
+        tenant_id=tenant_id,
+        entity_id=entity_id or uuid4(),
+        page_id=page_id or uuid4(),
+        job_id=JOB_ID,
+        entity_type="concept",
+        name="Entity",
+        extraction_method="llm_ollama",
+        confidence_score=0.9,
+    )
+
+
+def make_relationship(tenant_id, page_id):
+    """Create a RelationshipDiscovered event."""
+    return RelationshipDiscovered(
+        aggregate_id=uuid4(),
+        tenant_id=tenant_id,
+        relationship_id=uuid4(),
+        page_id=page_id,
+        source_entity_name="A",
+        target_entity_name="B",
+        relationship_type="uses",
+        confidence_score=0.8,
+    )
+
+
+class RecordingProjection:
+    """Projection stand-in recording the events applied to it.
+
+    Created with a session_factory (rebuild projections), it records the
+    connection its session is bound to.
+    """
+
+    projection_name = "RecordingProjection"
+
+    def __init__(
+        self,
+        log,
+        handled=(EntityExtracted,),
+        fail_bulk=False,
+        session_factory=None,
+        checkpoint_repo=None,
+    ):
+        self.log = log
+        self.handled = handled
+        self.fail_bulk = fail_bulk
+        self.session_factory = session_factory
+
+    def subscribed_to(self):
+        return list(self.handled)
+
+    async def handle(self, event):
+        if self.session_factory is None:
+            self.log.append(("handle", event))
+            return
+        if self.fail_bulk:
+            raise RuntimeError("constraint violation")
+        self.log.append(("bulk", event, self.session_factory().bind))
+
+
+def make_session_factory():
+    """Create a session factory whose sessions hand out one connection."""
+    connection = MagicMock(spec=AsyncConnection)
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=connection)
+    transaction = MagicMock()
+    transaction.__aenter__ = AsyncMock()
+    transaction.__aexit__ = AsyncMock(return_value=False)
+    session.begin.return_value = transaction
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=context), connection
+
+
+async def append(store, events):
+    """Append events to the store, one stream per event."""
+    for event in events:
+        await store.append_events(
+            event.aggregate_id, event.aggregate_type, [event], ExpectedVersion.ANY
+        )
+
+
+def make_catch_up(store, checkpoints, log, partitions=2, **kwargs):
+    """Create a catch-up over one recording projection."""
+    factory = kwargs.pop("factory", lambda **overrides: RecordingProjection(log, **overrides))
+    session_factory = kwargs.pop("session_factory", MagicMock())
+    return PartitionedCatchUp(
+        store,
+        checkpoints,
+        projection_factories=[factory],
+        session_factory=session_factory,
+        partitions=partitions,
+        batch_size=3,
+        **kwargs,
+    )
+
+
+class TestPartitioning:
+    """Tests for partition assignment and configuration."""
+
+    def test_events_are_partitioned_by_tenant_or_page(self):
+        """Test a tenant's (or page's) events always share a partition."""
+        tenant_id, page_id = uuid4(), uuid4()
+        by_tenant = make_catch_up(None, None, [], partitions=8)
+        by_page = make_catch_up(None, None, [], partitions=8, partition_key="page")
+
+        events = [make_entity(tenant_id, page_id) for _ in range(5)]
+        events.append(make_relationship(uuid4(), page_id))
+
+        assert len({by_tenant.partition_of(event) for event in events[:5]}) == 1
+        assert {by_page.partition_of(event) for event in events} == {page_id.int % 8}
+        assert by_tenant.checkpoint_name(3) == "ExtractionProjections:tenant:3/8"
+
+    def test_invalid_configuration_is_rejected(self):
+        """Test partitions and partition_key are validated."""
+        with pytest.raises(ValueError):
+            make_catch_up(None, None, [], partitions=0)
+        with pytest.raises(ValueError):
+            make_catch_up(None, None, [], partition_key="aggregate")
+
+
+class TestRun:
+    """Tests for PartitionedCatchUp.run."""
+
+    @pytest.mark.asyncio
+    async def test_every_event_is_applied_once_in_tenant_order(self):
+        """Test events are applied once, in order per tenant, with a checkpoint per partition."""
+        store, checkpoints, log = InMemoryEventStore(), InMemoryCheckpointRepository(), []
+        tenants = [uuid4() for _ in range(4)]
+        events = [make_entity(tenants[i % 4]) for i in range(20)]
+        await append(store, events)
+        catch_up = make_catch_up(store, checkpoints, log)
+
+        summary = await catch_up.run()
+
+        applied = [event for _, event in log]
+        assert sorted(e.event_id for e in applied) == sorted(e.event_id for e in events)
+        for tenant_id in tenants:
+            assert [e for e in applied if e.tenant_id == tenant_id] == [
+                e for e in events if e.tenant_id == tenant_id
+            ]
+        assert summary.position == 20
+        assert sum(summary.events_applied) == 20
+        for partition in range(2):
+            assert await checkpoints.get_position(catch_up.checkpoint_name(partition)) == 20
+
+    @pytest.mark.asyncio
+    async def test_resume_applies_only_new_events(self):
+        """Test a second run starts from the partition checkpoints."""
+        store, checkpoints, log = InMemoryEventStore(), InMemoryCheckpointRepository(), []
+        await append(store, [make_entity(uuid4()) for _ in range(5)])
+        await make_catch_up(store, checkpoints, log).run()
+
+        new_events = [make_entity(uuid4()) for _ in range(3)]
+        await append(store, new_events)
+        log.clear()
+        summary = await make_catch_up(store, checkpoints, log).run()
+
+        assert {event.event_id for _, event in log} == {e.event_id for e in new_events}
+        assert summary.position == 8
+
+    @pytest.mark.asyncio
+    async def test_initial_position_skips_projected_events(self):
+        """Test partitions without a checkpoint start at initial_position."""
+        store, checkpoints, log = InMemoryEventStore(), InMemoryCheckpointRepository(), []
+        events = [make_entity(uuid4()) for _ in range(6)]
+        await append(store, events)
+
+        await make_catch_up(store, checkpoints, log).run(initial_position=4)
+
+        assert {event.event_id for _, event in log} == {e.event_id for e in events[4:]}
+
+    @pytest.mark.asyncio
+    async def test_stale_partition_checkpoint_starts_at_initial_position(self):
+        """Test a partition checkpoint older than initial_position is not replayed from."""
+        store, checkpoints, log = InMemoryEventStore(), InMemoryCheckpointRepository(), []
+        events = [make_entity(uuid4()) for _ in range(6)]
+        await append(store, events[:2])
+        await make_catch_up(store, checkpoints, log).run()
+        await append(store, events[2:])
+        log.clear()
+
+        summary = await make_catch_up(store, checkpoints, log).run(initial_position=4)
+
+        assert {event.event_id for _, event in log} == {e.event_id for e in events[4:]}
+        assert summary.position == 6
+
+    @pytest.mark.asyncio
+    async def test_rebuild_writes_chunks_in_one_transaction(self):
+        """Test rebuild mode applies coalesced events on the chunk's connection."""
+        store, checkpoints, log = InMemoryEventStore(), InMemoryCheckpointRepository(), []
+        tenant_id, page_id = uuid4(), uuid4()
+        await append(store, [make_entity(tenant_id, page_id) for _ in range(3)])
+        session_factory, connection = make_session_factory()
+
+        await make_catch_up(
+            store,
+            checkpoints,
+            log,
+            partitions=1,
+            rebuild=True,
+            session_factory=session_factory,
+            factory=lambda **overrides: RecordingProjection(
+                log, handled=(EntityExtracted, EntitiesRecordedBatch), **overrides
+            ),
+        ).run()
+
+        [(kind, event, conn)] = log
+        assert kind == "bulk"
+        assert isinstance(event, EntitiesRecordedBatch)
+        assert event.entity_count == 3
+        assert conn is connection
+        session_factory.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_rebuild_chunk_is_replayed_event_by_event(self):
+        """Test a chunk that fails in bulk falls back to per-event handling."""
+        store, checkpoints, log = InMemoryEventStore(), InMemoryCheckpointRepository(), []
+        events = [make_entity(uuid4()) for _ in range(2)]
+        await append(store, events)
+        session_factory, _ = make_session_factory()
+
+        await make_catch_up(
+            store,
+            checkpoints,
+            log,
+            partitions=1,
+            rebuild=True,
+            session_factory=session_factory,
+            factory=lambda **overrides: RecordingProjection(log, fail_bulk=True, **overrides),
+        ).run()
+
+        assert log == [("handle", event) for event in events]
+
+
+class TestCoalesceForBulk:
+    """Tests for coalesce_for_bulk."""
+
+    def test_runs_of_a_page_become_batch_events(self):
+        """Test per-item events are upcast per page, keeping order."""
+        tenant_id, page_a, page_b = uuid4(), uuid4(), uuid4()
+        events = [
+            make_entity(tenant_id, page_a),
+            make_entity(tenant_id, page_a),
+            make_relationship(tenant_id, page_a),
+            make_relationship(tenant_id, page_a),
+            make_relationship(tenant_id, page_b),
+        ]
+        handled = {EntityExtracted, EntitiesRecordedBatch, RelationshipsRecordedBatch}
+
+        coalesced = coalesce_for_bulk(events, handled | {RelationshipDiscovered})
+
+        assert [type(event) for event in coalesced] == [
+            EntitiesRecordedBatch,
+            RelationshipsRecordedBatch,
+            RelationshipDiscovered,
+        ]
+        assert coalesced[1].relationship_count == 2
+        # Unhandled event types are dropped
+        assert coalesce_for_bulk(events, {EntityExtracted}) == events[:2]
+
+    def test_repeated_id_starts_a_new_batch(self):
+        """Test a run never upserts the same entity twice in one statement."""
+        tenant_id, page_id, entity_id = uuid4(), uuid4(), uuid4()
+        events = [make_entity(tenant_id, page_id, entity_id) for _ in range(2)]
+
+        coalesced = coalesce_for_bulk(events, {EntityExtracted, EntitiesRecordedBatch})
+
+        assert coalesced == events
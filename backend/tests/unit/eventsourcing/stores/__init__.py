@@ -0,0 +1 @@
+"""Unit tests for eventsourcing stores."""
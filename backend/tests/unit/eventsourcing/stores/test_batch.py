@@ -0,0 +1,292 @@
+"""
+Unit tests for batched event emission from sync tasks.
+
+Batches are bound to an in-memory SQLite session, so the commit and
+rollback hooks are real; the event store and the PostgreSQL write are
+replaced with mocks. write_events() is checked against the rows
+PostgreSQLEventStore writes, so a library upgrade that changes them fails here.
+"""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+from eventsource import ExpectedVersion, InMemoryEventStore, PostgreSQLEventStore
+from eventsource.stores import ReadOptions
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.eventsourcing.events.scraping import EntitiesExtractedBatch
+from app.eventsourcing.stores.batch import SyncEventBatch, write_events
+from app.eventsourcing.stores.factory import SyncEventStoreWrapper
+from app.worker.runtime import run_async
+
+
+def make_event(page_id=None):
+    page_id = page_id or uuid4()
+    return EntitiesExtractedBatch(
+        aggregate_id=page_id,
+        tenant_id=uuid4(),
+        page_id=page_id,
+        job_id=uuid4(),
+        entity_count=3,
+        schema_org_count=1,
+        llm_extracted_count=2,
+        extracted_at=datetime.now(UTC),
+    )
+
+
+def make_store(transactional: bool):
+    store = MagicMock()
+    store.transactional = transactional
+    store.outbox_enabled = True
+    return store
+
+
+def normalize_insert(statement, row: dict) -> tuple[str, dict]:
+    """Normalize an INSERT and its parameters for comparison across writers.
+
+    UUIDs are compared as strings, JSON columns as decoded values; the
+    random outbox row id and its creation time are dropped.
+    """
+    sql = " ".join(str(statement).split()).split(" RETURNING ")[0]
+    row = {
+        key: str(value) if isinstance(value, UUID) else value
+        for key, value in row.items()
+        if key not in ("id", "created_at")
+    }
+    for key in ("payload", "event_data"):
+        if key in row:
+            row[key] = json.loads(row[key])
+    return sql, row
+
+
+async def append_with_store(groups) -> list[tuple[str, dict]]:
+    """Append each aggregate's events with PostgreSQLEventStore and record its INSERTs."""
+    inserts = []
+
+    async def execute(statement, params=None):
+        sql = str(statement)
+        if "INSERT" in sql:
+            inserts.append(normalize_insert(statement, params))
+        result = MagicMock()
+        # Stream version 0, no existing event, global position 1
+        if "MAX(version)" in sql:
+            result.fetchone.return_value = (0,)
+        elif "SELECT 1" in sql:
+            result.fetchone.return_value = None
+        else:
+            result.fetchone.return_value = (1,)
+        return result
+
+    session = MagicMock()
+    session.execute = execute
+    session.commit = AsyncMock()
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=False)
+    store = PostgreSQLEventStore(
+        MagicMock(return_value=context), outbox_enabled=True, enable_tracing=False
+    )
+    for group in groups:
+        await store.append_events(
+            group[0].aggregate_id, group[0].aggregate_type, group, ExpectedVersion.ANY
+        )
+    return inserts
+
+
+@pytest.fixture
+def session():
+    session = Session(create_engine("sqlite://"))
+    session.execute(text("SELECT 1"))
+    yield session
+    session.close()
+
+
+class TestSyncEventBatch:
+    """Tests for SyncEventBatch."""
+
+    def test_unbound_batch_appends_once_on_flush(self):
+        """Test all events go to the store in one call, duplicates dropped."""
+        store = make_store(transactional=True)
+        batch = SyncEventBatch(store)
+        first, second = make_event(), make_event()
+
+        batch.extend([first, second, first])
+
+        assert not batch.transactional
+        assert batch.flush() == 2
+        store.append_batch_sync.assert_called_once_with([first, second])
+        assert len(batch) == 0
+
+    def test_appended_after_commit_when_not_transactional(self, session):
+        """Test events are appended once the session commits."""
+        store = make_store(transactional=False)
+        batch = SyncEventBatch(store, session)
+        events = [make_event(), make_event()]
+
+        batch.extend(events)
+        store.append_batch_sync.assert_not_called()
+        session.commit()
+
+        store.append_batch_sync.assert_called_once_with(events)
+        assert len(batch) == 0
+
+    def test_rollback_discards_events(self, session):
+        """Test a rollback drops the events collected since the last commit."""
+        store = make_store(transactional=False)
+        batch = SyncEventBatch(store, session)
+
+        batch.add(make_event())
+        session.rollback()
+        session.commit()
+
+        store.append_batch_sync.assert_not_called()
+        assert len(batch) == 0
+
+    def test_savepoint_rollback_keeps_events(self, session):
+        """Test rolling back a savepoint does not drop collected events."""
+        store = make_store(transactional=False)
+        batch = SyncEventBatch(store, session)
+        event = make_event()
+
+        batch.add(event)
+        with pytest.raises(ValueError):
+            with session.begin_nested():
+                raise ValueError("page failed")
+        session.commit()
+
+        store.append_batch_sync.assert_called_once_with([event])
+
+    def test_written_in_transaction_before_commit(self, session):
+        """Test a transactional batch writes with the session before COMMIT."""
+        store = make_store(transactional=True)
+        batch = SyncEventBatch(store, session)
+        events = [make_event(), make_event()]
+        calls = []
+
+        def fake_write(write_session, written, outbox_enabled):
+            calls.append((write_session.in_transaction(), list(written), outbox_enabled))
+
+        batch.extend(events)
+        with patch("app.eventsourcing.stores.batch.write_events", side_effect=fake_write):
+            session.commit()
+
+        assert calls == [(True, events, True)]
+        store.append_batch_sync.assert_not_called()
+
+    def test_failed_write_falls_back_to_append_after_commit(self, session):
+        """Test events that cannot be written in the transaction are appended later."""
+        store = make_store(transactional=True)
+        batch = SyncEventBatch(store, session)
+        event = make_event()
+
+        batch.add(event)
+        with patch(
+            "app.eventsourcing.stores.batch.write_events",
+            side_effect=RuntimeError("permission denied"),
+        ):
+            session.commit()
+
+        store.append_batch_sync.assert_called_once_with([event])
+
+    def test_close_detaches_from_session(self, session):
+        """Test a closed batch no longer reacts to commits."""
+        store = make_store(transactional=False)
+        batch = SyncEventBatch(store, session)
+
+        batch.add(make_event())
+        batch.close()
+        session.execute(text("SELECT 1"))
+        session.commit()
+
+        store.append_batch_sync.assert_not_called()
+
+
+class TestWriteEvents:
+    """Tests for write_events."""
+
+    def test_versions_continue_each_aggregate_stream(self):
+        """Test events get consecutive versions after the stored ones."""
+        page_id = uuid4()
+        events = [make_event(page_id), make_event(), make_event(page_id)]
+        session = MagicMock()
+        session.execute.side_effect = [
+            [(page_id, "ExtractedEntity", 4)],
+            None,
+            None,
+        ]
+
+        write_events(session, events, outbox_enabled=True)
+
+        _, event_rows = session.execute.call_args_list[1].args
+        _, outbox_rows = session.execute.call_args_list[2].args
+        assert [(row["aggregate_id"], row["version"]) for row in event_rows] == [
+            (str(page_id), 5),
+            (str(page_id), 6),
+            (str(events[1].aggregate_id), 1),
+        ]
+        assert [row["event_id"] for row in outbox_rows] == [
+            row["event_id"] for row in event_rows
+        ]
+
+    def test_outbox_rows_skipped_when_disabled(self):
+        """Test no outbox statement runs when the outbox is disabled."""
+        session = MagicMock()
+        session.execute.side_effect = [[], None]
+
+        write_events(session, [make_event()], outbox_enabled=False)
+
+        assert session.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rows_match_postgresql_event_store(self):
+        """Test events and outbox rows are written exactly as the library's store writes them."""
+        page_id = uuid4()
+        events = [make_event(page_id), make_event(page_id), make_event()]
+        session = MagicMock()
+        session.execute.side_effect = [[], None, None]
+
+        write_events(session, events, outbox_enabled=True)
+
+        written = [
+            normalize_insert(call.args[0], row)
+            for call in session.execute.call_args_list[1:]
+            for row in call.args[1]
+        ]
+        expected = await append_with_store([events[:2], events[2:]])
+
+        # The store interleaves each event row with its outbox row
+        for table in ("INTO events ", "INTO event_outbox "):
+            assert [insert for insert in written if table in insert[0]] == [
+                insert for insert in expected if table in insert[0]
+            ]
+        assert len(written) == len(expected) == 6
+
+
+class TestSyncEventStoreWrapper:
+    """Tests for SyncEventStoreWrapper batch appends."""
+
+    def test_append_batch_sync_groups_by_aggregate(self):
+        """Test events of several aggregates are appended in one call."""
+        store = InMemoryEventStore()
+        wrapper = SyncEventStoreWrapper(store)
+        page_id = uuid4()
+        events = [make_event(page_id), make_event(), make_event(page_id)]
+
+        wrapper.append_batch_sync(events)
+
+        async def read_all():
+            return [stored async for stored in store.read_all(ReadOptions())]
+
+        stored = run_async(read_all())
+        assert {s.event.event_id for s in stored} == {e.event_id for e in events}
+        versions = {
+            (s.event.event_id, s.stream_position)
+            for s in stored
+            if s.event.aggregate_id == page_id
+        }
+        assert versions == {(events[0].event_id, 1), (events[2].event_id, 2)}
+        assert not wrapper.transactional
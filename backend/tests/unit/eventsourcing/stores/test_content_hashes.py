@@ -0,0 +1,199 @@
+"""
+Unit tests for the extraction trigger content hash stores.
+
+The PostgreSQL store runs against a mocked session factory, so these tests
+cover claim semantics and the in-process cache, not the SQL itself.
+"""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.eventsourcing.stores.content_hashes import (
+    InMemoryContentHashStore,
+    PostgreSQLContentHashStore,
+)
+
+
+def make_session_factory(*claim_results):
+    """Create a session factory whose INSERT ... RETURNING yields the given rows."""
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            MagicMock(scalar_one_or_none=MagicMock(return_value=value))
+            for value in claim_results
+        ]
+    )
+    session.commit = AsyncMock()
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=context), session
+
+
+class TestInMemoryContentHashStore:
+    """Tests for InMemoryContentHashStore."""
+
+    @pytest.mark.asyncio
+    async def test_claim_succeeds_once_per_tenant(self):
+        """Test content is claimed once per tenant."""
+        store = InMemoryContentHashStore()
+        tenant_id = uuid4()
+
+        assert await store.claim(tenant_id, "hash", uuid4()) is True
+        assert await store.claim(tenant_id, "hash", uuid4()) is False
+        assert await store.claim(uuid4(), "hash", uuid4()) is True
+
+    @pytest.mark.asyncio
+    async def test_release_allows_new_claim(self):
+        """Test a released claim can be made again."""
+        store = InMemoryContentHashStore()
+        tenant_id = uuid4()
+        await store.claim(tenant_id, "hash", uuid4())
+
+        await store.release(tenant_id, "hash")
+
+        assert not await store.contains(tenant_id, "hash")
+        assert await store.claim(tenant_id, "hash", uuid4()) is True
+
+    @pytest.mark.asyncio
+    async def test_reclaim_takes_over_stale_claim_without_process(self):
+        """Test only a stale claim whose process does not exist is reclaimed."""
+        tenant_id, owner = uuid4(), uuid4()
+        fresh = InMemoryContentHashStore()
+        stale = InMemoryContentHashStore(claim_timeout=timedelta(0))
+        for store in (fresh, stale):
+            await store.claim(tenant_id, "hash", owner)
+
+        missing = AsyncMock(return_value=False)
+        assert await fresh.reclaim(tenant_id, "hash", uuid4(), missing) is False
+        assert await stale.reclaim(tenant_id, "hash", uuid4(), AsyncMock(return_value=True)) is False
+        assert await stale.reclaim(tenant_id, "hash", uuid4(), missing) is True
+        missing.assert_awaited_once_with(owner)
+
+    @pytest.mark.asyncio
+    async def test_preclaimed_pairs_are_not_reclaimed(self):
+        """Test pairs passed to the constructor have no process to check."""
+        tenant_id = uuid4()
+        store = InMemoryContentHashStore({(tenant_id, "hash")}, claim_timeout=timedelta(0))
+        process_exists = AsyncMock(return_value=False)
+
+        assert await store.reclaim(tenant_id, "hash", uuid4(), process_exists) is False
+        process_exists.assert_not_awaited()
+
+
+class TestPostgreSQLContentHashStore:
+    """Tests for PostgreSQLContentHashStore."""
+
+    @pytest.mark.asyncio
+    async def test_claim_inserts_and_reports_conflicts(self):
+        """Test the claim result reflects whether the insert returned a row."""
+        process_id = uuid4()
+        session_factory, session = make_session_factory(process_id, None)
+        store = PostgreSQLContentHashStore(session_factory, cache_size=10)
+
+        assert await store.claim(uuid4(), "hash_a", process_id) is True
+        assert await store.claim(uuid4(), "hash_b", uuid4()) is False
+
+        assert session.execute.await_count == 2
+        assert session.commit.await_count == 2
+        sql = str(session.execute.await_args_list[0].args[0])
+        assert "ON CONFLICT" in sql
+        assert "DO NOTHING" in sql
+
+    @pytest.mark.asyncio
+    async def test_repeated_claim_answered_from_cache(self):
+        """Test a pair claimed before is rejected without a database round trip."""
+        session_factory, session = make_session_factory(uuid4())
+        store = PostgreSQLContentHashStore(session_factory, cache_size=10)
+        tenant_id = uuid4()
+
+        await store.claim(tenant_id, "hash", uuid4())
+
+        assert await store.claim(tenant_id, "hash", uuid4()) is False
+        assert await store.contains(tenant_id, "hash") is True
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self):
+        """Test the least recently seen pairs are evicted from the cache."""
+        session_factory, _ = make_session_factory(*[uuid4() for _ in range(5)])
+        store = PostgreSQLContentHashStore(session_factory, cache_size=3)
+        tenant_id = uuid4()
+
+        for i in range(5):
+            await store.claim(tenant_id, f"hash_{i}", uuid4())
+
+        assert list(store._cache) == [(tenant_id, f"hash_{i}") for i in range(2, 5)]
+
+    @pytest.mark.asyncio
+    async def test_release_deletes_and_uncaches(self):
+        """Test release removes the claim from the table and the cache."""
+        session_factory, session = make_session_factory(uuid4(), None)
+        store = PostgreSQLContentHashStore(session_factory, cache_size=10)
+        tenant_id = uuid4()
+        await store.claim(tenant_id, "hash", uuid4())
+
+        await store.release(tenant_id, "hash")
+
+        assert (tenant_id, "hash") not in store._cache
+        assert "DELETE FROM processed_content_hashes" in str(
+            session.execute.await_args_list[1].args[0]
+        )
+
+    @pytest.mark.asyncio
+    async def test_lost_claim_is_not_cached(self):
+        """Test a pair claimed elsewhere is checked again, as its process may never exist."""
+        session_factory, session = make_session_factory(None, None)
+        store = PostgreSQLContentHashStore(session_factory, cache_size=10)
+        tenant_id = uuid4()
+
+        await store.claim(tenant_id, "hash", uuid4())
+        await store.claim(tenant_id, "hash", uuid4())
+
+        assert session.execute.await_count == 2
+        assert not store._cache
+
+    @pytest.mark.asyncio
+    async def test_reclaim_replaces_stale_owner(self):
+        """Test a stale claim without a process is updated to the new process."""
+        owner, process_id = uuid4(), uuid4()
+        session_factory, session = make_session_factory(owner, process_id)
+        store = PostgreSQLContentHashStore(session_factory, cache_size=10)
+        tenant_id = uuid4()
+        process_exists = AsyncMock(return_value=False)
+
+        assert await store.reclaim(tenant_id, "hash", process_id, process_exists) is True
+
+        process_exists.assert_awaited_once_with(owner)
+        select_sql, update_sql = (
+            str(call.args[0]) for call in session.execute.await_args_list
+        )
+        assert "created_at <" in select_sql
+        assert "UPDATE processed_content_hashes" in update_sql
+        assert (tenant_id, "hash") in store._cache
+
+    @pytest.mark.asyncio
+    async def test_reclaim_caches_claim_with_process(self):
+        """Test a claim whose process exists is kept and answered from the cache."""
+        session_factory, session = make_session_factory(uuid4())
+        store = PostgreSQLContentHashStore(session_factory, cache_size=10)
+        tenant_id = uuid4()
+        process_exists = AsyncMock(return_value=True)
+
+        assert await store.reclaim(tenant_id, "hash", uuid4(), process_exists) is False
+        assert await store.claim(tenant_id, "hash", uuid4()) is False
+
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reclaim_skips_fresh_claims(self):
+        """Test a claim younger than claim_timeout is not looked up in the event store."""
+        session_factory, _ = make_session_factory(None)
+        store = PostgreSQLContentHashStore(session_factory, cache_size=10)
+        process_exists = AsyncMock()
+
+        assert await store.reclaim(uuid4(), "hash", uuid4(), process_exists) is False
+        process_exists.assert_not_awaited()
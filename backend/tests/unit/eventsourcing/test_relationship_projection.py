@@ -1,8 +1,9 @@
 """
 Unit tests for RelationshipProjectionHandler.
 
-Tests the projection handler that processes RelationshipDiscovered events
-to create EntityRelationship records in the database.
+Tests the projection handler that processes RelationshipDiscovered and
+RelationshipsRecordedBatch events to create EntityRelationship records in
+the database.
 """
 
 import pytest
@@ -10,8 +11,15 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
-from app.eventsourcing.events.extraction import RelationshipDiscovered
-from app.eventsourcing.projections.extraction import RelationshipProjectionHandler
+from app.eventsourcing.events.extraction import (
+    RelationshipDiscovered,
+    RelationshipsRecordedBatch,
+)
+from app.eventsourcing.projections.extraction import (
+    _ENTITY_NAME_CACHE_PAGES,
+    RelationshipProjectionHandler,
+    _PageEntityNames,
+)
 
 
 class TestRelationshipProjectionHandlerInit:
@@ -50,81 +58,154 @@ class TestRelationshipProjectionHandlerInit:
         assert handler is not None
 
 
-class TestFindEntityByName:
-    """Test suite for _find_entity_by_name helper method."""
+def _entity_names(**entities):
+    """Build a page name map from name=entity_id pairs."""
+    names = _PageEntityNames()
+    for name, entity_id in entities.items():
+        names.add(entity_id, name, name.lower())
+    return names
+
+
+class TestLoadEntityNames:
+    """Test suite for loading and resolving a page's entity names."""
 
     @pytest.mark.asyncio
-    async def test_find_entity_exact_match(self):
-        """Test finding entity by exact name match."""
+    async def test_page_names_loaded_with_one_query(self):
+        """Test the name map of a page is loaded with a single query."""
         mock_session_factory = MagicMock()
         handler = RelationshipProjectionHandler(session_factory=mock_session_factory)
 
         tenant_id = uuid4()
         page_id = uuid4()
         entity_id = uuid4()
-        entity_name = "TestEntity"
 
-        # Mock connection and query result
         mock_conn = AsyncMock()
         mock_result = MagicMock()
-        mock_result.fetchone.return_value = (entity_id,)
+        mock_result.fetchall.return_value = [(entity_id, "TestEntity", "testentity")]
         mock_conn.execute.return_value = mock_result
 
-        result = await handler._find_entity_by_name(
-            mock_conn, tenant_id, page_id, entity_name
-        )
+        names = await handler._load_entity_names(mock_conn, tenant_id, page_id)
 
-        assert result == entity_id
+        assert names.resolve("TestEntity") == entity_id
         mock_conn.execute.assert_called_once()
+        params = mock_conn.execute.call_args[0][1]
+        assert params == {"tenant_id": tenant_id, "page_id": page_id}
+
+    def test_resolve_exact_then_normalized_name(self):
+        """Test exact names take precedence over normalized names."""
+        exact_id = uuid4()
+        normalized_id = uuid4()
+        names = _PageEntityNames()
+        names.add(normalized_id, "Other Spelling", "testentity")
+        names.add(exact_id, "testentity", "testentity")
+
+        assert names.resolve("testentity") == exact_id
+        assert names.resolve("  TestEntity ") == normalized_id
+        assert names.resolve("Unknown") is None
+
+    def test_first_entity_with_a_name_wins(self):
+        """Test duplicate names resolve to the first loaded entity."""
+        first_id = uuid4()
+        names = _PageEntityNames()
+        names.add(first_id, "Dup", "dup")
+        names.add(uuid4(), "Dup", "dup")
+
+        assert names.resolve("Dup") == first_id
+
+
+class TestEntityNameCache:
+    """Test suite for caching page name maps across events."""
+
+    def _relationship(self, source="A", target="B"):
+        return {
+            "relationship_id": uuid4(),
+            "source_entity_name": source,
+            "target_entity_name": target,
+            "relationship_type": "RELATES",
+            "confidence_score": 1.0,
+            "context": None,
+        }
 
     @pytest.mark.asyncio
-    async def test_find_entity_normalized_match(self):
-        """Test finding entity by normalized name when exact match fails."""
-        mock_session_factory = MagicMock()
-        handler = RelationshipProjectionHandler(session_factory=mock_session_factory)
-
+    async def test_page_loaded_once_across_events(self):
+        """Test consecutive events of one page reuse the cached name map."""
+        handler = RelationshipProjectionHandler(session_factory=MagicMock())
         tenant_id = uuid4()
         page_id = uuid4()
-        entity_id = uuid4()
-        entity_name = "TestEntity"
+        names = _entity_names(A=uuid4(), B=uuid4())
 
-        # Mock connection - first query returns None, second returns entity
-        mock_conn = AsyncMock()
-        mock_result_none = MagicMock()
-        mock_result_none.fetchone.return_value = None
-        mock_result_found = MagicMock()
-        mock_result_found.fetchone.return_value = (entity_id,)
+        with patch.object(
+            handler, "_load_entity_names", new=AsyncMock(return_value=names)
+        ) as mock_load:
+            for _ in range(3):
+                await handler._upsert_relationships(
+                    AsyncMock(), tenant_id, page_id, [self._relationship()]
+                )
 
-        mock_conn.execute.side_effect = [mock_result_none, mock_result_found]
+        mock_load.assert_awaited_once()
 
-        result = await handler._find_entity_by_name(
-            mock_conn, tenant_id, page_id, entity_name
-        )
+    @pytest.mark.asyncio
+    async def test_cached_page_reloaded_once_on_unresolved_name(self):
+        """Test a cached map is refreshed when an endpoint is missing from it."""
+        handler = RelationshipProjectionHandler(session_factory=MagicMock())
+        tenant_id = uuid4()
+        page_id = uuid4()
+        a_id, b_id, c_id = uuid4(), uuid4(), uuid4()
 
-        assert result == entity_id
-        assert mock_conn.execute.call_count == 2
+        with patch.object(
+            handler,
+            "_load_entity_names",
+            new=AsyncMock(
+                side_effect=[
+                    _entity_names(A=a_id, B=b_id),
+                    _entity_names(A=a_id, B=b_id, C=c_id),
+                ]
+            ),
+        ) as mock_load:
+            await handler._upsert_relationships(
+                AsyncMock(), tenant_id, page_id, [self._relationship()]
+            )
+            endpoints = await handler._resolve_endpoints(
+                AsyncMock(), tenant_id, page_id, [self._relationship("A", "C")]
+            )
+
+        assert mock_load.await_count == 2
+        assert endpoints == [(a_id, c_id)]
 
     @pytest.mark.asyncio
-    async def test_find_entity_not_found(self):
-        """Test returns None when entity not found."""
-        mock_session_factory = MagicMock()
-        handler = RelationshipProjectionHandler(session_factory=mock_session_factory)
-
+    async def test_failed_upsert_evicts_cached_page(self):
+        """Test a failed write drops the page so a retry reloads its entities."""
+        handler = RelationshipProjectionHandler(session_factory=MagicMock())
         tenant_id = uuid4()
         page_id = uuid4()
-        entity_name = "NonExistentEntity"
-
-        # Mock connection - both queries return None
         mock_conn = AsyncMock()
-        mock_result_none = MagicMock()
-        mock_result_none.fetchone.return_value = None
-        mock_conn.execute.return_value = mock_result_none
+        mock_conn.execute.side_effect = Exception("foreign key violation")
 
-        result = await handler._find_entity_by_name(
-            mock_conn, tenant_id, page_id, entity_name
-        )
+        with patch.object(
+            handler,
+            "_load_entity_names",
+            new=AsyncMock(return_value=_entity_names(A=uuid4(), B=uuid4())),
+        ):
+            with pytest.raises(Exception, match="foreign key"):
+                await handler._upsert_relationships(
+                    mock_conn, tenant_id, page_id, [self._relationship()]
+                )
+
+        assert (tenant_id, page_id) not in handler._entity_names
 
-        assert result is None
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self):
+        """Test the least recently used pages are evicted."""
+        handler = RelationshipProjectionHandler(session_factory=MagicMock())
+        tenant_id = uuid4()
+
+        with patch.object(
+            handler, "_load_entity_names", new=AsyncMock(return_value=_PageEntityNames())
+        ):
+            for _ in range(_ENTITY_NAME_CACHE_PAGES + 5):
+                await handler._resolve_endpoints(AsyncMock(), tenant_id, uuid4(), [])
+
+        assert len(handler._entity_names) == _ENTITY_NAME_CACHE_PAGES
 
 
 class TestHandleRelationshipDiscovered:
@@ -180,8 +261,8 @@ class TestHandleRelationshipDiscovered:
         # Mock entity lookups and insert
         with patch.object(
             handler,
-            "_find_entity_by_name",
-            side_effect=[source_entity_id, target_entity_id],
+            "_load_entity_names",
+            return_value=_entity_names(PersonA=source_entity_id, CompanyB=target_entity_id),
         ):
             await handler._handle_relationship_discovered(mock_conn, event)
 
@@ -191,13 +272,13 @@ class TestHandleRelationshipDiscovered:
 
         # Check parameters
         params = call_args[0][1]
-        assert params["relationship_id"] == event.relationship_id
+        assert params["relationship_ids"] == [event.relationship_id]
         assert params["tenant_id"] == tenant_id
-        assert params["source_entity_id"] == source_entity_id
-        assert params["target_entity_id"] == target_entity_id
-        assert params["relationship_type"] == "WORKS_FOR"  # Uppercase
-        assert params["confidence_score"] == 0.9
-        assert params["properties"] == '{"context": "PersonA works at CompanyB"}'
+        assert params["source_entity_ids"] == [source_entity_id]
+        assert params["target_entity_ids"] == [target_entity_id]
+        assert params["relationship_types"] == ["WORKS_FOR"]  # Uppercase
+        assert params["confidence_scores"] == [0.9]
+        assert params["properties"] == ['{"context": "PersonA works at CompanyB"}']
 
     @pytest.mark.asyncio
     async def test_skips_when_source_entity_missing(self):
@@ -211,8 +292,8 @@ class TestHandleRelationshipDiscovered:
         # Mock source entity not found
         with patch.object(
             handler,
-            "_find_entity_by_name",
-            side_effect=[None, uuid4()],  # source not found
+            "_load_entity_names",
+            return_value=_entity_names(TargetEntity=uuid4()),
         ):
             await handler._handle_relationship_discovered(mock_conn, event)
 
@@ -231,8 +312,8 @@ class TestHandleRelationshipDiscovered:
         # Mock target entity not found
         with patch.object(
             handler,
-            "_find_entity_by_name",
-            side_effect=[uuid4(), None],  # target not found
+            "_load_entity_names",
+            return_value=_entity_names(SourceEntity=uuid4()),
         ):
             await handler._handle_relationship_discovered(mock_conn, event)
 
@@ -252,14 +333,14 @@ class TestHandleRelationshipDiscovered:
 
         with patch.object(
             handler,
-            "_find_entity_by_name",
-            side_effect=[uuid4(), uuid4()],
+            "_load_entity_names",
+            return_value=_entity_names(SourceEntity=uuid4(), TargetEntity=uuid4()),
         ):
             await handler._handle_relationship_discovered(mock_conn, event)
 
         call_args = mock_conn.execute.call_args
         params = call_args[0][1]
-        assert params["relationship_type"] == "RELATED_TO"
+        assert params["relationship_types"] == ["RELATED_TO"]
 
     @pytest.mark.asyncio
     async def test_empty_properties_when_no_context(self):
@@ -272,14 +353,14 @@ class TestHandleRelationshipDiscovered:
 
         with patch.object(
             handler,
-            "_find_entity_by_name",
-            side_effect=[uuid4(), uuid4()],
+            "_load_entity_names",
+            return_value=_entity_names(SourceEntity=uuid4(), TargetEntity=uuid4()),
         ):
             await handler._handle_relationship_discovered(mock_conn, event)
 
         call_args = mock_conn.execute.call_args
         params = call_args[0][1]
-        assert params["properties"] == '{}'
+        assert params["properties"] == ['{}']
 
 
 class TestRelationshipProjectionIdempotency:
@@ -305,8 +386,8 @@ class TestRelationshipProjectionIdempotency:
 
         with patch.object(
             handler,
-            "_find_entity_by_name",
-            side_effect=[uuid4(), uuid4()],
+            "_load_entity_names",
+            return_value=_entity_names(A=uuid4(), B=uuid4()),
         ):
             await handler._handle_relationship_discovered(mock_conn, event)
 
@@ -338,7 +419,7 @@ class TestRelationshipProjectionLogging:
         )
         mock_conn = AsyncMock()
 
-        with patch.object(handler, "_find_entity_by_name", return_value=None):
+        with patch.object(handler, "_load_entity_names", return_value=_entity_names()):
             with patch(
                 "app.eventsourcing.projections.extraction.logger"
             ) as mock_logger:
@@ -368,8 +449,8 @@ class TestRelationshipProjectionLogging:
 
         with patch.object(
             handler,
-            "_find_entity_by_name",
-            side_effect=[uuid4(), None],  # source found, target not
+            "_load_entity_names",
+            return_value=_entity_names(Source=uuid4()),  # source found, target not
         ):
             with patch(
                 "app.eventsourcing.projections.extraction.logger"
@@ -400,8 +481,8 @@ class TestRelationshipProjectionLogging:
 
         with patch.object(
             handler,
-            "_find_entity_by_name",
-            side_effect=[uuid4(), uuid4()],
+            "_load_entity_names",
+            return_value=_entity_names(Source=uuid4(), Target=uuid4()),
         ):
             with patch(
                 "app.eventsourcing.projections.extraction.logger"
@@ -410,4 +491,46 @@ class TestRelationshipProjectionLogging:
 
                 mock_logger.debug.assert_called_once()
                 call_args = mock_logger.debug.call_args
-                assert "Upserted entity relationship" in call_args[0][0]
+                assert "Upserted entity relationships" in call_args[0][0]
+
+
+class TestHandleRelationshipsRecordedBatch:
+    """Test suite for _handle_relationships_recorded_batch."""
+
+    @pytest.mark.asyncio
+    async def test_batch_upserted_with_one_statement(self):
+        """Test a batch loads its page once and writes resolved relationships together."""
+        handler = RelationshipProjectionHandler(session_factory=MagicMock())
+        tenant_id = uuid4()
+        page_id = uuid4()
+        a_id, b_id, c_id = uuid4(), uuid4(), uuid4()
+        event = RelationshipsRecordedBatch.from_relationship_events(
+            [
+                RelationshipDiscovered(
+                    aggregate_id=page_id,
+                    tenant_id=tenant_id,
+                    relationship_id=uuid4(),
+                    page_id=page_id,
+                    source_entity_name=source,
+                    target_entity_name=target,
+                    relationship_type="CALLS",
+                    confidence_score=0.9,
+                )
+                for source, target in (("A", "B"), ("B", "Missing"), ("b", "C"))
+            ]
+        )
+        mock_conn = AsyncMock()
+
+        with patch.object(
+            handler,
+            "_load_entity_names",
+            new=AsyncMock(return_value=_entity_names(A=a_id, B=b_id, C=c_id)),
+        ) as mock_load:
+            await handler._handle_relationships_recorded_batch(mock_conn, event)
+
+        mock_load.assert_awaited_once_with(mock_conn, tenant_id, page_id)
+        mock_conn.execute.assert_called_once()
+        params = mock_conn.execute.call_args[0][1]
+        assert params["relationship_ids"] == [event.relationship_ids[0], event.relationship_ids[2]]
+        assert params["source_entity_ids"] == [a_id, b_id]
+        assert params["target_entity_ids"] == [b_id, c_id]
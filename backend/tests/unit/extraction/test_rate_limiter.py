@@ -75,6 +75,7 @@ class MockRedis:
         self.zremrangebyscore_result = None
         self.zcard_result = 0
         self.zrange_result = []
+        self.zrem_calls = []
         self.close_called = False
 
     def pipeline(self, transaction=True):
@@ -89,6 +90,9 @@ class MockRedis:
     async def zrange(self, key, start, end, withscores=False):
         return self.zrange_result
 
+    async def zrem(self, key, *members):
+        self.zrem_calls.append((key, members))
+
     async def close(self):
         self.close_called = True
 
@@ -234,6 +238,19 @@ class TestAcquire:
         assert exc_info.value.tenant_id == tenant_id
         assert exc_info.value.retry_after >= 0
 
+    @pytest.mark.asyncio
+    async def test_rejected_request_does_not_use_a_slot(
+        self, rate_limiter, mock_redis, tenant_id
+    ):
+        """Test the entry added for a rejected request is removed again."""
+        mock_redis.mock_pipeline.execute_result = [None, 10, None, None]
+
+        with pytest.raises(RateLimitExceeded):
+            await rate_limiter.acquire(tenant_id)
+
+        (added,) = mock_redis.mock_pipeline.zadd_calls[0][1]
+        assert mock_redis.zrem_calls == [(f"ollama_ratelimit:{tenant_id}", (added,))]
+
     @pytest.mark.asyncio
     async def test_acquire_uses_correct_redis_key(self, rate_limiter, mock_redis, tenant_id):
         """Test acquire uses correct Redis key format."""
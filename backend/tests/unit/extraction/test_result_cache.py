@@ -0,0 +1,163 @@
+"""
+Unit tests for the extraction result cache.
+
+Tests key normalization, hit/miss behavior, size-based eviction and
+graceful degradation, using an in-memory stand-in for the Redis client.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.extraction.ollama_extractor import OllamaExtractionService
+from app.extraction.result_cache import ExtractionCacheKey, ExtractionResultCache
+from app.extraction.schemas import ExtractedEntitySchema, ExtractionResult
+
+
+class InMemoryRedis:
+    """Minimal async Redis stand-in covering the commands the cache uses."""
+
+    def __init__(self):
+        self.values = {}
+        self.index = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def zpopmin(self, key, count):
+        oldest = sorted(self.index.items(), key=lambda item: item[1])[:count]
+        for member, _ in oldest:
+            del self.index[member]
+        return oldest
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+
+class _Pipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._results = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value, ex=None):
+        self._redis.values[key] = value
+        self._results.append(True)
+
+    def zadd(self, key, mapping):
+        self._redis.index.update(mapping)
+        self._results.append(len(mapping))
+
+    def zremrangebyscore(self, key, low, high):
+        self._results.append(0)
+
+    def zcard(self, key):
+        self._results.append(len(self._redis.index))
+
+    async def execute(self):
+        return self._results
+
+
+@pytest.fixture
+def redis():
+    """Provide an in-memory Redis stand-in."""
+    return InMemoryRedis()
+
+
+@pytest.fixture
+def result():
+    """Create a small extraction result."""
+    return ExtractionResult(
+        entities=[ExtractedEntitySchema(name="DomainEvent", entity_type="class", confidence=0.9)]
+    )
+
+
+def _key(text="some chunk text", **overrides):
+    return ExtractionCacheKey.build(
+        text, provider=overrides.pop("provider", "ollama"), model="test-model", **overrides
+    )
+
+
+class TestExtractionCacheKey:
+    """Tests for ExtractionCacheKey."""
+
+    def test_whitespace_differences_share_a_key(self):
+        """Test re-wrapped text maps to the same entry."""
+        assert _key("Event  sourcing\n stores\tevents ").digest == _key(
+            "Event sourcing stores events"
+        ).digest
+
+    def test_model_and_prompt_version_are_part_of_the_key(self):
+        """Test changing provider or prompt version changes the key."""
+        base = _key()
+
+        assert _key(provider="openai").digest != base.digest
+        assert _key(prompt_version="2").digest != base.digest
+
+
+class TestExtractionResultCache:
+    """Tests for ExtractionResultCache."""
+
+    async def test_miss_then_hit(self, redis, result):
+        """Test a stored result is returned validated on the next lookup."""
+        cache = ExtractionResultCache(redis, ttl_seconds=60, max_entries=10)
+        key = _key()
+
+        assert await cache.get(key) is None
+        assert await cache.set(key, result)
+
+        cached = await cache.get(key)
+
+        assert cached == result
+        assert cache.get_cache_stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    async def test_oldest_entries_evicted_over_limit(self, redis, result):
+        """Test the cache holds at most max_entries results."""
+        cache = ExtractionResultCache(redis, ttl_seconds=60, max_entries=2)
+        keys = [_key(f"chunk {i}") for i in range(3)]
+
+        for key in keys:
+            await cache.set(key, result)
+
+        assert len(redis.index) == 2
+        assert await cache.get(keys[0]) is None
+        assert await cache.get(keys[2]) == result
+
+    async def test_redis_errors_degrade_to_miss(self, result):
+        """Test Redis failures never surface to the extraction path."""
+        broken = AsyncMock()
+        broken.get.side_effect = ConnectionError("redis down")
+        broken.pipeline.side_effect = ConnectionError("redis down")
+        cache = ExtractionResultCache(broken, ttl_seconds=60, max_entries=10)
+
+        assert await cache.get(_key()) is None
+        assert await cache.set(_key(), result) is False
+
+
+class TestOllamaResultCache:
+    """Tests for result caching in OllamaExtractionService.extract."""
+
+    async def test_cache_hit_skips_model(self, redis, result):
+        """Test a repeated extraction is served without calling the model."""
+        cache = ExtractionResultCache(redis, ttl_seconds=60, max_entries=10)
+        service = OllamaExtractionService(
+            base_url="http://localhost:11434", model="test-model", result_cache=cache
+        )
+
+        with patch.object(service._agent, "run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value.data = result
+
+            first = await service.extract(content="same text", page_url="https://a.example")
+            second = await service.extract(content="same  text", page_url="https://b.example")
+
+        assert mock_run.await_count == 1
+        assert first == second == result
@@ -0,0 +1,403 @@
+"""
+Unit tests for the fair extraction scheduler.
+
+Tests the Python side of ExtractionScheduler (script arguments, result
+parsing, waiting for eligible jobs) with the Lua scripts mocked, and the
+scheduled worker loop in app.extraction.worker.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.extraction import worker
+from app.extraction.rate_limiter import RateLimitExceeded
+from app.extraction.scheduler import (
+    ExtractionPriority,
+    ExtractionScheduler,
+    LeaseState,
+    ScheduledJob,
+)
+
+
+@pytest.fixture
+def tenant_id():
+    """Generate a test tenant ID."""
+    return uuid4()
+
+
+@pytest.fixture
+def scheduler():
+    """Create a scheduler whose Redis scripts are mocks."""
+    scheduler = ExtractionScheduler(
+        redis_url="redis://localhost:6379/0",
+        max_concurrency=2,
+        rpm=60,
+        burst=3,
+        lease_seconds=120,
+    )
+    scheduler._redis = MagicMock(zrem=AsyncMock(), hset=AsyncMock())
+    scheduler._scripts = {
+        "acquire": AsyncMock(return_value=0),
+        "enqueue": AsyncMock(return_value=1),
+        "dispatch": AsyncMock(return_value=[0, -1]),
+        "release": AsyncMock(return_value=1),
+        "requeue": AsyncMock(return_value=1),
+        "hold": AsyncMock(return_value=1),
+    }
+    return scheduler
+
+
+# =============================================================================
+# Scheduler Tests
+# =============================================================================
+
+
+class TestTokenBucket:
+    """Tests for ExtractionScheduler.acquire."""
+
+    async def test_acquire_passes_rate_and_burst(self, scheduler, tenant_id):
+        """Test acquire runs one script call against the tenant's bucket."""
+        await scheduler.acquire(tenant_id)
+
+        call = scheduler._scripts["acquire"].await_args
+        assert call.kwargs["keys"] == [f"extraction_sched:bucket:{tenant_id}"]
+        assert call.kwargs["args"][:2] == [1.0, 3]
+
+    async def test_empty_bucket_raises_with_retry_after(self, scheduler, tenant_id):
+        """Test an empty bucket reports when the next token is due."""
+        scheduler._scripts["acquire"].return_value = 750
+
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            await scheduler.acquire(tenant_id)
+
+        assert exc_info.value.retry_after == 0.75
+
+
+class TestDispatch:
+    """Tests for submitting and dispatching jobs."""
+
+    async def test_submit_queues_per_tenant_and_priority(self, scheduler, tenant_id):
+        """Test jobs go to the tenant's queue for their priority."""
+        await scheduler.submit(tenant_id, {"process_id": "p1"}, ExtractionPriority.INTERACTIVE)
+
+        call = scheduler._scripts["enqueue"].await_args
+        assert call.kwargs["keys"] == [
+            f"extraction_sched:queue:interactive:{tenant_id}",
+            "extraction_sched:active:interactive",
+        ]
+        assert json.loads(call.kwargs["args"][1]) == {"process_id": "p1"}
+
+    async def test_dispatch_scans_interactive_before_bulk(self, scheduler, tenant_id):
+        """Test the dispatch script receives priorities in dispatch order."""
+        scheduler._scripts["dispatch"].return_value = [
+            1,
+            str(tenant_id),
+            "bulk",
+            json.dumps({"process_id": "p1"}),
+        ]
+
+        job, wait = await scheduler.try_dispatch()
+
+        call = scheduler._scripts["dispatch"].await_args
+        args = call.kwargs["args"]
+        assert call.kwargs["keys"][2] == "extraction_sched:inflight"
+        assert args[-2:] == ["interactive", "bulk"]
+        assert job.tenant_id == tenant_id
+        assert job.priority is ExtractionPriority.BULK
+        assert job.payload == {"process_id": "p1"}
+        assert job.lease_id == args[6]
+        assert wait is None
+
+    async def test_next_job_waits_for_token_instead_of_failing(self, scheduler, tenant_id):
+        """Test next_job sleeps for the advised delay and then dispatches."""
+        scheduler._scripts["dispatch"].side_effect = [
+            [0, 200],
+            [1, str(tenant_id), "interactive", "{}"],
+        ]
+
+        with patch("app.extraction.scheduler.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            job = await scheduler.next_job(timeout=5)
+
+        sleep.assert_awaited_once_with(0.2)
+        assert job.tenant_id == tenant_id
+
+    async def test_next_job_times_out(self, scheduler):
+        """Test next_job returns None when nothing becomes eligible."""
+        job = await scheduler.next_job(timeout=0.05)
+
+        assert job is None
+
+    async def test_release_drops_lease_and_inflight_record(self, scheduler, tenant_id):
+        """Test releasing a job removes its lease and in-flight record together."""
+        job = ScheduledJob(tenant_id, ExtractionPriority.BULK, {}, "lease-1")
+
+        await scheduler.release(job)
+
+        call = scheduler._scripts["release"].await_args
+        assert call.kwargs["keys"] == [
+            "extraction_sched:leases",
+            "extraction_sched:inflight",
+        ]
+        assert call.kwargs["args"] == ["lease-1"]
+
+    async def test_requeue_restores_job_by_lease(self, scheduler, tenant_id):
+        """Test requeueing hands the lease to the requeue script."""
+        job = ScheduledJob(tenant_id, ExtractionPriority.BULK, {}, "lease-1")
+
+        await scheduler.requeue(job)
+
+        call = scheduler._scripts["requeue"].await_args
+        assert call.kwargs["args"] == ["extraction_sched", "lease-1"]
+
+    async def test_release_lease_drops_page_claim(self, scheduler):
+        """Test releasing a page job also passes the page's claim key."""
+        page_id = uuid4()
+
+        await scheduler.release_lease("lease-1", page_id)
+
+        call = scheduler._scripts["release"].await_args
+        assert call.kwargs["keys"][2] == f"extraction_sched:page:{page_id}"
+
+    async def test_weight_must_be_positive(self, scheduler, tenant_id):
+        """Test zero or negative weights are rejected."""
+        with pytest.raises(ValueError):
+            await scheduler.set_tenant_weight(tenant_id, 0)
+
+
+class TestLeaseRenewal:
+    """Tests for holding and renewing a dispatched job's lease."""
+
+    async def test_hold_extends_lease_and_claims_page(self, scheduler):
+        """Test holding a lease renews it for a full period under the page claim."""
+        page_id = uuid4()
+
+        state = await scheduler.hold_lease("lease-1", page_id)
+
+        assert state is LeaseState.HELD
+        call = scheduler._scripts["hold"].await_args
+        assert call.kwargs["keys"] == [
+            "extraction_sched:leases",
+            f"extraction_sched:page:{page_id}",
+        ]
+        assert call.kwargs["args"] == ["lease-1", 120]
+
+    @pytest.mark.parametrize(
+        ("result", "expected"),
+        [(0, LeaseState.LOST), (-1, LeaseState.PAGE_BUSY)],
+    )
+    async def test_hold_reports_lost_or_busy(self, scheduler, result, expected):
+        """Test an expired lease or a page held by another run is reported."""
+        scheduler._scripts["hold"].return_value = result
+
+        assert await scheduler.hold_lease("lease-1", uuid4()) is expected
+
+    async def test_keep_lease_stops_once_lost(self, scheduler):
+        """Test the heartbeat renews until the lease is no longer held."""
+        scheduler._lease_seconds = 0.03
+        scheduler._scripts["hold"].side_effect = [1, 1, 0]
+
+        await scheduler.keep_lease("lease-1")
+
+        assert scheduler._scripts["hold"].await_count == 3
+
+
+# =============================================================================
+# Worker Loop Tests
+# =============================================================================
+
+
+class TestRunScheduledExtractions:
+    """Tests for run_scheduled_extractions."""
+
+    def _job(self, tenant_id):
+        return ScheduledJob(
+            tenant_id=tenant_id,
+            priority=ExtractionPriority.BULK,
+            payload={"process_id": str(uuid4())},
+            lease_id="lease",
+        )
+
+    async def test_releases_slot_and_skips_rate_limit(self, tenant_id):
+        """Test each job runs without a second rate check and frees its slot."""
+        scheduler = MagicMock(
+            next_job=AsyncMock(side_effect=[self._job(tenant_id), None]),
+            release=AsyncMock(),
+        )
+        process = AsyncMock(return_value={"status": "completed"})
+
+        with (
+            patch.object(worker, "get_extraction_scheduler", return_value=scheduler),
+            patch.object(worker, "process_extraction", process),
+        ):
+            summary = await worker.run_scheduled_extractions(idle_timeout=0)
+
+        assert summary == {"processed": 1, "statuses": {"completed": 1}}
+        assert process.await_args.kwargs["skip_rate_limit"] is True
+        scheduler.release.assert_awaited_once()
+
+    async def test_circuit_open_requeues_and_stops(self, tenant_id):
+        """Test a job hitting an open circuit is requeued and draining stops."""
+        job = self._job(tenant_id)
+        scheduler = MagicMock(
+            next_job=AsyncMock(return_value=job),
+            release=AsyncMock(),
+            requeue=AsyncMock(),
+        )
+
+        with (
+            patch.object(worker, "get_extraction_scheduler", return_value=scheduler),
+            patch.object(
+                worker,
+                "process_extraction",
+                AsyncMock(return_value={"status": "circuit_open"}),
+            ),
+        ):
+            summary = await worker.run_scheduled_extractions(idle_timeout=0)
+
+        assert summary["processed"] == 1
+        scheduler.requeue.assert_awaited_once_with(job)
+        scheduler.release.assert_not_awaited()
+
+    async def test_unexpected_error_requeues_job(self, tenant_id):
+        """Test a job is not lost when processing raises an unexpected error."""
+        job = self._job(tenant_id)
+        scheduler = MagicMock(
+            next_job=AsyncMock(return_value=job),
+            release=AsyncMock(),
+            requeue=AsyncMock(),
+        )
+
+        with (
+            patch.object(worker, "get_extraction_scheduler", return_value=scheduler),
+            patch.object(
+                worker,
+                "process_extraction",
+                AsyncMock(side_effect=ConnectionError("event store down")),
+            ),
+            pytest.raises(ConnectionError),
+        ):
+            await worker.run_scheduled_extractions(idle_timeout=0)
+
+        scheduler.requeue.assert_awaited_once_with(job)
+        scheduler.release.assert_not_awaited()
+
+    def _page_job(self, tenant_id, lease_id="lease"):
+        return ScheduledJob(
+            tenant_id=tenant_id,
+            priority=ExtractionPriority.BULK,
+            payload={"page_id": str(uuid4())},
+            lease_id=lease_id,
+        )
+
+    async def test_page_jobs_are_dispatched_with_their_lease(self, tenant_id):
+        """Test page jobs go to the dispatcher, which takes over the lease."""
+        job = self._page_job(tenant_id)
+        scheduler = MagicMock(
+            next_job=AsyncMock(side_effect=[job, None]),
+            try_dispatch=AsyncMock(return_value=(None, None)),
+            release=AsyncMock(),
+            requeue=AsyncMock(),
+        )
+        dispatch_pages = MagicMock()
+
+        with patch.object(worker, "get_extraction_scheduler", return_value=scheduler):
+            summary = await worker.run_scheduled_extractions(
+                idle_timeout=0, dispatch_pages=dispatch_pages
+            )
+
+        assert summary == {"processed": 1, "statuses": {"dispatched": 1}}
+        dispatch_pages.assert_called_once_with([job])
+        scheduler.release.assert_not_awaited()
+        scheduler.requeue.assert_not_awaited()
+
+    async def test_eligible_page_jobs_are_batched_per_tenant(self, tenant_id):
+        """Test page jobs eligible together are dispatched as one batch per tenant."""
+        other_tenant = uuid4()
+        first = self._page_job(tenant_id, "lease-1")
+        second = self._page_job(other_tenant, "lease-2")
+        third = self._page_job(tenant_id, "lease-3")
+        scheduler = MagicMock(
+            next_job=AsyncMock(side_effect=[first, None]),
+            try_dispatch=AsyncMock(
+                side_effect=[(second, None), (third, None), (None, 0.5)]
+            ),
+            requeue=AsyncMock(),
+        )
+        dispatch_pages = MagicMock()
+
+        with patch.object(worker, "get_extraction_scheduler", return_value=scheduler):
+            summary = await worker.run_scheduled_extractions(
+                idle_timeout=0, dispatch_pages=dispatch_pages, page_batch_size=4
+            )
+
+        assert summary == {"processed": 3, "statuses": {"dispatched": 3}}
+        assert [call.args[0] for call in dispatch_pages.call_args_list] == [
+            [first, third],
+            [second],
+        ]
+
+    async def test_page_batch_stops_at_process_job(self, tenant_id):
+        """Test a process job taken while filling a page batch still runs."""
+        page_job = self._page_job(tenant_id)
+        process_job = self._job(tenant_id)
+        scheduler = MagicMock(
+            next_job=AsyncMock(side_effect=[page_job, None]),
+            try_dispatch=AsyncMock(return_value=(process_job, None)),
+            release=AsyncMock(),
+            requeue=AsyncMock(),
+        )
+        dispatch_pages = MagicMock()
+
+        with (
+            patch.object(worker, "get_extraction_scheduler", return_value=scheduler),
+            patch.object(
+                worker,
+                "process_extraction",
+                AsyncMock(return_value={"status": "completed"}),
+            ),
+        ):
+            summary = await worker.run_scheduled_extractions(
+                idle_timeout=0, dispatch_pages=dispatch_pages
+            )
+
+        assert summary == {
+            "processed": 2,
+            "statuses": {"dispatched": 1, "completed": 1},
+        }
+        dispatch_pages.assert_called_once_with([page_job])
+        scheduler.release.assert_awaited_once_with(process_job)
+
+    async def test_failed_page_dispatch_requeues_job(self, tenant_id):
+        """Test a page job whose hand-off fails goes back to the queue."""
+        job = self._page_job(tenant_id)
+        scheduler = MagicMock(
+            next_job=AsyncMock(return_value=job),
+            try_dispatch=AsyncMock(return_value=(None, None)),
+            requeue=AsyncMock(),
+        )
+
+        with (
+            patch.object(worker, "get_extraction_scheduler", return_value=scheduler),
+            pytest.raises(ConnectionError),
+        ):
+            await worker.run_scheduled_extractions(
+                idle_timeout=0,
+                dispatch_pages=MagicMock(side_effect=ConnectionError("broker down")),
+            )
+
+        scheduler.requeue.assert_awaited_once_with(job)
+
+    async def test_schedule_page_extraction_queues_page_payload(self, tenant_id):
+        """Test pages are queued as page jobs for their tenant."""
+        scheduler = MagicMock(submit=AsyncMock(return_value=1))
+        page_id = uuid4()
+
+        with patch.object(worker, "get_extraction_scheduler", return_value=scheduler):
+            await worker.schedule_page_extraction(page_id, str(tenant_id))
+
+        scheduler.submit.assert_awaited_once_with(
+            tenant_id, {"page_id": str(page_id)}, ExtractionPriority.BULK
+        )
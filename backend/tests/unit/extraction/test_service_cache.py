@@ -0,0 +1,118 @@
+"""
+Unit tests for the extraction service cache.
+
+Tests reuse by (provider id, config version), eviction of stale versions,
+LRU and TTL eviction, and closing of evicted services.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.extraction.service_cache import ExtractionServiceCache, provider_cache_key
+from app.models.extraction_provider import ExtractionProvider, ExtractionProviderType
+
+
+@pytest.fixture
+def tenant_id():
+    """Create a test tenant ID."""
+    return uuid.uuid4()
+
+
+def _provider(updated_at=None):
+    """Create a mock Ollama ExtractionProvider."""
+    provider = MagicMock(spec=ExtractionProvider)
+    provider.id = uuid.uuid4()
+    provider.provider_type = ExtractionProviderType.OLLAMA
+    provider.created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    provider.updated_at = updated_at
+    return provider
+
+
+@pytest.fixture
+def registry():
+    """Patch the provider registry to return a fresh mock service per call."""
+    with patch("app.extraction.registry.get_extraction_provider_registry") as get_registry:
+        registry = get_registry.return_value
+        registry.create_service.side_effect = lambda provider, tenant_id: MagicMock(
+            aclose=AsyncMock()
+        )
+        yield registry
+
+
+@pytest.fixture
+def runtime():
+    """Patch the async runtime used to close evicted services."""
+    with patch("app.worker.runtime.get_async_runtime") as get_runtime:
+        runtime = get_runtime.return_value
+        # Discard close coroutines instead of scheduling them
+        runtime.submit.side_effect = lambda coro: coro.close() or MagicMock()
+        yield runtime
+
+
+class TestExtractionServiceCache:
+    """Tests for ExtractionServiceCache."""
+
+    def test_reuses_service_for_same_config(self, registry, runtime, tenant_id):
+        """Test repeated lookups return the same service without rebuilding it."""
+        cache = ExtractionServiceCache(max_size=4, ttl_seconds=60)
+        provider = _provider()
+
+        first = cache.get(provider, tenant_id)
+        second = cache.get(provider, tenant_id)
+
+        assert first is second
+        registry.create_service.assert_called_once()
+
+    def test_config_change_evicts_old_version(self, registry, runtime, tenant_id):
+        """Test updating a provider rebuilds and closes the stale service."""
+        cache = ExtractionServiceCache(max_size=4, ttl_seconds=60)
+        provider = _provider()
+        stale = cache.get(provider, tenant_id)
+
+        provider.updated_at = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        fresh = cache.get(provider, tenant_id)
+
+        assert fresh is not stale
+        assert len(cache) == 1
+        stale.aclose.assert_called_once()
+        runtime.submit.assert_called_once()
+
+    def test_lru_eviction(self, registry, runtime, tenant_id):
+        """Test the least recently used service is evicted at capacity."""
+        cache = ExtractionServiceCache(max_size=2, ttl_seconds=60)
+        a, b, c = _provider(), _provider(), _provider()
+        service_a = cache.get(a, tenant_id)
+        cache.get(b, tenant_id)
+        cache.get(a, tenant_id)  # a is now most recently used
+
+        cache.get(c, tenant_id)
+
+        assert len(cache) == 2
+        assert cache.get(a, tenant_id) is service_a
+        assert registry.create_service.call_count == 3
+
+    def test_expired_service_is_rebuilt(self, registry, runtime, tenant_id):
+        """Test services are rebuilt after the TTL (re-decrypting keys)."""
+        cache = ExtractionServiceCache(max_size=4, ttl_seconds=10)
+        provider = _provider()
+
+        with patch("app.extraction.service_cache.time.monotonic", side_effect=[0, 11]):
+            first = cache.get(provider, tenant_id)
+            second = cache.get(provider, tenant_id)
+
+        assert first is not second
+        first.aclose.assert_called_once()
+
+
+def test_cache_key_uses_config_version():
+    """Test the cache key changes when the provider is updated."""
+    provider = _provider()
+    created_key = provider_cache_key(provider)
+
+    provider.updated_at = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+    assert provider_cache_key(provider) != created_key
+    assert provider_cache_key(provider)[0] == provider.id
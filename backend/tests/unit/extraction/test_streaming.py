@@ -0,0 +1,229 @@
+"""
+Unit tests for streaming extraction.
+
+Tests EntityStreamParser and OllamaExtractionService.extract_streaming()
+with a stubbed inference provider, so no Ollama server is contacted.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.extraction.ollama_extractor import OllamaExtractionService
+from app.extraction.schemas import (
+    ExtractedEntitySchema,
+    ExtractedRelationshipSchema,
+    ExtractionResult,
+)
+from app.extraction.streaming import EntityStreamParser, parse_streamed_result
+from app.inference.providers.base import InferenceChunk
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+STREAMING_SETTINGS = SimpleNamespace(
+    OLLAMA_TEMPERATURE=0.1,
+    OLLAMA_MAX_CONTEXT_LENGTH=8000,
+    OLLAMA_MAX_CONTEXT_TOKENS=0,
+    EXTRACTION_STREAMING_MAX_TOKENS=4096,
+)
+
+
+@pytest.fixture
+def extraction_result():
+    """Create a valid extraction result."""
+    return ExtractionResult(
+        entities=[
+            ExtractedEntitySchema(
+                name="DomainEvent",
+                entity_type="class",
+                description='Base class for "domain" events {with braces}',
+                confidence=0.95,
+                properties={"methods": ["to_dict"]},
+            ),
+            ExtractedEntitySchema(
+                name="to_dict",
+                entity_type="function",
+                description="Convert event to dictionary",
+                confidence=0.9,
+            ),
+        ],
+        relationships=[
+            ExtractedRelationshipSchema(
+                source_name="DomainEvent",
+                target_name="to_dict",
+                relationship_type="contains",
+                confidence=0.85,
+            ),
+        ],
+    )
+
+
+class RecordingSink:
+    """Sink keeping the entities that were added and not retracted."""
+
+    def __init__(self):
+        self.entities = []
+        self.retractions = []
+        self.added_before_done = 0
+
+    async def add(self, entity):
+        self.entities.append(entity)
+
+    async def retract(self, reason):
+        self.entities = []
+        self.retractions.append(reason)
+
+
+def _stream(text: str, piece_size: int, sink: RecordingSink | None = None):
+    """Build an infer_stream() replacement yielding text in pieces."""
+
+    async def infer_stream(request):
+        for start in range(0, len(text), piece_size):
+            yield InferenceChunk(content=text[start : start + piece_size])
+        if sink is not None:
+            sink.added_before_done = len(sink.entities)
+        yield InferenceChunk(content="", done=True)
+
+    return infer_stream
+
+
+@pytest.fixture
+def service():
+    """Create a service without cache or concurrency limiter."""
+    with patch("app.extraction.ollama_extractor.settings", STREAMING_SETTINGS):
+        yield OllamaExtractionService(
+            base_url="http://localhost:11434",
+            model="test-model",
+            timeout=30,
+            adaptive_concurrency=False,
+        )
+
+
+# =============================================================================
+# Parser Tests
+# =============================================================================
+
+
+class TestEntityStreamParser:
+    """Tests for incremental parsing of the entities array."""
+
+    @pytest.mark.parametrize("piece_size", [1, 7, 10_000])
+    def test_items_are_parsed_whatever_the_piece_size(self, extraction_result, piece_size):
+        """Test every entity is returned once, in order, for any split."""
+        text = extraction_result.model_dump_json()
+        parser = EntityStreamParser()
+
+        items = []
+        for start in range(0, len(text), piece_size):
+            items.extend(parser.feed(text[start : start + piece_size]))
+
+        assert items == [json.loads(e.model_dump_json()) for e in extraction_result.entities]
+        assert parser.items_parsed == 2
+
+    def test_items_complete_before_the_response(self, extraction_result):
+        """Test an entity is returned as soon as its closing brace arrives."""
+        text = extraction_result.model_dump_json()
+        first_end = text.index('"entity_type":"function"')
+        parser = EntityStreamParser()
+
+        assert len(parser.feed(text[:first_end])) == 1
+        assert len(parser.feed(text[first_end:])) == 1
+
+    def test_code_fence_and_other_arrays_are_ignored(self):
+        """Test text around the object and arrays under other keys are skipped."""
+        text = (
+            '```json\n{"relationships": [{"source_name": "a"}], '
+            '"entities": [{"name": "[x]"}, 3, {"name": "b"}]}\n```'
+        )
+
+        assert EntityStreamParser().feed(text) == [{"name": "[x]"}, {"name": "b"}]
+
+    def test_fenced_response_validates(self, extraction_result):
+        """Test parse_streamed_result() strips a Markdown code fence."""
+        text = f"```json\n{extraction_result.model_dump_json()}\n```"
+
+        assert parse_streamed_result(text) == extraction_result
+
+
+# =============================================================================
+# Service Tests
+# =============================================================================
+
+
+class TestExtractStreaming:
+    """Tests for OllamaExtractionService.extract_streaming."""
+
+    @pytest.mark.asyncio
+    async def test_entities_reach_the_sink_while_streaming(self, service, extraction_result):
+        """Test entities are added before the stream ends and match the result."""
+        sink = RecordingSink()
+        service._stream_provider.infer_stream = _stream(
+            extraction_result.model_dump_json(), 16, sink
+        )
+
+        with patch("app.extraction.ollama_extractor.settings", STREAMING_SETTINGS):
+            result = await service.extract_streaming("content", "https://example.com", sink)
+
+        assert result == extraction_result
+        assert sink.added_before_done == 2
+        assert sink.entities == extraction_result.entities
+        assert not sink.retractions
+
+    @pytest.mark.asyncio
+    async def test_invalid_response_is_retracted_and_extracted_again(
+        self, service, extraction_result
+    ):
+        """Test streamed entities are retracted when the response does not validate."""
+        sink = RecordingSink()
+        text = extraction_result.model_dump_json()
+        service._stream_provider.infer_stream = _stream(text[: text.index('"relationships"')], 16)
+        service.extract = AsyncMock(return_value=extraction_result)
+
+        with patch("app.extraction.ollama_extractor.settings", STREAMING_SETTINGS):
+            result = await service.extract_streaming("content", "https://example.com", sink)
+
+        assert result == extraction_result
+        assert len(sink.retractions) == 1
+        assert sink.entities == extraction_result.entities
+        service.extract.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_error_falls_back_without_retracting(self, service, extraction_result):
+        """Test an error before any entity falls back with nothing to retract."""
+        sink = RecordingSink()
+
+        async def infer_stream(request):
+            yield InferenceChunk(content="", done=True, error="model not found")
+
+        service._stream_provider.infer_stream = infer_stream
+        service.extract = AsyncMock(return_value=extraction_result)
+
+        with patch("app.extraction.ollama_extractor.settings", STREAMING_SETTINGS):
+            result = await service.extract_streaming("content", "https://example.com", sink)
+
+        assert result == extraction_result
+        assert not sink.retractions
+        assert sink.entities == extraction_result.entities
+
+    @pytest.mark.asyncio
+    async def test_streamed_entities_differing_from_result_are_retracted(
+        self, service, extraction_result
+    ):
+        """Test the sink is reset when the validated entities differ."""
+        sink = RecordingSink()
+        first, second = (e.model_dump_json() for e in extraction_result.entities)
+        # JSON parsing keeps the last of repeated keys, the parser streams both
+        text = f'{{"entities": [{first}], "entities": [{second}]}}'
+        service._stream_provider.infer_stream = _stream(text, 16)
+
+        with patch("app.extraction.ollama_extractor.settings", STREAMING_SETTINGS):
+            result = await service.extract_streaming("content", "https://example.com", sink)
+
+        assert len(sink.retractions) == 1
+        assert result.entities == extraction_result.entities[1:]
+        assert sink.entities == result.entities
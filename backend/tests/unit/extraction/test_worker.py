@@ -12,6 +12,7 @@ in isolation without requiring actual database connections.
 """
 
 from datetime import UTC, datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 import sys
@@ -33,6 +34,17 @@ def mock_database_module():
     pass
 
 
+WORKER_SETTINGS = SimpleNamespace(
+    EXTRACTION_STREAMING_ENABLED=False,
+    EXTRACTION_STREAMING_FLUSH_SECONDS=60.0,
+)
+
+STREAMING_SETTINGS = SimpleNamespace(
+    EXTRACTION_STREAMING_ENABLED=True,
+    EXTRACTION_STREAMING_FLUSH_SECONDS=60.0,
+)
+
+
 # We need to import after patching - use importlib for controlled import
 @pytest.fixture
 def worker_module():
@@ -55,7 +67,9 @@ def worker_module():
         import app.extraction.worker as worker
 
         importlib.reload(worker)
-        yield worker
+        # Tests stream only where they enable it
+        with patch.object(worker, "settings", WORKER_SETTINGS):
+            yield worker
 
 
 # =============================================================================
@@ -194,8 +208,8 @@ def mock_process(mock_process_state):
     process = MagicMock()
     process.state = mock_process_state
     process.start = MagicMock()
-    process.record_entity = MagicMock(return_value=uuid4())
-    process.record_relationship = MagicMock(return_value=uuid4())
+    process.record_entities = MagicMock(return_value=[uuid4()])
+    process.record_relationships = MagicMock(return_value=[uuid4()])
     process.complete = MagicMock()
     process.fail = MagicMock()
     return process
@@ -383,8 +397,10 @@ class TestProcessExtractionHappyPath:
 
             # Verify method calls
             mock_process.start.assert_called_once()
-            assert mock_process.record_entity.call_count == 3
-            assert mock_process.record_relationship.call_count == 2
+            mock_process.record_entities.assert_called_once()
+            assert len(mock_process.record_entities.call_args[0][0]) == 3
+            mock_process.record_relationships.assert_called_once()
+            assert len(mock_process.record_relationships.call_args[0][0]) == 2
             mock_process.complete.assert_called_once()
             mock_circuit.record_success.assert_called_once()
             mock_repo.save.assert_called_once()
@@ -448,15 +464,16 @@ class TestProcessExtractionHappyPath:
             await worker_module.process_extraction(process_id, tenant_id)
 
             # Verify entity recording
-            entity_calls = mock_process.record_entity.call_args_list
-            assert len(entity_calls) == 3
+            mock_process.record_entities.assert_called_once()
+            entities = mock_process.record_entities.call_args[0][0]
+            assert len(entities) == 3
 
             # Check first entity
-            first_call_kwargs = entity_calls[0][1]
-            assert first_call_kwargs["entity_type"] == "class"
-            assert first_call_kwargs["name"] == "TestClass"
-            assert first_call_kwargs["normalized_name"] == "testclass"
-            assert first_call_kwargs["confidence_score"] == 0.95
+            first_entity = entities[0]
+            assert first_entity["entity_type"] == "class"
+            assert first_entity["name"] == "TestClass"
+            assert first_entity["normalized_name"] == "testclass"
+            assert first_entity["confidence_score"] == 0.95
 
 
 # =============================================================================
@@ -535,6 +552,70 @@ class TestRateLimitHandling:
             # Event store should not be accessed
             mock_get_store.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_defers_without_failing(
+        self,
+        worker_module,
+        process_id,
+        tenant_id,
+        mock_process,
+    ):
+        """Test a full LLM endpoint defers the extraction like a rate limit."""
+        from app.core.concurrency import ConcurrencyLimitExceeded
+
+        with (
+            patch.object(
+                worker_module, "get_circuit_breaker"
+            ) as mock_get_circuit,
+            patch.object(
+                worker_module, "get_rate_limiter"
+            ) as mock_get_limiter,
+            patch.object(
+                worker_module, "get_event_store"
+            ) as mock_get_store,
+            patch.object(
+                worker_module, "create_extraction_process_repository"
+            ) as mock_create_repo,
+            patch.object(
+                worker_module, "_get_page_content"
+            ) as mock_get_content,
+            patch.object(
+                worker_module, "get_ollama_extraction_service"
+            ) as mock_get_service,
+            patch.object(worker_module, "set_current_tenant"),
+            patch.object(worker_module, "clear_current_tenant"),
+        ):
+            mock_circuit = AsyncMock()
+            mock_circuit.allow_request = AsyncMock(return_value=True)
+            mock_get_circuit.return_value = mock_circuit
+
+            mock_limiter = AsyncMock()
+            mock_limiter.acquire = AsyncMock()
+            mock_get_limiter.return_value = mock_limiter
+
+            mock_get_store.return_value = MagicMock()
+
+            mock_repo = AsyncMock()
+            mock_repo.load = AsyncMock(return_value=mock_process)
+            mock_repo.save = AsyncMock()
+            mock_create_repo.return_value = mock_repo
+
+            mock_get_content.return_value = "test content"
+
+            mock_service = MagicMock()
+            mock_service.extract = AsyncMock(
+                side_effect=ConcurrencyLimitExceeded("ollama", retry_after=12.0)
+            )
+            mock_get_service.return_value = mock_service
+
+            result = await worker_module.process_extraction(process_id, tenant_id)
+
+            assert result["status"] == "rate_limited"
+            assert result["retry_after"] == 12.0
+            mock_circuit.record_failure.assert_not_called()
+            mock_process.fail.assert_not_called()
+            mock_repo.save.assert_not_called()
+
 
 # =============================================================================
 # Circuit Breaker Tests
@@ -825,3 +906,166 @@ class TestErrorHandling:
             # Check fail was called with retryable=False
             fail_call_kwargs = mock_process.fail.call_args[1]
             assert fail_call_kwargs["retryable"] is False
+
+
+# =============================================================================
+# Streaming Tests
+# =============================================================================
+
+
+@pytest.fixture
+def streaming_mocks(worker_module, mock_process):
+    """Patch the worker's collaborators with streaming enabled."""
+    with (
+        patch.object(worker_module, "settings", STREAMING_SETTINGS),
+        patch.object(worker_module, "get_circuit_breaker") as mock_get_circuit,
+        patch.object(worker_module, "get_rate_limiter") as mock_get_limiter,
+        patch.object(worker_module, "get_event_store"),
+        patch.object(
+            worker_module, "create_extraction_process_repository"
+        ) as mock_create_repo,
+        patch.object(worker_module, "_get_page_content", return_value="test content"),
+        patch.object(
+            worker_module, "get_ollama_extraction_service"
+        ) as mock_get_service,
+        patch.object(worker_module, "set_current_tenant"),
+        patch.object(worker_module, "clear_current_tenant"),
+    ):
+        mock_circuit = AsyncMock()
+        mock_circuit.allow_request = AsyncMock(return_value=True)
+        mock_get_circuit.return_value = mock_circuit
+        mock_get_limiter.return_value = AsyncMock()
+
+        mock_repo = AsyncMock()
+        mock_repo.load = AsyncMock(return_value=mock_process)
+        mock_create_repo.return_value = mock_repo
+
+        mock_process.record_entities = MagicMock(
+            side_effect=lambda entities: [uuid4() for _ in entities]
+        )
+        mock_process.retract_entities = MagicMock()
+        mock_service = MagicMock()
+        mock_get_service.return_value = mock_service
+
+        yield SimpleNamespace(service=mock_service, repo=mock_repo, circuit=mock_circuit)
+
+
+class TestStreamingExtraction:
+    """Tests for recording entities while the response streams in."""
+
+    @pytest.mark.asyncio
+    async def test_streamed_entities_are_saved_before_completion(
+        self,
+        worker_module,
+        process_id,
+        tenant_id,
+        mock_process,
+        mock_extraction_result,
+        streaming_mocks,
+    ):
+        """Test the first entity is saved at once and the rest with completion."""
+        saved_entities = []
+
+        async def extract_streaming(content, page_url, sink):
+            for entity in mock_extraction_result.entities:
+                await sink.add(entity)
+                saved_entities.append(streaming_mocks.repo.save.await_count)
+            return mock_extraction_result
+
+        streaming_mocks.service.extract_streaming = extract_streaming
+
+        result = await worker_module.process_extraction(process_id, tenant_id)
+
+        assert result["status"] == "completed"
+        assert saved_entities == [1, 1, 1]
+        batches = [call.args[0] for call in mock_process.record_entities.call_args_list]
+        assert [[entity["name"] for entity in batch] for batch in batches] == [
+            ["TestClass"],
+            ["test_function", "test_module"],
+        ]
+        mock_process.retract_entities.assert_not_called()
+        mock_process.complete.assert_called_once()
+        assert streaming_mocks.repo.save.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retracted_entities_are_withdrawn_from_the_process(
+        self,
+        worker_module,
+        process_id,
+        tenant_id,
+        mock_process,
+        mock_extraction_result,
+        streaming_mocks,
+    ):
+        """Test a retraction withdraws every recorded entity and saves."""
+
+        async def extract_streaming(content, page_url, sink):
+            await sink.add(mock_extraction_result.entities[0])
+            await sink.retract("streamed response failed validation")
+            for entity in mock_extraction_result.entities:
+                await sink.add(entity)
+            return mock_extraction_result
+
+        streaming_mocks.service.extract_streaming = extract_streaming
+
+        result = await worker_module.process_extraction(process_id, tenant_id)
+
+        assert result["status"] == "completed"
+        retracted_ids, reason = mock_process.retract_entities.call_args.args
+        assert len(retracted_ids) == 1
+        assert reason == "streamed response failed validation"
+        assert sum(len(call.args[0]) for call in mock_process.record_entities.call_args_list) == 4
+        assert streaming_mocks.repo.save.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_after_streaming_withdraws_entities(
+        self,
+        worker_module,
+        process_id,
+        tenant_id,
+        mock_process,
+        mock_extraction_result,
+        streaming_mocks,
+    ):
+        """Test a failed extraction does not keep entities it streamed."""
+        from app.extraction.ollama_extractor import ExtractionError
+
+        async def extract_streaming(content, page_url, sink):
+            await sink.add(mock_extraction_result.entities[0])
+            raise ExtractionError("Ollama connection failed")
+
+        streaming_mocks.service.extract_streaming = extract_streaming
+
+        result = await worker_module.process_extraction(process_id, tenant_id)
+
+        assert result["status"] == "failed"
+        mock_process.retract_entities.assert_called_once()
+        mock_process.fail.assert_called_once()
+        assert streaming_mocks.repo.save.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_after_saving_fails_retryably(
+        self,
+        worker_module,
+        process_id,
+        tenant_id,
+        mock_process,
+        mock_extraction_result,
+        streaming_mocks,
+    ):
+        """Test a saved process is failed as retryable instead of deferred."""
+        from app.core.concurrency import ConcurrencyLimitExceeded
+
+        async def extract_streaming(content, page_url, sink):
+            await sink.add(mock_extraction_result.entities[0])
+            raise ConcurrencyLimitExceeded("ollama", retry_after=12.0)
+
+        streaming_mocks.service.extract_streaming = extract_streaming
+
+        result = await worker_module.process_extraction(process_id, tenant_id)
+
+        assert result["status"] == "failed"
+        assert result["retryable"] is True
+        mock_process.retract_entities.assert_called_once()
+        assert mock_process.fail.call_args.kwargs["retryable"] is True
+        streaming_mocks.circuit.record_failure.assert_not_called()
@@ -0,0 +1,220 @@
+"""
+Unit tests for bulk graph export and import.
+
+Tests export query construction, row/CSV rendering, the Neo4j load
+statements, and checkpointed rebuilds with a mocked loader and session.
+"""
+
+import csv
+import io
+import os
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.graph.bulk import (
+    ENTITIES,
+    ENTITY_COLUMNS,
+    RELATIONSHIPS,
+    GraphBulkLoader,
+    RebuildCheckpoint,
+    export_query,
+    export_row,
+    load_csv_query,
+    rebuild_tenant_graph,
+    rows_to_csv,
+    unwind_query,
+)
+
+
+@pytest.fixture
+def tenant_id():
+    """Generate a test tenant ID."""
+    return uuid4()
+
+
+def _entity_row(entity_id=None, description="A company"):
+    """Build a raw entity export row."""
+    return (
+        entity_id or uuid4(),
+        uuid4(),
+        "Acme, Inc.",
+        "acme, inc.",
+        "organization",
+        description,
+        0.9,
+        MagicMock(value="llm_claude"),
+        {"founded": 1999},
+    )
+
+
+def _stream(*chunks):
+    """Build a mock execute() result streaming the given chunks."""
+    result = MagicMock()
+    result.partitions.return_value = iter(chunks)
+    return result
+
+
+# =============================================================================
+# Export Tests
+# =============================================================================
+
+
+class TestExportQuery:
+    """Tests for export_query."""
+
+    def test_entities_are_canonical_and_ordered(self, tenant_id):
+        """Test entity export is restricted to canonical entities in id order."""
+        sql = str(export_query(ENTITIES, tenant_id).compile(dialect=postgresql.dialect()))
+
+        assert "is_canonical" in sql
+        assert sql.rstrip().endswith("ORDER BY extracted_entities.id")
+
+    def test_resume_filters_after_id(self, tenant_id):
+        """Test resuming adds a keyset condition on the id."""
+        sql = str(
+            export_query(RELATIONSHIPS, tenant_id, after_id=uuid4()).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert "entity_relationships.id >" in sql
+        assert sql.count("is_canonical") == 2
+
+    def test_unknown_kind_raises(self, tenant_id):
+        """Test only entities and relationships can be exported."""
+        with pytest.raises(ValueError):
+            export_query("pages", tenant_id)
+
+
+class TestExportRows:
+    """Tests for row conversion and CSV rendering."""
+
+    def test_entity_row_round_trips_through_csv(self):
+        """Test entity rows render to CSV with the export columns."""
+        row = export_row(ENTITIES, _entity_row(description=None))
+
+        parsed = list(csv.DictReader(io.StringIO(rows_to_csv(ENTITIES, [row]))))
+
+        assert tuple(parsed[0]) == ENTITY_COLUMNS
+        assert parsed[0]["name"] == "Acme, Inc."
+        assert parsed[0]["type_label"] == "Organization"
+        assert parsed[0]["description"] == ""
+        assert parsed[0]["properties"] == '{"founded": 1999}'
+
+    def test_relationship_type_is_normalized(self):
+        """Test relationship types become Neo4j relationship type names."""
+        row = export_row(
+            RELATIONSHIPS,
+            (uuid4(), uuid4(), uuid4(), uuid4(), "works for", 1.0, {}),
+        )
+
+        assert row["type"] == "WORKS_FOR"
+        assert row["properties"] == "{}"
+
+    def test_csv_without_header(self):
+        """Test continuation chunks omit the header line."""
+        row = export_row(ENTITIES, _entity_row())
+
+        assert not rows_to_csv(ENTITIES, [row], header=False).startswith("id,")
+
+
+# =============================================================================
+# Import Tests
+# =============================================================================
+
+
+class TestLoadStatements:
+    """Tests for the Neo4j load statements."""
+
+    def test_unwind_merges_on_id(self):
+        """Test the UNWIND statement merges entities by id."""
+        query = unwind_query(ENTITIES)
+
+        assert query.startswith("UNWIND $rows AS row")
+        assert "MERGE (e:Entity {id: row.id})" in query
+
+    def test_load_csv_batches_transactions(self):
+        """Test LOAD CSV commits in inner transactions of the given size."""
+        query = load_csv_query(RELATIONSHIPS, 2500)
+
+        assert query.startswith("LOAD CSV WITH HEADERS FROM $url AS row")
+        assert "IN TRANSACTIONS OF 2500 ROWS" in query
+        assert "apoc.merge.relationship" in query
+
+    def test_load_csv_writes_and_removes_chunk_file(self, tmp_path):
+        """Test the CSV path loads from the import dir and cleans up."""
+        driver = MagicMock()
+        session = driver.session.return_value.__enter__.return_value
+        session.run.return_value.single.return_value = {"loaded": 1}
+        loader = GraphBulkLoader(driver, import_dir=str(tmp_path))
+
+        loaded = loader.load(ENTITIES, [export_row(ENTITIES, _entity_row())])
+
+        assert loaded == 1
+        url = session.run.call_args.kwargs["url"]
+        assert url.startswith("file:///entities-")
+        assert os.listdir(tmp_path) == []
+
+
+# =============================================================================
+# Rebuild Tests
+# =============================================================================
+
+
+class TestRebuild:
+    """Tests for rebuild_tenant_graph."""
+
+    def test_loads_entities_then_relationships(self, tenant_id):
+        """Test both phases run in order and report checkpoints."""
+        entity_ids = [uuid4(), uuid4()]
+        db = MagicMock()
+        db.execute.side_effect = [
+            _stream([_entity_row(entity_ids[0]), _entity_row(entity_ids[1])]),
+            _stream(),
+        ]
+        loader = MagicMock()
+        loader.load.side_effect = lambda kind, rows: len(rows)
+        progress = []
+
+        totals = rebuild_tenant_graph(
+            db,
+            tenant_id,
+            clear=True,
+            loader=loader,
+            on_chunk=lambda kind, ids, position, totals: progress.append(position),
+        )
+
+        loader.clear_tenant.assert_called_once_with(tenant_id)
+        assert totals["entities"] == 2
+        assert totals["relationships"] == 0
+        assert progress == [RebuildCheckpoint(ENTITIES, str(entity_ids[1]))]
+
+    def test_resume_skips_finished_phase(self, tenant_id):
+        """Test resuming in the relationship phase neither clears nor reloads entities."""
+        after_id = uuid4()
+        db = MagicMock()
+        db.execute.return_value = _stream()
+        loader = MagicMock()
+
+        rebuild_tenant_graph(
+            db,
+            tenant_id,
+            clear=True,
+            checkpoint=RebuildCheckpoint(RELATIONSHIPS, str(after_id)),
+            loader=loader,
+        )
+
+        loader.clear_tenant.assert_not_called()
+        db.execute.assert_called_once()
+        sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "entity_relationships.id >" in sql
+
+    def test_checkpoint_round_trip(self):
+        """Test checkpoints survive serialization as task arguments."""
+        checkpoint = RebuildCheckpoint(RELATIONSHIPS, str(UUID(int=1)))
+
+        assert RebuildCheckpoint.from_dict(checkpoint.to_dict()) == checkpoint
+        assert RebuildCheckpoint.from_dict(None) == RebuildCheckpoint()
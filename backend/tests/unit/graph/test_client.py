@@ -0,0 +1,102 @@
+"""
+Unit tests for the Neo4j graph client.
+
+Tests driver ownership and the single-transaction relationship sync with
+mocked drivers.
+"""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import settings
+from app.graph.client import Neo4jClient
+
+
+@pytest.fixture
+def drivers():
+    """Patch driver creation and return the mocked drivers."""
+    shared = MagicMock(name="shared")
+    owned = MagicMock(name="owned")
+    with (
+        patch("app.graph.client.get_sync_driver", return_value=shared),
+        patch("app.graph.client.create_sync_driver", return_value=owned) as create,
+        patch("app.graph.client.create_async_driver"),
+    ):
+        yield shared, owned, create
+
+
+def _entity(tenant_id):
+    """Build an entity stand-in with the fields the client writes."""
+    return MagicMock(
+        id=uuid4(),
+        tenant_id=tenant_id,
+        entity_type=MagicMock(value="class"),
+        extraction_method=MagicMock(value="llm_ollama"),
+        properties={},
+    )
+
+
+class TestDriverOwnership:
+    """Tests for which driver a client uses and closes."""
+
+    def test_default_client_shares_driver(self, drivers):
+        """Test the configured server uses the shared driver, left open on close."""
+        shared, _, create = drivers
+
+        client = Neo4jClient()
+        client.close()
+
+        assert client._sync_driver is shared
+        create.assert_not_called()
+        shared.close.assert_not_called()
+
+    def test_other_server_gets_own_driver(self, drivers):
+        """Test explicit connection arguments are honoured and closed with the client."""
+        _, owned, create = drivers
+
+        client = Neo4jClient(uri="bolt://other:7687", user="reader")
+        client.close()
+
+        assert client._sync_driver is owned
+        create.assert_called_once_with(
+            "bolt://other:7687", auth=("reader", settings.NEO4J_PASSWORD)
+        )
+        owned.close.assert_called_once()
+
+
+class TestSyncRelationshipWithEntities:
+    """Tests for writing endpoints and a relationship together."""
+
+    def test_statements_run_in_one_transaction(self, drivers):
+        """Test entity nodes and the relationship are written in one execute_write."""
+        client = Neo4jClient()
+        tenant_id = uuid4()
+        source, target = _entity(tenant_id), _entity(tenant_id)
+        relationship = MagicMock(
+            id=uuid4(),
+            tenant_id=tenant_id,
+            source_entity_id=source.id,
+            target_entity_id=target.id,
+            relationship_type="uses",
+            properties={},
+        )
+
+        with patch.object(
+            client,
+            "run_statements",
+            return_value=[[{"node_id": "4:a"}], [{"node_id": "4:b"}], [{"rel_id": "5:r"}]],
+        ) as run_statements:
+            node_ids, rel_id = client.sync_relationship_with_entities(
+                relationship, [source, target]
+            )
+
+        (statements,) = run_statements.call_args.args
+        assert [params.get("id") for _, params in statements[:2]] == [
+            str(source.id),
+            str(target.id),
+        ]
+        assert ":USES" in statements[2][0]
+        assert node_ids == {source.id: "4:a", target.id: "4:b"}
+        assert rel_id == "5:r"
@@ -0,0 +1 @@
+# Preprocessing module unit tests
@@ -0,0 +1,129 @@
+"""
+Unit tests for near-duplicate chunk detection.
+
+Uses an in-memory stand-in for the async Redis client.
+"""
+
+import pytest
+
+from app.preprocessing.dedup import ChunkDeduplicator, LocalLSHIndex
+
+
+class FakePipeline:
+    """Pipeline that queues calls and runs them on execute()."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self._calls.append((name, args))
+
+        return queue
+
+    async def execute(self):
+        return [getattr(self._redis, name)(*args) for name, args in self._calls]
+
+
+class FakeRedis:
+    """Subset of redis.asyncio.Redis backed by dicts."""
+
+    def __init__(self):
+        self.sets: dict[str, set] = {}
+        self.hashes: dict[str, dict] = {}
+        self.ttls: dict[str, int] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, ()))
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    async def hmget(self, key, fields):
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+
+def _article(variant: str = "") -> str:
+    words = [f"word{i}" for i in range(300)]
+    return " ".join(words) + f" Published {variant}"
+
+
+@pytest.fixture
+def dedup():
+    return ChunkDeduplicator(redis_client=FakeRedis(), threshold=0.85, ttl_seconds=60)
+
+
+class TestSignatures:
+    """Tests for MinHash signatures."""
+
+    def test_near_identical_texts_are_similar(self, dedup):
+        """Test texts differing in a few words score above the threshold."""
+        a = dedup.signature(_article("2024-01-01"))
+        b = dedup.signature(_article("2024-02-02"))
+
+        assert dedup.similarity(a, b) >= 0.85
+
+    def test_different_texts_are_not_similar(self, dedup):
+        """Test unrelated texts score far below the threshold."""
+        a = dedup.signature(_article())
+        b = dedup.signature(" ".join(f"other{i}" for i in range(300)))
+
+        assert dedup.similarity(a, b) < 0.2
+
+    def test_local_index_returns_first_similar_key(self, dedup):
+        """Test the in-memory index finds an earlier near-duplicate."""
+        index = LocalLSHIndex(dedup)
+        index.add(0, dedup.signature(_article("a")))
+
+        assert index.query(dedup.signature(_article("b"))) == 0
+        assert index.query(dedup.signature("something else entirely")) is None
+
+
+class TestSharedIndex:
+    """Tests for the Redis-backed index."""
+
+    @pytest.mark.asyncio
+    async def test_finds_chunk_indexed_from_another_source(self, dedup):
+        """Test a near-duplicate from another page is found with its member ID."""
+        await dedup.add("job-1", dedup.signature(_article("a")), "https://a/1", 3)
+
+        match = await dedup.find_duplicate(
+            "job-1", dedup.signature(_article("b")), source="https://a/2"
+        )
+
+        assert match == "https://a/1#3"
+        assert set(dedup._redis.ttls.values()) == {60}
+
+    @pytest.mark.asyncio
+    async def test_same_source_and_other_scopes_are_ignored(self, dedup):
+        """Test a page never matches its own chunks or another job's."""
+        signature = dedup.signature(_article("a"))
+        await dedup.add("job-1", signature, "https://a/1", 0)
+
+        assert await dedup.find_duplicate("job-1", signature, source="https://a/1") is None
+        assert await dedup.find_duplicate("job-2", signature, source="https://a/2") is None
+
+    @pytest.mark.asyncio
+    async def test_without_redis_nothing_is_shared(self):
+        """Test the shared index is a no-op without a Redis client."""
+        dedup = ChunkDeduplicator()
+        signature = dedup.signature(_article())
+        await dedup.add("job-1", signature, "https://a/1", 0)
+
+        assert await dedup.find_duplicate("job-1", signature, source="https://a/2") is None
@@ -0,0 +1,93 @@
+"""
+Unit tests for the entity mergers' candidate generation.
+
+Covers blocked fuzzy merging in SimpleMerger and ambiguous candidate
+selection in LLMMerger.
+"""
+
+import pytest
+
+from app.preprocessing.mergers.llm_merger import LLMMerger
+from app.preprocessing.mergers.simple_merger import SimpleMerger
+
+
+def _entity(name, entity_type="organization", confidence=0.5):
+    return {"name": name, "type": entity_type, "confidence": confidence, "properties": {}}
+
+
+class TestSimpleMergerFuzzyMerge:
+    """Tests for SimpleMerger._fuzzy_merge."""
+
+    def test_similar_names_of_same_type_merge(self):
+        """Test near-identical names merge into the first, others are kept."""
+        merger = SimpleMerger(similarity_threshold=0.92)
+        entities = [
+            _entity("Microsoft Corporation"),
+            _entity("Apple"),
+            _entity("Microsoft Corporations"),
+            _entity("Microsoft Corporation", entity_type="product"),
+        ]
+
+        result = merger._fuzzy_merge(entities)
+
+        assert [e["name"] for e in result] == [
+            "Microsoft Corporation",
+            "Apple",
+            "Microsoft Corporation",
+        ]
+        assert result[0]["_merged_from"] == ["Microsoft Corporation", "Microsoft Corporations"]
+
+    def test_entity_merges_into_first_match_only(self):
+        """Test an entity already merged is not merged again."""
+        merger = SimpleMerger(similarity_threshold=0.9)
+        entities = [
+            _entity("acme corp"),
+            _entity("acme corp."),
+            _entity("acme corp.."),
+            _entity("acme"),
+        ]
+
+        result = merger._fuzzy_merge(entities)
+
+        assert [e["name"] for e in result] == ["acme corp", "acme"]
+
+    def test_type_mismatch_merges_when_not_required(self):
+        """Test types are ignored when require_type_match is False."""
+        merger = SimpleMerger(require_type_match=False)
+        entities = [_entity("Berlin", "city"), _entity("berlin", "location")]
+
+        assert len(merger._fuzzy_merge(entities)) == 1
+
+
+    def test_untyped_entities_merge_when_type_required(self):
+        """Test entities without a type still match each other."""
+        merger = SimpleMerger(similarity_threshold=0.9)
+        entities = [_entity("acme corp", None), _entity("acme corp.", ""), _entity("acme")]
+
+        result = merger._fuzzy_merge(entities)
+
+        assert [e["name"] for e in result] == ["acme corp", "acme"]
+
+
+class TestLLMMergerCandidates:
+    """Tests for LLMMerger._find_ambiguous_candidates."""
+
+    @pytest.fixture
+    def merger(self):
+        return LLMMerger(high_threshold=0.9, low_threshold=0.7, use_llm_for_ambiguous=False)
+
+    def test_only_ambiguous_pairs_are_candidates(self, merger):
+        """Test pairs between the thresholds are returned once, in order."""
+        entities = [
+            _entity("Jonathan Smith", "person"),
+            _entity("Jon Smith", "person"),
+            _entity("Jonathan Smith", "person"),
+            _entity("Quantum Computing", "concept"),
+        ]
+
+        candidates = merger._find_ambiguous_candidates(entities)
+
+        assert [(c.entity_a_name, c.entity_b_name) for c in candidates] == [
+            ("Jonathan Smith", "Jon Smith")
+        ]
+        assert 0.7 <= candidates[0].similarity_score < 0.9
@@ -0,0 +1,107 @@
+"""
+Unit tests for packing small chunks into shared extraction requests.
+
+Tests grouping by size and section count, packed content layout, and
+splitting a packed result back to its sections.
+"""
+
+from app.extraction.schemas import (
+    ExtractedEntitySchema,
+    ExtractedRelationshipSchema,
+    ExtractionResult,
+)
+from app.preprocessing.packing import ChunkPacker, build_packed_content, split_packed_result
+
+
+def _entity(name, source_text=None):
+    return ExtractedEntitySchema(
+        name=name, entity_type="concept", confidence=0.9, source_text=source_text
+    )
+
+
+class TestChunkPacker:
+    """Tests for ChunkPacker.pack."""
+
+    def test_small_chunks_share_packs_up_to_capacity(self):
+        """Test consecutive small texts are packed until max_size is reached."""
+        packer = ChunkPacker(max_size=100, small_chunk_chars=50)
+
+        groups = packer.pack(["a" * 40, "b" * 40, "c" * 40, "d" * 10])
+
+        assert groups == [[0, 1], [2, 3]]
+
+    def test_large_chunks_go_alone(self):
+        """Test texts at or above the threshold are never packed."""
+        packer = ChunkPacker(max_size=100, small_chunk_chars=50)
+
+        groups = packer.pack(["a" * 10, "b" * 60, "c" * 10])
+
+        assert groups == [[1], [0, 2]]
+
+    def test_section_limit(self):
+        """Test packs hold at most max_sections texts."""
+        packer = ChunkPacker(max_size=1000, small_chunk_chars=50, max_sections=2)
+
+        assert packer.pack(["x"] * 5) == [[0, 1], [2, 3], [4]]
+
+    def test_budget_uses_size_of(self):
+        """Test the pack budget is measured with size_of, e.g. in tokens."""
+        packer = ChunkPacker(
+            max_size=4, small_chunk_chars=50, size_of=lambda text: len(text.split())
+        )
+
+        groups = packer.pack(["one two", "three four", "five"])
+
+        assert groups == [[0, 1], [2]]
+
+
+class TestSplitPackedResult:
+    """Tests for build_packed_content and split_packed_result."""
+
+    def test_content_has_numbered_sections(self):
+        """Test each text is delimited by a numbered header."""
+        content = build_packed_content(["first text", "second text"])
+
+        assert "### Section 1\nfirst text" in content
+        assert "### Section 2\nsecond text" in content
+        assert content.index("Section 1\n") < content.index("Section 2\n")
+
+    def test_entities_and_relationships_follow_their_sections(self):
+        """Test results are attributed to the sections that mention them."""
+        texts = [
+            "The EventStore persists every DomainEvent.",
+            "Kafka topics carry  projections downstream.",
+        ]
+        result = ExtractionResult(
+            entities=[
+                _entity("EventStore"),
+                _entity("DomainEvent"),
+                _entity("Kafka topic", source_text="Kafka topics carry projections"),
+            ],
+            relationships=[
+                ExtractedRelationshipSchema(
+                    source_name="EventStore",
+                    target_name="DomainEvent",
+                    relationship_type="uses",
+                    confidence=0.8,
+                )
+            ],
+        )
+
+        first, second = split_packed_result(result, texts)
+
+        assert [e.name for e in first.entities] == ["EventStore", "DomainEvent"]
+        assert [e.name for e in second.entities] == ["Kafka topic"]
+        assert len(first.relationships) == 1
+        assert second.relationships == []
+        assert len(result.entities) == 3
+
+    def test_unmatched_entity_goes_to_closest_section(self):
+        """Test an entity not found verbatim is still attributed once."""
+        texts = ["Snapshots speed up aggregate loading.", "The outbox publishes events."]
+        result = ExtractionResult(entities=[_entity("Outbox publisher")])
+
+        first, second = split_packed_result(result, texts)
+
+        assert first.entities == []
+        assert [e.name for e in second.entities] == ["Outbox publisher"]
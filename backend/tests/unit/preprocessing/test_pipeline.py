@@ -0,0 +1,318 @@
+"""
+Unit tests for the preprocessing pipeline.
+
+Tests concurrent chunk extraction: bounded concurrency, chunk ordering,
+per-chunk failure isolation, retries when the extractor is rate limited,
+per-chunk result caching, packing small chunks across documents, and
+skipping near-duplicate chunks.
+"""
+
+import asyncio
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from app.preprocessing.dedup import ChunkDeduplicator
+from app.preprocessing.exceptions import PipelineConfigError
+from app.preprocessing.factory import ChunkerType
+from app.preprocessing.pipeline import PipelineConfig, PipelineDocument, PreprocessingPipeline
+from app.preprocessing.schemas import Chunk, ChunkingResult
+
+
+class RateLimited(Exception):
+    """Stand-in for RateLimitExceeded."""
+
+    def __init__(self, retry_after: float):
+        super().__init__("rate limited")
+        self.retry_after = retry_after
+
+
+class FakeExtractor:
+    """Extractor returning one entity per chunk, named after the chunk text."""
+
+    def __init__(self, delays=None, failures=None, rate_limits=None):
+        self.delays = delays or {}
+        self.failures = failures or set()
+        self.rate_limits = dict(rate_limits or {})
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+
+    async def extract(self, content, page_url, tenant_id=None, **kwargs):
+        self.calls.append(content)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(content, 0.01))
+            if self.rate_limits.get(content):
+                self.rate_limits[content] -= 1
+                raise RateLimited(retry_after=0.01)
+            if content in self.failures:
+                raise RuntimeError(f"boom {content}")
+            entity = SimpleNamespace(name=content, entity_type="concept")
+            return SimpleNamespace(entities=[entity], relationships=[])
+        finally:
+            self.active -= 1
+
+
+class FixedChunker:
+    """Chunker splitting text into fixed 10-character pieces."""
+
+    chunker_type = "fixed"
+
+    def chunk(self, text, max_chunk_size, overlap_size):
+        chunks = [
+            Chunk(text=text[i : i + 10], chunk_index=i // 10, start_char=i, end_char=i + 10)
+            for i in range(0, len(text), 10)
+        ]
+        return ChunkingResult(
+            chunks=chunks,
+            total_chunks=len(chunks),
+            original_length=len(text),
+            chunking_method=self.chunker_type,
+        )
+
+
+class PassthroughMerger:
+    """Merger that flattens per-chunk results in chunk order."""
+
+    merger_type = "passthrough"
+
+    async def merge_entities(self, entities_by_chunk, relationships_by_chunk, document_context):
+        entities = [e for index in sorted(entities_by_chunk) for e in entities_by_chunk[index]]
+        relationships = [
+            r for index in sorted(relationships_by_chunk) for r in relationships_by_chunk[index]
+        ]
+        return entities, relationships
+
+
+class CacheableExtractor(FakeExtractor):
+    """FakeExtractor that exposes a result cache key."""
+
+    def result_cache_key(self, content):
+        return content
+
+    async def extract(self, content, page_url, tenant_id=None, use_cache=True, **kwargs):
+        assert use_cache is False
+        return await super().extract(content, page_url, tenant_id)
+
+
+class DictResultCache:
+    """Result cache keeping entries in a dict."""
+
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+
+    async def get(self, key):
+        return self.entries.get(key)
+
+    async def set(self, key, result):
+        self.entries[key] = result
+        return True
+
+
+class SectionExtractor(FakeExtractor):
+    """FakeExtractor that returns one entity per section of packed content."""
+
+    async def extract(self, content, page_url, tenant_id=None, **kwargs):
+        self.calls.append(content)
+        sections = re.split(r"### Section \d+\n", content)[1:] or [content]
+        entities = [
+            SimpleNamespace(name=section.strip(), entity_type="concept") for section in sections
+        ]
+        return SimpleNamespace(entities=entities, relationships=[])
+
+
+def _pipeline(result_cache=None, deduplicator=None, **overrides) -> PreprocessingPipeline:
+    """Build a pipeline with a fixed-size chunker and passthrough merger."""
+    config = PipelineConfig(
+        **{"chunk_size": 10, "chunk_overlap": 0, "skip_preprocessing": True, **overrides}
+    )
+    pipeline = PreprocessingPipeline(
+        config, result_cache=result_cache, deduplicator=deduplicator
+    )
+    pipeline._chunker = FixedChunker()
+    pipeline._merger = PassthroughMerger()
+    return pipeline
+
+
+CONTENT = "".join(f"chunk-{i:03d}-" for i in range(6))  # six 10-char chunks
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    """Test no more than max_concurrent_extractions chunks run at once."""
+    extractor = FakeExtractor()
+    pipeline = _pipeline(max_concurrent_extractions=3)
+
+    result = await pipeline.process(CONTENT, extractor, content_type="text/plain")
+
+    assert result.num_chunks == 6
+    assert extractor.max_active == 3
+    assert result.metrics.chunks_processed == 6
+
+
+@pytest.mark.asyncio
+async def test_results_keep_chunk_order():
+    """Test per-chunk results follow chunk order, not completion order."""
+    # Earlier chunks finish last
+    delays = {f"chunk-{i:03d}-": 0.05 - i * 0.008 for i in range(6)}
+    extractor = FakeExtractor(delays=delays, failures={"chunk-001-"})
+    pipeline = _pipeline(max_concurrent_extractions=6)
+
+    result = await pipeline.process(CONTENT, extractor, content_type="text/plain")
+
+    assert result.entities_per_chunk == [1, 0, 1, 1, 1, 1]
+    assert result.chunk_errors == ["Chunk 1: boom chunk-001-"]
+    assert result.metrics.chunks_failed == 1
+    assert result.metrics.chunks_processed == 5
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_chunks_are_retried():
+    """Test chunks rejected by the rate limiter are retried after retry_after."""
+    extractor = FakeExtractor(rate_limits={"chunk-002-": 2})
+    pipeline = _pipeline(max_concurrent_extractions=2)
+
+    result = await pipeline.process(CONTENT, extractor, content_type="text/plain")
+
+    assert result.metrics.chunks_failed == 0
+    assert extractor.calls.count("chunk-002-") == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_retries_are_bounded():
+    """Test a chunk fails once its rate limit retries are exhausted."""
+    extractor = FakeExtractor(rate_limits={"chunk-000-": 5})
+    pipeline = _pipeline(rate_limit_retries=1)
+
+    result = await pipeline.process(CONTENT, extractor, content_type="text/plain")
+
+    assert result.metrics.chunks_failed == 1
+    assert extractor.calls.count("chunk-000-") == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_chunks_skip_extraction():
+    """Test cache hits skip the extractor and misses are written back."""
+    cached = SimpleNamespace(
+        entities=[SimpleNamespace(name="from-cache", entity_type="concept")],
+        relationships=[],
+    )
+    cache = DictResultCache({"chunk-001-": cached, "chunk-004-": cached})
+    extractor = CacheableExtractor()
+    pipeline = _pipeline(result_cache=cache, max_concurrent_extractions=2)
+
+    result = await pipeline.process(CONTENT, extractor, content_type="text/plain")
+
+    assert sorted(extractor.calls) == ["chunk-000-", "chunk-002-", "chunk-003-", "chunk-005-"]
+    assert result.metrics.chunks_from_cache == 2
+    assert result.entities[1]["name"] == "from-cache"
+    assert len(cache.entries) == 6
+
+
+@pytest.mark.asyncio
+async def test_small_chunks_are_packed():
+    """Test small chunks share requests and results keep per-chunk provenance."""
+    extractor = SectionExtractor()
+    # Packs hold up to chunk_size characters: three 10-character chunks
+    pipeline = _pipeline(pack_chunks_below=11, chunk_size=30)
+
+    result = await pipeline.process(CONTENT, extractor, content_type="text/plain")
+
+    assert len(extractor.calls) == 2
+    assert result.metrics.chunks_packed == 6
+    assert result.entities_per_chunk == [1] * 6
+    assert [e["name"] for e in result.entities] == [f"chunk-{i:03d}-" for i in range(6)]
+
+
+@pytest.mark.asyncio
+async def test_token_chunker_packs_by_tokens():
+    """Test packs of a token chunker are bounded by chunk_tokens, not chunk_size."""
+
+    class WordTokenizer:
+        name = "words"
+
+        def token_spans(self, text):
+            return [match.span() for match in re.finditer(r"\w+", text)]
+
+    extractor = SectionExtractor()
+    # Each chunk is two tokens ("chunk", "00N"), so packs hold two chunks
+    # although chunk_size=10 would leave every chunk on its own
+    pipeline = _pipeline(
+        chunker_type=ChunkerType.TOKEN,
+        chunk_tokens=4,
+        chunk_overlap_tokens=0,
+        pack_chunks_below=11,
+    )
+    pipeline._chunker.tokenizer = WordTokenizer()
+
+    result = await pipeline.process(CONTENT, extractor, content_type="text/plain")
+
+    assert len(extractor.calls) == 3
+    assert result.metrics.chunks_packed == 6
+    assert result.entities_per_chunk == [1] * 6
+
+
+@pytest.mark.asyncio
+async def test_batch_packs_across_documents():
+    """Test small documents share one request and get separate results."""
+    extractor = SectionExtractor()
+    pipeline = _pipeline(pack_chunks_below=20, chunk_size=30)
+    documents = [
+        PipelineDocument(content="page one", content_type="text/plain", url="https://a/1"),
+        PipelineDocument(content="page two", content_type="text/plain", url="https://a/2"),
+    ]
+
+    first, second = await pipeline.process_batch(documents, extractor)
+
+    assert len(extractor.calls) == 1
+    assert [e["name"] for e in first.entities] == ["page one"]
+    assert [e["name"] for e in second.entities] == ["page two"]
+    assert first.metrics.chunks_packed == second.metrics.chunks_packed == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_pack_falls_back_to_single_chunks():
+    """Test a failing packed request is retried chunk by chunk."""
+
+    class NoPacks(FakeExtractor):
+        async def extract(self, content, page_url, tenant_id=None, **kwargs):
+            if "### Section" in content:
+                self.calls.append("packed")
+                raise ValueError("invalid JSON")
+            return await super().extract(content, page_url, tenant_id)
+
+    extractor = NoPacks()
+    pipeline = _pipeline(pack_chunks_below=11, chunk_size=30)
+
+    result = await pipeline.process(CONTENT, extractor, content_type="text/plain")
+
+    assert extractor.calls.count("packed") == 2
+    assert result.metrics.chunks_failed == 0
+    assert result.metrics.chunks_packed == 0
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_chunks_reuse_first_result():
+    """Test near-identical documents in a batch are extracted once."""
+    body = " ".join(f"word{i}" for i in range(200))
+    extractor = FakeExtractor()
+    pipeline = _pipeline(deduplicator=ChunkDeduplicator(threshold=0.85), chunk_size=5000)
+    documents = [
+        PipelineDocument(content=f"{body} {day}", content_type="text/plain", url=f"https://a/{day}")
+        for day in ("monday", "tuesday")
+    ]
+
+    first, second = await pipeline.process_batch(documents, extractor, dedup_scope="job-1")
+
+    assert len(extractor.calls) == 1
+    assert first.entities == second.entities
+    assert (first.metrics.chunks_deduplicated, second.metrics.chunks_deduplicated) == (0, 1)
+
+
+def test_invalid_concurrency_rejected():
+    """Test max_concurrent_extractions must be positive."""
+    with pytest.raises(PipelineConfigError):
+        PipelineConfig(max_concurrent_extractions=0)
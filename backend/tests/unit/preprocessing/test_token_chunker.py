@@ -0,0 +1,121 @@
+"""
+Unit tests for the token-aware chunker and tokenization helpers.
+
+Uses a whitespace tokenizer so token counts are easy to reason about.
+"""
+
+import re
+from unittest.mock import patch
+
+import pytest
+
+from app.core.tokenization import ApproximateTokenizer, get_tokenizer, truncate_to_tokens
+from app.preprocessing.chunkers.token_chunker import TokenChunker
+from app.preprocessing.exceptions import ChunkSizeError
+from app.preprocessing.factory import ChunkerFactory, ChunkerType
+
+
+class WhitespaceTokenizer:
+    """Tokenizer treating every whitespace-separated word as one token."""
+
+    name = "whitespace"
+
+    def token_spans(self, text):
+        return [match.span() for match in re.finditer(r"\S+", text)]
+
+
+def _chunker(**kwargs):
+    return TokenChunker(tokenizer=WhitespaceTokenizer(), **kwargs)
+
+
+def _words(count, start=0):
+    return " ".join(f"w{i}" for i in range(start, start + count))
+
+
+class TestTokenChunker:
+    """Tests for TokenChunker."""
+
+    def test_registered_in_factory(self):
+        """Test the chunker can be created through ChunkerFactory."""
+        chunker = ChunkerFactory.create(
+            ChunkerType.TOKEN, {"default_chunk_size": 10, "default_overlap": 2}
+        )
+
+        assert chunker.chunker_type == "token"
+
+    def test_windows_are_sized_in_tokens_with_overlap(self):
+        """Test chunks hold at most max tokens and overlap by the given count."""
+        result = _chunker(default_chunk_size=10, default_overlap=2, snap_to_sentences=False).chunk(
+            _words(25)
+        )
+
+        counts = [chunk.metadata["token_count"] for chunk in result.chunks]
+        assert counts == [10, 10, 9]
+        assert result.chunks[1].text.split()[:2] == ["w8", "w9"]
+        assert result.chunks[-1].text.endswith("w24")
+        assert result.chunks[1].overlap_with_previous > 0
+
+    def test_chunk_ends_snap_to_sentence_boundary(self):
+        """Test a window ends after the last sentence in its second half."""
+        text = f"{_words(7)}. {_words(10, start=7)}"
+
+        result = _chunker(default_chunk_size=10, default_overlap=0).chunk(text)
+
+        assert result.chunks[0].text == f"{_words(7)}."
+        assert result.chunks[1].text.startswith("w7 ")
+
+    def test_short_text_is_a_single_chunk(self):
+        """Test text within the budget yields one chunk and empty text none."""
+        chunker = _chunker(default_chunk_size=10, default_overlap=2)
+
+        assert chunker.chunk(_words(5)).total_chunks == 1
+        assert chunker.chunk("   ").total_chunks == 0
+
+    def test_overlap_must_be_smaller_than_window(self):
+        """Test invalid overlap is rejected."""
+        with pytest.raises(ChunkSizeError):
+            _chunker(default_chunk_size=10, default_overlap=10)
+
+
+class TestTokenization:
+    """Tests for tokenizers and truncate_to_tokens."""
+
+    def test_cjk_counts_one_token_per_character(self):
+        """Test the approximate tokenizer does not undercount CJK text."""
+        spans = ApproximateTokenizer().token_spans("事件溯源 event")
+
+        assert len(spans) == 5
+
+    def test_truncate_to_tokens(self):
+        """Test text is cut after the last token within budget."""
+        text, truncated = truncate_to_tokens(_words(10), 4, WhitespaceTokenizer())
+
+        assert (text, truncated) == ("w0 w1 w2 w3", True)
+        assert truncate_to_tokens(_words(3), 4, WhitespaceTokenizer()) == (_words(3), False)
+
+    def test_truncate_counts_multibyte_characters(self):
+        """Test text shorter in characters than the budget is still tokenized."""
+
+        class ByteTokenizer:
+            """Byte-level tokenizer: one token per UTF-8 byte."""
+
+            name = "bytes"
+
+            def token_spans(self, text):
+                return [
+                    (i, i + 1) for i, char in enumerate(text) for _ in char.encode("utf-8")
+                ]
+
+        text, truncated = truncate_to_tokens("事件溯源", 6, ByteTokenizer())
+
+        assert (text, truncated) == ("事件", True)
+
+    def test_unloadable_tokenizer_falls_back_to_approximate(self):
+        """Test a tokenizer that fails to load degrades to approximate counts."""
+        with patch(
+            "app.core.tokenization.HuggingFaceTokenizer", side_effect=OSError("offline")
+        ):
+            tokenizer = get_tokenizer("example/unreachable-model")
+
+        assert tokenizer.name == "approximate"
+        assert get_tokenizer("") is get_tokenizer("")
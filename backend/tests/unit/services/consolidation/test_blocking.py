@@ -4,6 +4,11 @@ Unit tests for the BlockingEngine service.
 Tests blocking strategies, candidate generation, and tenant isolation.
 """
 
+import itertools
+import random
+import string
+
+import jellyfish
 import pytest
 from uuid import uuid4
 
@@ -11,6 +16,8 @@ from app.services.consolidation.blocking import (
     BlockingEngine,
     BlockingResult,
     BlockingStrategy,
+    block_entities,
+    similar_pairs,
 )
 
 
@@ -302,3 +309,50 @@ class TestPhoneticBlockingConsistency:
 
         # Should be consistent
         assert upper == lower
+
+
+class TestInMemoryBlocking:
+    """Tests for block_entities and similar_pairs."""
+
+    def test_blocks_share_a_key(self):
+        """Test entities are grouped by prefix, type and soundex keys."""
+        names = ["robert smith", "rupert smith", "acme corp", "zeta"]
+        types = ["person", "person", "org", "org"]
+
+        blocks = block_entities(names, types, min_prefix_length=5)
+
+        assert [0, 1] in blocks  # same type (and soundex R163)
+        assert [2, 3] in blocks  # same type
+        assert all(len(block) > 1 for block in blocks)
+
+    def test_strategies_limit_blocks(self):
+        """Test only the requested keys are used."""
+        names = ["acme corp", "acme inc"]
+
+        assert block_entities(names, ["org", "person"], [BlockingStrategy.ENTITY_TYPE]) == []
+        assert block_entities(names, ["org", "person"], [BlockingStrategy.PREFIX]) == [[0, 1]]
+
+    def test_similar_pairs_match_brute_force(self):
+        """Test the vectorized bound never drops a pair above the threshold."""
+        rng = random.Random(7)
+        names = [
+            "".join(rng.choices(string.ascii_lowercase + " .", k=rng.randint(0, 12)))
+            for _ in range(80)
+        ]
+        names += [name[:-1] + "x" for name in names if name] + ["café", "cafe"]
+
+        for threshold in (0.7, 0.92):
+            expected = {
+                (i, j): jellyfish.jaro_winkler_similarity(names[i], names[j])
+                for i, j in itertools.combinations(range(len(names)), 2)
+            }
+            expected = {pair: score for pair, score in expected.items() if score >= threshold}
+
+            assert similar_pairs(names, threshold, [list(range(len(names)))]) == expected
+
+    def test_similar_pairs_stay_within_blocks(self):
+        """Test pairs in different blocks are never compared."""
+        names = ["acme corp", "acme corp.", "acme corp!"]
+
+        assert set(similar_pairs(names, 0.9, [[0, 1]])) == {(0, 1)}
+
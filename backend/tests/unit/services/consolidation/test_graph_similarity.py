@@ -260,31 +260,32 @@ class TestGetNeighborhood:
     async def test_get_neighborhood_queries_both_directions(
         self, service, mock_driver
     ):
-        """Test neighborhood query retrieves outgoing and incoming."""
+        """Test neighborhood query retrieves outgoing and incoming in one query."""
         entity_id = uuid4()
 
         # Create mock session and results
         mock_session = AsyncMock()
         mock_driver.session.return_value.__aenter__.return_value = mock_session
 
-        # Mock outgoing result
-        mock_outgoing_result = AsyncMock()
-        neighbor_id = uuid4()
-        mock_outgoing_result.data.return_value = [
-            {"neighbor_id": str(neighbor_id), "rel_type": "EXTENDS"}
+        outgoing_id = uuid4()
+        incoming_id = uuid4()
+        mock_result = AsyncMock()
+        mock_result.data.return_value = [
+            {
+                "entity_id": str(entity_id),
+                "outgoing": [[str(outgoing_id), "EXTENDS"]],
+                "incoming": [[str(incoming_id), "USES"]],
+            }
         ]
-
-        # Mock incoming result
-        mock_incoming_result = AsyncMock()
-        mock_incoming_result.data.return_value = []
-
-        mock_session.run.side_effect = [mock_outgoing_result, mock_incoming_result]
+        mock_session.run.return_value = mock_result
 
         result = await service.get_neighborhood(entity_id)
 
-        assert mock_session.run.call_count == 2
+        mock_session.run.assert_called_once()
         assert isinstance(result, GraphNeighborhood)
-        assert neighbor_id in result.outgoing_neighbors
+        assert outgoing_id in result.outgoing_neighbors
+        assert incoming_id in result.incoming_neighbors
+        assert result.relationship_types[incoming_id] == "USES"
 
     @pytest.mark.asyncio
     async def test_get_neighborhood_handles_invalid_uuid(
@@ -299,15 +300,73 @@ class TestGetNeighborhood:
         # Return invalid UUID
         mock_result = AsyncMock()
         mock_result.data.return_value = [
-            {"neighbor_id": "not-a-uuid", "rel_type": "EXTENDS"}
+            {
+                "entity_id": str(entity_id),
+                "outgoing": [["not-a-uuid", "EXTENDS"]],
+                "incoming": [],
+            }
         ]
-        mock_session.run.side_effect = [mock_result, AsyncMock(data=AsyncMock(return_value=[]))]
+        mock_session.run.return_value = mock_result
 
         result = await service.get_neighborhood(entity_id)
 
         # Should not raise, just skip invalid
         assert result.neighbor_count == 0
 
+    @pytest.mark.asyncio
+    async def test_get_neighborhood_missing_entity_is_empty(
+        self, service, mock_driver
+    ):
+        """Test entities absent from the graph get an empty neighborhood."""
+        entity_id = uuid4()
+
+        mock_session = AsyncMock()
+        mock_driver.session.return_value.__aenter__.return_value = mock_session
+        mock_session.run.return_value = AsyncMock(data=AsyncMock(return_value=[]))
+
+        result = await service.get_neighborhood(entity_id)
+
+        assert result.entity_id == entity_id
+        assert result.neighbor_count == 0
+
+    @pytest.mark.asyncio
+    async def test_get_neighborhoods_batches_and_caches(self, service, mock_driver):
+        """Test a block is fetched in one query and reused from cache."""
+        entity_ids = [uuid4(), uuid4(), uuid4()]
+
+        mock_session = AsyncMock()
+        mock_driver.session.return_value.__aenter__.return_value = mock_session
+        mock_result = AsyncMock()
+        mock_result.data.return_value = [
+            {"entity_id": str(eid), "outgoing": [], "incoming": []}
+            for eid in entity_ids
+        ]
+        mock_session.run.return_value = mock_result
+
+        first = await service.get_neighborhoods(entity_ids)
+        second = await service.get_neighborhood(entity_ids[1])
+
+        mock_session.run.assert_called_once()
+        kwargs = mock_session.run.call_args[1]
+        assert kwargs["entity_ids"] == [str(eid) for eid in entity_ids]
+        assert set(first) == set(entity_ids)
+        assert second is first[entity_ids[1]]
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_forces_reload(self, service, mock_driver):
+        """Test clear_cache drops cached neighborhoods."""
+        entity_id = uuid4()
+
+        mock_session = AsyncMock()
+        mock_driver.session.return_value.__aenter__.return_value = mock_session
+        mock_session.run.return_value = AsyncMock(data=AsyncMock(return_value=[]))
+
+        await service.get_neighborhood(entity_id)
+        service.clear_cache()
+        await service.get_neighborhood(entity_id)
+
+        assert mock_session.run.call_count == 2
+
 
 class TestComputeSimilarity:
     """Tests for overall graph similarity computation."""
@@ -330,15 +389,18 @@ class TestComputeSimilarity:
 
         shared_neighbor = uuid4()
 
-        # Mock get_neighborhood to return overlapping neighborhoods
-        async def mock_get_neighborhood(entity_id, max_neighbors=100):
-            return GraphNeighborhood(
-                entity_id=entity_id,
-                outgoing_neighbors={shared_neighbor},
-                relationship_types={shared_neighbor: "EXTENDS"},
-            )
-
-        with patch.object(service, "get_neighborhood", mock_get_neighborhood):
+        # Mock get_neighborhoods to return overlapping neighborhoods
+        async def mock_get_neighborhoods(entity_ids, max_neighbors=100):
+            return {
+                entity_id: GraphNeighborhood(
+                    entity_id=entity_id,
+                    outgoing_neighbors={shared_neighbor},
+                    relationship_types={shared_neighbor: "EXTENDS"},
+                )
+                for entity_id in entity_ids
+            }
+
+        with patch.object(service, "get_neighborhoods", mock_get_neighborhoods):
             result = await service.compute_similarity(entity_a_id, entity_b_id)
 
         # Both have identical neighbors and types
@@ -362,10 +424,10 @@ class TestComputeSimilarityScores:
         entity_b_id = uuid4()
 
         # Mock to return empty neighborhoods
-        async def mock_get_neighborhood(entity_id, max_neighbors=100):
-            return GraphNeighborhood(entity_id=entity_id)
+        async def mock_get_neighborhoods(entity_ids, max_neighbors=100):
+            return {entity_id: GraphNeighborhood(entity_id=entity_id) for entity_id in entity_ids}
 
-        with patch.object(service, "get_neighborhood", mock_get_neighborhood):
+        with patch.object(service, "get_neighborhoods", mock_get_neighborhoods):
             result = await service.compute_similarity_scores(entity_a_id, entity_b_id)
 
         assert result.neighborhood is not None
@@ -405,8 +467,8 @@ class TestBatchSimilarity:
 
         mock_result = AsyncMock()
         mock_result.data.return_value = [
-            {"candidate_id": str(cid), "similarity": 0.5}
-            for cid in candidate_ids
+            {"entity_id": str(eid), "outgoing": [], "incoming": []}
+            for eid in [entity_id, *candidate_ids]
         ]
         mock_session.run.return_value = mock_result
 
@@ -416,6 +478,48 @@ class TestBatchSimilarity:
         mock_session.run.assert_called_once()
         assert len(result) == 3
 
+    @pytest.mark.asyncio
+    async def test_batch_computes_jaccard(self, service, mock_driver):
+        """Test batch computes Jaccard over undirected neighbor sets."""
+        entity_id = uuid4()
+        match_id, partial_id, missing_id = uuid4(), uuid4(), uuid4()
+        n1, n2, n3 = (str(uuid4()) for _ in range(3))
+
+        mock_session = AsyncMock()
+        mock_driver.session.return_value.__aenter__.return_value = mock_session
+        mock_result = AsyncMock()
+        mock_result.data.return_value = [
+            {"entity_id": str(entity_id), "outgoing": [[n1, "USES"]], "incoming": [[n2, "CALLS"]]},
+            {"entity_id": str(match_id), "outgoing": [], "incoming": [[n1, "USES"], [n2, "USES"]]},
+            {"entity_id": str(partial_id), "outgoing": [[n2, "USES"], [n3, "USES"]], "incoming": []},
+        ]
+        mock_session.run.return_value = mock_result
+
+        result = await service.compute_similarities_batch(
+            entity_id, [match_id, partial_id, missing_id]
+        )
+
+        assert result[match_id] == pytest.approx(1.0)
+        assert result[partial_id] == pytest.approx(1 / 3)
+        # Candidates absent from the graph are omitted
+        assert missing_id not in result
+
+    @pytest.mark.asyncio
+    async def test_batch_reuses_cached_neighborhoods(self, service, mock_driver):
+        """Test only uncached entities are queried on later batches."""
+        entity_id = uuid4()
+        first_candidate, second_candidate = uuid4(), uuid4()
+
+        mock_session = AsyncMock()
+        mock_driver.session.return_value.__aenter__.return_value = mock_session
+        mock_session.run.return_value = AsyncMock(data=AsyncMock(return_value=[]))
+
+        await service.compute_similarities_batch(entity_id, [first_candidate])
+        await service.compute_similarities_batch(entity_id, [first_candidate, second_candidate])
+
+        second_call_ids = mock_session.run.call_args_list[1][1]["entity_ids"]
+        assert second_call_ids == [str(second_candidate)]
+
     @pytest.mark.asyncio
     async def test_batch_scores_returns_dict(self, service, mock_driver):
         """Test batch_scores returns dict of GraphSimilarityScores."""
@@ -427,8 +531,8 @@ class TestBatchSimilarity:
 
         mock_result = AsyncMock()
         mock_result.data.return_value = [
-            {"candidate_id": str(cid), "similarity": 0.5}
-            for cid in candidate_ids
+            {"entity_id": str(eid), "outgoing": [], "incoming": []}
+            for eid in [entity_id, *candidate_ids]
         ]
         mock_session.run.return_value = mock_result
 
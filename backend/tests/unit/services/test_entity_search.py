@@ -0,0 +1,132 @@
+"""
+Unit tests for indexed entity name search.
+
+Tests the pg_trgm condition/rank builders by compiling them against the
+PostgreSQL dialect, and the Lucene query builder for the Neo4j full-text
+index.
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.entity_search import (
+    SearchMode,
+    build_fulltext_query,
+    entity_search_condition,
+    entity_search_rank,
+    normalize_search_text,
+)
+
+
+def _compile(expression) -> tuple[str, list]:
+    """Compile an expression to PostgreSQL SQL and its bound parameter values."""
+    compiled = expression.compile(dialect=postgresql.dialect())
+    return str(compiled), list(compiled.params.values())
+
+
+# =============================================================================
+# PostgreSQL Tests
+# =============================================================================
+
+
+class TestEntitySearchCondition:
+    """Tests for entity_search_condition."""
+
+    def test_fuzzy_uses_trigram_operators(self):
+        """Test fuzzy search uses similarity operators instead of ILIKE."""
+        sql, params = _compile(entity_search_condition("  Acme   Corp "))
+
+        assert "normalized_name %% %(" in sql
+        assert "<%% extracted_entities.normalized_name" in sql
+        assert "ILIKE" not in sql.upper()
+        assert params == ["acme corp", "acme corp"]
+
+    def test_prefix_uses_anchored_like(self):
+        """Test prefix search anchors the pattern at the start of the name."""
+        sql, params = _compile(entity_search_condition("Acme", SearchMode.PREFIX))
+
+        assert "normalized_name LIKE" in sql
+        assert params == ["acme%"]
+
+    def test_prefix_escapes_wildcards(self):
+        """Test LIKE wildcards in user input are matched literally."""
+        _sql, params = _compile(entity_search_condition("100%_x", SearchMode.PREFIX))
+
+        assert params == ["100\\%\\_x%"]
+
+    def test_short_fuzzy_query_falls_back_to_prefix(self):
+        """Test queries too short for trigrams use prefix matching."""
+        sql, params = _compile(entity_search_condition("ac"))
+
+        assert "LIKE" in sql
+        assert params == ["ac%"]
+
+
+class TestEntitySearchRank:
+    """Tests for entity_search_rank."""
+
+    def test_fuzzy_rank_combines_similarities(self):
+        """Test fuzzy rank takes the best of similarity and word similarity."""
+        sql, params = _compile(entity_search_rank("acme"))
+
+        assert "greatest(similarity(" in sql
+        assert "word_similarity(" in sql
+        assert params == ["acme", "acme"]
+
+    def test_prefix_rank_uses_similarity(self):
+        """Test prefix rank orders completions by similarity."""
+        sql, _params = _compile(entity_search_rank("acme", SearchMode.PREFIX))
+
+        assert sql.startswith("similarity(")
+
+
+def test_normalize_search_text():
+    """Test search text is normalized like entity names."""
+    assert normalize_search_text("  Ada   LOVELACE ") == "ada lovelace"
+
+
+# =============================================================================
+# Neo4j Full-Text Tests
+# =============================================================================
+
+
+class TestBuildFulltextQuery:
+    """Tests for build_fulltext_query."""
+
+    @pytest.fixture
+    def tenant_id(self):
+        """Generate a test tenant ID string."""
+        return str(uuid4())
+
+    def test_scopes_query_to_tenant(self, tenant_id):
+        """Test the tenant restriction is part of the Lucene query."""
+        query = build_fulltext_query("acme", tenant_id)
+
+        assert query.startswith(f'tenant_id:"{tenant_id}" AND name:(')
+
+    def test_fuzzy_expands_terms(self, tenant_id):
+        """Test fuzzy mode boosts exact terms and adds prefix/edit matches."""
+        query = build_fulltext_query("Acme Co", tenant_id)
+
+        assert "(acme^3 OR acme* OR acme~1)" in query
+        # Short terms are not edit-distance expanded
+        assert "(co^3 OR co*)" in query
+        assert " AND (co^3" in query
+
+    def test_prefix_mode_only_expands_last_term(self, tenant_id):
+        """Test prefix mode matches earlier terms exactly and the last as a prefix."""
+        query = build_fulltext_query("acme corp", tenant_id, SearchMode.PREFIX)
+
+        assert query.endswith("name:(acme AND corp*)")
+
+    def test_strips_lucene_syntax(self, tenant_id):
+        """Test Lucene operators and punctuation in input are dropped."""
+        query = build_fulltext_query('acme" OR name:* (x', tenant_id, SearchMode.PREFIX)
+
+        assert query.endswith("name:(acme AND or AND name AND x*)")
+
+    def test_returns_none_without_terms(self, tenant_id):
+        """Test input without searchable terms yields no query."""
+        assert build_fulltext_query(" *?! ", tenant_id) is None
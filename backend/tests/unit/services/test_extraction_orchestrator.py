@@ -0,0 +1,279 @@
+"""
+Unit tests for batch extraction in ExtractionOrchestrator.
+
+LLM extraction is replaced with stubs, so no provider is contacted.
+"""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from app.services.extraction import (
+    ExtractionOrchestrator,
+    ExtractionResult,
+    PageExtractionRequest,
+)
+
+
+def _page(html: str = "<p>content</p>", schema_org_data=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        job_id=uuid4(),
+        url=f"https://example.com/{html}",
+        html_content=html,
+        schema_org_data=schema_org_data or [],
+        open_graph_data={},
+    )
+
+
+class TestExtractFromPages:
+    """Tests for ExtractionOrchestrator.extract_from_pages."""
+
+    def test_results_are_returned_in_request_order(self):
+        """Test each page gets its own result in the order requested."""
+        orchestrator = ExtractionOrchestrator()
+
+        def fake_llm(text, tenant_id, page_url, extraction_provider, dedup_scope, skip_rate_limit):
+            return [{"name": text, "type": "concept"}], []
+
+        orchestrator._extract_with_llm = fake_llm
+        pages = [_page(html=f"page-{i}") for i in range(5)]
+
+        results = orchestrator.extract_from_pages(
+            [PageExtractionRequest(page=page) for page in pages], "tenant", max_concurrency=3
+        )
+
+        assert [result.entities[0]["name"] for result in results] == [
+            f"page-{i}" for i in range(5)
+        ]
+        assert all(result.llm_count == 1 for result in results)
+
+    def test_failing_page_does_not_affect_others(self):
+        """Test an exception is returned in place of the failing page's result."""
+        orchestrator = ExtractionOrchestrator()
+
+        def fake_llm(text, tenant_id, page_url, extraction_provider, dedup_scope, skip_rate_limit):
+            if text == "bad":
+                raise RuntimeError("provider down")
+            return [{"name": text, "type": "concept"}], []
+
+        orchestrator._extract_with_llm = fake_llm
+        requests = [PageExtractionRequest(page=_page(html=html)) for html in ("a", "bad", "c")]
+
+        results = orchestrator.extract_from_pages(requests, "tenant", max_concurrency=2)
+
+        assert isinstance(results[0], ExtractionResult)
+        assert isinstance(results[1], RuntimeError)
+        assert results[2].entities[0]["name"] == "c"
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency pages are extracted at once."""
+        orchestrator = ExtractionOrchestrator()
+        lock = threading.Lock()
+        active = peak = 0
+
+        def fake_llm(text, tenant_id, page_url, extraction_provider, dedup_scope, skip_rate_limit):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return [], []
+
+        orchestrator._extract_with_llm = fake_llm
+        requests = [PageExtractionRequest(page=_page(html=str(i))) for i in range(8)]
+
+        orchestrator.extract_from_pages(requests, "tenant", max_concurrency=2)
+
+        assert 1 < peak <= 2
+
+    def test_llm_disabled_uses_structured_data_only(self):
+        """Test pages without LLM extraction only yield schema.org entities."""
+        orchestrator = ExtractionOrchestrator()
+        orchestrator._extract_with_llm = MagicMock()
+        page = _page(
+            schema_org_data=[{"@type": "Person", "name": "Ada Lovelace"}],
+        )
+
+        [result] = orchestrator.extract_from_pages(
+            [PageExtractionRequest(page=page, use_llm_extraction=False)],
+            "tenant",
+            max_concurrency=1,
+        )
+
+        orchestrator._extract_with_llm.assert_not_called()
+        assert result.llm_count == 0
+        assert result.schema_org_count == len(result.entities) > 0
+        assert not orchestrator.extract_from_pages([], "tenant")
+
+    def test_structured_data_is_parsed_in_process_pool(self):
+        """Test pages with structured data are parsed in worker processes."""
+        orchestrator = ExtractionOrchestrator()
+        people = ["Ada Lovelace", "Alan Turing", "Grace Hopper"]
+        pages = [_page(schema_org_data=[{"@type": "Person", "name": name}]) for name in people]
+        requests = [PageExtractionRequest(page=page, use_llm_extraction=False) for page in pages]
+
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            pool.submit = MagicMock(wraps=pool.submit)
+            with patch(
+                "app.services.extraction.orchestrator.get_process_pool", return_value=pool
+            ):
+                results = orchestrator.extract_from_pages(requests, "tenant", max_concurrency=2)
+
+        assert pool.submit.call_count == 3
+        assert results == [
+            orchestrator.extract_from_page(page, "tenant", use_llm_extraction=False)
+            for page in pages
+        ]
+
+    def test_unparseable_structured_data_fails_only_its_page(self):
+        """Test a page whose structured data cannot be parsed gets the exception."""
+        orchestrator = ExtractionOrchestrator()
+        pages = [_page(schema_org_data=[{"@type": "Person", "name": name}]) for name in "ab"]
+        requests = [PageExtractionRequest(page=page, use_llm_extraction=False) for page in pages]
+
+        def parse(data):
+            if data[0]["name"] == "a":
+                raise ValueError("bad JSON-LD")
+            return [{"name": data[0]["name"], "type": "person"}]
+
+        with (
+            patch("app.services.extraction.orchestrator.get_process_pool", return_value=None),
+            patch("app.extraction.schema_org.extract_entities_from_schema_org", side_effect=parse),
+        ):
+            results = orchestrator.extract_from_pages(requests, "tenant", max_concurrency=2)
+
+        assert isinstance(results[0], ValueError)
+        assert results[1].entities == [{"name": "b", "type": "person"}]
+
+    def test_broken_process_pool_falls_back_to_inline_parsing(self):
+        """Test pages are parsed inline and the pool discarded when it breaks."""
+        orchestrator = ExtractionOrchestrator()
+        pages = [_page(schema_org_data=[{"@type": "Person", "name": name}]) for name in "ab"]
+        requests = [PageExtractionRequest(page=page, use_llm_extraction=False) for page in pages]
+        broken = Future()
+        broken.set_exception(BrokenProcessPool("worker died"))
+        pool = MagicMock()
+        pool.submit.return_value = broken
+
+        with (
+            patch("app.services.extraction.orchestrator.get_process_pool", return_value=pool),
+            patch("app.services.extraction.orchestrator.shutdown_process_pool") as shutdown,
+        ):
+            results = orchestrator.extract_from_pages(requests, "tenant", max_concurrency=2)
+
+        shutdown.assert_called()
+        assert [result.schema_org_count for result in results] == [1, 1]
+
+
+PACKING_SETTINGS = SimpleNamespace(
+    OLLAMA_BASE_URL="http://ollama:11434",
+    PREPROCESSING_ENABLED=True,
+    CHUNK_PACK_BELOW=2000,
+    CHUNK_PACK_MAX_SECTIONS=2,
+)
+
+
+class TestPagePacking:
+    """Tests for batching pages of one job through the preprocessing pipeline."""
+
+    def test_pages_of_a_job_and_domain_are_batched(self):
+        """Test pages of the same job and domain share a pipeline run."""
+        orchestrator = ExtractionOrchestrator()
+        job_id = uuid4()
+        pages = [_page(html=f"page-{i}") for i in range(4)]
+        for page in pages[:3]:
+            page.job_id = job_id
+        pages[2].url = "https://other.example/page-2"
+        batches = []
+
+        def fake_batch(pages, tenant_id, skip_rate_limit=False):
+            batches.append([page.html_content for page in pages])
+            return [
+                ([{"name": f"batched {page.html_content}", "type": "concept"}], [])
+                for page in pages
+            ]
+
+        def fake_llm(text, tenant_id, page_url, extraction_provider, dedup_scope, skip_rate_limit):
+            return [{"name": text, "type": "concept"}], []
+
+        orchestrator._extract_batch_with_preprocessing_pipeline = fake_batch
+        orchestrator._extract_with_llm = fake_llm
+
+        with patch("app.services.extraction.orchestrator.settings", PACKING_SETTINGS):
+            results = orchestrator.extract_from_pages(
+                [PageExtractionRequest(page=page) for page in pages], "tenant", max_concurrency=2
+            )
+
+        assert batches == [["page-0", "page-1"]]
+        assert [result.entities[0]["name"] for result in results] == [
+            "batched page-0",
+            "batched page-1",
+            "page-2",
+            "page-3",
+        ]
+
+    def test_batches_hold_at_most_max_sections_pages(self):
+        """Test a job's pages are split into batches of CHUNK_PACK_MAX_SECTIONS."""
+        orchestrator = ExtractionOrchestrator()
+        job_id = uuid4()
+        pages = [_page(html=f"page-{i}") for i in range(5)]
+        for page in pages:
+            page.job_id = job_id
+            page.url = "https://example.com/"
+
+        with patch("app.services.extraction.orchestrator.settings", PACKING_SETTINGS):
+            groups = orchestrator._group_pages_for_packing(
+                [PageExtractionRequest(page=page) for page in pages]
+            )
+
+        assert groups == [[0, 1], [2, 3], [4]]
+
+    def test_failed_batch_extracts_pages_one_by_one(self):
+        """Test pages of a failed batch fall back to per-page extraction."""
+        orchestrator = ExtractionOrchestrator()
+        job_id = uuid4()
+        pages = [_page(html=f"page-{i}") for i in range(2)]
+        for page in pages:
+            page.job_id = job_id
+            page.url = "https://example.com/"
+
+        def fake_llm(text, tenant_id, page_url, extraction_provider, dedup_scope, skip_rate_limit):
+            return [{"name": text, "type": "concept"}], []
+
+        orchestrator._extract_batch_with_preprocessing_pipeline = MagicMock(return_value=None)
+        orchestrator._extract_with_llm = fake_llm
+
+        with patch("app.services.extraction.orchestrator.settings", PACKING_SETTINGS):
+            results = orchestrator.extract_from_pages(
+                [PageExtractionRequest(page=page) for page in pages], "tenant", max_concurrency=2
+            )
+
+        orchestrator._extract_batch_with_preprocessing_pipeline.assert_called_once()
+        assert [result.entities[0]["name"] for result in results] == ["page-0", "page-1"]
+
+    def test_packing_disabled_extracts_pages_one_by_one(self):
+        """Test no batches are formed when CHUNK_PACK_BELOW is 0."""
+        orchestrator = ExtractionOrchestrator()
+        job_id = uuid4()
+        pages = [_page(html=f"page-{i}") for i in range(2)]
+        for page in pages:
+            page.job_id = job_id
+            page.url = "https://example.com/"
+        settings = SimpleNamespace(**{**vars(PACKING_SETTINGS), "CHUNK_PACK_BELOW": 0})
+
+        with patch("app.services.extraction.orchestrator.settings", settings):
+            groups = orchestrator._group_pages_for_packing(
+                [PageExtractionRequest(page=page) for page in pages]
+            )
+
+        assert groups == [[0], [1]]
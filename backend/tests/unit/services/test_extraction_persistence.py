@@ -0,0 +1,119 @@
+"""
+Unit tests for bulk persistence of extraction results.
+
+Uses a mock session and checks the statements and rows it receives.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.extracted_entity import EntityRelationship, ExtractedEntity
+from app.models.scraping_job import ScrapingJob
+from app.services.extraction import ExtractionResult, persist_page_extraction
+
+
+@pytest.fixture
+def page():
+    return SimpleNamespace(id=uuid4(), job_id=uuid4(), extraction_status="processing")
+
+
+@pytest.fixture
+def result():
+    return ExtractionResult(
+        entities=[
+            {"name": "DomainEvent ", "type": "class", "method": "llm_ollama", "confidence": 0.9},
+            {"name": "to_dict", "type": "function", "method": "llm_ollama"},
+        ],
+        relationships=[
+            {
+                "source_name": "domainevent",
+                "target_name": "TO_DICT",
+                "relationship_type": "contains",
+            },
+            {"source_name": "DomainEvent", "target_name": "Missing", "relationship_type": "uses"},
+        ],
+        llm_count=2,
+    )
+
+
+def _inserts(db):
+    return {
+        call.args[0].table.name: call.args[1]
+        for call in db.execute.call_args_list
+        if call.args[0].is_insert
+    }
+
+
+def _stats_updates(db):
+    return [
+        call.args[1]
+        for call in db.execute.call_args_list
+        if "graph_statistics" in str(call.args[0])
+    ]
+
+
+class TestPersistPageExtraction:
+    """Tests for persist_page_extraction."""
+
+    def test_writes_each_table_with_one_statement(self, page, result):
+        """Test entities and relationships are inserted as lists of rows."""
+        db = MagicMock()
+
+        persisted = persist_page_extraction(db, page, uuid4(), result)
+
+        inserts = _inserts(db)
+        assert len(inserts[ExtractedEntity.__tablename__]) == 2
+        assert len(inserts[EntityRelationship.__tablename__]) == 1
+        assert (persisted.entity_count, persisted.relationship_count) == (2, 1)
+        assert persisted.unresolved_relationships == 1
+        db.add.assert_not_called()
+        db.flush.assert_not_called()
+        db.commit.assert_not_called()
+
+    def test_relationship_endpoints_use_generated_ids(self, page, result):
+        """Test endpoints resolve by normalized name to the inserted entity IDs."""
+        db = MagicMock()
+
+        persist_page_extraction(db, page, uuid4(), result)
+
+        inserts = _inserts(db)
+        entities = {row["normalized_name"]: row["id"] for row in inserts["extracted_entities"]}
+        (relationship,) = inserts["entity_relationships"]
+        assert relationship["source_entity_id"] == entities["domainevent"]
+        assert relationship["target_entity_id"] == entities["to_dict"]
+        assert relationship["relationship_type"] == "CONTAINS"
+
+    def test_page_and_job_updated_in_same_transaction(self, page, result):
+        """Test the page is marked completed and the job counter incremented."""
+        db = MagicMock()
+
+        persist_page_extraction(db, page, uuid4(), result)
+
+        assert page.extraction_status == "completed"
+        assert page.extracted_at is not None
+        updates = [call.args[0] for call in db.execute.call_args_list if call.args[0].is_update]
+        assert [statement.table.name for statement in updates] == [ScrapingJob.__tablename__]
+
+    def test_graph_statistics_counts_inserted_rows(self, page, result):
+        """Test the tenant's graph statistics get the inserted types in the same session."""
+        db = MagicMock()
+        tenant_id = uuid4()
+
+        persist_page_extraction(db, page, tenant_id, result)
+
+        entity_delta, relationship_delta = _stats_updates(db)
+        assert entity_delta == {"tenant_id": tenant_id, "types": ["class", "function"]}
+        assert relationship_delta == {"tenant_id": tenant_id, "types": ["CONTAINS"]}
+
+    def test_empty_result_writes_nothing(self, page):
+        """Test a page without entities only gets its status updated."""
+        db = MagicMock()
+
+        persisted = persist_page_extraction(db, page, uuid4(), ExtractionResult())
+
+        db.execute.assert_not_called()
+        assert persisted.entity_count == 0
+        assert page.extraction_status == "completed"
@@ -0,0 +1,156 @@
+"""
+Unit tests for precomputed graph statistics.
+
+Tests the SQL builders used by projection handlers to maintain the
+graph_statistics read model, and the GraphStatisticsService read path
+with a mocked session.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.services.graph_stats import (
+    DEGREE_BUCKETS,
+    RECONCILE_STATS_SQL,
+    GraphStatisticsService,
+    empty_stats,
+    stats_delta_sql,
+)
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def tenant_id():
+    """Generate a test tenant ID."""
+    return uuid4()
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock AsyncSession."""
+    session = AsyncMock()
+    session.execute = AsyncMock()
+    return session
+
+
+def _result_with(row):
+    """Build a mock execute() result returning a single row."""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = row
+    return result
+
+
+# =============================================================================
+# stats_delta_sql Tests
+# =============================================================================
+
+
+class TestStatsDeltaSql:
+    """Tests for the incremental stats SQL builder."""
+
+    def test_entity_addition_upserts_entity_counters(self):
+        """Test additions insert or increment the entity counters."""
+        sql = stats_delta_sql("new_entities", "entity")
+
+        assert "INSERT INTO graph_statistics" in sql
+        assert "FROM new_entities" in sql
+        assert "ON CONFLICT (tenant_id) DO UPDATE" in sql
+        assert "total_entities = gs.total_entities + EXCLUDED.total_entities" in sql
+        assert "graph_stats_merge_counts" in sql
+        assert "entity_type" in sql
+        assert "relationship" not in sql
+
+    def test_relationship_addition_uses_relationship_columns(self):
+        """Test relationship additions update the relationship counters."""
+        sql = stats_delta_sql("new_relationships", "relationship")
+
+        assert "FROM new_relationships" in sql
+        assert "total_relationships" in sql
+        assert "relationship_counts" in sql
+        assert "relationship_type" in sql
+        assert "total_entities" not in sql
+
+    def test_subtraction_only_updates_existing_rows(self):
+        """Test subtractions never insert and clamp totals at zero."""
+        sql = stats_delta_sql("demoted", "entity", sign=-1)
+
+        assert "INSERT" not in sql
+        assert "UPDATE graph_statistics" in sql
+        assert "GREATEST(gs.total_entities - deltas.total, 0)" in sql
+        assert "-value::bigint" in sql
+
+    def test_invalid_sign_raises(self):
+        """Test that only +1 and -1 are accepted."""
+        with pytest.raises(ValueError):
+            stats_delta_sql("new_entities", "entity", sign=2)
+
+
+class TestReconcileSql:
+    """Tests for the full recount statement."""
+
+    def test_reconcile_covers_all_buckets(self):
+        """Test every degree bucket label appears in the recount."""
+        for label, _, _ in DEGREE_BUCKETS:
+            assert f"'{label}'" in RECONCILE_STATS_SQL
+
+    def test_reconcile_counts_only_canonical_entities(self):
+        """Test merged aliases are excluded from the recount."""
+        assert "is_canonical" in RECONCILE_STATS_SQL
+        assert "LIMIT :top_hubs" in RECONCILE_STATS_SQL
+        assert "reconciled_at = EXCLUDED.reconciled_at" in RECONCILE_STATS_SQL
+
+
+# =============================================================================
+# GraphStatisticsService Tests
+# =============================================================================
+
+
+class TestGetStats:
+    """Tests for GraphStatisticsService.get_stats."""
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_stats_without_row(self, mock_session, tenant_id):
+        """Test zeroed statistics are returned before any stats row exists."""
+        mock_session.execute.return_value = _result_with(None)
+        service = GraphStatisticsService(mock_session)
+
+        stats = await service.get_stats(tenant_id)
+
+        assert stats == empty_stats()
+        assert set(stats["degree_histogram"]) == {label for label, _, _ in DEGREE_BUCKETS}
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_returns_stored_stats(self, mock_session, tenant_id):
+        """Test stored statistics are returned with missing buckets zero-filled."""
+        now = datetime.now(timezone.utc)
+        hub = {"id": str(uuid4()), "name": "Ada", "entity_type": "person", "degree": 12}
+        row = MagicMock()
+        row.total_entities = 3
+        row.total_relationships = 2
+        row.entity_counts = {"person": 2, "organization": 1}
+        row.relationship_counts = {"works_for": 2}
+        row.degree_histogram = {"1": 2, "10-49": 1}
+        row.top_hubs = [hub]
+        row.reconciled_at = now
+        row.updated_at = now
+        mock_session.execute.return_value = _result_with(row)
+        service = GraphStatisticsService(mock_session)
+
+        stats = await service.get_stats(tenant_id)
+
+        assert stats["total_entities"] == 3
+        assert stats["total_relationships"] == 2
+        assert stats["entity_counts"] == {"person": 2, "organization": 1}
+        assert stats["relationship_counts"] == {"works_for": 2}
+        assert stats["degree_histogram"]["1"] == 2
+        assert stats["degree_histogram"]["10-49"] == 1
+        assert stats["degree_histogram"]["100+"] == 0
+        assert stats["top_hubs"] == [hub]
+        assert stats["reconciled_at"] == now
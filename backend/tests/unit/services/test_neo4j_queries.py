@@ -895,3 +895,27 @@ async def test_find_similar_entities_uses_distinct_count(
     query = call_args[0][0]
 
     assert "count(DISTINCT shared)" in query
+
+
+@pytest.mark.asyncio
+async def test_find_similar_entities_skips_hub_neighbors(
+    mock_neo4j_service, entity_id, tenant_id
+):
+    """Test find_similar_entities only expands degree-bounded shared neighbors."""
+    service, session = mock_neo4j_service
+
+    mock_result = AsyncMock()
+    mock_result.__aiter__ = lambda self: MockAsyncIterator([])
+    session.run = AsyncMock(return_value=mock_result)
+
+    query_service = GraphQueryService(service)
+    await query_service.find_similar_entities(
+        entity_id, tenant_id, max_shared_degree=50
+    )
+
+    call_args = session.run.call_args
+    query = call_args[0][0]
+    kwargs = call_args[1]
+
+    assert "COUNT { (shared)--() } <= $max_shared_degree" in query
+    assert kwargs["max_shared_degree"] == 50
@@ -34,6 +34,7 @@ drop_schema = neo4j_schema.drop_schema
 get_schema_info = neo4j_schema.get_schema_info
 CONSTRAINTS = neo4j_schema.CONSTRAINTS
 INDEXES = neo4j_schema.INDEXES
+FULLTEXT_INDEXES = neo4j_schema.FULLTEXT_INDEXES
 
 
 class MockAsyncIterator:
@@ -86,6 +87,7 @@ def mock_index_records():
         {"name": "entity_type_idx", "type": "RANGE"},
         {"name": "entity_name_idx", "type": "RANGE"},
         {"name": "entity_tenant_type_idx", "type": "RANGE"},
+        {"name": "entity_name_fulltext", "type": "FULLTEXT"},
     ]
 
 
@@ -122,11 +124,12 @@ async def test_setup_neo4j_schema_creates_indexes(mock_neo4j_service):
 
     # Verify all indexes were attempted to be created
     assert "indexes_created" in result
-    assert len(result["indexes_created"]) == len(INDEXES)
+    assert len(result["indexes_created"]) == len(INDEXES) + len(FULLTEXT_INDEXES)
     assert "entity_tenant_idx" in result["indexes_created"]
     assert "entity_type_idx" in result["indexes_created"]
     assert "entity_name_idx" in result["indexes_created"]
     assert "entity_tenant_type_idx" in result["indexes_created"]
+    assert "entity_name_fulltext" in result["indexes_created"]
 
 
 @pytest.mark.asyncio
@@ -139,7 +142,7 @@ async def test_setup_neo4j_schema_calls_correct_queries(mock_neo4j_service):
     await setup_neo4j_schema(service)
 
     # Verify session.run was called for each constraint and index
-    expected_call_count = len(CONSTRAINTS) + len(INDEXES)
+    expected_call_count = len(CONSTRAINTS) + len(INDEXES) + len(FULLTEXT_INDEXES)
     assert session.run.call_count == expected_call_count
 
     # Verify constraint query was called
@@ -394,7 +397,7 @@ async def test_drop_schema_drops_indexes_before_constraints(mock_neo4j_service):
     await drop_schema(service)
 
     # All index drops should come before constraint drops
-    index_count = len(INDEXES)
+    index_count = len(INDEXES) + len(FULLTEXT_INDEXES)
     assert call_order[:index_count] == ["index"] * index_count
     assert call_order[index_count:] == ["constraint"] * len(CONSTRAINTS)
 
@@ -488,6 +491,16 @@ def test_indexes_dictionary_structure():
     assert "entity_tenant_type_idx" in INDEXES
 
 
+def test_fulltext_index_query_syntax():
+    """Test that full-text index queries cover entity names scoped by tenant."""
+    assert "entity_name_fulltext" in FULLTEXT_INDEXES
+    for _name, query in FULLTEXT_INDEXES.items():
+        assert "CREATE FULLTEXT INDEX" in query
+        assert "IF NOT EXISTS" in query
+        assert "e.name" in query
+        assert "e.tenant_id" in query
+
+
 def test_constraint_query_syntax():
     """Test that constraint queries have correct Cypher syntax."""
     for _name, query in CONSTRAINTS.items():
@@ -541,6 +541,59 @@ async def test_search_entities_returns_results(
     assert result[0]["name"] == "extract_entities"
 
 
+@pytest.mark.asyncio
+async def test_search_entities_uses_fulltext_index(mock_neo4j_service, tenant_id):
+    """Test search_entities queries the tenant-scoped full-text index."""
+    service, session = mock_neo4j_service
+
+    mock_result = AsyncMock()
+    mock_result.__aiter__ = lambda self: MockAsyncIterator([])
+    session.run = AsyncMock(return_value=mock_result)
+
+    scoped_service = TenantScopedNeo4jService(service, tenant_id)
+    await scoped_service.search_entities("extract data")
+
+    call_args = session.run.call_args
+    query = call_args[0][0]
+    kwargs = call_args[1]
+
+    assert "db.index.fulltext.queryNodes('entity_name_fulltext'" in query
+    assert "CONTAINS" not in query
+    assert "score DESC" in query
+    assert kwargs["search_query"].startswith(f'tenant_id:"{tenant_id}" AND name:(')
+    assert "extract~1" in kwargs["search_query"]
+
+
+@pytest.mark.asyncio
+async def test_search_entities_prefix_mode(mock_neo4j_service, tenant_id):
+    """Test prefix mode treats only the last term as a prefix."""
+    service, session = mock_neo4j_service
+
+    mock_result = AsyncMock()
+    mock_result.__aiter__ = lambda self: MockAsyncIterator([])
+    session.run = AsyncMock(return_value=mock_result)
+
+    scoped_service = TenantScopedNeo4jService(service, tenant_id)
+    await scoped_service.search_entities("Extract Ent", mode="prefix")
+
+    kwargs = session.run.call_args[1]
+
+    assert kwargs["search_query"].endswith("name:(extract AND ent*)")
+
+
+@pytest.mark.asyncio
+async def test_search_entities_without_terms_skips_query(mock_neo4j_service, tenant_id):
+    """Test search_entities returns nothing for text with no searchable terms."""
+    service, session = mock_neo4j_service
+    session.run = AsyncMock()
+
+    scoped_service = TenantScopedNeo4jService(service, tenant_id)
+    result = await scoped_service.search_entities("  *?! ")
+
+    assert result == []
+    session.run.assert_not_called()
+
+
 # =============================================================================
 # get_entities_by_type Tests
 # =============================================================================
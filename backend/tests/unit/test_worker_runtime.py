@@ -0,0 +1,103 @@
+"""
+Unit tests for the persistent worker async runtime.
+
+Tests that coroutines submitted from sync code share one long-lived event
+loop, and that timeouts, re-entrant calls and shutdown behave correctly.
+Also covers the process pool kept next to the runtime.
+"""
+
+import asyncio
+import operator
+from unittest.mock import patch
+
+import pytest
+
+from app.worker.runtime import AsyncRuntime, get_process_pool, shutdown_process_pool
+
+
+@pytest.fixture
+def runtime():
+    """Start a runtime and stop it after the test."""
+    runtime = AsyncRuntime(name="test-runtime")
+    yield runtime
+    runtime.shutdown()
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+def test_runs_coroutines_on_one_loop(runtime):
+    """Test successive calls reuse the same event loop."""
+    first = runtime.run(_current_loop())
+    second = runtime.run(_current_loop())
+
+    assert first is second is runtime.loop
+    assert not first.is_closed()
+
+
+def test_propagates_exceptions(runtime):
+    """Test exceptions raised by the coroutine reach the caller."""
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        runtime.run(fail())
+
+
+def test_timeout_cancels_coroutine(runtime):
+    """Test a timed-out call raises TimeoutError and cancels the coroutine."""
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        runtime.run(slow(), timeout=0.05)
+
+    assert runtime.run(asyncio.wait_for(cancelled.wait(), 1)) is True
+
+
+def test_rejects_calls_from_runtime_thread(runtime):
+    """Test blocking on the runtime from its own loop raises instead of deadlocking."""
+
+    async def reenter():
+        runtime.run(_current_loop())
+
+    with pytest.raises(RuntimeError):
+        runtime.run(reenter())
+
+
+def test_shutdown_stops_loop():
+    """Test shutdown stops the thread and closes the loop."""
+    runtime = AsyncRuntime(name="test-runtime")
+
+    runtime.shutdown()
+
+    assert not runtime.is_running
+    assert runtime.loop.is_closed()
+
+
+def test_process_pool_is_shared_until_shutdown():
+    """Test the process pool is started once and replaced after shutdown."""
+    with patch("app.core.config.settings.WORKER_PROCESS_POOL_SIZE", 1):
+        pool = get_process_pool()
+        try:
+            assert get_process_pool() is pool
+            assert pool.submit(operator.add, 2, 3).result(timeout=30) == 5
+        finally:
+            shutdown_process_pool()
+
+        assert get_process_pool() is not pool
+        shutdown_process_pool()
+
+
+def test_process_pool_can_be_disabled():
+    """Test a pool size of 0 keeps CPU-bound work in the calling process."""
+    with patch("app.core.config.settings.WORKER_PROCESS_POOL_SIZE", 0):
+        assert get_process_pool() is None